@@ -0,0 +1,165 @@
+"""Normalized repo columns on scans and a trigger-maintained per-day rollup for scan statistics.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18
+
+/api/scans/statistics aggregates in SQL: distinct repos/owners come from scans.repo_owner /
+repo_slug (set at insert; backfilled here) and daily_scan_counts from scan_daily_rollups,
+which counts completed scans per created_at day and owner scope.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("scans", sa.Column("repo_owner", sa.String(255), nullable=True))
+    op.add_column("scans", sa.Column("repo_slug", sa.String(500), nullable=True))
+    # Same parsing as domain.utils.git_repo_url.github_repo_owner_and_slug
+    op.execute(r"""
+    WITH parsed AS (
+        SELECT id,
+               COALESCE(
+                   regexp_match(btrim(target_url), '^git@github\.com:([^/]+)/(.+)$', 'i'),
+                   regexp_match(btrim(target_url), '^[^:/]+://github\.com/+([^/?#]+)/+([^/?#]+)', 'i')
+               ) AS m
+        FROM scans
+        WHERE target_url ILIKE '%github.com%'
+    ),
+    normalized AS (
+        SELECT id,
+               NULLIF(lower(btrim(m[1])), '') AS owner,
+               NULLIF(lower(btrim(regexp_replace(btrim(m[2]), '\.git$', '', 'i'), '/')), '') AS repo
+        FROM parsed
+        WHERE m IS NOT NULL
+    )
+    UPDATE scans s
+    SET repo_owner = n.owner,
+        repo_slug = CASE WHEN n.owner IS NOT NULL AND n.repo IS NOT NULL THEN n.owner || '/' || n.repo END
+    FROM normalized n
+    WHERE s.id = n.id
+    """)
+
+    op.create_table(
+        "scan_daily_rollups",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("scope_key", sa.String(300), primary_key=True),
+        sa.Column("total_scans", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("repository_scans", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("container_scans", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("infrastructure_scans", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("web_application_scans", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.create_index("idx_scan_daily_rollups_scope_day", "scan_daily_rollups", ["scope_key", "day"])
+
+    # Scope of a scan row: owner user, else guest session (scan_metadata.session_id), else "-"
+    op.execute("""
+    CREATE OR REPLACE FUNCTION scan_rollup_scope_key(p_user_id uuid, p_metadata jsonb)
+    RETURNS text AS $$
+        SELECT CASE
+            WHEN p_user_id IS NOT NULL THEN 'u:' || p_user_id::text
+            WHEN p_metadata ->> 'session_id' IS NOT NULL THEN 'g:' || (p_metadata ->> 'session_id')
+            ELSE '-'
+        END
+    $$ LANGUAGE sql IMMUTABLE;
+    """)
+    op.execute("""
+    CREATE OR REPLACE FUNCTION scan_daily_rollup_add(
+        p_created_at timestamp, p_user_id uuid, p_metadata jsonb, p_scan_type text, p_delta integer
+    )
+    RETURNS void AS $$
+    DECLARE
+        kind text := lower(COALESCE(p_scan_type, 'code'));
+    BEGIN
+        INSERT INTO scan_daily_rollups AS r (
+            day, scope_key, total_scans, repository_scans, container_scans,
+            infrastructure_scans, web_application_scans
+        )
+        VALUES (
+            p_created_at::date,
+            scan_rollup_scope_key(p_user_id, p_metadata),
+            p_delta,
+            CASE WHEN kind IN ('code', 'repository', 'repo') THEN p_delta ELSE 0 END,
+            CASE WHEN kind IN ('image', 'container') THEN p_delta ELSE 0 END,
+            CASE WHEN kind IN ('infrastructure', 'infra', 'terraform') THEN p_delta ELSE 0 END,
+            CASE WHEN kind IN ('web', 'web_application') THEN p_delta ELSE 0 END
+        )
+        ON CONFLICT (day, scope_key) DO UPDATE SET
+            total_scans = r.total_scans + EXCLUDED.total_scans,
+            repository_scans = r.repository_scans + EXCLUDED.repository_scans,
+            container_scans = r.container_scans + EXCLUDED.container_scans,
+            infrastructure_scans = r.infrastructure_scans + EXCLUDED.infrastructure_scans,
+            web_application_scans = r.web_application_scans + EXCLUDED.web_application_scans;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    # Row enters/leaves "completed" (or a completed row is moved/deleted): adjust its day bucket
+    op.execute("""
+    CREATE OR REPLACE FUNCTION maintain_scan_daily_rollups()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.status = 'completed' THEN
+            PERFORM scan_daily_rollup_add(OLD.created_at, OLD.user_id, OLD.scan_metadata::jsonb, OLD.scan_type, -1);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.status = 'completed' THEN
+            PERFORM scan_daily_rollup_add(NEW.created_at, NEW.user_id, NEW.scan_metadata::jsonb, NEW.scan_type, 1);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+    CREATE TRIGGER maintain_scan_daily_rollups_ins_del
+    AFTER INSERT OR DELETE ON scans
+    FOR EACH ROW EXECUTE PROCEDURE maintain_scan_daily_rollups();
+    """)
+    op.execute("""
+    CREATE TRIGGER maintain_scan_daily_rollups_upd
+    AFTER UPDATE OF status, created_at, scan_type, user_id, scan_metadata ON scans
+    FOR EACH ROW
+    WHEN (
+        (OLD.status = 'completed' OR NEW.status = 'completed')
+        AND (
+            OLD.status IS DISTINCT FROM NEW.status
+            OR OLD.created_at::date IS DISTINCT FROM NEW.created_at::date
+            OR OLD.scan_type IS DISTINCT FROM NEW.scan_type
+            OR scan_rollup_scope_key(OLD.user_id, OLD.scan_metadata::jsonb)
+               IS DISTINCT FROM scan_rollup_scope_key(NEW.user_id, NEW.scan_metadata::jsonb)
+        )
+    )
+    EXECUTE PROCEDURE maintain_scan_daily_rollups();
+    """)
+    op.execute("""
+    INSERT INTO scan_daily_rollups (
+        day, scope_key, total_scans, repository_scans, container_scans,
+        infrastructure_scans, web_application_scans
+    )
+    SELECT created_at::date,
+           scan_rollup_scope_key(user_id, scan_metadata::jsonb),
+           COUNT(*),
+           COUNT(*) FILTER (WHERE lower(COALESCE(scan_type, 'code')) IN ('code', 'repository', 'repo')),
+           COUNT(*) FILTER (WHERE lower(COALESCE(scan_type, 'code')) IN ('image', 'container')),
+           COUNT(*) FILTER (WHERE lower(COALESCE(scan_type, 'code')) IN ('infrastructure', 'infra', 'terraform')),
+           COUNT(*) FILTER (WHERE lower(COALESCE(scan_type, 'code')) IN ('web', 'web_application'))
+    FROM scans
+    WHERE status = 'completed'
+    GROUP BY 1, 2
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS maintain_scan_daily_rollups_upd ON scans")
+    op.execute("DROP TRIGGER IF EXISTS maintain_scan_daily_rollups_ins_del ON scans")
+    op.execute("DROP FUNCTION IF EXISTS maintain_scan_daily_rollups()")
+    op.execute("DROP FUNCTION IF EXISTS scan_daily_rollup_add(timestamp, uuid, jsonb, text, integer)")
+    op.execute("DROP FUNCTION IF EXISTS scan_rollup_scope_key(uuid, jsonb)")
+    op.drop_table("scan_daily_rollups")
+    op.drop_column("scans", "repo_slug")
+    op.drop_column("scans", "repo_owner")
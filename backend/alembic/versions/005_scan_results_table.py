@@ -0,0 +1,61 @@
+"""Move per-tool results JSON from scans.results to scan_results.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18
+
+List, queue and statistics queries read scans rows only; the results payload is joined
+in for single-scan reads (DatabaseScanRepository.get_by_id).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scan_results",
+        sa.Column(
+            "scan_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("scans.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("results", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.text("NOW()")),
+    )
+    op.execute("""
+    INSERT INTO scan_results (scan_id, results, updated_at)
+    SELECT id, results, updated_at
+    FROM scans
+    WHERE results IS NOT NULL AND results <> '[]'::jsonb
+    """)
+    op.drop_index("idx_scans_results_completed", table_name="scans")
+    op.drop_index("idx_scans_results", table_name="scans")
+    op.drop_column("scans", "results")
+
+
+def downgrade() -> None:
+    op.add_column("scans", sa.Column("results", postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.execute("""
+    UPDATE scans s
+    SET results = r.results
+    FROM scan_results r
+    WHERE r.scan_id = s.id
+    """)
+    op.create_index("idx_scans_results", "scans", ["results"], postgresql_using="gin")
+    op.create_index(
+        "idx_scans_results_completed",
+        "scans",
+        ["results"],
+        postgresql_using="gin",
+        postgresql_where=sa.text("status = 'completed' AND results IS NOT NULL"),
+    )
+    op.drop_table("scan_results")
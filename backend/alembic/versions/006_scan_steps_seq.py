@@ -0,0 +1,42 @@
+"""Ordering and live event position columns for the batched scan_steps mirror.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18
+
+The scanner's StepRegistry coalesces step changes and upserts them in batches; each row
+carries a monotonically increasing seq and the upsert only applies when it is newer, so a
+late or retried batch can no longer move a step back to an older status.
+
+Step deltas are published live as soon as they happen, so a batched snapshot can lag the
+live stream. Each flushed row also records the scanner's event epoch/seq the batch covers;
+GET /steps hands that position (not the newest live delta) to clients, which then catch up
+on the deltas the snapshot does not include yet.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "scan_steps",
+        sa.Column("seq", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column("scan_steps", sa.Column("event_epoch", sa.String(32), nullable=True))
+    op.add_column(
+        "scan_steps",
+        sa.Column("event_seq", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("scan_steps", "event_seq")
+    op.drop_column("scan_steps", "event_epoch")
+    op.drop_column("scan_steps", "seq")
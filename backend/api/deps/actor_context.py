@@ -83,7 +83,26 @@ class ActorContextDependency:
 
         Used by FastAPI dependencies and AuthMiddleware (single code path).
         Invalid ``ssc_`` keys return an unauthenticated context (never a guest session).
+        The result is memoized on ``request.state.actor_context``, so the middleware and
+        every route dependency share one resolution per request.
         """
+        memo = getattr(request.state, "actor_context", None)
+        if isinstance(memo, ActorContext):
+            if memo.session_id and memo.session_id != request.cookies.get("session_id"):
+                # Guest session created earlier in this request (e.g. by the middleware,
+                # whose response is discarded): the cookie still has to reach the client
+                self.create_session_cookie(memo.session_id, response)
+            return memo
+        context = await self._resolve_uncached(request, response, credentials)
+        request.state.actor_context = context
+        return context
+
+    async def _resolve_uncached(
+        self,
+        request: Request,
+        response: Response,
+        credentials: Optional[HTTPAuthorizationCredentials],
+    ) -> ActorContext:
         if credentials and credentials.credentials:
             token = credentials.credentials.strip()
             if self._looks_like_api_key(token):
@@ -131,8 +150,18 @@ class ActorContextDependency:
         try:
             from api.auth.api_key_utils import hash_api_key
             from infrastructure.container import get_api_key_service
+            from infrastructure.redis.principal_cache import (
+                api_key_tag,
+                get_principal_cache,
+                user_tag,
+            )
 
             key_hash = hash_api_key(plain_key)
+            cache = get_principal_cache()
+            cache_key = f"api_key:{key_hash}"
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
             result = await get_api_key_service().authenticate(key_hash)
             if not result:
                 return None
@@ -143,7 +172,7 @@ class ActorContextDependency:
                 if api_key.expires_at
                 else None
             )
-            return ActorContext(
+            context = ActorContext(
                 user_id=str(user.id),
                 session_id=None,
                 is_authenticated=True,
@@ -152,6 +181,17 @@ class ActorContextDependency:
                 role=str(role) if role else "user",
                 expires_at=key_exp,
             )
+            cache.set(
+                cache_key,
+                context,
+                tags=(api_key_tag(str(api_key.id)), user_tag(str(user.id))),
+                max_age=(
+                    (api_key.expires_at - datetime.utcnow()).total_seconds()
+                    if api_key.expires_at
+                    else None
+                ),
+            )
+            return context
         except Exception:
             self.logger.warning("API key authentication failed", exc_info=True)
             return None
@@ -189,6 +229,13 @@ class ActorContextDependency:
         """Guest session: Redis revoked flag + issued-at for /session expires_at."""
         if not session_id or len(session_id) > 128:
             return None
+        from infrastructure.redis.principal_cache import get_principal_cache, guest_tag
+
+        cache = get_principal_cache()
+        cache_key = f"guest:{session_id}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
         guest_exp: Optional[str] = None
         try:
             from infrastructure.redis.client import redis_client
@@ -198,9 +245,11 @@ class ActorContextDependency:
                 TTL_SECONDS,
             )
 
-            if await redis_client.get(revoked_key(session_id)):
+            revoked, issued_raw = await redis_client.mget(
+                revoked_key(session_id), issued_key(session_id)
+            )
+            if revoked:
                 return None
-            issued_raw = await redis_client.get(issued_key(session_id))
             if issued_raw:
                 try:
                     issued = int(issued_raw)
@@ -214,12 +263,19 @@ class ActorContextDependency:
                 "Guest session Redis lookup failed; treating as unissued guest",
                 exc_info=True,
             )
-        return ActorContext(
+            return ActorContext(
+                user_id=None,
+                session_id=session_id,
+                is_authenticated=False,
+            )
+        context = ActorContext(
             user_id=None,
             session_id=session_id,
             is_authenticated=False,
             expires_at=guest_exp,
         )
+        cache.set(cache_key, context, tags=(guest_tag(session_id),))
+        return context
     
     async def _create_guest_session(self, response: Response) -> ActorContext:
         """Create guest session: cookie + Redis issued (admin can revoke)."""
@@ -246,12 +302,16 @@ class ActorContextDependency:
             samesite="lax",
             max_age=86400 * 30,
         )
-        return ActorContext(
+        context = ActorContext(
             user_id=None,
             session_id=session_id,
             is_authenticated=False,
             expires_at=guest_exp,
         )
+        from infrastructure.redis.principal_cache import get_principal_cache, guest_tag
+
+        get_principal_cache().set(f"guest:{session_id}", context, tags=(guest_tag(session_id),))
+        return context
     
     def create_jwt_token(self, user_id: str, email: str, name: str, role: Optional[str] = None) -> str:
         """Create JWT access token for authenticated user."""
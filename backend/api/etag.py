@@ -0,0 +1,40 @@
+"""Strong ETags and If-None-Match handling for scan results that only change when the report is regenerated."""
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from fastapi import Response
+
+# Clients may keep the body but must revalidate (results are private to the scan's readers)
+CONDITIONAL_CACHE_CONTROL = "private, no-cache"
+
+
+def strong_etag(*parts: Any) -> str:
+    """Quoted strong ETag derived from the given version/query parts."""
+    raw = "\x1f".join(str(p) for p in parts).encode("utf-8")
+    return f'"{hashlib.sha256(raw).hexdigest()[:32]}"'
+
+
+def if_none_match_matches(header_val: str | None, etag: str) -> bool:
+    """True if an If-None-Match header lists ``etag`` (weak comparison, RFC 9110) or is ``*``."""
+    if not header_val:
+        return False
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header_val.split(","):
+        c = candidate.strip()
+        if c == "*":
+            return True
+        if c.startswith("W/"):
+            c = c[2:]
+        if c == opaque:
+            return True
+    return False
+
+
+def conditional_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": CONDITIONAL_CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=conditional_headers(etag))
@@ -45,6 +45,8 @@ _auto_scan_scheduler = None
 _stale_sweep_task = None
 _sse_bridge_stop = None
 _sse_bridge_task = None
+_principal_listener_stop = None
+_principal_listener_task = None
 
 
 def create_app() -> FastAPI:
@@ -429,6 +431,21 @@ async def startup_event():
     elif setup_complete:
         logger.info("SSE Redis bridge disabled (SSE_REDIS_BRIDGE_ENABLED=false)")
 
+    # Drop cached API-key / guest principals revoked on other API processes
+    if settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS > 0:
+        try:
+            import api.main as main_module
+
+            main_module._principal_listener_stop = asyncio.Event()
+            from infrastructure.redis.principal_cache import run_principal_invalidation_listener
+
+            main_module._principal_listener_task = asyncio.create_task(
+                run_principal_invalidation_listener(main_module._principal_listener_stop)
+            )
+        except Exception as e:
+            if setup_complete:
+                logger.warning("Principal cache invalidation listener not started: %s", e)
+
     # Pre-load scanners on startup (especially important during setup)
     # This ensures scanners are available when user completes setup
     # Do this silently during setup mode
@@ -595,6 +612,18 @@ async def shutdown_event():
             main_module._sse_bridge_task = None
             main_module._sse_bridge_stop = None
             logger.info("SSE Redis bridge stopped")
+        stop = getattr(main_module, "_principal_listener_stop", None)
+        task = getattr(main_module, "_principal_listener_task", None)
+        if stop is not None:
+            stop.set()
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+            main_module._principal_listener_task = None
+            main_module._principal_listener_stop = None
     except Exception as e:
         logger.error("Failed to stop schedulers", error=str(e))
     
@@ -10,7 +10,6 @@ from fastapi.security import HTTPAuthorizationCredentials
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 import logging
-import time
 
 from api.deps.actor_context import ActorContext, ActorContextDependency
 from config.settings import settings
@@ -148,19 +147,26 @@ class AuthMiddleware(BaseHTTPMiddleware):
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
     Rate limiting middleware to prevent abuse.
+
+    Limits are shared across workers and replicas through Redis (GCRA, see
+    infrastructure.redis.rate_limiter); per-process counters are used while Redis is down.
     """
 
     def __init__(
         self,
         app,
         rate_limits: dict = None,
+        limiter=None,
     ):
         super().__init__(app)
         if rate_limits is None:
             from domain.services.security_policy_service import SecurityPolicyService
             rate_limits = SecurityPolicyService.get_rate_limits()
+        if limiter is None:
+            from infrastructure.redis.rate_limiter import RedisRateLimiter
+            limiter = RedisRateLimiter()
         self.rate_limits = rate_limits
-        self.request_counts = {}
+        self.limiter = limiter
 
     async def dispatch(
         self,
@@ -172,20 +178,24 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             if not actor_context:
                 actor_context = ActorContext()
 
-            if await self._is_rate_limited(actor_context):
+            user_type = self._get_user_type(actor_context)
+            limit_config = self.rate_limits[user_type]
+            decision = await self.limiter.hit(
+                f"{user_type}:{actor_context.get_identifier()}",
+                limit_config["requests"],
+                limit_config["window"],
+            )
+            if not decision.allowed:
                 return JSONResponse(
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                     content={
                         "detail": "Rate limit exceeded",
-                        "retry_after": self.rate_limits[
-                            self._get_user_type(actor_context)
-                        ]["window"],
+                        "retry_after": decision.retry_after,
                     },
+                    headers={"Retry-After": str(decision.retry_after)},
                 )
 
-            response = await call_next(request)
-            await self._increment_request_count(actor_context)
-            return response
+            return await call_next(request)
 
         except Exception as e:
             return JSONResponse(
@@ -198,31 +208,6 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return "guest"
         return "authenticated"
 
-    async def _is_rate_limited(self, actor_context: ActorContext) -> bool:
-        user_type = self._get_user_type(actor_context)
-        limit_config = self.rate_limits[user_type]
-
-        user_id = actor_context.get_identifier()
-        current_time = int(time.time())
-        window_start = current_time - limit_config["window"]
-
-        if user_id in self.request_counts:
-            self.request_counts[user_id] = [
-                ts for ts in self.request_counts[user_id] if ts > window_start
-            ]
-
-        current_count = len(self.request_counts.get(user_id, []))
-        return current_count >= limit_config["requests"]
-
-    async def _increment_request_count(self, actor_context: ActorContext) -> None:
-        user_id = actor_context.get_identifier()
-        current_time = int(time.time())
-
-        if user_id not in self.request_counts:
-            self.request_counts[user_id] = []
-
-        self.request_counts[user_id].append(current_time)
-
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     """Security headers middleware."""
@@ -1382,6 +1382,9 @@ async def revoke_guest_session(
         await redis_client.set(
             revoked_key(session_id), "1", expire=TTL_SECONDS
         )
+        from infrastructure.redis.principal_cache import guest_tag, publish_invalidation
+
+        await publish_invalidation(guest_tag(session_id))
         await AuditLogService.log_event(
             user_id=actor_context.user_id,
             user_email=actor_context.email,
@@ -1543,6 +1546,10 @@ async def update_user(
             user.is_active = user_data.is_active
         user.updated_at = datetime.utcnow()
         user = await user_service.update(user)
+        # Cached API-key principals carry role/email and must not outlive a deactivation
+        from infrastructure.redis.principal_cache import publish_invalidation, user_tag
+
+        await publish_invalidation(user_tag(user_id))
         await AuditLogService.log_event(
             user_id=actor_context.user_id,
             user_email=actor_context.email,
@@ -1592,6 +1599,9 @@ async def delete_user(
             )
         user_email = user.email
         await user_service.delete_by_id(user_id)
+        from infrastructure.redis.principal_cache import publish_invalidation, user_tag
+
+        await publish_invalidation(user_tag(user_id))
         await AuditLogService.log_event(
             user_id=actor_context.user_id,
             user_email=actor_context.email,
@@ -3,23 +3,28 @@ Results API — HTML report (summary.html), AI prompt for findings.
 
 Access: owner, report_shared_with_user_ids, or ?share_token= (report_share_token in metadata).
 """
-import json
-import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse, JSONResponse
 from fastapi import status as fastapi_status
 
 from api.deps.actor_context import get_actor_context, ActorContext
+from api.etag import conditional_headers, if_none_match_matches, not_modified, strong_etag
 from domain.policies.finding_policy import DEFAULT_FINDING_POLICY_PATH
 from domain.policies.finding_policy_schema import (
     format_policy_schema_markdown,
     policy_keys_from_findings,
 )
-from application.helpers.prompt_findings_select import select_findings_for_prompt
-from application.helpers.findings_file import findings_json_path
+from application.helpers.prompt_findings_select import select_findings_for_prompt_from_store
+from application.helpers.findings_file import (
+    findings_db_path,
+    findings_json_path,
+    findings_store_version,
+    open_findings_store,
+)
+from application.helpers.findings_query_cache import findings_query_cache
 from application.services.scan_service import ScanService
 from domain.exceptions.scan_exceptions import ScanNotFoundException
 from domain.policies.scan_result_access_policy import can_read_scan_results
@@ -41,35 +46,6 @@ def _report_path(scan_id: str) -> Path:
     return base / scan_id / "summary" / "summary.html"
 
 
-def _extract_findings_json_from_html_text(text: str) -> List[Dict[str, Any]]:
-    for script_id in ("report-findings-data", "findings-data"):
-        match = re.search(
-            rf'<script[^>]*\sid="{re.escape(script_id)}"[^>]*>\s*([\s\S]*?)\s*</script>',
-            text,
-        )
-        if not match:
-            continue
-        raw = match.group(1).strip()
-        if not raw:
-            continue
-        try:
-            data = json.loads(raw)
-        except (json.JSONDecodeError, TypeError):
-            continue
-        if isinstance(data, list):
-            return data
-    return []
-
-
-def _extract_findings_from_report_html(html_path: Path) -> List[Dict[str, Any]]:
-    """Extract post-policy report findings from summary.html (report-findings-data preferred)."""
-    try:
-        text = html_path.read_text(encoding="utf-8", errors="replace")
-    except OSError:
-        return []
-    return _extract_findings_json_from_html_text(text)
-
-
 def _build_ai_prompt(
     findings: List[Dict[str, Any]],
     language: str,
@@ -244,6 +220,7 @@ async def _serve_report(
     actor: ActorContext,
     svc: ScanService,
     share_token: Optional[str],
+    if_none_match: Optional[str] = None,
 ):
     try:
         dto = await svc.get_scan_by_id(scan_id)
@@ -262,12 +239,17 @@ async def _serve_report(
         raise HTTPException(fastapi_status.HTTP_403_FORBIDDEN, "Access denied")
 
     p = _report_path(scan_id)
-    if not p.is_file():
+    try:
+        st = p.stat()
+    except OSError:
         raise HTTPException(fastapi_status.HTTP_404_NOT_FOUND, "Report not found")
+    etag = strong_etag("report", scan_id, st.st_mtime_ns, st.st_size)
+    if if_none_match_matches(if_none_match, etag):
+        return not_modified(etag)
     return FileResponse(
         p,
         media_type="text/html; charset=utf-8",
-        headers={"Content-Disposition": 'inline; filename="summary.html"'},
+        headers={"Content-Disposition": 'inline; filename="summary.html"', **conditional_headers(etag)},
     )
 
 
@@ -278,7 +260,7 @@ def _scan_user_id_str(user_id) -> Optional[str]:
 
 
 def _scan_has_report(scan_id: str) -> bool:
-    if findings_json_path(scan_id).is_file():
+    if findings_db_path(scan_id).is_file() or findings_json_path(scan_id).is_file():
         return True
     return _report_path(scan_id).is_file()
 
@@ -344,18 +326,22 @@ async def list_results(
     return {"scans": items, "total": total, "limit": limit, "offset": offset}
 
 
-@router.get("/results/{scan_id}/report")
+@router.get("/results/{scan_id}/report", responses={304: {"description": "Not modified (If-None-Match)"}})
 async def get_results_report(
+    request: Request,
     scan_id: str,
     actor_context: ActorContext = Depends(get_actor_context),
     scan_service: ScanService = Depends(_scan_svc),
     share_token: Optional[str] = Query(None),
 ):
-    return await _serve_report(scan_id, actor_context, scan_service, share_token)
+    return await _serve_report(
+        scan_id, actor_context, scan_service, share_token, request.headers.get("if-none-match")
+    )
 
 
-@router.get("/results/{scan_id}/ai-prompt")
+@router.get("/results/{scan_id}/ai-prompt", responses={304: {"description": "Not modified (If-None-Match)"}})
 async def get_results_ai_prompt(
+    request: Request,
     scan_id: str,
     actor_context: ActorContext = Depends(get_actor_context),
     scan_service: ScanService = Depends(_scan_svc),
@@ -391,40 +377,54 @@ async def get_results_ai_prompt(
     ):
         raise HTTPException(fastapi_status.HTTP_403_FORBIDDEN, "Access denied")
 
-    html_path = _report_path(scan_id)
-    if not html_path.is_file():
+    version = findings_store_version(scan_id)
+    if version is None:
         raise HTTPException(fastapi_status.HTTP_404_NOT_FOUND, "Report not found")
 
-    findings = _extract_findings_from_report_html(html_path)
     min_sev = (min_severity or "HIGH").strip().upper()
     if only_critical_high is True:
         min_sev = "HIGH"
-    selected, meta = select_findings_for_prompt(
-        findings,
-        max_findings=max_findings,
-        min_severity=min_sev,
-        tool=(tool or "").strip() or None,
-        sort_by=sort_by or "severity",
-    )
-    prompt = _build_ai_prompt(
-        selected,
-        language=language,
-        policy_path=policy_path or DEFAULT_FINDING_POLICY_PATH,
-        max_findings=max_findings,
-        min_severity=min_sev,
-        tool=(tool or "").strip() or None,
-        sort_by=sort_by or "severity",
-    )
-    return {
-        "prompt": prompt,
-        "findings_count": meta["included"],
-        "total_findings": meta["total"],
-        "matched_findings": meta["matched"],
-        "included_by_severity": meta["included_by_severity"],
-        "language": language,
-        "policy_path": policy_path or DEFAULT_FINDING_POLICY_PATH,
-        "max_findings": max_findings,
-        "min_severity": min_sev,
-        "tool": (tool or "").strip() or None,
-        "sort_by": sort_by or "severity",
-    }
+    tool_key = (tool or "").strip() or None
+    query = (language, policy_path, max_findings, min_sev, tool_key, sort_by)
+    etag = strong_etag("ai-prompt", scan_id, version, *query)
+    if if_none_match_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+
+    cache_key = ("ai-prompt", scan_id, version, query)
+    body = findings_query_cache.get(cache_key)
+    if body is None:
+        store, _source = open_findings_store(scan_id)
+        if store is None:
+            raise HTTPException(fastapi_status.HTTP_404_NOT_FOUND, "Report not found")
+        with store:
+            selected, meta = select_findings_for_prompt_from_store(
+                store,
+                max_findings=max_findings,
+                min_severity=min_sev,
+                tool=tool_key,
+                sort_by=sort_by or "severity",
+            )
+        prompt = _build_ai_prompt(
+            selected,
+            language=language,
+            policy_path=policy_path or DEFAULT_FINDING_POLICY_PATH,
+            max_findings=max_findings,
+            min_severity=min_sev,
+            tool=tool_key,
+            sort_by=sort_by or "severity",
+        )
+        body = {
+            "prompt": prompt,
+            "findings_count": meta["included"],
+            "total_findings": meta["total"],
+            "matched_findings": meta["matched"],
+            "included_by_severity": meta["included_by_severity"],
+            "language": language,
+            "policy_path": policy_path or DEFAULT_FINDING_POLICY_PATH,
+            "max_findings": max_findings,
+            "min_severity": min_sev,
+            "tool": tool_key,
+            "sort_by": sort_by or "severity",
+        }
+        findings_query_cache.put(cache_key, body, weight=len(selected))
+    return JSONResponse(content=body, headers=conditional_headers(etag))
@@ -5,7 +5,7 @@ This module defines the FastAPI routes for scan operations.
 Routes support both authenticated and guest users via ActorContext.
 """
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse
 from fastapi import status as fastapi_status
 import asyncio
@@ -70,6 +70,8 @@ import re
 
 # Import dependency injection container
 from infrastructure.container import get_scan_service, get_scan_steps_repository, get_user_service, get_scan_repository
+from infrastructure.realtime.step_event_buffer import step_event_buffer
+from shared.steps_log import STEPS_LOG_FILENAME, read_steps
 from domain.repositories.scan_repository import ScanRepository
 from domain.entities.target_type import TargetType
 
@@ -295,49 +297,19 @@ def _require_scan_owner(dto: ScanDTO, actor: ActorContext) -> None:
 
 def _read_deduplicated_steps(scan_id: str) -> tuple[List[Dict[str, Any]], int, int]:
     """
-    Read and deduplicate steps from steps.log file.
+    Read current step state from steps.log (latest snapshot + deltas, see shared.steps_log).
     Returns: (steps_list, total_steps, completed_steps)
     """
     from config.settings import settings
     
     results_dir = Path(settings.RESULTS_DIR_HOST if hasattr(settings, 'RESULTS_DIR_HOST') else "/app/results")
-    steps_log_path = results_dir / scan_id / "logs" / "steps.log"
+    steps_log_path = results_dir / scan_id / "logs" / STEPS_LOG_FILENAME
     
-    if not steps_log_path.exists():
-        return [], 0, 0
-    
-    # Use a dict to track the latest status for each step number
-    steps_dict = {}
     try:
-        with open(steps_log_path, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('{"init"'):
-                    continue
-                try:
-                    step_data = json.loads(line)
-                    # Filter out init messages and only include actual step entries
-                    if "step_name" in step_data or "name" in step_data:
-                        step_number = step_data.get("number")
-                        if step_number is not None:
-                            # Get timestamp for comparison
-                            timestamp_str = step_data.get("timestamp", "")
-                            # Keep the entry with the latest timestamp for each step number
-                            if step_number not in steps_dict:
-                                steps_dict[step_number] = step_data
-                            else:
-                                # Compare timestamps to keep the latest
-                                existing_timestamp = steps_dict[step_number].get("timestamp", "")
-                                if timestamp_str > existing_timestamp:
-                                    steps_dict[step_number] = step_data
-                except json.JSONDecodeError:
-                    continue
+        steps = read_steps(steps_log_path)
     except Exception:
         return [], 0, 0
     
-    # Convert dict to sorted list by step number
-    steps = [steps_dict[key] for key in sorted(steps_dict.keys())]
-    
     for step in steps:
         _enrich_step_duration_fields(step)
     
@@ -1024,13 +996,16 @@ def _summary_from_payload_or_scan(
     response_model=ScanFindingsResponseSchema,
     summary="Get scan findings (JSON)",
     description=(
-        "Return normalized findings from results/{scan_id}/summary/findings.json. "
-        "Falls back to embedded report data for older scans. Requires read access to the scan. "
+        "Return normalized findings from the scan's findings store (results/{scan_id}/summary/findings.db). "
+        "Older scans are imported once from findings.json or the report embed. Requires read access to the scan. "
         "Use limit and offset for pagination (stable sort: severity, path, rule_id). "
-        "Optional filters: severity (comma-separated), tool (exact), path_prefix, rule_id (regex)."
+        "Optional filters: severity (comma-separated), tool (exact), path_prefix, rule_id (regex). "
+        "Responses carry a strong ETag; send If-None-Match to get 304 when unchanged."
     ),
+    responses={304: {"description": "Not modified (If-None-Match)"}},
 )
 async def get_scan_findings(
+    request: Request,
     scan_id: str,
     limit: Optional[int] = Query(
         None,
@@ -1061,6 +1036,7 @@ async def get_scan_findings(
         tool=tool,
         path_prefix=path_prefix,
         rule_id=rule_id,
+        if_none_match=request.headers.get("if-none-match"),
     )
 
 
@@ -1143,6 +1119,11 @@ async def get_scan_steps(
 
     Primary source: ``scan_steps`` table (one row per step, no log dedup).
     Fallback: ``results/{scan_id}/logs/steps.log`` (legacy / no DB mirror).
+
+    ``event_epoch`` / ``event_seq``: live step delta the snapshot is known to include. The
+    database mirror is flushed in batches, so this is the position its latest flush covered
+    (``events``: buffered deltas after it, to apply on top of ``steps``), not the newest delta.
+    Clients apply ``scan_steps`` SSE events after that seq (see ``/{scan_id}/steps/events``).
     """
     try:
         from pathlib import Path
@@ -1150,8 +1131,12 @@ async def get_scan_steps(
         
         scan_dto = await scan_service.get_scan_by_id(scan_id)
         _require_scan_read(scan_dto, actor_context)
+        # Positions are read before the snapshot: it may already be ahead of them (re-applying
+        # those deltas in order is harmless) but never behind
+        event_epoch, event_seq = step_event_buffer.position(scan_id)
 
         steps_repo = get_scan_steps_repository()
+        db_epoch, db_seq = await steps_repo.get_event_position(scan_id)
         steps_raw = await steps_repo.get_steps_for_scan(scan_id)
         if steps_raw is not None and len(steps_raw) > 0:
             for step in steps_raw:
@@ -1168,10 +1153,13 @@ async def get_scan_steps(
                 "completed_steps": completed_steps,
                 "progress_percentage": progress_percentage,
                 "source": "database",
+                "event_epoch": db_epoch,
+                "event_seq": db_seq,
+                "events": step_event_buffer.since(scan_id, db_epoch, db_seq) or [],
             }
 
         results_dir = Path(settings.RESULTS_DIR_HOST if hasattr(settings, 'RESULTS_DIR_HOST') else "/app/results")
-        steps_log_path = results_dir / scan_id / "logs" / "steps.log"
+        steps_log_path = results_dir / scan_id / "logs" / STEPS_LOG_FILENAME
         
         if not steps_log_path.exists():
             return {
@@ -1182,6 +1170,8 @@ async def get_scan_steps(
                 "progress_percentage": 0,
                 "message": "Steps log file not found (scan may not have started yet)",
                 "source": "file",
+                "event_epoch": event_epoch,
+                "event_seq": event_seq,
             }
         
         steps, total_steps, completed_steps = _read_deduplicated_steps(scan_id)
@@ -1194,6 +1184,8 @@ async def get_scan_steps(
             "completed_steps": completed_steps,
             "progress_percentage": progress_percentage,
             "source": "file",
+            "event_epoch": event_epoch,
+            "event_seq": event_seq,
         }
         
     except ScanNotFoundException as e:
@@ -1210,6 +1202,43 @@ async def get_scan_steps(
         )
 
 
+@router.get(
+    "/{scan_id}/steps/events",
+    summary="Catch up on live step events",
+    description=(
+        "Step deltas after ``after_seq`` in scanner epoch ``epoch`` (from the last scan_steps SSE "
+        "event or GET /steps). ``resync: true`` means the gap is no longer buffered: reload GET /steps."
+    ),
+    response_description="Buffered step events",
+)
+async def get_scan_step_events(
+    scan_id: str,
+    epoch: Optional[str] = Query(None, description="Scanner event epoch the client last saw"),
+    after_seq: int = Query(0, ge=0, description="Last applied event seq"),
+    actor_context: ActorContext = Depends(get_actor_context),
+    scan_service: ScanService = Depends(get_scan_service_dependency),
+) -> Dict[str, Any]:
+    try:
+        scan_dto = await scan_service.get_scan_by_id(scan_id)
+        _require_scan_read(scan_dto, actor_context)
+    except ScanNotFoundException as e:
+        raise HTTPException(
+            status_code=fastapi_status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+    current_epoch, _ = step_event_buffer.position(scan_id)
+    events = step_event_buffer.since(scan_id, epoch, after_seq)
+    return {
+        "scan_id": scan_id,
+        "epoch": current_epoch,
+        "events": [
+            {k: e[k] for k in ("epoch", "seq", "step", "substep") if k in e} for e in events or []
+        ],
+        "resync": events is None,
+    }
+
+
 @router.post(
     "/{scan_id}/cancel",
     response_model=ScanResponseSchema,
@@ -269,6 +269,9 @@ async def revoke_api_key(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="API key not found"
             )
+        from infrastructure.redis.principal_cache import api_key_tag, publish_invalidation
+
+        await publish_invalidation(api_key_tag(key_id))
         await AuditLogService.log_event(
             user_id=actor_context.user_id,
             user_email=actor_context.email,
@@ -1533,10 +1536,12 @@ async def get_target_scan_history(
     summary="Get findings for a target",
     description=(
         "Return findings for the latest finished scan on this target, or for scan_id if provided. "
-        "Does not start a new scan."
+        "Does not start a new scan. Supports If-None-Match (strong ETag per scan findings and query)."
     ),
+    responses={304: {"description": "Not modified (If-None-Match)"}},
 )
 async def get_target_findings(
+    request: Request,
     target_id: str,
     scan_id: Optional[str] = Query(
         None,
@@ -1596,6 +1601,7 @@ async def get_target_findings(
         tool=tool,
         path_prefix=path_prefix,
         rule_id=rule_id,
+        if_none_match=request.headers.get("if-none-match"),
     )
 
 
@@ -130,7 +130,8 @@ async def github_webhook(
                 user_id=repo.user_id,
                 scanners=repo.scanners if repo.scanners else None,
                 commit_hash=commit_hash,
-                metadata={"webhook_event": x_github_event, "webhook_delivery": x_github_delivery}
+                metadata={"webhook_event": x_github_event, "webhook_delivery": x_github_delivery},
+                diff_base=True,
             )
             
             if scan_id:
@@ -232,7 +233,8 @@ async def generic_webhook(
             user_id=user_id,
             scanners=repo.scanners if repo.scanners else None,
             commit_hash=webhook_data.commit,
-            metadata={"webhook_event": webhook_data.event, "webhook_type": "generic"}
+            metadata={"webhook_event": webhook_data.event, "webhook_type": "generic"},
+            diff_base=True,
         )
         
         if scan_id:
@@ -421,7 +421,7 @@ class ScanFindingsResponseSchema(BaseModel):
     )
     source: str = Field(
         default="file",
-        description="findings source: file (findings.json), html (legacy embed), or empty",
+        description="findings source: store (findings.db), file (imported from findings.json), html (imported from legacy embed), or empty",
     )
 
 
@@ -1,13 +1,21 @@
-"""Load scan findings from results/summary/findings.json (or HTML fallback)."""
+"""Per-scan findings store (results/summary/findings.db); findings.json / summary.html for older scans."""
 from __future__ import annotations
 
+import base64
+import gzip
 import json
+import logging
 import re
+import sqlite3
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from config.settings import get_settings
+from shared.findings_store import FINDINGS_DB_FILENAME, FindingsStore, write_findings_db
+
+logger = logging.getLogger(__name__)
 
 
 def findings_json_path(scan_id: str) -> Path:
@@ -16,19 +24,30 @@ def findings_json_path(scan_id: str) -> Path:
     return base / scan_id / "summary" / "findings.json"
 
 
-def _extract_findings_from_report_html(html_path: Path) -> List[Dict[str, Any]]:
+def findings_db_path(scan_id: str) -> Path:
+    return findings_json_path(scan_id).with_name(FINDINGS_DB_FILENAME)
+
+
+def _decode_script_payload(attrs: str, raw: str) -> str:
+    """Text of an embedded JSON payload; summary.html may store it gzip+base64 encoded."""
+    if 'data-encoding="gzip+base64"' not in attrs:
+        return raw
     try:
-        text = html_path.read_text(encoding="utf-8", errors="replace")
-    except OSError:
-        return []
+        return gzip.decompress(base64.b64decode(raw)).decode("utf-8")
+    except (ValueError, OSError, EOFError):
+        return ""
+
+
+def extract_findings_from_report_html_text(text: str) -> List[Dict[str, Any]]:
+    """Findings embedded in summary.html (report-findings-data preferred, findings-data in older reports)."""
     for script_id in ("report-findings-data", "findings-data"):
         match = re.search(
-            rf'<script[^>]*\sid="{re.escape(script_id)}"[^>]*>\s*([\s\S]*?)\s*</script>',
+            rf'<script([^>]*\sid="{re.escape(script_id)}"[^>]*)>\s*([\s\S]*?)\s*</script>',
             text,
         )
         if not match:
             continue
-        raw = match.group(1).strip()
+        raw = _decode_script_payload(match.group(1), match.group(2).strip())
         if not raw:
             continue
         try:
@@ -40,6 +59,14 @@ def _extract_findings_from_report_html(html_path: Path) -> List[Dict[str, Any]]:
     return []
 
 
+def _extract_findings_from_report_html(html_path: Path) -> List[Dict[str, Any]]:
+    try:
+        text = html_path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return []
+    return extract_findings_from_report_html_text(text)
+
+
 def load_findings_payload(scan_id: str) -> Tuple[Optional[Dict[str, Any]], str]:
     """
     Load findings document for a scan.
@@ -73,3 +100,66 @@ def load_findings_payload(scan_id: str) -> Tuple[Optional[Dict[str, Any]], str]:
             }, "html"
 
     return None, "missing"
+
+
+def _imported_db_path(scan_id: str) -> Path:
+    """Import target for older scans when the results volume is read-only."""
+    return Path(tempfile.gettempdir()) / "ssc-findings" / f"{Path(scan_id).name}.db"
+
+
+def open_findings_store(scan_id: str) -> Tuple[Optional[FindingsStore], str]:
+    """
+    Open the scan's findings store (caller closes it).
+
+    Scans reported before the store existed are imported once from findings.json or the
+    summary.html embed; if the results volume is read-only the import goes to the temp dir.
+    Returns (store, source) where source is 'store', 'file', 'html', or 'missing'.
+    """
+    db_path = findings_db_path(scan_id)
+    store = FindingsStore.open(db_path)
+    if store is not None:
+        return store, "store"
+    fallback_path = _imported_db_path(scan_id)
+    store = FindingsStore.open(fallback_path)
+    if store is not None:
+        return store, "store"
+
+    payload, source = load_findings_payload(scan_id)
+    if payload is None:
+        return None, "missing"
+    for target in (db_path, fallback_path):
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            write_findings_db(
+                target,
+                payload.get("findings") or [],
+                summary=payload.get("summary"),
+                generated_at=payload.get("generated_at"),
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("findings store import to %s failed: %s", target, e)
+            continue
+        store = FindingsStore.open(target)
+        if store is not None:
+            return store, source
+    return None, "missing"
+
+
+def findings_store_version(scan_id: str) -> Optional[str]:
+    """
+    Version tag of the scan's findings store ("<mtime_ns>-<size>"), importing older scans first.
+    Changes whenever the report is regenerated; None if the scan has no findings yet.
+    """
+    for attempt in range(2):
+        for path in (findings_db_path(scan_id), _imported_db_path(scan_id)):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            return f"{st.st_mtime_ns:x}-{st.st_size:x}"
+        if attempt == 0:
+            store, _source = open_findings_store(scan_id)
+            if store is None:
+                return None
+            store.close()
+    return None
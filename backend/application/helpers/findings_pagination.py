@@ -60,7 +60,7 @@ def filter_findings_by_severity(
     ]
 
 
-def _compile_rule_id_pattern(rule_id: Optional[str]) -> Optional[re.Pattern[str]]:
+def compile_rule_id_pattern(rule_id: Optional[str]) -> Optional[re.Pattern[str]]:
     raw = (rule_id or "").strip()
     if not raw:
         return None
@@ -101,7 +101,7 @@ def filter_findings_by_rule_id(
     items: Sequence[ScanFindingItemSchema],
     rule_id: Optional[str],
 ) -> List[ScanFindingItemSchema]:
-    pattern = _compile_rule_id_pattern(rule_id)
+    pattern = compile_rule_id_pattern(rule_id)
     if pattern is None:
         return list(items)
     return [
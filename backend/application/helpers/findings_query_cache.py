@@ -0,0 +1,59 @@
+"""
+Bounded LRU of built findings responses and AI prompts.
+
+Keys include the scan's findings store version (findings_file.findings_store_version), so a
+regenerated report never serves stale entries; old versions simply age out.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 256
+# Upper bound on findings held across all cached entries (unpaginated responses are large)
+DEFAULT_MAX_FINDINGS = 50_000
+
+
+class FindingsQueryCache:
+    """LRU keyed by (kind, scan_id, store version, query params); weight = findings in the entry."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_findings: int = DEFAULT_MAX_FINDINGS):
+        self.max_entries = max_entries
+        self.max_findings = max_findings
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._weight = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, weight: int = 1) -> None:
+        weight = max(1, weight)
+        if weight > self.max_findings:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._weight -= old[1]
+            self._entries[key] = (value, weight)
+            self._weight += weight
+            while self._entries and (len(self._entries) > self.max_entries or self._weight > self.max_findings):
+                _, (_, w) = self._entries.popitem(last=False)
+                self._weight -= w
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+findings_query_cache = FindingsQueryCache()
@@ -1,4 +1,4 @@
-"""Build API findings response from stored payload and scan DTO."""
+"""Build API findings response from the scan's findings store and scan DTO."""
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
@@ -9,44 +9,19 @@ from api.schemas.scan_schemas import (
     ScanFindingsSummarySchema,
 )
 from application.dtos.scan_dto import ScanDTO
-from application.helpers.findings_file import load_findings_payload
+from application.helpers.findings_file import open_findings_store
 from application.helpers.findings_pagination import (
-    apply_findings_filters,
     build_pagination_meta,
+    compile_rule_id_pattern,
     findings_filters_active,
-    paginate_findings,
     parse_severity_filter,
-    sort_findings,
 )
 
 
 def finding_item_from_dict(raw: Dict[str, Any]) -> ScanFindingItemSchema:
-    from shared.finding_normalize import normalize_finding_fields
+    from shared.findings_store import finding_row
 
-    fields = normalize_finding_fields(raw) if isinstance(raw, dict) else {}
-    cwe = raw.get("cwe") or raw.get("CWE") or raw.get("cwe_id")
-    fix_hint = raw.get("fix_hint") or raw.get("remediation") or raw.get("fix")
-    policy_key = str(raw.get("policy_key") or "").strip()
-    if not policy_key:
-        try:
-            from scanner.core.policy_schema_registry import display_name_to_policy_key
-
-            tool_name = str(raw.get("tool") or "").strip()
-            policy_key = display_name_to_policy_key().get(tool_name, "")
-        except ImportError:
-            policy_key = ""
-
-    return ScanFindingItemSchema(
-        tool=str(raw.get("tool") or ""),
-        policy_key=policy_key,
-        severity=str(raw.get("severity") or fields.get("severity") or ""),
-        path=str(fields.get("path") or raw.get("path") or raw.get("file") or ""),
-        line=str(fields.get("line") or raw.get("line") or raw.get("line_number") or ""),
-        message=str(fields.get("message") or raw.get("message") or ""),
-        rule_id=str(fields.get("rule_id") or raw.get("rule_id") or raw.get("check_id") or ""),
-        cwe=str(cwe) if cwe else None,
-        fix_hint=str(fix_hint) if fix_hint else None,
-    )
+    return ScanFindingItemSchema(**finding_row(raw))
 
 
 def summary_from_payload_or_scan(
@@ -84,9 +59,9 @@ def build_findings_response(
     path_prefix: Optional[str] = None,
     rule_id: Optional[str] = None,
 ) -> Optional[ScanFindingsResponseSchema]:
-    """Return findings response if report data exists; else None."""
-    payload, source = load_findings_payload(scan_id)
-    if payload is None:
+    """Return findings response if report data exists; else None. Filters and paging run in the findings store."""
+    store, source = open_findings_store(scan_id)
+    if store is None:
         return None
 
     status = status_str or (
@@ -94,27 +69,20 @@ def build_findings_response(
         if hasattr(scan_dto.status, "value")
         else str(scan_dto.status or "")
     )
-    raw_findings = payload.get("findings") if isinstance(payload, dict) else []
-    if not isinstance(raw_findings, list):
-        raw_findings = []
-
-    items = [
-        finding_item_from_dict(f) for f in raw_findings if isinstance(f, dict)
-    ]
-    items = sort_findings(items)
-
     severity_set = parse_severity_filter(severity)
-    filtered = apply_findings_filters(
-        items,
-        severities=severity_set,
-        tool=tool,
-        path_prefix=path_prefix,
-        rule_id=rule_id,
-    )
-    total = len(filtered)
-    page = paginate_findings(filtered, limit=limit, offset=offset)
-
-    generated_at = payload.get("generated_at") if isinstance(payload, dict) else None
+    pattern = compile_rule_id_pattern(rule_id)
+    with store:
+        total, rows = store.query(
+            limit=limit,
+            offset=offset,
+            severities=severity_set,
+            tool=tool,
+            path_prefix=path_prefix,
+            rule_id_match=pattern.search if pattern is not None else None,
+        )
+        generated_at = store.generated_at
+        payload_summary = store.summary
+    page = [ScanFindingItemSchema(**row) for row in rows]
 
     pagination = None
     if findings_filters_active(
@@ -142,10 +110,7 @@ def build_findings_response(
         status=str(status).lower(),
         generated_at=str(generated_at) if generated_at else None,
         findings=page,
-        summary=summary_from_payload_or_scan(
-            payload.get("summary") if isinstance(payload, dict) else None,
-            scan_dto,
-        ),
+        summary=summary_from_payload_or_scan(payload_summary, scan_dto),
         pagination=pagination,
         source=source,
     )
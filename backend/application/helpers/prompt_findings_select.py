@@ -104,3 +104,45 @@ def select_findings_for_prompt(
         "included_by_severity": count_by_severity(selected),
     }
     return selected, meta
+
+
+def select_findings_for_prompt_from_store(
+    store: Any,
+    *,
+    max_findings: int = 100,
+    min_severity: str = "HIGH",
+    tool: Optional[str] = None,
+    sort_by: str = "severity",
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Same selection as select_findings_for_prompt, run as queries on a FindingsStore."""
+    tool_key = (tool or "").strip()
+    key = (min_severity or "ALL").strip().upper()
+    filters: Dict[str, Any] = {"tool_exact": tool_key or None}
+    if key != "ALL":
+        filters["max_severity_rank"] = MIN_SEVERITY_THRESHOLD.get(key, 1)
+    order = (sort_by or "severity").strip().lower()
+    cap = max(1, int(max_findings))
+    matched, selected = store.query(
+        order=order if order in ("tool", "path") else "severity",
+        limit=cap,
+        **filters,
+    )
+    meta = {
+        "total": store.count(),
+        "matched": matched,
+        "included": len(selected),
+        "min_severity": (min_severity or "HIGH").upper(),
+        "tool": tool_key or None,
+        "sort_by": sort_by or "severity",
+        "matched_by_severity": _severity_buckets(store.severity_counts(**filters)),
+        "included_by_severity": count_by_severity(selected),
+    }
+    return selected, meta
+
+
+def _severity_buckets(counts: Dict[str, int]) -> Dict[str, int]:
+    buckets: Dict[str, int] = {k: 0 for k in SEV_ORDER}
+    for sev, n in counts.items():
+        key = normalize_severity(sev)
+        buckets[key] = buckets.get(key, 0) + n
+    return buckets
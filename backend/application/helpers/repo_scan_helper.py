@@ -6,7 +6,7 @@ Helper functions for creating scans for GitHub repositories.
 from typing import Optional, Dict, Any
 import logging
 
-from domain.entities.scan import ScanType
+from domain.entities.scan import ScanStatus, ScanType
 from domain.entities.target_type import TargetType
 from application.dtos.request_dto import ScanRequestDTO
 from application.services.scan_service import ScanService
@@ -14,6 +14,30 @@ from application.services.scan_service import ScanService
 logger = logging.getLogger(__name__)
 
 
+async def resolve_diff_base_scan_id(user_id: str, repo_url: str) -> Optional[str]:
+    """
+    Latest completed scan of this repo, used as base for a diff-only scan.
+
+    The scanner checks per tool that the base ran with the same version/config and falls back
+    to a full scan otherwise, so any completed scan is a safe candidate.
+    """
+    from config.settings import settings
+
+    if not settings.AUTO_SCAN_DIFF_MODE:
+        return None
+    try:
+        from infrastructure.container import get_scan_repository
+        last = await get_scan_repository().find_latest_finished_scan_by_user_and_target(
+            user_id, repo_url
+        )
+    except Exception as e:
+        logger.warning("Could not resolve diff base scan for %s: %s", repo_url, e)
+        return None
+    if not last or last.status != ScanStatus.COMPLETED:
+        return None
+    return str(last.id)
+
+
 async def create_repo_scan(
     repo_url: str,
     repo_name: str,
@@ -21,9 +45,15 @@ async def create_repo_scan(
     user_id: str,
     commit_hash: Optional[str] = None,
     scanners: Optional[list[str]] = None,
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = None,
+    diff_base: bool = False,
 ) -> Optional[str]:
-    """Create a scan for a GitHub repository."""
+    """
+    Create a scan for a GitHub repository.
+
+    diff_base: scan only files changed since the latest completed scan of the repo
+    (webhook pushes, periodic rescans); unchanged files keep that scan's findings.
+    """
     try:
         if scanners is None:
             from infrastructure.container import get_scanner_repository
@@ -66,6 +96,12 @@ async def create_repo_scan(
         if commit_hash:
             scan_metadata["commit_hash"] = commit_hash
 
+        if diff_base:
+            diff_base_scan_id = await resolve_diff_base_scan_id(user_id, repo_url)
+            if diff_base_scan_id:
+                config["diff_base_scan_id"] = diff_base_scan_id
+                scan_metadata["diff_base_scan_id"] = diff_base_scan_id
+
         scan_request = ScanRequestDTO(
             name=scan_name,
             description=description,
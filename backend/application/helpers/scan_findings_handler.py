@@ -3,12 +3,13 @@ from __future__ import annotations
 
 from typing import Optional
 
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
 from fastapi import status as fastapi_status
 
 from api.deps.actor_context import ActorContext
-from api.schemas.scan_schemas import ScanFindingsResponseSchema
-from application.helpers.findings_file import load_findings_payload
+from api.etag import conditional_headers, if_none_match_matches, not_modified, strong_etag
+from application.helpers.findings_file import findings_store_version
+from application.helpers.findings_query_cache import findings_query_cache
 from application.helpers.findings_response import build_findings_response
 from application.services.scan_service import ScanService
 from domain.entities.scan import ScanStatus
@@ -48,8 +49,14 @@ async def get_scan_findings_response(
     tool: Optional[str] = None,
     path_prefix: Optional[str] = None,
     rule_id: Optional[str] = None,
-) -> ScanFindingsResponseSchema:
-    """Load paginated findings for a scan; raises HTTPException on errors."""
+    if_none_match: Optional[str] = None,
+) -> Response:
+    """
+    Load paginated findings for a scan; raises HTTPException on errors.
+
+    Responses carry a strong ETag (store version + query); a matching If-None-Match gets 304
+    without touching the store, and built bodies are kept in findings_query_cache.
+    """
     try:
         scan_dto = await scan_service.get_scan_by_id(scan_id)
         _require_scan_read(scan_dto, actor_context)
@@ -60,15 +67,14 @@ async def get_scan_findings_response(
             else str(scan_dto.status or "")
         ).lower()
 
-        payload, _source = load_findings_payload(scan_id)
-        terminal = status_str in (
-            ScanStatus.COMPLETED.value,
-            ScanStatus.FAILED.value,
-            ScanStatus.CANCELLED.value,
-            ScanStatus.INTERRUPTED.value,
-        )
-
-        if payload is None:
+        version = findings_store_version(scan_id)
+        if version is None:
+            terminal = status_str in (
+                ScanStatus.COMPLETED.value,
+                ScanStatus.FAILED.value,
+                ScanStatus.CANCELLED.value,
+                ScanStatus.INTERRUPTED.value,
+            )
             if not terminal:
                 raise HTTPException(
                     status_code=fastapi_status.HTTP_409_CONFLICT,
@@ -82,23 +88,37 @@ async def get_scan_findings_response(
                 detail="Findings not found for this scan",
             )
 
-        response = build_findings_response(
-            scan_id,
-            scan_dto,
-            status_str=status_str,
-            limit=limit,
-            offset=offset,
-            severity=severity,
-            tool=tool,
-            path_prefix=path_prefix,
-            rule_id=rule_id,
-        )
-        if response is None:
-            raise HTTPException(
-                status_code=fastapi_status.HTTP_404_NOT_FOUND,
-                detail="Findings not found for this scan",
+        query = (limit, offset, severity, tool, path_prefix, rule_id)
+        etag = strong_etag("findings", scan_id, version, status_str, *query)
+        if if_none_match_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        cache_key = ("findings", scan_id, version, status_str, query)
+        cached = findings_query_cache.get(cache_key)
+        if cached is None:
+            response = build_findings_response(
+                scan_id,
+                scan_dto,
+                status_str=status_str,
+                limit=limit,
+                offset=offset,
+                severity=severity,
+                tool=tool,
+                path_prefix=path_prefix,
+                rule_id=rule_id,
             )
-        return response
+            if response is None:
+                raise HTTPException(
+                    status_code=fastapi_status.HTTP_404_NOT_FOUND,
+                    detail="Findings not found for this scan",
+                )
+            cached = response.model_dump_json().encode("utf-8")
+            findings_query_cache.put(cache_key, cached, weight=len(response.findings))
+        return Response(
+            content=cached,
+            media_type="application/json",
+            headers=conditional_headers(etag),
+        )
     except ScanNotFoundException as e:
         raise HTTPException(
             status_code=fastapi_status.HTTP_404_NOT_FOUND,
@@ -103,7 +103,19 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str = Field(description="JWT secret key (set JWT_SECRET_KEY in env)")
     JWT_ALGORITHM: str = Field(default="HS256", description="JWT signing algorithm")
     JWT_EXPIRATION_MINUTES: int = Field(default=1440, description="JWT token expiration in minutes")
-    
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: float = Field(
+        default=30.0,
+        ge=0,
+        le=600,
+        description="Per-process cache of resolved API keys / guest sessions (0 disables); revocations invalidate it via Redis",
+    )
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = Field(
+        default=10_000,
+        ge=0,
+        le=1_000_000,
+        description="Max cached principals per API process (least recently used dropped first)",
+    )
+
     # Authentication: AUTH_MODE = how to log in; ACCESS_MODE = who may use the system
     AUTH_MODE: str = Field(default="free", description="Authentication mode (login mechanism): free|basic|jwt")
     ACCESS_MODE: str = Field(default="public", description="Who may use the system: public (all open) | mixed (public scan/queue, login for dashboard) | private (login required for all)")
@@ -144,6 +156,8 @@ class Settings(BaseSettings):
     # Only used when user did not check/uncheck the box (config missing or None). If user explicitly unchecks = no collection always.
     COLLECT_METADATA_DEFAULT: bool = Field(default=False, description="When True: collect metadata if user did not set the option. When False (default): collect only if user checked the box. User unchecked = never collect. Env: COLLECT_METADATA_DEFAULT=true.")
     
+    AUTO_SCAN_DIFF_MODE: bool = Field(default=True, description="Webhook and periodic repo scans only analyse files changed since the latest completed scan of the repo (per-file scanners); other scanners still run in full. Env: AUTO_SCAN_DIFF_MODE=false for full scans.")
+    
     # Scanner assets (DBs, manifests, etc.): global auto-update; can be extended with per-asset or health (SonarQube, Docker) in DB
     SCANNER_ASSETS_AUTO_UPDATE_ENABLED: bool = Field(default=False, description="If True, scanner assets (e.g. vuln DBs) are auto-updated; else admins trigger updates manually.")
     # External Services
@@ -60,6 +60,9 @@ class Scan:
 
     # Results
     results: List[Dict[str, Any]] = field(default_factory=list)
+    # False when loaded without its scan_results payload (list/queue queries): results is not
+    # known then, and saving the scan must leave the stored payload alone
+    results_loaded: bool = field(default=True, repr=False, compare=False)
     total_vulnerabilities: int = 0
     critical_vulnerabilities: int = 0
     high_vulnerabilities: int = 0
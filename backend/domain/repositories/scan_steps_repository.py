@@ -1,6 +1,6 @@
 """Scan steps read repository (DDD port)."""
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class ScanStepsRepository(ABC):
@@ -14,3 +14,11 @@ class ScanStepsRepository(ABC):
         Each dict has keys: number, name, status, message, started_at, completed_at, substeps, timeout_seconds.
         """
         pass
+
+    @abstractmethod
+    async def get_event_position(self, scan_id: str) -> Tuple[Optional[str], int]:
+        """
+        Scanner step-event (epoch, seq) the scan_steps rows of a scan are known to include.
+        Returns (None, 0) when unknown (no rows, no live events, or table not available).
+        """
+        pass
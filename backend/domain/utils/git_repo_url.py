@@ -3,7 +3,8 @@ Normalize Git hosting *web* URLs (blob/tree views) to clone URLs for git ls-remo
 """
 from __future__ import annotations
 
-from typing import Optional
+import re
+from typing import Optional, Tuple
 from urllib.parse import urlparse
 
 from domain.entities.target_type import TargetType
@@ -78,3 +79,37 @@ def normalize_repo_url_for_target_type(target_type: str, url: Optional[str]) ->
     if target_type != TargetType.GIT_REPO.value:
         return url if url is not None else ""
     return normalize_git_repo_url(url or "")
+
+
+_GITHUB_SSH_RE = re.compile(r"^git@github\.com:([^/]+)/(.+)$", flags=re.IGNORECASE)
+
+
+def github_repo_owner_and_slug(url: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Lower-case (owner, "owner/repo") of a GitHub repository URL, for distinct repo/owner statistics.
+
+    Accepts https://github.com/owner/repo(.git)[/...] and git@github.com:owner/repo(.git);
+    anything else yields (None, None). Stored on scans at insert time (scans.repo_owner / repo_slug).
+    """
+    target = (url or "").strip()
+    if not target:
+        return None, None
+    ssh_match = _GITHUB_SSH_RE.match(target)
+    if ssh_match:
+        owner, repo = ssh_match.group(1).strip(), ssh_match.group(2).strip()
+    elif "://" in target:
+        parsed = urlparse(target)
+        if parsed.netloc.lower() != "github.com":
+            return None, None
+        parts = [p for p in parsed.path.split("/") if p]
+        if len(parts) < 2:
+            return None, None
+        owner, repo = parts[0].strip(), parts[1].strip()
+    else:
+        return None, None
+    if repo.lower().endswith(".git"):
+        repo = repo[:-4]
+    owner, repo = owner.lower(), repo.strip("/").lower()
+    if owner and repo:
+        return owner, f"{owner}/{repo}"
+    return owner or None, None
@@ -65,6 +65,8 @@ class ScanConfig:
     finding_policy: Optional[str] = None
     collect_metadata: Optional[bool] = None
     git_branch: Optional[str] = None
+    # Diff-only scan: earlier completed scan of the same repo (scanner/core/scan_diff.py)
+    diff_base_scan_id: Optional[str] = None
 
     # Scan profile (manifest-driven per plugin); see manifest.yaml scan_profiles
     scan_profile: str = ScanProfileName.STANDARD.value
@@ -145,6 +147,7 @@ class ScanConfig:
             'finding_policy': self.finding_policy,
             'collect_metadata': self.collect_metadata,
             'git_branch': self.git_branch,
+            'diff_base_scan_id': self.diff_base_scan_id,
             'scan_profile': self.scan_profile,
             'profile_tuning': self.profile_tuning,
         }
@@ -176,6 +179,7 @@ class ScanConfig:
             finding_policy=data.get('finding_policy'),
             collect_metadata=data.get('collect_metadata'),
             git_branch=data.get('git_branch'),
+            diff_base_scan_id=data.get('diff_base_scan_id'),
             scan_profile=data.get('scan_profile') or ScanProfileName.STANDARD.value,
             profile_tuning=data.get('profile_tuning') or {},
         )
@@ -211,6 +215,9 @@ class ScanConfig:
             finding_policy=other.finding_policy if other.finding_policy is not None else self.finding_policy,
             collect_metadata=other.collect_metadata if other.collect_metadata is not None else self.collect_metadata,
             git_branch=other.git_branch if other.git_branch is not None else self.git_branch,
+            diff_base_scan_id=(
+                other.diff_base_scan_id if other.diff_base_scan_id is not None else self.diff_base_scan_id
+            ),
             scan_profile=(
                 other.scan_profile
                 if other.scan_profile != ScanProfileName.STANDARD.value
@@ -4,7 +4,7 @@ Database Models
 This module defines the SQLAlchemy models for the refactored backend.
 Models represent the database schema and provide ORM functionality.
 """
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, Text, JSON, Enum as SQLEnum, ForeignKey, ARRAY
+from sqlalchemy import Column, String, Date, DateTime, Boolean, Integer, Text, JSON, Enum as SQLEnum, ForeignKey, ARRAY
 from sqlalchemy.dialects.postgresql import UUID, INET, ENUM as PG_ENUM
 from sqlalchemy.sql import func
 from sqlalchemy.orm import declarative_base, relationship
@@ -166,6 +166,9 @@ class Scan(Base):
     status = Column(ScanStatusEnumType, nullable=False, server_default="pending")
     target_url = Column(String(500), nullable=False)
     target_type = Column(String(50), nullable=False)
+    # GitHub owner / "owner/repo" of target_url (lower-case), set at insert for distinct-count statistics
+    repo_owner = Column(String(255), nullable=True)
+    repo_slug = Column(String(500), nullable=True)
     
     # Configuration
     scanners = Column(JSON, default=list)
@@ -179,8 +182,7 @@ class Scan(Base):
     scheduled_at = Column(DateTime, nullable=True)  # Scheduled start time (optional)
     last_heartbeat_at = Column(DateTime, nullable=True)  # Worker liveness while running
 
-    # Results
-    results = Column(JSON, default=list)
+    # Results (per-tool results JSON lives in scan_results, see ScanResults)
     total_vulnerabilities = Column(Integer, default=0, nullable=False)
     critical_vulnerabilities = Column(Integer, default=0, nullable=False)
     high_vulnerabilities = Column(Integer, default=0, nullable=False)
@@ -209,6 +211,36 @@ class Scan(Base):
         return f"<Scan(id={self.id}, name='{self.name}', status='{self.status}', target='{self.target_url}')>"
 
 
+class ScanResults(Base):
+    """Per-tool results JSON of a scan, kept out of the scans table so list/queue queries stay narrow."""
+
+    __tablename__ = "scan_results"
+
+    scan_id = Column(UUID(as_uuid=True), ForeignKey("scans.id", ondelete="CASCADE"), primary_key=True)
+    results = Column(JSON, default=list)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<ScanResults(scan_id={self.scan_id})>"
+
+
+class ScanDailyRollup(Base):
+    """Completed scans per created_at day and owner scope; maintained by a trigger on scans (migration 004)."""
+
+    __tablename__ = "scan_daily_rollups"
+
+    day = Column(Date, primary_key=True)
+    scope_key = Column(String(300), primary_key=True)  # "u:<user_id>", "g:<guest session_id>" or "-"
+    total_scans = Column(Integer, default=0, nullable=False)
+    repository_scans = Column(Integer, default=0, nullable=False)
+    container_scans = Column(Integer, default=0, nullable=False)
+    infrastructure_scans = Column(Integer, default=0, nullable=False)
+    web_application_scans = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<ScanDailyRollup(day={self.day}, scope_key='{self.scope_key}', total_scans={self.total_scans})>"
+
+
 class Vulnerability(Base):
     """Vulnerability database model."""
     
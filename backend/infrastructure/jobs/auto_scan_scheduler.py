@@ -159,6 +159,7 @@ class AutoScanScheduler:
                     "repo_id": next_repo["id"],
                     "scan_frequency_reason": next_repo.get("scan_reason"),
                 },
+                diff_base=True,
             )
             if scan_id:
                 logger.info(
@@ -4,6 +4,13 @@ Redis scan_events → bounded asyncio.Queue → delivery to per-user SSE (Level
 - IO (Redis PubSub) is decoupled from fan-out (sse_emit_envelope).
 - Backpressure: when the queue is full, the Redis listener awaits put() until space is free.
 - Uses pubsub.listen() (event-driven, blocks until data) instead of get_message() polling.
+
+Multiple API replicas: every replica runs this bridge with its own subscription, so each
+one receives every scan_events message and delivers it to the SSE connections it holds.
+Envelopes raised by route handlers on one replica (sse_notify) are relayed on
+SSE_RELAY_CHANNEL and delivered here by the others. Pub/sub is at-most-once: events are
+refresh hints, and step deltas missed during a reconnect are recovered via
+GET /scans/{id}/steps/events.
 """
 from __future__ import annotations
 
@@ -14,6 +21,7 @@ import time
 from typing import Any, Dict, Optional, Tuple
 
 from config.settings import get_settings
+from infrastructure.realtime.sse_notify import SSE_RELAY_CHANNEL
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +32,12 @@ _list_rev_memo: Dict[str, Tuple[float, str]] = {}
 _LIST_REV_MEMO_TTL_SEC = 2.5
 _LIST_REV_MEMO_MAX_KEYS = 2000
 
+# step_delta events (scanner step/substep changes) only need the scan's owners, which don't change
+STEP_DELTA_EVENT = "step_delta"
+_scan_owner_memo: Dict[str, Tuple[float, list[str]]] = {}
+_SCAN_OWNER_MEMO_TTL_SEC = 30.0
+_SCAN_OWNER_MEMO_MAX_KEYS = 2000
+
 
 async def _list_revision_for_sse(user_id: str) -> str:
     """Compute targets list_revision with per-user memoization (reduces DB load on event bursts)."""
@@ -94,14 +108,53 @@ async def _recipient_keys_for_scan_event(data: Dict[str, Any]) -> list[str]:
     return keys
 
 
+async def _step_delta_recipient_keys(data: Dict[str, Any]) -> list[str]:
+    """Owners of a scan for step_delta events, memoized briefly (a running scan emits many deltas)."""
+    scan_id = str(data.get("scan_id") or "")
+    now = time.monotonic()
+    row = _scan_owner_memo.get(scan_id)
+    if row is not None and (now - row[0]) < _SCAN_OWNER_MEMO_TTL_SEC:
+        return row[1]
+    keys = await _recipient_keys_for_scan_event({"scan_id": scan_id})
+    if not keys:
+        return keys
+    _scan_owner_memo[scan_id] = (now, keys)
+    if len(_scan_owner_memo) > _SCAN_OWNER_MEMO_MAX_KEYS:
+        cutoff = now - _SCAN_OWNER_MEMO_TTL_SEC
+        stale = [k for k, (t, _) in _scan_owner_memo.items() if t < cutoff]
+        for k in stale[: _SCAN_OWNER_MEMO_MAX_KEYS // 2]:
+            _scan_owner_memo.pop(k, None)
+    return keys
+
+
+async def _deliver_step_delta(data: Dict[str, Any]) -> None:
+    """Buffer a scanner step_delta for catch-up and push it as a scan_steps envelope to the scan owners."""
+    from infrastructure.realtime.sse_notify import make_envelope, sse_emit_envelope
+    from infrastructure.realtime.step_event_buffer import step_event_buffer
+
+    if not step_event_buffer.record(data):
+        return
+    recipient_keys = await _step_delta_recipient_keys(data)
+    if not recipient_keys:
+        return
+    payload = {k: data[k] for k in ("scan_id", "epoch", "seq", "step", "substep") if k in data}
+    envelope = make_envelope("scan_steps", "scan", payload)
+    for key in recipient_keys:
+        await sse_emit_envelope(key, envelope)
+
+
 async def _deliver_scan_event_payload(data: Dict[str, Any]) -> None:
-    """Resolve owners, emit scan_update to each, broadcast queue_update."""
+    """Resolve owners, emit scan_update to each, broadcast queue_update (step deltas: scan_steps only)."""
     from infrastructure.realtime.sse_notify import (
         make_envelope,
         sse_emit_envelope,
         sse_notify_queue_changed,
     )
 
+    if data.get("type") == STEP_DELTA_EVENT:
+        await _deliver_step_delta(data)
+        return
+
     recipient_keys = await _recipient_keys_for_scan_event(data)
     if not recipient_keys:
         logger.warning(
@@ -136,12 +189,30 @@ async def _deliver_scan_event_payload(data: Dict[str, Any]) -> None:
     for key in recipient_keys:
         await sse_emit_envelope(key, envelope)
 
+    # Every replica receives scan_events, so each only notifies its own connections
     await sse_notify_queue_changed(
         reason=str(data.get("type") or data.get("status") or "updated"),
         scan_id=str(data.get("scan_id")) if data.get("scan_id") else None,
+        relay=False,
     )
 
 
+async def _deliver_relayed_envelope(data: Dict[str, Any]) -> None:
+    """Envelope emitted by a route handler on another replica: deliver to local connections only."""
+    from infrastructure.realtime.sse_manager import sse_broadcast_envelope, sse_emit_envelope
+    from infrastructure.realtime.sse_notify import REPLICA_ID
+
+    envelope = data.get("envelope")
+    if data.get("origin") == REPLICA_ID or not isinstance(envelope, dict):
+        return
+    key = data.get("key")
+    # Local puts never block, so relays are delivered inline instead of via the scan_events queue
+    if key:
+        await sse_emit_envelope(str(key), envelope)
+    else:
+        await sse_broadcast_envelope(envelope)
+
+
 async def _redis_io_loop(
     pubsub: Any,
     queue: "asyncio.Queue[Dict[str, Any]]",
@@ -169,6 +240,9 @@ async def _redis_io_loop(
                 continue
             if not isinstance(data, dict):
                 continue
+            if raw.get("channel") == SSE_RELAY_CHANNEL:
+                await _deliver_relayed_envelope(data)
+                continue
             await queue.put(data)
     except asyncio.CancelledError:
         raise
@@ -178,7 +252,7 @@ async def _redis_io_loop(
     finally:
         stop.set()
         try:
-            await pubsub.unsubscribe(SCAN_EVENTS_CHANNEL)
+            await pubsub.unsubscribe(SCAN_EVENTS_CHANNEL, SSE_RELAY_CHANNEL)
         except Exception:
             logger.debug("pubsub unsubscribe failed", exc_info=True)
         try:
@@ -191,39 +265,13 @@ async def _delivery_loop(
     queue: "asyncio.Queue[Dict[str, Any]]",
     stop: asyncio.Event,
 ) -> None:
-    """Consume parsed events from the queue and fan out to SSE.
-    
-    Optimierte Version ohne asyncio.wait() Overhead:
-    Nutzt asyncio.as_completed() statt wait() für minimalen Event Loop Last
-    """
+    """Consume parsed events from the queue and fan out to SSE (cancelled by run_redis_sse_bridge)."""
     while not stop.is_set():
+        data = await queue.get()
         try:
-            # Warte gleichzeitig auf Stop Event oder neue Nachricht
-            get_task = asyncio.create_task(queue.get())
-            stop_task = asyncio.create_task(stop.wait())
-            
-            for coro in asyncio.as_completed([get_task, stop_task]):
-                result = await coro
-                if coro is stop_task:
-                    get_task.cancel()
-                    try:
-                        await get_task
-                    except asyncio.CancelledError:
-                        pass
-                    return
-                if coro is get_task:
-                    stop_task.cancel()
-                    try:
-                        await stop_task
-                    except asyncio.CancelledError:
-                        pass
-                    data = result
-                    break
-            
             await _deliver_scan_event_payload(data)
-            
         except asyncio.CancelledError:
-            break
+            raise
         except Exception:
             logger.exception("SSE Redis bridge: delivery failed")
             await asyncio.sleep(0.5)
@@ -237,7 +285,7 @@ async def run_redis_sse_bridge(stop: asyncio.Event) -> None:
         logger.warning("SSE Redis bridge not started: %s", e)
         return
 
-    pair = await redis_client.subscribe(SCAN_EVENTS_CHANNEL)
+    pair = await redis_client.subscribe(SCAN_EVENTS_CHANNEL, SSE_RELAY_CHANNEL)
     if pair is None:
         logger.warning("SSE Redis bridge: subscribe returned None")
         return
@@ -246,23 +294,23 @@ async def run_redis_sse_bridge(stop: asyncio.Event) -> None:
     maxsize = get_settings().SSE_REDIS_BRIDGE_QUEUE_MAX
     queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue(maxsize=maxsize)
     logger.info(
-        "SSE Redis bridge: queue maxsize=%s channel=%s (listen + delivery)",
+        "SSE Redis bridge: queue maxsize=%s channels=%s,%s (listen + delivery)",
         maxsize,
         SCAN_EVENTS_CHANNEL,
+        SSE_RELAY_CHANNEL,
     )
 
     io_task = asyncio.create_task(_redis_io_loop(pubsub, queue, stop), name="redis_scan_events_io")
     delivery_task = asyncio.create_task(_delivery_loop(queue, stop), name="redis_scan_events_delivery")
 
     try:
-        await asyncio.gather(io_task, delivery_task)
-    except asyncio.CancelledError:
+        # Either loop ending (listen error, stop) or cancellation ends the bridge
+        await asyncio.wait({io_task, delivery_task}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
         stop.set()
         io_task.cancel()
         delivery_task.cancel()
         await asyncio.gather(io_task, delivery_task, return_exceptions=True)
-        raise
-    finally:
         try:
             await pub_redis.close()
         except Exception:
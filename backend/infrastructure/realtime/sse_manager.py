@@ -1,70 +1,143 @@
 """
-In-process SSE fan-out: one asyncio.Queue per open EventSource, keyed by user_id.
+In-process SSE fan-out: one SseConnection per open EventSource, keyed by subscriber key
+(user_id or guest:<session_id>).
+
+- Registry: subscriber keys are spread over a fixed number of shards (dict of sets). All
+  mutations are synchronous, so on the event loop they need no lock and emits never wait on
+  subscribe/unsubscribe; broadcasts walk the registry shard by shard.
+- Backpressure: each connection keeps at most SSE_QUEUE_MAX_PER_CONNECTION pending envelopes.
+  Envelopes that supersede each other (the latest scan_update for a scan, queue_update, …)
+  replace the pending one in place instead of queueing up; when the buffer is still full the
+  oldest pending envelope is dropped (clients treat these events as refresh hints).
 
 Each HTTP client must call sse_unsubscribe in a finally block when the stream ends
-(client disconnect, task cancel) so queues are not leaked.
+(client disconnect, task cancel) so connections are not leaked.
+
+Delivery is local to this process; see redis_sse_bridge for fan-out across API replicas.
 """
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
-from collections import defaultdict
-from typing import Any, DefaultDict, Dict, List
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterator, List, Set
 
 from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
-_lock = asyncio.Lock()
-_subscribers: DefaultDict[str, List[asyncio.Queue]] = defaultdict(list)
+SHARD_COUNT = 16
+
+_unique = itertools.count()
+
+
+def coalesce_key(envelope: Dict[str, Any]) -> Hashable:
+    """
+    Pending-slot key: envelopes with equal keys supersede each other (latest wins).
+
+    scan_update / queue_update per scan, target_update per target (list refetch hints share
+    one slot); everything else (scan_steps deltas, system) gets a unique key and stays in order.
+    """
+    typ = envelope.get("type")
+    payload = envelope.get("payload")
+    if not isinstance(payload, dict):
+        return next(_unique)
+    if typ in ("scan_update", "queue_update"):
+        return (typ, payload.get("scan_id"))
+    if typ == "target_update":
+        target = payload.get("target")
+        target_id = payload.get("target_id") or (target.get("id") if isinstance(target, dict) else None)
+        return (typ, target_id)
+    return next(_unique)
+
+
+class SseConnection:
+    """Pending envelopes of one EventSource, coalesced by coalesce_key and bounded by maxsize."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._pending: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._ready = asyncio.Event()
+
+    def qsize(self) -> int:
+        return len(self._pending)
+
+    def put_nowait(self, envelope: Dict[str, Any]) -> bool:
+        """Queue or coalesce one envelope; returns False when an older pending one had to be dropped."""
+        key = coalesce_key(envelope)
+        if key in self._pending:
+            self._pending[key] = envelope
+            return True
+        fits = len(self._pending) < self.maxsize
+        if not fits:
+            self._pending.popitem(last=False)
+            self.dropped += 1
+        self._pending[key] = envelope
+        self._ready.set()
+        return fits
 
+    async def get(self) -> Dict[str, Any]:
+        while not self._pending:
+            self._ready.clear()
+            await self._ready.wait()
+        _, envelope = self._pending.popitem(last=False)
+        return envelope
 
-async def sse_subscribe(user_id: str) -> asyncio.Queue:
-    maxsize = get_settings().SSE_QUEUE_MAX_PER_CONNECTION
-    q: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
-    async with _lock:
-        _subscribers[user_id].append(q)
-    return q
 
+_shards: List[Dict[str, Set[SseConnection]]] = [{} for _ in range(SHARD_COUNT)]
 
-async def sse_unsubscribe(user_id: str, q: asyncio.Queue) -> None:
-    async with _lock:
-        lst = _subscribers.get(user_id)
-        if not lst:
-            return
-        if q in lst:
-            lst.remove(q)
-        if not lst:
-            del _subscribers[user_id]
 
+def _shard(subscriber_key: str) -> Dict[str, Set[SseConnection]]:
+    return _shards[hash(subscriber_key) % SHARD_COUNT]
 
-def _put_envelope_on_queues(queues: List[asyncio.Queue], envelope: Dict[str, Any], label: str) -> None:
-    for q in queues:
-        try:
-            q.put_nowait(envelope)
-        except asyncio.QueueFull:
+
+def _all_connections() -> Iterator[SseConnection]:
+    for shard in _shards:
+        # Snapshot each shard's sets; subscribe/unsubscribe may run between emits
+        for conns in list(shard.values()):
+            yield from list(conns)
+
+
+def subscriber_count() -> int:
+    return sum(len(conns) for shard in _shards for conns in shard.values())
+
+
+async def sse_subscribe(user_id: str) -> SseConnection:
+    conn = SseConnection(get_settings().SSE_QUEUE_MAX_PER_CONNECTION)
+    _shard(user_id).setdefault(user_id, set()).add(conn)
+    return conn
+
+
+async def sse_unsubscribe(user_id: str, conn: SseConnection) -> None:
+    shard = _shard(user_id)
+    conns = shard.get(user_id)
+    if not conns:
+        return
+    conns.discard(conn)
+    if not conns:
+        del shard[user_id]
+
+
+def _put_envelope(conns, envelope: Dict[str, Any], label: str) -> None:
+    for conn in conns:
+        if not conn.put_nowait(envelope):
             logger.warning(
-                "SSE queue full for %s, dropping event %s",
+                "SSE buffer full for %s, dropped oldest pending event (%s dropped on this connection)",
                 label,
-                envelope.get("type"),
+                conn.dropped,
             )
 
 
 async def sse_emit_envelope(subscriber_key: str, envelope: Dict[str, Any]) -> None:
-    """Push one envelope to all connections for this subscriber key (user_id or guest:session_id)."""
-    async with _lock:
-        queues = list(_subscribers.get(subscriber_key, []))
-    if not queues:
+    """Push one envelope to all local connections for this subscriber key (user_id or guest:session_id)."""
+    conns = _shard(subscriber_key).get(subscriber_key)
+    if not conns:
         return
-    _put_envelope_on_queues(queues, envelope, subscriber_key)
+    _put_envelope(list(conns), envelope, subscriber_key)
 
 
 async def sse_broadcast_envelope(envelope: Dict[str, Any]) -> None:
-    """Push one envelope to every open SSE connection (e.g. public queue view)."""
-    async with _lock:
-        queues: List[asyncio.Queue] = []
-        for lst in _subscribers.values():
-            queues.extend(lst)
-    if not queues:
-        return
-    _put_envelope_on_queues(queues, envelope, "broadcast")
+    """Push one envelope to every local SSE connection (e.g. public queue view)."""
+    _put_envelope(_all_connections(), envelope, "broadcast")
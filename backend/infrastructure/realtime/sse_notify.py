@@ -1,12 +1,24 @@
-"""Fire-and-forget helpers for SSE fan-out from route handlers (structured envelopes)."""
+"""
+Fire-and-forget helpers for SSE fan-out from route handlers (structured envelopes).
+
+Envelopes are delivered to this process's connections right away and relayed over Redis
+(SSE_RELAY_CHANNEL) so the other API replicas deliver them to their own connections.
+"""
 from __future__ import annotations
 
+import logging
+import uuid
 from typing import Any, Dict, Optional
 
 from infrastructure.realtime.sse_manager import sse_broadcast_envelope, sse_emit_envelope
 
+logger = logging.getLogger(__name__)
+
 SSE_ENVELOPE_VERSION = 1
 GUEST_SSE_PREFIX = "guest:"
+SSE_RELAY_CHANNEL = "sse_envelopes"
+# Tags relayed envelopes so the bridge skips the ones this process already delivered
+REPLICA_ID = uuid.uuid4().hex[:12]
 
 
 def make_envelope(typ: str, scope: str, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -28,6 +40,35 @@ def sse_subscriber_key(
     return None
 
 
+async def _relay(subscriber_key: Optional[str], envelope: Dict[str, Any]) -> None:
+    """Publish for the other replicas (subscriber_key None = broadcast); no-op without the Redis bridge."""
+    from config.settings import get_settings
+
+    if not get_settings().SSE_REDIS_BRIDGE_ENABLED:
+        return
+    try:
+        from infrastructure.redis.client import redis_client
+
+        await redis_client.publish(
+            SSE_RELAY_CHANNEL,
+            {"origin": REPLICA_ID, "key": subscriber_key, "envelope": envelope},
+        )
+    except Exception:
+        logger.debug("SSE relay publish failed", exc_info=True)
+
+
+async def sse_publish_envelope(subscriber_key: str, envelope: Dict[str, Any]) -> None:
+    """Deliver to the subscriber's connections on every replica."""
+    await sse_emit_envelope(subscriber_key, envelope)
+    await _relay(subscriber_key, envelope)
+
+
+async def sse_publish_broadcast(envelope: Dict[str, Any]) -> None:
+    """Deliver to every connection on every replica."""
+    await sse_broadcast_envelope(envelope)
+    await _relay(None, envelope)
+
+
 async def sse_emit_to_actor(
     user_id: Optional[str],
     guest_session_id: Optional[str],
@@ -36,7 +77,7 @@ async def sse_emit_to_actor(
     key = sse_subscriber_key(user_id, guest_session_id)
     if not key:
         return
-    await sse_emit_envelope(key, envelope)
+    await sse_publish_envelope(key, envelope)
 
 
 async def sse_notify_scan(
@@ -73,13 +114,21 @@ async def sse_notify_scan(
 
 
 async def sse_notify_queue_changed(
-    *, reason: str = "updated", scan_id: Optional[str] = None
+    *, reason: str = "updated", scan_id: Optional[str] = None, relay: bool = True
 ) -> None:
-    """Broadcast queue invalidation to all SSE subscribers (public queue page)."""
+    """
+    Broadcast queue invalidation to all SSE subscribers (public queue page).
+
+    ``relay=False``: this process's connections only (the Redis bridge, which runs on every replica).
+    """
     payload: Dict[str, Any] = {"reason": reason}
     if scan_id:
         payload["scan_id"] = scan_id
-    await sse_broadcast_envelope(make_envelope("queue_update", "queue", payload))
+    envelope = make_envelope("queue_update", "queue", payload)
+    if relay:
+        await sse_publish_broadcast(envelope)
+    else:
+        await sse_broadcast_envelope(envelope)
 
 
 async def sse_notify_target_upsert(
@@ -87,7 +136,7 @@ async def sse_notify_target_upsert(
 ) -> None:
     if not user_id:
         return
-    await sse_emit_envelope(
+    await sse_publish_envelope(
         str(user_id),
         make_envelope(
             "target_update",
@@ -102,7 +151,7 @@ async def sse_notify_target_remove(
 ) -> None:
     if not user_id:
         return
-    await sse_emit_envelope(
+    await sse_publish_envelope(
         str(user_id),
         make_envelope(
             "target_update",
@@ -118,7 +167,7 @@ async def sse_notify_target_refetch(
     """Client should GET `/targets` with If-None-Match (light invalidation)."""
     if not user_id:
         return
-    await sse_emit_envelope(
+    await sse_publish_envelope(
         str(user_id),
         make_envelope(
             "target_update",
@@ -0,0 +1,82 @@
+"""
+Recent step_delta events per scan, for resume-from-seq catch-up after an SSE reconnect.
+
+The scanner numbers its deltas (epoch, seq); every API process sees all scan_events, so
+each keeps the tail of recent scans here. A client that missed events asks for
+everything after its last seq; when the tail no longer reaches back that far (or the
+scanner restarted with a new epoch) it gets resync=True and reloads GET /steps instead.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+MAX_SCANS = 500
+MAX_EVENTS_PER_SCAN = 500
+
+
+@dataclass
+class _ScanEvents:
+    epoch: str
+    events: Deque[Dict[str, Any]] = field(default_factory=deque)
+
+
+class StepEventBuffer:
+    """LRU of scans, each with a bounded deque of its latest step_delta events (in seq order)."""
+
+    def __init__(self, max_scans: int = MAX_SCANS, max_events: int = MAX_EVENTS_PER_SCAN):
+        self.max_scans = max_scans
+        self.max_events = max_events
+        self._scans: "OrderedDict[str, _ScanEvents]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, event: Dict[str, Any]) -> bool:
+        """Store one event; returns False for malformed or already-seen (duplicate/out-of-order) seqs."""
+        scan_id = event.get("scan_id")
+        epoch = event.get("epoch")
+        seq = event.get("seq")
+        if not scan_id or not epoch or not isinstance(seq, int):
+            return False
+        scan_id = str(scan_id)
+        with self._lock:
+            entry = self._scans.pop(scan_id, None)
+            if entry is None or entry.epoch != epoch:
+                entry = _ScanEvents(epoch=str(epoch), events=deque(maxlen=self.max_events))
+            self._scans[scan_id] = entry
+            while len(self._scans) > self.max_scans:
+                self._scans.popitem(last=False)
+            if entry.events and seq <= entry.events[-1]["seq"]:
+                return False
+            entry.events.append(event)
+        return True
+
+    def position(self, scan_id: str) -> Tuple[Optional[str], int]:
+        """(epoch, last seq) seen for the scan; (None, 0) when nothing is buffered."""
+        with self._lock:
+            entry = self._scans.get(str(scan_id))
+            if entry is None or not entry.events:
+                return None, 0
+            return entry.epoch, entry.events[-1]["seq"]
+
+    def since(self, scan_id: str, epoch: Optional[str], after_seq: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Events with seq > after_seq in ``epoch``, or None when the client must resync from GET /steps
+        (unknown scan, different epoch, or events after after_seq already evicted).
+        """
+        with self._lock:
+            entry = self._scans.get(str(scan_id))
+            if entry is None or entry.epoch != epoch:
+                return None
+            events = list(entry.events)
+        if not events:
+            return None
+        if after_seq >= events[-1]["seq"]:
+            return []
+        if events[0]["seq"] > after_seq + 1:
+            return None
+        return [e for e in events if e["seq"] > after_seq]
+
+
+step_event_buffer = StepEventBuffer()
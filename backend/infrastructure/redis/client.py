@@ -22,6 +22,7 @@ class RedisClient:
     def __init__(self):
         self.redis: Optional[Redis] = None
         self.is_connected = False
+        self._scripts: Dict[str, Any] = {}
         
     async def connect(self):
         """Connect to Redis."""
@@ -33,6 +34,7 @@ class RedisClient:
                 socket_timeout=5,
                 health_check_interval=30,
             )
+            self._scripts = {}
             # Test connection
             await self.redis.ping()
             self.is_connected = True
@@ -60,6 +62,17 @@ class RedisClient:
             logger.error(f"Redis GET error for key {key}: {e}")
             return None
     
+    async def mget(self, *keys: str) -> List[Optional[str]]:
+        """Get several values in one round trip (None for missing keys or on error)."""
+        if not self.is_connected:
+            await self.connect()
+
+        try:
+            return await self.redis.mget(keys)
+        except RedisError as e:
+            logger.error(f"Redis MGET error for keys {keys}: {e}")
+            return [None] * len(keys)
+
     async def set(self, key: str, value: str, expire: Optional[int] = None):
         """Set value in Redis."""
         if not self.is_connected:
@@ -231,6 +244,19 @@ class RedisClient:
             logger.error(f"Redis SMEMBERS error for key {key}: {e}")
             return []
     
+    async def run_script(self, script: str, keys: List[str], args: List[Any]) -> Any:
+        """Run a Lua script via EVALSHA (loaded on first use). Raises RedisError so callers can fall back."""
+        if not self.is_connected:
+            await self.connect()
+        registered = self._scripts.get(script)
+        if registered is None:
+            registered = self._scripts[script] = self.redis.register_script(script)
+        try:
+            return await registered(keys=keys, args=args)
+        except RedisError as e:
+            logger.error(f"Redis script error for keys {keys}: {e}")
+            raise
+    
     async def publish(self, channel: str, message: Union[str, Dict[str, Any]]):
         """Publish message to channel (JSON-encode dicts)."""
         if not self.is_connected:
@@ -245,9 +271,9 @@ class RedisClient:
         except RedisError as e:
             logger.error(f"Redis PUBLISH error for channel {channel}: {e}")
     
-    async def subscribe(self, channel: str) -> Optional[Tuple[Any, Redis]]:
+    async def subscribe(self, *channels: str) -> Optional[Tuple[Any, Redis]]:
         """
-        Subscribe to a channel for long-lived ``pubsub.listen()``.
+        Subscribe to one or more channels for long-lived ``pubsub.listen()``.
 
         Uses a **dedicated** Redis client with ``socket_timeout=None``. The shared
         pool client uses ``socket_timeout=5``, which breaks blocking pubsub reads
@@ -263,10 +289,10 @@ class RedisClient:
             )
             await pub_redis.ping()
             pubsub = pub_redis.pubsub()
-            await pubsub.subscribe(channel)
+            await pubsub.subscribe(*channels)
             return (pubsub, pub_redis)
         except RedisError as e:
-            logger.error(f"Redis SUBSCRIBE error for channel {channel}: {e}")
+            logger.error(f"Redis SUBSCRIBE error for channels {', '.join(channels)}: {e}")
             return None
     
     async def get_health(self) -> Dict[str, Any]:
@@ -0,0 +1,205 @@
+"""
+Per-process cache of resolved principals (API key → user context, guest session → context).
+
+API-key requests otherwise cost two DB lookups (key by hash, then its user) and guest
+requests a Redis round trip, on every request. Entries live for a short TTL and are
+dropped early when invalidated: revoking a key, changing/deactivating/deleting a user or
+revoking a guest session calls publish_invalidation(), which clears this process right
+away and tells the other API processes over PRINCIPAL_INVALIDATION_CHANNEL
+(run_principal_invalidation_listener). Pub/sub is at-most-once, so the TTL also bounds how
+long a missed invalidation can keep a principal alive.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_INVALIDATION_CHANNEL = "principal_invalidations"
+
+
+def api_key_tag(key_id: str) -> str:
+    return f"api_key:{key_id}"
+
+
+def user_tag(user_id: str) -> str:
+    return f"user:{user_id}"
+
+
+def guest_tag(session_id: str) -> str:
+    return f"guest:{session_id}"
+
+
+@dataclass(frozen=True)
+class _Entry:
+    value: Any
+    expires_at: float  # time.monotonic()
+    tags: FrozenSet[str]
+
+
+class PrincipalCache:
+    """TTL + LRU map; each entry carries tags (key id, user id, session id) it is invalidated by."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._by_tag: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, now: Optional[float] = None) -> Any:
+        """Cached value, or None when absent or expired."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= now:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        tags: Iterable[str],
+        max_age: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> None:
+        """Store value for at most the TTL (or ``max_age`` seconds, e.g. until an API key expires)."""
+        if not self.enabled:
+            return
+        ttl = self.ttl_seconds if max_age is None else min(self.ttl_seconds, max_age)
+        if ttl <= 0:
+            return
+        now = time.monotonic() if now is None else now
+        entry = _Entry(value=value, expires_at=now + ttl, tags=frozenset(tags))
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            for tag in entry.tags:
+                self._by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, *tags: str) -> int:
+        """Drop every entry carrying one of ``tags``; returns how many were dropped."""
+        dropped = 0
+        with self._lock:
+            for tag in tags:
+                for key in list(self._by_tag.get(tag, ())):
+                    self._remove(key)
+                    dropped += 1
+        return dropped
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_tag.clear()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._by_tag.get(tag)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._by_tag[tag]
+
+
+def _build_cache() -> PrincipalCache:
+    from config.settings import get_settings
+
+    settings = get_settings()
+    return PrincipalCache(
+        ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+        max_entries=settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES,
+    )
+
+
+_cache: Optional[PrincipalCache] = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    global _cache
+    if _cache is None:
+        _cache = _build_cache()
+    return _cache
+
+
+async def publish_invalidation(*tags: str) -> None:
+    """Invalidate ``tags`` in this process and in every other API process (best effort)."""
+    if not tags:
+        return
+    get_principal_cache().invalidate(*tags)
+    try:
+        from infrastructure.redis.client import redis_client
+
+        await redis_client.publish(PRINCIPAL_INVALIDATION_CHANNEL, {"tags": list(tags)})
+    except Exception:
+        logger.warning("Principal cache invalidation publish failed", exc_info=True)
+
+
+def apply_invalidation_message(data: Any) -> int:
+    """Apply one PRINCIPAL_INVALIDATION_CHANNEL payload (JSON ``{"tags": [...]}``)."""
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8", errors="ignore")
+    try:
+        payload = json.loads(data) if isinstance(data, str) else data
+    except json.JSONDecodeError:
+        return 0
+    tags = payload.get("tags") if isinstance(payload, dict) else None
+    if not isinstance(tags, list):
+        return 0
+    return get_principal_cache().invalidate(*(str(t) for t in tags))
+
+
+async def run_principal_invalidation_listener(stop: asyncio.Event) -> None:
+    """Apply invalidations published by other API processes until ``stop`` is set or cancelled."""
+    try:
+        from infrastructure.redis.client import redis_client
+    except Exception as e:
+        logger.warning("Principal cache invalidation listener not started: %s", e)
+        return
+
+    pair = await redis_client.subscribe(PRINCIPAL_INVALIDATION_CHANNEL)
+    if pair is None:
+        logger.warning("Principal cache invalidation listener: subscribe returned None")
+        return
+    pubsub, pub_redis = pair
+    try:
+        async for message in pubsub.listen():
+            if stop.is_set():
+                break
+            if message.get("type") == "message":
+                apply_invalidation_message(message.get("data"))
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        # Without the listener only the TTL bounds staleness; drop what we have to be safe
+        logger.warning("Principal cache invalidation listener stopped", exc_info=True)
+        get_principal_cache().clear()
+    finally:
+        try:
+            await pub_redis.close()
+        except Exception:
+            logger.debug("Principal cache listener: dedicated pubsub Redis close failed", exc_info=True)
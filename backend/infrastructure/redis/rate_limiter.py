@@ -0,0 +1,105 @@
+"""
+Rate limiter shared by all API workers/replicas.
+
+GCRA (generic cell rate algorithm) in Redis: one key per identifier holding its
+theoretical arrival time, updated by a single Lua script per request, so each check
+is O(1) regardless of traffic and limits hold across processes. While Redis is
+unreachable, a per-process fixed-window counter with a bounded key set takes over.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_KEY_PREFIX = "ratelimit:"
+# After a Redis failure, use the local limiter for this long before trying Redis again
+REDIS_RETRY_AFTER_SECONDS = 30.0
+LOCAL_MAX_KEYS = 10_000
+
+# KEYS[1]: TAT key. ARGV[1]: emission interval (ms), ARGV[2]: window (ms).
+# Returns {allowed (0/1), retry_after_ms}. Time comes from the Redis server so
+# replicas with skewed clocks agree.
+_GCRA_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1]) or '0')
+if tat < now then
+    tat = now
+end
+local new_tat = tat + interval
+if new_tat - now > window then
+    return {0, new_tat - now - window}
+end
+redis.call('SET', KEYS[1], new_tat, 'PX', new_tat - now)
+return {1, 0}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    retry_after: int = 0  # seconds until the next request would be allowed
+
+
+class LocalRateLimiter:
+    """Fixed-window counters per identifier; least recently used identifiers are dropped beyond max_keys."""
+
+    def __init__(self, max_keys: int = LOCAL_MAX_KEYS):
+        self.max_keys = max_keys
+        self._counters: "OrderedDict[str, Tuple[int, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, requests: int, window: int, now: Optional[float] = None) -> RateLimitDecision:
+        now = time.time() if now is None else now
+        window_index = int(now // window)
+        with self._lock:
+            current_window, count = self._counters.pop(key, (window_index, 0))
+            if current_window != window_index:
+                count = 0
+            allowed = count < requests
+            self._counters[key] = (window_index, count + 1 if allowed else count)
+            while len(self._counters) > self.max_keys:
+                self._counters.popitem(last=False)
+        if allowed:
+            return RateLimitDecision(True)
+        return RateLimitDecision(False, max(1, math.ceil((window_index + 1) * window - now)))
+
+
+class RedisRateLimiter:
+    """GCRA limiter on the shared Redis client, falling back to LocalRateLimiter on Redis errors."""
+
+    def __init__(self, client: Any = None, fallback: Optional[LocalRateLimiter] = None):
+        if client is None:
+            from infrastructure.redis.client import redis_client as client
+        self.client = client
+        self.fallback = fallback or LocalRateLimiter()
+        self._redis_down_until = 0.0
+
+    async def hit(self, key: str, requests: int, window: int) -> RateLimitDecision:
+        """Count one request for ``key`` against ``requests`` per ``window`` seconds."""
+        if time.monotonic() >= self._redis_down_until:
+            window_ms = window * 1000
+            try:
+                allowed, retry_after_ms = await self.client.run_script(
+                    _GCRA_SCRIPT,
+                    keys=[f"{RATE_LIMIT_KEY_PREFIX}{key}"],
+                    args=[max(1, window_ms // max(1, requests)), window_ms],
+                )
+                if int(allowed):
+                    return RateLimitDecision(True)
+                return RateLimitDecision(False, max(1, math.ceil(int(retry_after_ms) / 1000)))
+            except RedisError as e:
+                logger.warning(f"Redis rate limiter unavailable, using local counters: {e}")
+                self._redis_down_until = time.monotonic() + REDIS_RETRY_AFTER_SECONDS
+        return self.fallback.hit(key, requests, window)
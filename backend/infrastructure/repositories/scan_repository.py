@@ -5,21 +5,40 @@ This module provides the PostgreSQL implementation of the ScanRepository interfa
 """
 import json
 import logging
-import re
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Tuple
-from urllib.parse import urlparse
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func, text, cast
+from sqlalchemy import String, select, and_, or_, func, text, cast, delete
 
 from domain.repositories.scan_repository import ScanRepository
 from domain.entities.scan import Scan, ScanStatus, ScanType
-from infrastructure.database.models import Scan as ScanModel, ScanStatusEnumType
+from domain.utils.git_repo_url import github_repo_owner_and_slug
+from infrastructure.database.models import (
+    Scan as ScanModel,
+    ScanDailyRollup,
+    ScanResults as ScanResultsModel,
+    ScanStatusEnumType,
+)
 from infrastructure.database.adapter import db_adapter
 
 logger = logging.getLogger(__name__)
 
+# Statistics bucket -> scan_type values (same lists as the scan_daily_rollups trigger, migration 004)
+_SCAN_TYPE_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    "repository_scans": ("code", "repository", "repo"),
+    "container_scans": ("image", "container"),
+    "infrastructure_scans": ("infrastructure", "infra", "terraform"),
+    "web_application_scans": ("web", "web_application"),
+}
+
+
+def _scan_type_category(scan_type: str) -> Optional[str]:
+    for category, scan_types in _SCAN_TYPE_CATEGORIES.items():
+        if scan_type in scan_types:
+            return category
+    return None
+
 
 class DatabaseScanRepository(ScanRepository):
     """PostgreSQL implementation of ScanRepository."""
@@ -30,6 +49,7 @@ class DatabaseScanRepository(ScanRepository):
     
     async def _entity_to_model(self, scan: Scan) -> ScanModel:
         """Convert Scan entity to database model."""
+        repo_owner, repo_slug = github_repo_owner_and_slug(scan.target_url)
         return ScanModel(
             id=UUID(scan.id) if isinstance(scan.id, str) else scan.id,
             name=scan.name,
@@ -38,6 +58,8 @@ class DatabaseScanRepository(ScanRepository):
             status=scan.status.value,
             target_url=scan.target_url,
             target_type=scan.target_type,
+            repo_owner=repo_owner,
+            repo_slug=repo_slug,
             scanners=scan.scanners,
             config=scan.config,
             created_at=scan.created_at,
@@ -46,7 +68,6 @@ class DatabaseScanRepository(ScanRepository):
             updated_at=scan.updated_at,
             scheduled_at=scan.scheduled_at,
             last_heartbeat_at=scan.last_heartbeat_at,
-            results=scan.results,
             total_vulnerabilities=scan.total_vulnerabilities,
             critical_vulnerabilities=scan.critical_vulnerabilities,
             high_vulnerabilities=scan.high_vulnerabilities,
@@ -63,8 +84,10 @@ class DatabaseScanRepository(ScanRepository):
             priority=scan.priority,
         )
     
-    async def _model_to_entity(self, model: ScanModel) -> Scan:
-        """Convert database model to Scan entity."""
+    async def _model_to_entity(
+        self, model: ScanModel, results: Optional[List[Dict[str, Any]]] = None
+    ) -> Scan:
+        """Convert database model to Scan entity (results only when loaded from scan_results)."""
         return Scan(
             id=str(model.id),
             name=model.name,
@@ -81,7 +104,8 @@ class DatabaseScanRepository(ScanRepository):
             updated_at=model.updated_at,
             scheduled_at=model.scheduled_at,
             last_heartbeat_at=model.last_heartbeat_at,
-            results=model.results or [],
+            results=results or [],
+            results_loaded=results is not None,
             total_vulnerabilities=model.total_vulnerabilities or 0,
             critical_vulnerabilities=model.critical_vulnerabilities or 0,
             high_vulnerabilities=model.high_vulnerabilities or 0,
@@ -106,11 +130,13 @@ class DatabaseScanRepository(ScanRepository):
             try:
                 scan_model = await self._entity_to_model(scan)
                 session.add(scan_model)
+                if scan.results:
+                    session.add(ScanResultsModel(scan_id=scan_model.id, results=scan.results))
                 await session.commit()
                 await session.refresh(scan_model)
                 
                 logger.info(f"Created scan {scan.id} in database")
-                return await self._model_to_entity(scan_model)
+                return await self._model_to_entity(scan_model, scan.results)
             except Exception as e:
                 await session.rollback()
                 logger.error(f"Failed to create scan {scan.id}: {e}")
@@ -123,11 +149,14 @@ class DatabaseScanRepository(ScanRepository):
         async with self.db_adapter.async_session() as session:
             try:
                 result = await session.execute(
-                    select(ScanModel).where(ScanModel.id == UUID(scan_id))
+                    select(ScanModel, ScanResultsModel.results)
+                    .outerjoin(ScanResultsModel, ScanResultsModel.scan_id == ScanModel.id)
+                    .where(ScanModel.id == UUID(scan_id))
                 )
-                model = result.scalar_one_or_none()
-                if model:
-                    return await self._model_to_entity(model)
+                row = result.one_or_none()
+                if row:
+                    # No scan_results row: the scan has no results (still loaded)
+                    return await self._model_to_entity(row[0], row[1] or [])
                 return None
             except Exception as e:
                 logger.error(f"Failed to get scan {scan_id}: {e}")
@@ -227,6 +256,8 @@ class DatabaseScanRepository(ScanRepository):
                 model.description = scan.description
                 model.scan_type = scan.scan_type.value
                 model.status = scan.status.value
+                if model.target_url != scan.target_url:
+                    model.repo_owner, model.repo_slug = github_repo_owner_and_slug(scan.target_url)
                 model.target_url = scan.target_url
                 model.target_type = scan.target_type
                 model.scanners = scan.scanners
@@ -235,7 +266,6 @@ class DatabaseScanRepository(ScanRepository):
                 model.completed_at = scan.completed_at
                 model.updated_at = scan.updated_at
                 model.scheduled_at = scan.scheduled_at
-                model.results = scan.results
                 model.total_vulnerabilities = scan.total_vulnerabilities
                 model.critical_vulnerabilities = scan.critical_vulnerabilities
                 model.high_vulnerabilities = scan.high_vulnerabilities
@@ -249,12 +279,17 @@ class DatabaseScanRepository(ScanRepository):
                 model.project_id = scan.project_id
                 model.tags = scan.tags
                 model.scan_metadata = scan.scan_metadata
+                # List/queue entities carry no results (results_loaded=False); leave the payload alone
+                if scan.results:
+                    await session.merge(ScanResultsModel(scan_id=model.id, results=scan.results))
+                elif scan.results_loaded:
+                    await session.execute(delete(ScanResultsModel).where(ScanResultsModel.scan_id == model.id))
                 
                 await session.commit()
                 await session.refresh(model)
                 
                 logger.info(f"Updated scan {scan.id} in database")
-                return await self._model_to_entity(model)
+                return await self._model_to_entity(model, scan.results if scan.results_loaded else None)
             except Exception as e:
                 await session.rollback()
                 logger.error(f"Failed to update scan {scan.id}: {e}")
@@ -458,14 +493,13 @@ class DatabaseScanRepository(ScanRepository):
         
         async with self.db_adapter.async_session() as session:
             try:
-                result = await session.execute(
-                    select(ScanModel).where(ScanModel.id == UUID(scan_id))
+                exists = await session.execute(
+                    select(ScanModel.id).where(ScanModel.id == UUID(scan_id))
                 )
-                model = result.scalar_one_or_none()
-                if not model:
+                if exists.scalar_one_or_none() is None:
                     return False
                 
-                model.results = results
+                await session.merge(ScanResultsModel(scan_id=UUID(scan_id), results=results))
                 await session.commit()
                 
                 # Update scanner duration statistics after successful commit
@@ -517,136 +551,124 @@ class DatabaseScanRepository(ScanRepository):
         user_id: Optional[str] = None,
         guest_session_id: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Get scan statistics for API (ScanStatisticsSchema)."""
+        """
+        Get scan statistics for API (ScanStatisticsSchema).
+
+        Aggregated in SQL: counts/sums/durations grouped by (status, scan_type), distinct
+        targets/repos/owners from the normalized scans.repo_owner / repo_slug columns, and
+        daily_scan_counts from the trigger-maintained scan_daily_rollups table.
+        """
         await self.db_adapter.ensure_initialized()
         
         async with self.db_adapter.async_session() as session:
             try:
-                query = select(ScanModel)
+                scope: List[Any] = []
+                params: Dict[str, Any] = {}
+                rollup_scope: List[Any] = []
                 if user_id:
-                    query = query.where(ScanModel.user_id == UUID(user_id))
+                    scope.append(ScanModel.user_id == UUID(user_id))
+                    rollup_scope.append(ScanDailyRollup.scope_key == f"u:{UUID(user_id)}")
                 elif guest_session_id:
-                    query = query.where(
-                        and_(
-                            ScanModel.user_id.is_(None),
-                            text("scans.scan_metadata->>'session_id' = :gsid"),
-                        )
-                    ).params(gsid=guest_session_id)
-                
-                result = await session.execute(query)
-                scans = result.scalars().all()
-                
-                by_status: Dict[str, int] = {}
-                by_type: Dict[str, int] = {}
-                total_vuln = 0
-                critical = high = medium = low = info = 0
-                durations: List[float] = []
-                repo_scans = container_scans = infra_scans = web_scans = 0
-                distinct_targets: set[str] = set()
-                distinct_repositories: set[str] = set()
-                distinct_repo_owners: set[str] = set()
-                daily_rollup: Dict[str, Dict[str, int]] = {}
-
-                def _extract_repo_owner_and_slug(raw_url: str) -> tuple[Optional[str], Optional[str]]:
-                    if not raw_url:
-                        return None, None
-                    target = raw_url.strip()
-                    if not target:
-                        return None, None
-
-                    # Handle SSH notation: git@github.com:owner/repo(.git)
-                    ssh_match = re.match(r"^git@github\.com:([^/]+)/(.+)$", target, flags=re.IGNORECASE)
-                    if ssh_match:
-                        owner = ssh_match.group(1).strip().lower()
-                        repo = ssh_match.group(2).strip()
-                        if repo.lower().endswith(".git"):
-                            repo = repo[:-4]
-                        repo = repo.strip("/").lower()
-                        if owner and repo:
-                            return owner, f"{owner}/{repo}"
-                        return owner or None, None
+                    scope.append(ScanModel.user_id.is_(None))
+                    scope.append(text("scans.scan_metadata->>'session_id' = :gsid"))
+                    params["gsid"] = guest_session_id
+                    rollup_scope.append(ScanDailyRollup.scope_key == f"g:{guest_session_id}")
 
-                    # Handle http(s) URLs
-                    if "://" in target:
-                        parsed = urlparse(target)
-                        if parsed.netloc.lower() == "github.com":
-                            parts = [p for p in parsed.path.split("/") if p]
-                            if len(parts) >= 2:
-                                owner = parts[0].strip().lower()
-                                repo = parts[1].strip()
-                                if repo.lower().endswith(".git"):
-                                    repo = repo[:-4]
-                                repo = repo.lower()
-                                if owner and repo:
-                                    return owner, f"{owner}/{repo}"
-                                return owner or None, None
-                    return None, None
-                
-                def _increment_type_counts(bucket: Dict[str, int], scan_type: str) -> None:
-                    if scan_type in ("code", "repository", "repo"):
-                        bucket["repository_scans"] += 1
-                    elif scan_type in ("image", "container"):
-                        bucket["container_scans"] += 1
-                    elif scan_type in ("infrastructure", "infra", "terraform"):
-                        bucket["infrastructure_scans"] += 1
-                    elif scan_type in ("web", "web_application"):
-                        bucket["web_application_scans"] += 1
-
-                for scan in scans:
-                    status = (scan.status or "pending").lower()
-                    by_status[status] = by_status.get(status, 0) + 1
-                    st = (scan.scan_type or "code").lower()
-                    by_type[st] = by_type.get(st, 0) + 1
-                    if scan.target_url:
-                        distinct_targets.add(f"{(scan.target_type or '').lower()}::{scan.target_url.strip().lower()}")
-                    if st in ("code", "repository", "repo"):
-                        owner, slug = _extract_repo_owner_and_slug(scan.target_url or "")
-                        if owner:
-                            distinct_repo_owners.add(owner)
-                        if slug:
-                            distinct_repositories.add(slug)
+                status_col = func.lower(cast(ScanModel.status, String))
+                type_col = func.lower(func.coalesce(ScanModel.scan_type, "code"))
+                grouped = await session.execute(
+                    select(
+                        status_col,
+                        type_col,
+                        func.count(),
+                        func.coalesce(func.sum(ScanModel.total_vulnerabilities), 0),
+                        func.coalesce(func.sum(ScanModel.critical_vulnerabilities), 0),
+                        func.coalesce(func.sum(ScanModel.high_vulnerabilities), 0),
+                        func.coalesce(func.sum(ScanModel.medium_vulnerabilities), 0),
+                        func.coalesce(func.sum(ScanModel.low_vulnerabilities), 0),
+                        func.coalesce(func.sum(ScanModel.info_vulnerabilities), 0),
+                        func.count(ScanModel.duration),
+                        func.coalesce(func.sum(ScanModel.duration), 0),
+                        func.min(ScanModel.duration),
+                        func.max(ScanModel.duration),
+                    )
+                    .where(*scope)
+                    .group_by(status_col, type_col)
+                    .params(**params)
+                )
 
-                    is_completed = status == "completed"
-                    if not is_completed:
+                by_status: Dict[str, int] = {}
+                by_category = {category: 0 for category in _SCAN_TYPE_CATEGORIES}
+                vuln = [0] * 6
+                duration_count = 0
+                duration_sum = 0.0
+                shortest: Optional[float] = None
+                longest: Optional[float] = None
+                total = 0
+                for (
+                    status, scan_type, count, *sums, dur_count, dur_sum, dur_min, dur_max
+                ) in grouped.all():
+                    total += count
+                    by_status[status] = by_status.get(status, 0) + count
+                    if status != "completed":
                         continue
+                    vuln = [a + int(b) for a, b in zip(vuln, sums)]
+                    category = _scan_type_category(scan_type)
+                    if category:
+                        by_category[category] += count
+                    if dur_count:
+                        duration_count += dur_count
+                        duration_sum += float(dur_sum)
+                        shortest = float(dur_min) if shortest is None else min(shortest, float(dur_min))
+                        longest = float(dur_max) if longest is None else max(longest, float(dur_max))
 
-                    total_vuln += scan.total_vulnerabilities or 0
-                    critical += scan.critical_vulnerabilities or 0
-                    high += scan.high_vulnerabilities or 0
-                    medium += scan.medium_vulnerabilities or 0
-                    low += scan.low_vulnerabilities or 0
-                    info += scan.info_vulnerabilities or 0
-                    if getattr(scan, "duration", None) is not None:
-                        durations.append(float(scan.duration))
-                    if st in ("code", "repository", "repo"):
-                        repo_scans += 1
-                    elif st in ("image", "container"):
-                        container_scans += 1
-                    elif st in ("infrastructure", "infra", "terraform"):
-                        infra_scans += 1
-                    elif st in ("web", "web_application"):
-                        web_scans += 1
+                is_repo_scan = type_col.in_(_SCAN_TYPE_CATEGORIES["repository_scans"])
+                distinct = (
+                    await session.execute(
+                        select(
+                            func.count(
+                                func.distinct(
+                                    func.concat(
+                                        func.lower(func.coalesce(ScanModel.target_type, "")),
+                                        "::",
+                                        func.lower(func.trim(ScanModel.target_url)),
+                                    )
+                                )
+                            ).filter(ScanModel.target_url != ""),
+                            func.count(func.distinct(ScanModel.repo_slug)).filter(is_repo_scan),
+                            func.count(func.distinct(ScanModel.repo_owner)).filter(is_repo_scan),
+                        )
+                        .where(*scope)
+                        .params(**params)
+                    )
+                ).one()
 
-                    if scan.created_at:
-                        day_key = scan.created_at.strftime("%Y-%m-%d")
-                        if day_key not in daily_rollup:
-                            daily_rollup[day_key] = {
-                                "total_scans": 0,
-                                "repository_scans": 0,
-                                "container_scans": 0,
-                                "infrastructure_scans": 0,
-                                "web_application_scans": 0,
-                            }
-                        day_bucket = daily_rollup[day_key]
-                        day_bucket["total_scans"] += 1
-                        _increment_type_counts(day_bucket, st)
-                
-                total = len(scans)
-                avg_dur = sum(durations) / len(durations) if durations else 0.0
+                daily = await session.execute(
+                    select(
+                        ScanDailyRollup.day,
+                        func.sum(ScanDailyRollup.total_scans),
+                        func.sum(ScanDailyRollup.repository_scans),
+                        func.sum(ScanDailyRollup.container_scans),
+                        func.sum(ScanDailyRollup.infrastructure_scans),
+                        func.sum(ScanDailyRollup.web_application_scans),
+                    )
+                    .where(*rollup_scope)
+                    .group_by(ScanDailyRollup.day)
+                    .having(func.sum(ScanDailyRollup.total_scans) > 0)
+                    .order_by(ScanDailyRollup.day)
+                )
                 daily_scan_counts = [
-                    {"date": day, **counts}
-                    for day, counts in sorted(daily_rollup.items(), key=lambda item: item[0])
+                    {
+                        "date": day.isoformat(),
+                        "total_scans": int(day_total),
+                        "repository_scans": int(repo),
+                        "container_scans": int(container),
+                        "infrastructure_scans": int(infra),
+                        "web_application_scans": int(web),
+                    }
+                    for day, day_total, repo, container, infra, web in daily.all()
                 ]
+
                 return {
                     "total_scans": total,
                     "pending_scans": by_status.get("pending", 0),
@@ -654,22 +676,19 @@ class DatabaseScanRepository(ScanRepository):
                     "completed_scans": by_status.get("completed", 0),
                     "failed_scans": by_status.get("failed", 0),
                     "cancelled_scans": by_status.get("cancelled", 0),
-                    "total_vulnerabilities": total_vuln,
-                    "critical_vulnerabilities": critical,
-                    "high_vulnerabilities": high,
-                    "medium_vulnerabilities": medium,
-                    "low_vulnerabilities": low,
-                    "info_vulnerabilities": info,
-                    "repository_scans": repo_scans,
-                    "container_scans": container_scans,
-                    "infrastructure_scans": infra_scans,
-                    "web_application_scans": web_scans,
-                    "distinct_targets_scanned": len(distinct_targets),
-                    "distinct_repositories_scanned": len(distinct_repositories),
-                    "distinct_repo_owners_scanned": len(distinct_repo_owners),
-                    "average_scan_duration": avg_dur,
-                    "longest_scan_duration": max(durations) if durations else 0.0,
-                    "shortest_scan_duration": min(durations) if durations else 0.0,
+                    "total_vulnerabilities": vuln[0],
+                    "critical_vulnerabilities": vuln[1],
+                    "high_vulnerabilities": vuln[2],
+                    "medium_vulnerabilities": vuln[3],
+                    "low_vulnerabilities": vuln[4],
+                    "info_vulnerabilities": vuln[5],
+                    **by_category,
+                    "distinct_targets_scanned": int(distinct[0] or 0),
+                    "distinct_repositories_scanned": int(distinct[1] or 0),
+                    "distinct_repo_owners_scanned": int(distinct[2] or 0),
+                    "average_scan_duration": duration_sum / duration_count if duration_count else 0.0,
+                    "longest_scan_duration": longest or 0.0,
+                    "shortest_scan_duration": shortest or 0.0,
                     "daily_scan_counts": daily_scan_counts,
                 }
             except Exception as e:
@@ -911,21 +930,18 @@ class DatabaseScanRepository(ScanRepository):
         await self.db_adapter.ensure_initialized()
         async with self.db_adapter.async_session() as session:
             try:
+                # DISTINCT ON: one (newest) row per URL instead of the whole history
                 result = await session.execute(
                     select(ScanModel)
                     .where(
                         ScanModel.user_id == UUID(user_id),
                         ScanModel.target_url.in_(target_urls),
                     )
-                    .order_by(ScanModel.created_at.desc())
+                    .distinct(ScanModel.target_url)
+                    .order_by(ScanModel.target_url, ScanModel.created_at.desc())
                 )
                 rows = result.scalars().all()
-                out: Dict[str, Scan] = {}
-                for r in rows:
-                    url = r.target_url or ""
-                    if url not in out:
-                        out[url] = await self._model_to_entity(r)
-                return out
+                return {r.target_url or "": await self._model_to_entity(r) for r in rows}
             except Exception as e:
                 logger.error(f"get_latest_scans_by_target_urls failed: {e}")
                 raise
@@ -1,6 +1,6 @@
 """Database ScanSteps read repository (DDD)."""
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import text
 
@@ -89,3 +89,30 @@ class DatabaseScanStepsRepository(ScanStepsRepository):
             }
             steps.append(step)
         return steps
+
+    async def get_event_position(self, scan_id: str) -> Tuple[Optional[str], int]:
+        try:
+            await self.db_adapter.ensure_initialized()
+        except Exception:
+            return None, 0
+        try:
+            async with self.db_adapter.async_session() as session:
+                result = await session.execute(
+                    text(
+                        """
+                        SELECT event_epoch, event_seq
+                        FROM scan_steps
+                        WHERE scan_id = :sid
+                        ORDER BY seq DESC
+                        LIMIT 1
+                        """
+                    ),
+                    {"sid": scan_id},
+                )
+                row = result.fetchone()
+        except Exception:
+            return None, 0
+        # The most recently written row comes from the latest flush, which covers all earlier deltas
+        if row is None or not row[0]:
+            return None, 0
+        return str(row[0]), int(row[1] or 0)
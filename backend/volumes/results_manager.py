@@ -379,7 +379,11 @@ class ResultsManager:
             }
             
             if self.results_path.exists():
-                scan_dirs = [d for d in self.results_path.iterdir() if d.is_dir()]
+                # Dot-directories (e.g. the scanner's .findings-cache) are not scans
+                scan_dirs = [
+                    d for d in self.results_path.iterdir()
+                    if d.is_dir() and not d.name.startswith(".")
+                ]
                 status["total_scans"] = len(scan_dirs)
                 
                 total_size = 0
@@ -519,7 +523,7 @@ class ResultsManager:
             results = []
             
             for scan_dir in self.results_path.iterdir():
-                if scan_dir.is_dir():
+                if scan_dir.is_dir() and not scan_dir.name.startswith("."):
                     try:
                         # Check if this matches the requested scan_id
                         if scan_id and scan_id not in scan_dir.name:
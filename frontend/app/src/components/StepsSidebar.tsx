@@ -1,5 +1,4 @@
-import { useState, useEffect } from 'react'
-import { useWebSocket } from '../services/websocketService'
+import { useScanSteps } from '../hooks/useScanSteps'
 import { SubstepSlot } from './SubstepSlot'
 
 interface StepsSidebarProps {
@@ -8,103 +7,9 @@ interface StepsSidebarProps {
   scanId?: string | null
 }
 
-interface SubStep {
-  name: string
-  status: 'pending' | 'running' | 'completed' | 'failed'
-  message?: string
-  started_at?: string | null
-  completed_at?: string | null
-}
-
-interface Step {
-  number: number
-  name: string
-  status: 'pending' | 'running' | 'completed' | 'failed'
-  message?: string
-  substeps?: SubStep[]
-}
-
-interface WebSocketMessage {
-  type: string
-  steps?: Step[]
-  progress_percentage?: number
-  total_steps?: number
-  scan_id?: string
-  timestamp?: number
-}
-
 export default function StepsSidebar({ isOpen, onClose, scanId }: StepsSidebarProps) {
-  const [steps, setSteps] = useState<Step[]>([])
-  const [loading, setLoading] = useState(true)
-
-  // Use the same WebSocket service as ScanView
-  const { service } = useWebSocket(
-    isOpen && scanId ? scanId : null
-  )
-
-  // Load steps from REST API when sidebar opens
-  useEffect(() => {
-    if (!isOpen || !scanId) {
-      setLoading(false)
-      return
-    }
-
-    const fetchSteps = async () => {
-      try {
-        setLoading(true)
-        const { apiFetch } = await import('../utils/apiClient')
-        const response = await apiFetch(`/api/v1/scans/${scanId}/steps`)
-        if (response.ok) {
-          const data = await response.json()
-          if (data.steps && data.steps.length > 0) {
-            const convertedSteps: Step[] = data.steps.map((step: any) => ({
-              number: step.number || 0,
-              name: step.name || 'Unknown',
-              status: (step.status || 'pending') as 'pending' | 'running' | 'completed' | 'failed',
-              message: step.message || '',
-              substeps: step.substeps ? step.substeps.map((substep: any) => ({
-                name: substep.name || '',
-                status: (substep.status || 'pending') as 'pending' | 'running' | 'completed' | 'failed',
-                message: substep.message || '',
-                started_at: substep.started_at || null,
-                completed_at: substep.completed_at || null,
-              })) : []
-            }))
-            setSteps(convertedSteps)
-          }
-        }
-      } catch (error) {
-        console.error('Failed to fetch steps:', error)
-      } finally {
-        setLoading(false)
-      }
-    }
-
-    fetchSteps()
-  }, [isOpen, scanId])
-
-  // Handle WebSocket messages to update steps in real-time
-  useEffect(() => {
-    if (!isOpen || !scanId || !service) return
-
-    const handleMessage = (data: WebSocketMessage) => {
-      if (data.type === 'step_update' && data.steps) {
-        setSteps(data.steps)
-      } else if (data.type === 'initial_steps' && data.steps) {
-        setSteps(data.steps)
-      }
-    }
-
-    // Set up message handler
-    service.onMessage(handleMessage)
-
-    return () => {
-      // Clean up message handler
-      if (service) {
-        service.onMessage(() => {}) // Clear handler
-      }
-    }
-  }, [service, isOpen, scanId])
+  // Same live source as ScanView: /steps snapshot + scan_steps SSE deltas while open
+  const { steps, loading } = useScanSteps(scanId, isOpen)
 
   if (!isOpen) return null
 
@@ -0,0 +1,210 @@
+import { useCallback, useEffect, useMemo, useRef, useState } from 'react'
+import { apiFetch } from '../utils/apiClient'
+import { parseStepInstantMs } from '../utils/timeUtils'
+import { SSE_ENVELOPE_EVENT, type SseEnvelope } from './useGlobalSse'
+
+export type StepStatus = 'pending' | 'running' | 'completed' | 'failed'
+
+export interface ScanSubStep {
+  name: string
+  status: StepStatus
+  message?: string
+  started_at?: string | null
+  completed_at?: string | null
+  type?: 'phase' | 'action' | 'output'
+}
+
+export interface ScanStep {
+  number: number
+  name: string
+  status: StepStatus
+  message?: string
+  substeps?: ScanSubStep[]
+  started_at?: string | null
+  completed_at?: string | null
+  duration_seconds?: number | null
+  timeout_seconds?: number | null
+}
+
+/** One scanner step change (`scan_steps` SSE payload / GET /steps/events item). */
+interface StepDelta {
+  epoch: string
+  seq: number
+  step: Partial<ScanStep> & { number: number; name: string }
+  /** Only the changed substep; absent for step-level changes, where step.substeps is the full list */
+  substep?: ScanSubStep
+}
+
+const toSubStep = (s: any): ScanSubStep => ({
+  name: s.name || '',
+  status: (s.status || 'pending') as StepStatus,
+  message: s.message || '',
+  started_at: s.started_at || null,
+  completed_at: s.completed_at || null,
+  type: s.type,
+})
+
+const toStep = (s: any): ScanStep => ({
+  number: s.number || 0,
+  name: s.name || 'Unknown',
+  status: (s.status || 'pending') as StepStatus,
+  message: s.message || '',
+  substeps: Array.isArray(s.substeps) ? s.substeps.map(toSubStep) : [],
+  started_at: s.started_at ?? null,
+  completed_at: s.completed_at ?? null,
+  duration_seconds: s.duration_seconds ?? null,
+  timeout_seconds: s.timeout_seconds ?? null,
+})
+
+function applyDelta(steps: ScanStep[], delta: StepDelta): ScanStep[] {
+  const idx = steps.findIndex((s) => s.number === delta.step.number)
+  const prev = idx >= 0 ? steps[idx] : toStep({ number: delta.step.number, name: delta.step.name })
+  const next: ScanStep = {
+    ...prev,
+    name: delta.step.name || prev.name,
+    status: (delta.step.status || prev.status) as StepStatus,
+    message: delta.step.message ?? prev.message,
+    started_at: delta.step.started_at ?? null,
+    completed_at: delta.step.completed_at ?? null,
+    timeout_seconds: delta.step.timeout_seconds ?? prev.timeout_seconds ?? null,
+  }
+  const a = parseStepInstantMs(next.started_at)
+  const b = parseStepInstantMs(next.completed_at)
+  next.duration_seconds = !Number.isNaN(a) && !Number.isNaN(b) && b >= a ? Math.round((b - a) / 1000) : null
+
+  if (delta.substep) {
+    const sub = toSubStep(delta.substep)
+    const subs = prev.substeps ? [...prev.substeps] : []
+    const j = subs.findIndex((s) => s.name === sub.name)
+    if (j >= 0) subs[j] = sub
+    else subs.push(sub)
+    next.substeps = subs
+  } else if (Array.isArray(delta.step.substeps)) {
+    next.substeps = delta.step.substeps.map(toSubStep)
+  }
+
+  const out = [...steps]
+  if (idx >= 0) out[idx] = next
+  else {
+    out.push(next)
+    out.sort((x, y) => x.number - y.number)
+  }
+  return out
+}
+
+const progressOf = (steps: ScanStep[]): number => {
+  if (steps.length === 0) return 0
+  const done = steps.filter((s) => s.status === 'completed' || s.status === 'failed').length
+  return Math.floor((done / steps.length) * 100)
+}
+
+/**
+ * Scan steps: one GET /steps snapshot, then `scan_steps` SSE deltas applied in seq order.
+ * A seq gap or new scanner epoch is filled from GET /steps/events; when the server no
+ * longer buffers the gap (`resync`), the snapshot is reloaded.
+ */
+export function useScanSteps(scanId: string | null | undefined, enabled = true) {
+  const [steps, setSteps] = useState<ScanStep[]>([])
+  const [loading, setLoading] = useState(false)
+  const positionRef = useRef<{ epoch: string | null; seq: number }>({ epoch: null, seq: 0 })
+  const catchingUpRef = useRef(false)
+  const pendingRef = useRef<StepDelta[]>([])
+
+  const loadSnapshot = useCallback(async (id: string) => {
+    try {
+      setLoading(true)
+      const response = await apiFetch(`/api/v1/scans/${id}/steps`)
+      if (!response.ok) return
+      const data = await response.json()
+      // Deltas the (batched) DB snapshot does not include yet come along in `events`
+      const events: StepDelta[] = data.events ?? []
+      const last = events.length > 0 ? events[events.length - 1].seq : null
+      positionRef.current = { epoch: data.event_epoch ?? null, seq: last ?? data.event_seq ?? 0 }
+      if (data.steps && data.steps.length > 0) {
+        setSteps(events.reduce(applyDelta, data.steps.map(toStep)))
+      }
+    } catch (error) {
+      console.error('Failed to fetch steps:', error)
+    } finally {
+      setLoading(false)
+    }
+  }, [])
+
+  useEffect(() => {
+    positionRef.current = { epoch: null, seq: 0 }
+    pendingRef.current = []
+    if (!scanId || !enabled) {
+      setLoading(false)
+      return
+    }
+    void loadSnapshot(scanId)
+  }, [scanId, enabled, loadSnapshot])
+
+  useEffect(() => {
+    if (!scanId || !enabled) return
+
+    const applyInOrder = (deltas: StepDelta[]) => {
+      const pos = positionRef.current
+      const fresh = deltas.filter((d) => d.epoch === pos.epoch && d.seq > pos.seq)
+      if (fresh.length === 0) return
+      positionRef.current = { epoch: pos.epoch, seq: fresh[fresh.length - 1].seq }
+      setSteps((prev) => fresh.reduce(applyDelta, prev))
+    }
+
+    const catchUp = async (epoch: string, afterSeq: number) => {
+      catchingUpRef.current = true
+      try {
+        const response = await apiFetch(
+          `/api/v1/scans/${scanId}/steps/events?epoch=${encodeURIComponent(epoch)}&after_seq=${afterSeq}`,
+        )
+        if (!response.ok) return
+        const data = await response.json()
+        if (data.resync) {
+          await loadSnapshot(scanId)
+        } else {
+          positionRef.current = { epoch, seq: afterSeq }
+          applyInOrder(data.events as StepDelta[])
+        }
+      } catch (error) {
+        console.error('Failed to catch up on scan steps:', error)
+      } finally {
+        catchingUpRef.current = false
+        const queued = pendingRef.current
+        pendingRef.current = []
+        queued.forEach(onDelta)
+      }
+    }
+
+    const onDelta = (delta: StepDelta) => {
+      if (catchingUpRef.current) {
+        pendingRef.current.push(delta)
+        return
+      }
+      const pos = positionRef.current
+      if (delta.epoch !== pos.epoch) {
+        // Scanner (re)started or nothing seen yet: fetch this epoch from its first event
+        void catchUp(delta.epoch, 0)
+      } else if (delta.seq === pos.seq + 1) {
+        applyInOrder([delta])
+      } else if (delta.seq > pos.seq + 1) {
+        void catchUp(delta.epoch, pos.seq)
+      }
+    }
+
+    const onSse = (e: Event) => {
+      const env = (e as CustomEvent<SseEnvelope>).detail
+      if (!env || env.v !== 1 || env.type !== 'scan_steps') return
+      const payload = env.payload as unknown as StepDelta & { scan_id?: string }
+      if (String(payload.scan_id ?? '') !== scanId) return
+      onDelta(payload)
+    }
+
+    window.addEventListener(SSE_ENVELOPE_EVENT, onSse)
+    return () => window.removeEventListener(SSE_ENVELOPE_EVENT, onSse)
+  }, [scanId, enabled, loadSnapshot])
+
+  // Same formula as the backend's progress_percentage
+  const progress = useMemo(() => progressOf(steps), [steps])
+
+  return { steps, progress, loading }
+}
@@ -6,7 +6,7 @@ import AIPromptModal from '../components/AIPromptModal'
 import PageHeader from '../components/PageHeader'
 import ScanProgressAside from '../components/ScanProgressAside'
 import { SubstepSlot } from '../components/SubstepSlot'
-import { useWebSocket } from '../services/websocketService'
+import { useScanSteps, type ScanStep, type ScanSubStep } from '../hooks/useScanSteps'
 import { SSE_ENVELOPE_EVENT, type SseEnvelope } from '../hooks/useGlobalSse'
 import { SCAN_STATUS_REFRESH_EVENT } from '../hooks/useHeaderScanStatus'
 import { formatDuration, formatEstimatedTime, parseStepInstantMs } from '../utils/timeUtils'
@@ -34,38 +34,8 @@ interface QueueStatus {
   estimated_wait_seconds?: number | null
 }
 
-interface SubStep {
-  name: string
-  status: 'pending' | 'running' | 'completed' | 'failed'
-  message?: string
-  started_at?: string | null
-  completed_at?: string | null
-  type?: 'phase' | 'action' | 'output'  // Substep type for visual distinction
-}
-
-interface Step {
-  number: number
-  name: string
-  status: 'pending' | 'running' | 'completed' | 'failed'
-  message?: string
-  substeps?: SubStep[]
-  /** Step start (ISO); used for live elapsed while running */
-  started_at?: string | null
-  /** Elapsed time in seconds (final when completed; while running prefer started_at + tick) */
-  duration_seconds?: number | null
-  /** Max duration in seconds from manifest (timeout) */
-  timeout_seconds?: number | null
-}
-
-interface WebSocketMessage {
-  type: string
-  steps?: Step[]
-  progress_percentage?: number
-  total_steps?: number
-  scan_id?: string
-  status?: string
-  timestamp?: number
-}
+type SubStep = ScanSubStep
+type Step = ScanStep
 
 export default function ScanView() {
   const navigate = useNavigate()
@@ -82,8 +52,8 @@ export default function ScanView() {
   )
 
   const [queueStatus, setQueueStatus] = useState<QueueStatus | null>(null)
-  const [steps, setSteps] = useState<Step[]>([])
-  const [progress, setProgress] = useState<number>(0)
+  // Steps: GET /steps snapshot, then scan_steps SSE deltas (resume-from-seq on gaps)
+  const { steps, progress } = useScanSteps(status.scan_id)
   const [isStepsSidebarOpen, setIsStepsSidebarOpen] = useState(false)
   const [isLogsSidebarOpen, setIsLogsSidebarOpen] = useState(false)
   const [isAIPromptModalOpen, setIsAIPromptModalOpen] = useState(false)
@@ -234,7 +204,7 @@ export default function ScanView() {
     return () => window.clearInterval(intervalId)
   }, [status.status, status.scan_id, syncScanFromServer])
 
-  // Running: SSE + WebSocket scan_status; safety DB sync while worker finishes report
+  // Running: SSE scan_update; safety DB sync while worker finishes report
   useEffect(() => {
     if (status.status !== 'running' || !status.scan_id) return
     const scanId = status.scan_id
@@ -266,85 +236,6 @@ export default function ScanView() {
     return () => window.clearInterval(id)
   }, [status.status])
 
-  // WebSocket: Real-time scan updates using new service
-  const { service } = useWebSocket(
-    status.status === 'running' && status.scan_id ? status.scan_id : null
-  )
-
-  // Load steps from REST API when scan_id is available (initial load)
-  useEffect(() => {
-    if (!status.scan_id) return
-
-    const fetchSteps = async () => {
-      try {
-        const { apiFetch } = await import('../utils/apiClient')
-        const response = await apiFetch(`/api/v1/scans/${status.scan_id}/steps`)
-        if (response.ok) {
-          const data = await response.json()
-          if (data.steps && data.steps.length > 0) {
-            const convertedSteps: Step[] = data.steps.map((step: any) => ({
-              number: step.number || 0,
-              name: step.name || 'Unknown',
-              status: (step.status || 'pending') as 'pending' | 'running' | 'completed' | 'failed',
-              message: step.message || '',
-              substeps: step.substeps ? step.substeps.map((substep: any) => ({
-                name: substep.name || '',
-                status: (substep.status || 'pending') as 'pending' | 'running' | 'completed' | 'failed',
-                message: substep.message || '',
-                started_at: substep.started_at || null,
-                completed_at: substep.completed_at || null,
-              })) : [],
-              started_at: step.started_at ?? null,
-              duration_seconds: step.duration_seconds ?? null,
-              timeout_seconds: step.timeout_seconds ?? null,
-            }))
-            setSteps(convertedSteps)
-            if (data.progress_percentage !== undefined) {
-              setProgress(data.progress_percentage)
-            }
-          }
-        }
-      } catch (error) {
-        console.error('Failed to fetch steps:', error)
-      }
-    }
-
-    fetchSteps()
-  }, [status.scan_id])
-
-  // Handle WebSocket messages to update steps and progress (real-time updates)
-  useEffect(() => {
-    if (!service) return
-
-    const handleMessage = (data: WebSocketMessage) => {
-      if (data.type === 'scan_status' && data.status && status.scan_id) {
-        void fetchAndApplyScanStatus(status.scan_id)
-        return
-      }
-      if (data.type === 'step_update' && data.steps) {
-        setSteps(data.steps)
-        if (data.progress_percentage !== undefined) {
-          setProgress(data.progress_percentage)
-        }
-      } else if (data.type === 'initial_steps' && data.steps) {
-        setSteps(data.steps)
-        if (data.progress_percentage !== undefined) {
-          setProgress(data.progress_percentage)
-        }
-      }
-    }
-
-    // Set up message handler
-    service.onMessage(handleMessage)
-
-    return () => {
-      // Clean up message handler
-      if (service) {
-        service.onMessage(() => {}) // Clear handler
-      }
-    }
-  }, [service, status.scan_id, fetchAndApplyScanStatus])
-
   // Listen for messages from iframe (HTML Report) — legacy export page only
   useEffect(() => {
     const handleMessage = (event: MessageEvent) => {
@@ -361,7 +252,7 @@ export default function ScanView() {
     return () => window.removeEventListener('message', handleMessage)
   }, [])
 
-  // Progress is now calculated in backend and sent via WebSocket
+  // Progress: share of completed/failed steps (useScanSteps)
 
   const toggleStepExpand = (stepNumber: number) => {
     setExpandedStepNumbers((prev) => {
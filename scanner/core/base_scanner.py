@@ -2,11 +2,17 @@
 Base Scanner Class
 Common functionality for all scanner implementations
 """
+import codecs
+import contextvars
 import os
 import signal
 import subprocess
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import IO, Optional, List, Dict, Any, Sequence
+from scanner.core.scan_scheduler import ENV_SCANNER_CPUS, detect_cpu_budget
 from scanner.core.scanner_registry import ScanType, TargetType, ArtifactType, ScannerCapability
 from scanner.core.step_registry import SubStepType
 from scanner.core.manifest_exit_codes import (
@@ -18,6 +24,22 @@ from abc import ABC, abstractmethod
 # Global StepRegistry instance (set by orchestrator)
 _global_step_registry = None
 
+# Per-invocation environment overlay (admin/profile overrides, SCANNER_TIMEOUT_SECONDS).
+# Set by the orchestrator around one scanner run; never written to os.environ, so
+# concurrently running scanners each see only their own values.
+_invocation_env: contextvars.ContextVar[Dict[str, str]] = contextvars.ContextVar(
+    "ssc_scanner_invocation_env", default={}
+)
+
+
+def set_invocation_env(env: Dict[str, str]) -> contextvars.Token:
+    """Install the env overlay for the current context (orchestrator, per scanner run)."""
+    return _invocation_env.set(dict(env))
+
+
+def reset_invocation_env(token: contextvars.Token) -> None:
+    _invocation_env.reset(token)
+
 
 def scan_log_verbose() -> bool:
     """When true, mirror tool stdout/stderr to console. Default: quiet console, full detail in per-tool log files."""
@@ -35,6 +57,110 @@ def get_global_step_registry():
     return _global_step_registry
 
 
+# Lines of stdout/stderr kept for the failure tail when the full text is not retained.
+OUTPUT_TAIL_LINES = 200
+# Single-line JSON reports can be huge; the tail only needs the end of each line.
+_TAIL_LINE_CHARS = 4096
+_LOG_FLUSH_INTERVAL = 0.5
+
+
+class _OutputTee:
+    """
+    Drain one subprocess pipe in a background thread.
+
+    Output is appended to the per-tool log file as it arrives (flushed at most every
+    ``_LOG_FLUSH_INTERVAL`` seconds), the last ``OUTPUT_TAIL_LINES`` lines are kept in a
+    ring buffer, and the full text is only retained when ``keep_full`` is set.
+    """
+
+    def __init__(self, pipe: IO[bytes], log_file: Path, keep_full: bool = False):
+        self._pipe = pipe
+        self._log_file = log_file
+        self._keep_full = keep_full
+        self._chunks: List[str] = []
+        self.tail: deque = deque(maxlen=OUTPUT_TAIL_LINES)
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+
+    def start(self) -> "_OutputTee":
+        self._thread.start()
+        return self
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        self._thread.join(timeout)
+
+    def _drain(self) -> None:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        try:
+            log = open(self._log_file, "a", encoding="utf-8")
+        except OSError:
+            log = None
+        partial = ""
+        last_flush = time.monotonic()
+        try:
+            for raw in iter(lambda: self._pipe.read1(65536), b""):
+                text = decoder.decode(raw)
+                if not text:
+                    continue
+                if log is not None:
+                    log.write(text)
+                    now = time.monotonic()
+                    if now - last_flush >= _LOG_FLUSH_INTERVAL:
+                        log.flush()
+                        last_flush = now
+                if self._keep_full:
+                    self._chunks.append(text)
+                if "\n" not in text:
+                    partial = (partial + text)[-_TAIL_LINE_CHARS:]
+                    continue
+                lines = (partial + text).split("\n")
+                partial = lines.pop()[-_TAIL_LINE_CHARS:]
+                self.tail.extend(ln[-_TAIL_LINE_CHARS:] for ln in lines[-OUTPUT_TAIL_LINES:])
+            rest = decoder.decode(b"", final=True)
+            if rest:
+                if log is not None:
+                    log.write(rest)
+                if self._keep_full:
+                    self._chunks.append(rest)
+            if partial + rest or self.tail:
+                # Empty last element: output ended with a newline, which tail_text keeps
+                self.tail.append(partial + rest)
+        except (OSError, ValueError):
+            pass
+        finally:
+            if log is not None:
+                try:
+                    log.close()
+                except OSError:
+                    pass
+            try:
+                self._pipe.close()
+            except OSError:
+                pass
+
+    @property
+    def text(self) -> str:
+        """Full output when retained, otherwise the buffered tail."""
+        if self._keep_full:
+            return "".join(self._chunks).replace("\r\n", "\n")
+        return self.tail_text
+
+    @property
+    def tail_text(self) -> str:
+        return "\n".join(self.tail).replace("\r\n", "\n")
+
+
+def _file_tail_text(path: Path, max_bytes: int = 64 * 1024) -> str:
+    """Last ``max_bytes`` of a (partial) report file, for failure diagnostics."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - max_bytes))
+            return f.read().decode("utf-8", errors="replace")
+    except OSError:
+        return ""
+
+
 class BaseScanner(ABC):
     """Base class for all scanners - provides common functionality"""
     
@@ -76,6 +202,36 @@ class BaseScanner(ABC):
         self.results_dir.mkdir(parents=True, exist_ok=True)
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
         self._manifest_exit_note_logged = False
+        # Snapshot of the invocation overlay; read via getenv() / process_env().
+        self.env_overrides: Dict[str, str] = dict(_invocation_env.get())
+        # Set by the orchestrator per run; preferred over the env so
+        # concurrently running scanners each keep their own limit.
+        self.timeout_seconds: Optional[int] = None
+
+    def getenv(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """``os.getenv`` with this run's override env layered on top."""
+        overlay = getattr(self, "env_overrides", None)
+        if overlay is None:
+            # Called from a subclass __init__ before BaseScanner.__init__ ran
+            overlay = _invocation_env.get()
+        if key in overlay:
+            return overlay[key]
+        return os.environ.get(key, default)
+
+    def process_env(self) -> Dict[str, str]:
+        """Environment for tool subprocesses: os.environ plus this run's overrides."""
+        env = os.environ.copy()
+        env.update(getattr(self, "env_overrides", None) or _invocation_env.get())
+        return env
+
+    def cpu_budget(self) -> int:
+        """Whole cores this run may use for tool workers (``--jobs``); set per run by the orchestrator."""
+        raw = (self.getenv(ENV_SCANNER_CPUS) or "").strip()
+        try:
+            cpus = float(raw) if raw else detect_cpu_budget()
+        except ValueError:
+            cpus = detect_cpu_budget()
+        return max(1, int(cpus))
 
     def log(self, message: str, level: str = "INFO"):
         """Log message to log file and stdout"""
@@ -111,8 +267,10 @@ class BaseScanner(ABC):
             self.log(f"  {line}", "WARNING")
     
     def get_timeout(self) -> int:
-        """Timeout seconds from ``SCANNER_TIMEOUT_SECONDS`` (set by orchestrator from manifest only)."""
-        raw = os.getenv("SCANNER_TIMEOUT_SECONDS")
+        """Timeout seconds: ``timeout_seconds`` set by the orchestrator, else ``SCANNER_TIMEOUT_SECONDS``."""
+        if self.timeout_seconds is not None and self.timeout_seconds > 0:
+            return int(self.timeout_seconds)
+        raw = self.getenv("SCANNER_TIMEOUT_SECONDS")
         if raw is None or not str(raw).strip():
             raise RuntimeError(
                 "SCANNER_TIMEOUT_SECONDS is not set. "
@@ -137,10 +295,16 @@ class BaseScanner(ABC):
         capture_output: bool = True,
         use_process_group: bool = True,
         log_failure_output_tail: bool = True,
+        stdout_file: Optional[Path] = None,
+        stdout_file_exit_codes: Sequence[int] = (0,),
+        keep_output: bool = False,
     ) -> subprocess.CompletedProcess:
         """
         Run a command and log output
         
+        Output is streamed: stdout/stderr are appended to the per-tool log file while the
+        tool runs instead of being buffered until it exits.
+
         Args:
             cmd: Command to run
             cwd: Working directory
@@ -151,6 +315,14 @@ class BaseScanner(ABC):
                 tools like Checkov where process groups break multiprocessing.
             log_failure_output_tail: If False, do not print stderr/stdout tail to console on
                 non-zero exit (output is still appended to the per-tool log file).
+            stdout_file: Write stdout straight to this file (for tools that print their report
+                to stdout) instead of holding it in memory; ``result.stdout`` is then None.
+                The file is written via a ``.part`` sibling and only put in place when the exit
+                code is in ``stdout_file_exit_codes`` and the output is non-empty.
+            stdout_file_exit_codes: Exit codes for which ``stdout_file`` is kept.
+            keep_output: Return the full stdout/stderr (for output that is parsed or saved).
+                By default ``result.stdout``/``result.stderr`` only hold the last
+                ``OUTPUT_TAIL_LINES`` lines; the full output is in the per-tool log file.
 
         Returns:
             CompletedProcess result
@@ -167,21 +339,34 @@ class BaseScanner(ABC):
                 pass
         
         process = None
+        stdout_part: Optional[Path] = None
+        stdout_handle = None
+        tees: Dict[str, _OutputTee] = {}
         try:
+            if stdout_file is not None:
+                stdout_file = Path(stdout_file)
+                stdout_file.parent.mkdir(parents=True, exist_ok=True)
+                stdout_part = stdout_file.with_name(stdout_file.name + ".part")
+                stdout_handle = open(stdout_part, "wb")
+                stdout_target = stdout_handle
+            else:
+                stdout_target = subprocess.PIPE if capture_output else None
             # Process group: kill all children on timeout. Optional: Checkov passes False (setsid breaks it).
             process = subprocess.Popen(
                 cmd,
                 cwd=str(cwd) if cwd else None,
-                env=env or os.environ.copy(),
-                stdout=subprocess.PIPE if capture_output else None,
+                env=env or self.process_env(),
+                stdout=stdout_target,
                 stderr=subprocess.PIPE if capture_output else None,
-                text=True,
                 preexec_fn=os.setsid if (hasattr(os, 'setsid') and use_process_group) else None
             )
+            if process.stdout is not None:
+                tees["stdout"] = _OutputTee(process.stdout, self.log_file, keep_output).start()
+            if process.stderr is not None:
+                tees["stderr"] = _OutputTee(process.stderr, self.log_file, keep_output).start()
             
             try:
-                stdout, stderr = process.communicate(timeout=timeout)
-                returncode = process.returncode
+                returncode = process.wait(timeout=timeout)
             except subprocess.TimeoutExpired:
                 if use_process_group and hasattr(os, "setsid"):
                     try:
@@ -200,6 +385,32 @@ class BaseScanner(ABC):
                 
                 self.log(f"Command timed out after {timeout} seconds", "ERROR")
                 raise subprocess.TimeoutExpired(cmd, timeout)
+            finally:
+                # Orphaned grandchildren may keep a pipe open; don't block on them forever.
+                for tee in tees.values():
+                    tee.join(timeout=5)
+            
+            stdout = tees["stdout"].text if "stdout" in tees else None
+            stderr = tees["stderr"].text if "stderr" in tees else None
+            stdout_tail = tees["stdout"].tail_text if "stdout" in tees else ""
+            if stdout_handle is not None:
+                stdout_handle.close()
+                stdout_handle = None
+                keep = returncode in stdout_file_exit_codes and stdout_part.stat().st_size > 0
+                if not keep and returncode != 0:
+                    stdout_tail = _file_tail_text(stdout_part)
+                if keep:
+                    os.replace(stdout_part, stdout_file)
+                else:
+                    stdout_part.unlink(missing_ok=True)
+                try:
+                    with open(self.log_file, "a", encoding="utf-8") as f:
+                        f.write(
+                            f"[stdout -> {stdout_file}]\n" if keep
+                            else f"[stdout discarded (exit {returncode})]\n"
+                        )
+                except OSError:
+                    pass
             
             # Create CompletedProcess-like result
             result = subprocess.CompletedProcess(
@@ -209,34 +420,29 @@ class BaseScanner(ABC):
                 stderr
             )
             
-            # Log output: always full detail to per-tool log file; console depends on SSC_SCAN_LOG_VERBOSE
+            # Per-tool log already holds the full output (streamed above); console depends on SSC_SCAN_LOG_VERBOSE
             if capture_output:
                 verbose = scan_log_verbose()
-                if result.stdout:
-                    with open(self.log_file, "a", encoding="utf-8") as f:
-                        f.write(result.stdout)
-                    if verbose and result.returncode != 0:
-                        stdout_lines = result.stdout.split("\n")
-                        error_lines = [
-                            line.strip()
-                            for line in stdout_lines
-                            if line.strip()
-                            and any(
-                                keyword in line.lower()
-                                for keyword in ("error", "failed", "exception", "fatal", "warning")
-                            )
-                        ]
-                        for error_line in error_lines[:10]:
-                            self.log(
-                                f"[STDOUT] {error_line}",
-                                "ERROR"
-                                if "error" in error_line.lower() or "failed" in error_line.lower()
-                                else "WARNING",
-                            )
+                if stdout_tail and verbose and result.returncode != 0:
+                    stdout_lines = (result.stdout or stdout_tail).split("\n")
+                    error_lines = [
+                        line.strip()
+                        for line in stdout_lines
+                        if line.strip()
+                        and any(
+                            keyword in line.lower()
+                            for keyword in ("error", "failed", "exception", "fatal", "warning")
+                        )
+                    ]
+                    for error_line in error_lines[:10]:
+                        self.log(
+                            f"[STDOUT] {error_line}",
+                            "ERROR"
+                            if "error" in error_line.lower() or "failed" in error_line.lower()
+                            else "WARNING",
+                        )
 
                 if result.stderr:
-                    with open(self.log_file, "a", encoding="utf-8") as f:
-                        f.write(result.stderr)
                     if verbose:
                         stderr_lines = result.stderr.split("\n")
                         for stderr_line in stderr_lines[:30]:
@@ -245,8 +451,8 @@ class BaseScanner(ABC):
                                 lvl = "ERROR" if result.returncode != 0 else "INFO"
                                 self.log(f"[STDERR] {stderr_line.strip()}", lvl)
                     elif result.returncode != 0 and log_failure_output_tail:
-                        self._log_output_tail(result.stderr, "[STDERR]", max_lines=18)
-                        self._log_output_tail(result.stdout, "[STDOUT]", max_lines=10)
+                        self._log_output_tail(tees["stderr"].tail_text, "[STDERR]", max_lines=18)
+                        self._log_output_tail(stdout_tail, "[STDOUT]", max_lines=10)
             
             if result.returncode == 0:
                 if scan_log_verbose():
@@ -287,7 +493,7 @@ class BaseScanner(ABC):
         except subprocess.TimeoutExpired:
             raise
         except Exception as e:
-            if process:
+            if process and process.poll() is None:
                 try:
                     if use_process_group and hasattr(os, "setsid"):
                         try:
@@ -301,6 +507,10 @@ class BaseScanner(ABC):
                     pass
             self.log(f"Error running command: {e}", "ERROR")
             raise
+        finally:
+            if stdout_handle is not None:
+                stdout_handle.close()
+                stdout_part.unlink(missing_ok=True)
     
     def get_tool_command(self, tool_name: str) -> Optional[List[str]]:
         """
@@ -350,7 +560,19 @@ class BaseScanner(ABC):
             from scanner.core.scan_excludes import merged_exclude_list
 
             return ",".join(merged_exclude_list(self.target_path, extra_csv=override))
-        return os.getenv("SIMPLESECCHECK_EXCLUDE_PATHS", "").strip()
+        return self.getenv("SIMPLESECCHECK_EXCLUDE_PATHS", "").strip()
+
+    def scan_candidate_files(self, suffixes: Optional[Sequence[str]] = None, exclude_csv: Optional[str] = None) -> List[str]:
+        """
+        Target-relative files a per-file tool analyses (findings-cache candidates): git ls-files
+        for checkouts, else a .gitignore-aware walk; minus the scan excludes (``exclude_csv``,
+        default SIMPLESECCHECK_EXCLUDE_PATHS) and files whose suffix is not in ``suffixes``.
+        """
+        from scanner.core.findings_cache import target_files
+        from scanner.core.scan_excludes import exclude_matcher
+
+        csv = exclude_csv if exclude_csv is not None else self.scan_exclude_paths()
+        return target_files(self.target_path, exclude_matcher(self.target_path, csv), suffixes)
 
     def should_skip_scan_path(self, path: Path | str) -> bool:
         from scanner.core.scan_excludes import path_matches_exclude
@@ -0,0 +1,632 @@
+"""
+Content-addressed per-file findings cache, shared across scans on the results volume.
+
+Per-file tools (bandit, semgrep, detect_secrets, eslint, baas_rules) store the findings
+of every analysed file under its git blob hash. The namespace combines the tool version
+(manifest ``checkpoint.version_command`` via ``run_tool_version`` plus the plugin source)
+and ``scanner_config_hash``, plus the contents of local rule files the tool reads itself
+(semgrep's rules directory), so any tool/profile/override/rule change starts a fresh cache.
+The next scan of the same repository only analyses blobs that are not cached and merges
+cached findings for the rest.
+
+Layout: ``<root>/<tools_key>/<namespace>/<blob[:2]>/<blob>-<path-hash>.json``. The path is
+part of the entry because rules and excludes are path-scoped (a moved file is re-analysed).
+
+Expired entries (older than the max age; namespaces of old tool versions expire the same way)
+are deleted by a sweep over the whole root that runs at most every PRUNE_INTERVAL_SECONDS,
+after a scan stores its entries.
+"""
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import json
+import os
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from scanner.core.scan_checkpoint import ensure_git_safe_directory, run_tool_version
+from scanner.core.scan_diff import ENV_SCAN_DIFF_FILE, ScanDiff, load_scan_diff
+
+ENV_FINDINGS_CACHE = "SSC_FINDINGS_CACHE"
+ENV_FINDINGS_CACHE_DIR = "SSC_FINDINGS_CACHE_DIR"
+ENV_FINDINGS_CACHE_MAX_AGE_DAYS = "SSC_FINDINGS_CACHE_MAX_AGE_DAYS"
+# Set per scanner run by the orchestrator (same hash the checkpoint uses).
+ENV_SCANNER_CONFIG_HASH = "SSC_SCANNER_CONFIG_HASH"
+
+CACHE_VERSION = 1
+# Registry rule packs (semgrep p/*) change without a tool version bump; bound entry age.
+DEFAULT_MAX_AGE_DAYS = 7
+# Above this share of changed files a full run is about as fast and keeps argv small.
+MAX_MISS_RATIO = 0.5
+MAX_MISS_FILES = 2000
+PRUNE_INTERVAL_SECONDS = 6 * 3600
+# Deletion age when entries never expire on read (max age 0)
+PRUNE_FALLBACK_MAX_AGE_DAYS = 30
+_PRUNE_MARKER = ".last-prune"
+
+
+def git_blob_hash(path: Path) -> str:
+    """Same id ``git hash-object`` prints, so index hashes and on-disk hashes agree."""
+    h = hashlib.sha1()
+    size = path.stat().st_size
+    h.update(f"blob {size}\0".encode("ascii"))
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _git_lines(repo: Path, *args: str) -> Optional[List[str]]:
+    try:
+        r = subprocess.run(
+            ["git", "-C", str(repo), *args],
+            capture_output=True,
+            timeout=120,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if r.returncode != 0:
+        return None
+    return [x for x in r.stdout.decode("utf-8", errors="surrogateescape").split("\0") if x]
+
+
+def indexed_blob_hashes(root: Path) -> Dict[str, str]:
+    """rel path -> blob hash from the git index, for tracked files unmodified on disk ({} if not git)."""
+    indexed: Dict[str, str] = {}
+    if not (root / ".git").exists():
+        return indexed
+    ensure_git_safe_directory(root)
+    staged = _git_lines(root, "ls-files", "-s", "-z")
+    dirty = _git_lines(root, "diff", "--name-only", "-z")
+    if staged is None or dirty is None:
+        return indexed
+    dirty_set = set(dirty)
+    for line in staged:
+        meta, _, rel = line.partition("\t")
+        parts = meta.split()
+        if len(parts) == 3 and parts[2] == "0" and rel not in dirty_set:
+            indexed[rel] = parts[1]
+    return indexed
+
+
+def git_listed_files(root: Path) -> Optional[List[str]]:
+    """Tracked and untracked, not ignored files (honours .gitignore / info/exclude); None if not git."""
+    if not (root / ".git").exists():
+        return None
+    ensure_git_safe_directory(root)
+    return _git_lines(root, "ls-files", "-z", "--cached", "--others", "--exclude-standard")
+
+
+class _GitignoreRules:
+    """Minimal .gitignore matcher for targets that are not git checkouts (uploads, archives)."""
+
+    def __init__(self) -> None:
+        # (base_dir, pattern, negate, dir_only, anchored), in file/line order
+        self._rules: List[Tuple[str, str, bool, bool, bool]] = []
+
+    def add_file(self, path: Path, base_dir: str) -> None:
+        try:
+            lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+        except OSError:
+            return
+        for raw in lines:
+            line = raw.strip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/").removeprefix("**/")
+            # A slash at the start or in the middle anchors the pattern to the .gitignore dir
+            anchored = "/" in line
+            line = line.lstrip("/")
+            if line:
+                self._rules.append((base_dir, line, negate, dir_only, anchored))
+
+    def ignored(self, rel: str, is_dir: bool) -> bool:
+        result = False
+        name = rel.rsplit("/", 1)[-1]
+        for base_dir, pattern, negate, dir_only, anchored in self._rules:
+            if dir_only and not is_dir:
+                continue
+            if base_dir:
+                if not rel.startswith(base_dir + "/"):
+                    continue
+                sub = rel[len(base_dir) + 1 :]
+            else:
+                sub = rel
+            if fnmatch.fnmatchcase(sub if anchored else name, pattern):
+                result = not negate
+        return result
+
+
+def target_files(
+    root: Path,
+    excluded: Callable[[str], bool],
+    suffixes: Optional[Iterable[str]] = None,
+) -> List[str]:
+    """
+    Sorted relative paths of the files under ``root`` a per-file tool analyses: git's view when
+    a checkout (tracked and untracked, not ignored), else a walk honouring .gitignore that never
+    enters .git; minus ``excluded`` and, if given, files whose suffix is not in ``suffixes``.
+    """
+    wanted = {s.lower() for s in suffixes} if suffixes is not None else None
+
+    def keep(rel: str) -> bool:
+        return wanted is None or os.path.splitext(rel)[1].lower() in wanted
+
+    listed = git_listed_files(root)
+    if listed is not None:
+        return sorted(rel for rel in listed if keep(rel) and not excluded(rel))
+
+    rules = _GitignoreRules()
+    out: List[str] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = Path(dirpath).relative_to(root).as_posix()
+        rel_dir = "" if rel_dir == "." else rel_dir
+        if ".gitignore" in filenames:
+            rules.add_file(Path(dirpath) / ".gitignore", rel_dir)
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        dirnames[:] = sorted(
+            d
+            for d in dirnames
+            if d != ".git" and not excluded(prefix + d) and not rules.ignored(prefix + d, True)
+        )
+        for name in filenames:
+            rel = prefix + name
+            if not keep(rel) or excluded(rel) or rules.ignored(rel, False):
+                continue
+            out.append(rel)
+    return sorted(out)
+
+
+def blob_hashes(root: Path, rel_paths: Iterable[str]) -> Dict[str, str]:
+    """
+    rel path -> blob hash. Uses the git index for tracked, unmodified files (no file reads)
+    and hashes everything else from disk.
+    """
+    wanted = list(rel_paths)
+    indexed = indexed_blob_hashes(root)
+    out: Dict[str, str] = {}
+    for rel in wanted:
+        blob = indexed.get(rel)
+        if blob is None:
+            try:
+                blob = git_blob_hash(root / rel)
+            except OSError:
+                continue
+        out[rel] = blob
+    return out
+
+
+def _plugin_manifest(scanner_class: type) -> Tuple[Optional[Path], Dict[str, Any]]:
+    from scanner.core.manifest_exit_codes import plugin_manifest_path_from_class
+
+    manifest = plugin_manifest_path_from_class(scanner_class)
+    if manifest is None:
+        return None, {}
+    try:
+        import yaml
+
+        data = yaml.safe_load(manifest.read_text(encoding="utf-8")) or {}
+    except Exception:
+        data = {}
+    return manifest, data if isinstance(data, dict) else {}
+
+
+def manifest_tool_version(scanner_class: type) -> Optional[str]:
+    """Output of manifest ``checkpoint.version_command`` (same value the checkpoint records)."""
+    _, data = _plugin_manifest(scanner_class)
+    cmd = (data.get("checkpoint") or {}).get("version_command")
+    if isinstance(cmd, list) and cmd:
+        return run_tool_version([str(c) for c in cmd])
+    return None
+
+
+def plugin_tool_version(scanner_class: type) -> str:
+    """Tool version (manifest checkpoint.version_command) + plugin source hash."""
+    parts: List[str] = []
+    manifest, data = _plugin_manifest(scanner_class)
+    if manifest is not None:
+        version = manifest_tool_version(scanner_class)
+        if version is not None:
+            parts.append(version)
+        parts.append(str(data.get("version", "")))
+        for name in ("scanner.py", "processor.py"):
+            src = manifest.parent / name
+            if src.is_file():
+                parts.append(hashlib.sha256(src.read_bytes()).hexdigest()[:16])
+    return "|".join(parts)
+
+
+@dataclass(frozen=True)
+class ReportLayout:
+    """
+    Where per-file findings live in a tool's JSON report.
+
+    ``items_key``: list/dict of findings under this key (None = the report is the list).
+    ``path_field``: item field holding the file path; with ``keyed_by_path`` the container
+    is a dict ``{path: [items]}`` (detect-secrets) and ``path_field`` is rewritten inside items.
+    ``errors``: (key, path field) of per-file analysis errors; such files are never cached.
+    """
+
+    items_key: Optional[str]
+    path_field: str
+    keyed_by_path: bool = False
+    errors: Optional[Tuple[str, str]] = None
+
+    def errored_paths(self, report: Any) -> List[str]:
+        if self.errors is None or not isinstance(report, dict):
+            return []
+        key, field = self.errors
+        return [
+            str(e[field]) for e in report.get(key) or []
+            if isinstance(e, dict) and e.get(field)
+        ]
+
+    def _container(self, report: Any) -> Any:
+        if self.items_key is None:
+            return report
+        return report.get(self.items_key) if isinstance(report, dict) else None
+
+    def split(self, report: Any) -> Dict[str, List[Any]]:
+        """reported path -> findings"""
+        out: Dict[str, List[Any]] = {}
+        container = self._container(report)
+        if self.keyed_by_path:
+            if isinstance(container, dict):
+                for path, items in container.items():
+                    out.setdefault(str(path), []).extend(items if isinstance(items, list) else [])
+            return out
+        for item in container if isinstance(container, list) else []:
+            if isinstance(item, dict) and item.get(self.path_field):
+                out.setdefault(str(item[self.path_field]), []).append(item)
+        return out
+
+    def with_items(self, report: Any, extra: Dict[str, List[Any]]) -> Any:
+        """``report`` with ``extra`` findings (reported path -> items) added."""
+        if self.items_key is not None and isinstance(report, dict):
+            container = report.get(self.items_key)
+        else:
+            container = report
+        if self.keyed_by_path:
+            container = dict(container) if isinstance(container, dict) else {}
+            for path, items in extra.items():
+                if items:
+                    container[path] = list(container.get(path) or []) + items
+            container = dict(sorted(container.items()))
+        else:
+            container = list(container) if isinstance(container, list) else []
+            for items in extra.values():
+                container.extend(items)
+        if self.items_key is None:
+            return container
+        out = dict(report) if isinstance(report, dict) else {}
+        out[self.items_key] = container
+        return out
+
+    def retarget(self, items: List[Any], path: str) -> List[Any]:
+        out = []
+        for item in items:
+            if isinstance(item, dict) and self.path_field in item:
+                item = {**item, self.path_field: path}
+            out.append(item)
+        return out
+
+
+@dataclass
+class CachePlan:
+    """Outcome of a lookup: cached findings per rel path, and files that must be analysed."""
+
+    hashes: Dict[str, str]
+    hits: Dict[str, List[Any]]
+    misses: List[str]
+
+    @property
+    def incremental(self) -> bool:
+        """Worth running the tool on ``misses`` only (at least one hit, few enough misses)."""
+        if not self.hits:
+            return False
+        if len(self.misses) > MAX_MISS_FILES:
+            return False
+        return len(self.misses) <= MAX_MISS_RATIO * len(self.hashes)
+
+
+def config_files_digest(paths: Iterable[Path]) -> str:
+    """Content hash of a tool's local config/rule files; missing files hash as absent."""
+    h = hashlib.sha256()
+    for path in sorted({str(p) for p in paths}):
+        h.update(path.encode("utf-8") + b"\0")
+        try:
+            h.update(hashlib.sha256(Path(path).read_bytes()).digest())
+        except OSError:
+            h.update(b"-")
+    return h.hexdigest()
+
+
+class FindingsCache:
+    """One tool's cache namespace (tools_key + tool version + scanner config hash + rule files)."""
+
+    def __init__(
+        self,
+        root: Path,
+        tools_key: str,
+        tool_version: str,
+        config_hash: str,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+        config_files: Iterable[Path] = (),
+    ):
+        ns = hashlib.sha256(
+            json.dumps([CACHE_VERSION, tool_version, config_hash, config_files_digest(config_files)]).encode("utf-8")
+        ).hexdigest()[:24]
+        self.root = Path(root)
+        self.dir = self.root / tools_key / ns
+        self.max_age_seconds = max(0.0, max_age_days) * 86400
+
+    @classmethod
+    def for_scanner(cls, scanner, tools_key: str, config_files: Iterable[Path] = ()) -> Optional["FindingsCache"]:
+        """
+        Cache for a running plugin, or None when disabled / no config hash from the orchestrator.
+
+        ``config_files``: rule/config files the tool reads itself (not covered by the config hash).
+        """
+        if (scanner.getenv(ENV_FINDINGS_CACHE, "1") or "").strip().lower() in ("0", "false", "no"):
+            return None
+        config_hash = (scanner.getenv(ENV_SCANNER_CONFIG_HASH) or "").strip()
+        if not config_hash:
+            return None
+        root = (scanner.getenv(ENV_FINDINGS_CACHE_DIR) or "").strip()
+        if not root:
+            base = (scanner.getenv("RESULTS_DIR_IN_CONTAINER") or "").strip()
+            if not base:
+                return None
+            root = str(Path(base) / ".findings-cache")
+        try:
+            max_age = float(scanner.getenv(ENV_FINDINGS_CACHE_MAX_AGE_DAYS, str(DEFAULT_MAX_AGE_DAYS)))
+        except ValueError:
+            max_age = DEFAULT_MAX_AGE_DAYS
+        return cls(Path(root), tools_key, plugin_tool_version(type(scanner)), config_hash, max_age, config_files)
+
+    def _entry_path(self, blob: str, rel: str) -> Path:
+        path_hash = hashlib.sha1(rel.encode("utf-8")).hexdigest()[:12]
+        return self.dir / blob[:2] / f"{blob}-{path_hash}.json"
+
+    def plan(self, root: Path, rel_paths: Iterable[str]) -> CachePlan:
+        hashes = blob_hashes(root, rel_paths)
+        hits: Dict[str, List[Any]] = {}
+        misses: List[str] = []
+        now = time.time()
+        for rel, blob in hashes.items():
+            entry = self._entry_path(blob, rel)
+            try:
+                if self.max_age_seconds and now - entry.stat().st_mtime > self.max_age_seconds:
+                    misses.append(rel)
+                    continue
+                data = json.loads(entry.read_text(encoding="utf-8"))
+                items = data.get("items")
+                if data.get("path") != rel or not isinstance(items, list):
+                    raise ValueError("stale entry")
+                hits[rel] = items
+            except (OSError, ValueError):
+                misses.append(rel)
+        return CachePlan(hashes=hashes, hits=hits, misses=sorted(misses))
+
+    def store(self, hashes: Dict[str, str], findings: Dict[str, List[Any]], rel_paths: Iterable[str]) -> int:
+        """Record findings (empty list = clean) for each analysed rel path; returns entries written."""
+        written = 0
+        for rel in rel_paths:
+            blob = hashes.get(rel)
+            if not blob:
+                continue
+            entry = self._entry_path(blob, rel)
+            try:
+                entry.parent.mkdir(parents=True, exist_ok=True)
+                tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+                tmp.write_text(
+                    json.dumps({"path": rel, "items": findings.get(rel, [])}, separators=(",", ":")),
+                    encoding="utf-8",
+                )
+                tmp.replace(entry)
+                written += 1
+            except OSError:
+                continue
+        self.prune_if_due()
+        return written
+
+    def prune_if_due(self, now: Optional[float] = None) -> int:
+        """Run prune() over the whole cache root unless another scan did within PRUNE_INTERVAL_SECONDS."""
+        now = time.time() if now is None else now
+        marker = self.root / _PRUNE_MARKER
+        try:
+            if now - marker.stat().st_mtime < PRUNE_INTERVAL_SECONDS:
+                return 0
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return 0
+        try:
+            # Claim the sweep first so concurrent scans skip it
+            self.root.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+            os.utime(marker, (now, now))
+        except OSError:
+            return 0
+        return self.prune(now)
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Delete expired entries (and leftover temp files, empty dirs) of every namespace; returns files removed."""
+        now = time.time() if now is None else now
+        max_age = self.max_age_seconds or PRUNE_FALLBACK_MAX_AGE_DAYS * 86400
+        removed = 0
+        for dirpath, dirnames, filenames in os.walk(self.root, topdown=False):
+            for name in filenames:
+                if not (name.endswith(".json") or name.endswith(".tmp")):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    if now - os.stat(path).st_mtime > max_age:
+                        os.unlink(path)
+                        removed += 1
+                except OSError:
+                    continue
+            if os.path.abspath(dirpath) != os.path.abspath(self.root):
+                try:
+                    os.rmdir(dirpath)  # only succeeds when empty
+                except OSError:
+                    pass
+        return removed
+
+
+def relative_findings(
+    layout: ReportLayout,
+    report: Any,
+    to_rel: Callable[[str], Optional[str]],
+) -> Dict[str, List[Any]]:
+    """Findings of a report keyed by rel path, with the path field rewritten to rel."""
+    out: Dict[str, List[Any]] = {}
+    for reported, items in layout.split(report).items():
+        rel = to_rel(reported)
+        if rel is not None:
+            out.setdefault(rel, []).extend(layout.retarget(items, rel))
+    return out
+
+
+def merge_cached(
+    layout: ReportLayout,
+    report: Any,
+    hits: Dict[str, List[Any]],
+    to_reported: Callable[[str], str],
+) -> Any:
+    """Add cached findings (rel path -> items) to ``report`` in the tool's own path form."""
+    extra = {}
+    for rel, items in sorted(hits.items()):
+        if items:
+            reported = to_reported(rel)
+            extra[reported] = layout.retarget(items, reported)
+    return layout.with_items(report, extra)
+
+
+def path_mapper(target: Path, absolute: bool) -> Tuple[Callable[[str], Optional[str]], Callable[[str], str]]:
+    """
+    (to_rel, to_reported) for a tool that reports paths absolute under ``target``
+    (``absolute=True``) or relative to it.
+    """
+    target_s = str(target).rstrip("/")
+
+    def to_rel(reported: str) -> Optional[str]:
+        p = reported.replace("\\", "/")
+        if p.startswith(target_s + "/"):
+            return p[len(target_s) + 1:]
+        if os.path.isabs(p):
+            return None
+        return p[2:] if p.startswith("./") else p
+
+    def to_reported(rel: str) -> str:
+        return f"{target_s}/{rel}" if absolute else rel
+
+    return to_rel, to_reported
+
+
+class IncrementalScan:
+    """
+    Plugin-side glue around one tool run.
+
+    ``targets`` is None for a full run, otherwise the rel paths (changed blobs) the tool
+    must analyse — possibly empty when everything is cached. ``finish`` merges cached
+    findings into the tool's report and records the freshly analysed files.
+
+    In diff scan mode (``scan_diff``) unchanged files take their findings from the base
+    scan's report of this tool instead of the cache.
+    """
+
+    def __init__(
+        self,
+        scanner,
+        tools_key: str,
+        layout: ReportLayout,
+        rel_paths: Callable[[], Iterable[str]],
+        absolute_paths: bool = True,
+        config_files: Iterable[Path] = (),
+    ):
+        self.scanner = scanner
+        self.layout = layout
+        self.to_rel, self.to_reported = path_mapper(scanner.target_path, absolute_paths)
+        self.cache = FindingsCache.for_scanner(scanner, tools_key, config_files)
+        self.plan: Optional[CachePlan] = None
+        diff = load_scan_diff(scanner.getenv(ENV_SCAN_DIFF_FILE) or "")
+        if diff is not None:
+            try:
+                self.plan = self._diff_plan(diff, tools_key, list(rel_paths()))
+            except Exception as e:
+                scanner.log(f"Diff scan unavailable for this tool: {e}", "WARNING")
+            if self.plan is not None and self.plan.incremental:
+                scanner.log(
+                    f"Diff scan: {len(self.plan.hits)} unchanged file(s) from base scan "
+                    f"{diff.base_scan_id}, analysing {len(self.plan.misses)} changed file(s)"
+                )
+                return
+            self.plan = None
+        if self.cache is not None:
+            try:
+                self.plan = self.cache.plan(scanner.target_path, rel_paths())
+            except Exception as e:
+                scanner.log(f"Findings cache unavailable: {e}", "WARNING")
+                self.cache = None
+        if self.plan is not None and self.plan.incremental:
+            scanner.log(
+                f"Findings cache: {len(self.plan.hits)} unchanged file(s) cached, "
+                f"analysing {len(self.plan.misses)} changed file(s)"
+            )
+
+    def _diff_plan(self, diff: ScanDiff, tools_key: str, rel_paths: List[str]) -> Optional[CachePlan]:
+        """Plan from the base scan's report; None unless the base ran this tool identically."""
+        step = diff.base_step(tools_key)
+        config_hash = (self.scanner.getenv(ENV_SCANNER_CONFIG_HASH) or "").strip()
+        if not step or not config_hash or step.get("config_hash") != config_hash:
+            self.scanner.log(f"Diff scan: base scan {diff.base_scan_id} used another config, full run")
+            return None
+        if step.get("tool_version") != manifest_tool_version(type(self.scanner)):
+            self.scanner.log(f"Diff scan: tool version changed since base scan {diff.base_scan_id}, full run")
+            return None
+        base_report = json.loads(diff.base_report(tools_key).read_text(encoding="utf-8"))
+        base_findings = relative_findings(self.layout, base_report, self.to_rel)
+        base_errored = {self.to_rel(p) for p in self.layout.errored_paths(base_report)}
+        hits: Dict[str, List[Any]] = {}
+        misses: List[str] = []
+        for rel in rel_paths:
+            if rel in diff.changed or rel in base_errored:
+                misses.append(rel)
+            else:
+                hits[rel] = base_findings.get(rel, [])
+        # Blob hashes only feed the findings cache for the re-analysed files.
+        hashes = blob_hashes(self.scanner.target_path, misses) if self.cache is not None else {}
+        hashes.update({rel: hashes.get(rel, "") for rel in rel_paths})
+        return CachePlan(hashes=hashes, hits=hits, misses=sorted(misses))
+
+    @property
+    def targets(self) -> Optional[List[str]]:
+        if self.plan is None or not self.plan.incremental:
+            return None
+        return list(self.plan.misses)
+
+    def finish(self, report: Any, ok: bool) -> Any:
+        """
+        ``report``: the tool's JSON for this run (targets only when incremental).
+        ``ok``: the run completed normally, so its per-file results may be cached.
+        """
+        if self.plan is None:
+            return report
+        analysed = self.targets if self.targets is not None else list(self.plan.hashes)
+        if ok and self.cache is not None:
+            findings = relative_findings(self.layout, report, self.to_rel)
+            errored = {self.to_rel(p) for p in self.layout.errored_paths(report)}
+            self.cache.store(self.plan.hashes, findings, [r for r in analysed if r not in errored])
+        if self.targets is None:
+            return report
+        return merge_cached(self.layout, report, self.plan.hits, self.to_reported)
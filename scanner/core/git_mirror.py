@@ -0,0 +1,190 @@
+"""
+Bare-mirror cache for git_repo targets, shared across scans on the results volume.
+
+One bare repository per normalized repository URL (credentials, scheme, ``.git`` suffix and
+trailing slashes do not matter). Each scan takes the mirror's lock, fetches the scanned branch
+into it (``--depth 1``: the server only sends objects the mirror does not have yet), then builds
+/target as a repository that borrows the mirror's objects (``objects/info/alternates``) and
+checks the commit out. /target looks like a ``git clone --depth 1``: one shallow commit,
+``origin`` = the scanned URL, the branch checked out.
+
+A failed fetch never falls back to mirror content (the caller clones directly instead), so a
+scan without access to a repository cannot read what an earlier scan cached. Mirrors are never
+garbage-collected (``gc.auto=0``): older commits stay available, e.g. for diff-only scans.
+"""
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import os
+import re
+import subprocess
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import urlsplit
+
+ENV_GIT_MIRROR_CACHE = "SSC_GIT_MIRROR_CACHE"
+ENV_GIT_MIRROR_DIR = "SSC_GIT_MIRROR_DIR"
+
+# Fetch is proportional to the delta, but the first fetch of a large repository is a full download
+_FETCH_TIMEOUT_SECONDS = 300
+_LOCK_TIMEOUT_SECONDS = 300
+_LOCAL_GIT_TIMEOUT_SECONDS = 120
+
+_SCP_LIKE = re.compile(r"^(?:[^@/]+@)?([^:/]+):(?!//)(.+)$")
+
+
+def normalize_repo_url(url: str) -> str:
+    """``host/owner/repo`` for https/ssh/scp-style URLs (no credentials, port 22/443, ``.git``)."""
+    raw = (url or "").strip()
+    m = _SCP_LIKE.match(raw)
+    if m and "://" not in raw:
+        host, path = m.group(1), m.group(2)
+    else:
+        parts = urlsplit(raw)
+        if not parts.netloc:
+            return raw.rstrip("/")
+        host = parts.hostname or ""
+        if parts.port and parts.port not in (22, 80, 443):
+            host = f"{host}:{parts.port}"
+        path = parts.path
+    path = path.strip("/")
+    if path.endswith(".git"):
+        path = path[: -len(".git")]
+    return f"{host.lower()}/{path.rstrip('/')}"
+
+
+def mirror_dir_for(cache_root: Path, url: str) -> Path:
+    normalized = normalize_repo_url(url)
+    digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+    name = re.sub(r"[^A-Za-z0-9._-]", "_", normalized.rsplit("/", 1)[-1])[:40]
+    return cache_root / f"{digest}-{name}.git"
+
+
+def mirror_cache_root() -> Optional[Path]:
+    """Mirror cache location, or None when disabled / no results volume."""
+    if os.environ.get(ENV_GIT_MIRROR_CACHE, "1").strip().lower() in ("0", "false", "no", "off"):
+        return None
+    root = os.environ.get(ENV_GIT_MIRROR_DIR, "").strip()
+    if root:
+        return Path(root)
+    base = os.environ.get("RESULTS_DIR_IN_CONTAINER", "").strip()
+    return Path(base) / ".git-mirrors" if base else None
+
+
+class _MirrorLock:
+    """Exclusive flock on ``<mirror>.lock`` (released by the kernel if the scan dies)."""
+
+    def __init__(self, mirror: Path, timeout: float = _LOCK_TIMEOUT_SECONDS):
+        self.path = mirror.with_suffix(".lock")
+        self.timeout = timeout
+        self._fh = None
+
+    def __enter__(self) -> "_MirrorLock":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.path, "a+")
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return self
+            except BlockingIOError:
+                if time.monotonic() > deadline:
+                    self._fh.close()
+                    raise TimeoutError(f"mirror lock {self.path} busy for {self.timeout:.0f}s")
+                time.sleep(0.5)
+
+    def __exit__(self, *exc) -> None:
+        if self._fh is not None:
+            fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+            self._fh.close()
+
+
+def _git(*args: str, timeout: float = _LOCAL_GIT_TIMEOUT_SECONDS) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["git", *args],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        check=False,
+        env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+    )
+
+
+def _error(result: subprocess.CompletedProcess) -> str:
+    return (result.stderr or result.stdout or "").strip() or f"exit code {result.returncode}"
+
+
+def remote_default_branch(url: str) -> Optional[str]:
+    """Branch the remote HEAD points to (what a plain clone checks out), or None."""
+    r = _git("ls-remote", "--symref", url, "HEAD", timeout=_FETCH_TIMEOUT_SECONDS)
+    if r.returncode != 0:
+        return None
+    for line in r.stdout.splitlines():
+        if line.startswith("ref: refs/heads/") and line.endswith("\tHEAD"):
+            return line[len("ref: refs/heads/"):-len("\tHEAD")]
+    return None
+
+
+def fetch_into_mirror(mirror: Path, url: str, branch: Optional[str]) -> Tuple[Optional[str], str]:
+    """Fetch ``branch`` (remote HEAD if None) into the mirror; returns (commit, error). Lock held by caller."""
+    if not (mirror / "HEAD").exists():
+        r = _git("init", "--bare", "--quiet", str(mirror))
+        if r.returncode != 0:
+            return None, f"cannot create mirror: {_error(r)}"
+        _git("-C", str(mirror), "config", "gc.auto", "0")
+    src = f"refs/heads/{branch}" if branch else "HEAD"
+    local = f"refs/ssc/heads/{branch}" if branch else "refs/ssc/HEAD"
+    r = _git(
+        "-C", str(mirror), "fetch", "--quiet", "--no-tags", "--depth", "1", url, f"+{src}:{local}",
+        timeout=_FETCH_TIMEOUT_SECONDS,
+    )
+    if r.returncode != 0:
+        return None, _error(r)
+    r = _git("-C", str(mirror), "rev-parse", "--verify", f"{local}^{{commit}}")
+    if r.returncode != 0:
+        return None, _error(r)
+    return r.stdout.strip(), ""
+
+
+def checkout_from_mirror(mirror: Path, commit: str, url: str, branch: Optional[str], target: Path) -> str:
+    """Build ``target`` as a shallow single-commit repo borrowing the mirror's objects; returns error or ''."""
+    r = _git("init", "--quiet", str(target))
+    if r.returncode != 0:
+        return _error(r)
+    git_dir = target / ".git"
+    (git_dir / "objects" / "info").mkdir(parents=True, exist_ok=True)
+    (git_dir / "objects" / "info" / "alternates").write_text(f"{mirror.resolve() / 'objects'}\n", encoding="utf-8")
+    # Same history as a --depth 1 clone
+    (git_dir / "shallow").write_text(f"{commit}\n", encoding="utf-8")
+    for args in (
+        ("remote", "add", "origin", url),
+        ("checkout", "--quiet", "-B", branch, commit) if branch else ("checkout", "--quiet", "--detach", commit),
+    ):
+        r = _git("-C", str(target), *args)
+        if r.returncode != 0:
+            return _error(r)
+    return ""
+
+
+def clone_via_mirror(url: str, branch: Optional[str], target: Path, cache_root: Path) -> Tuple[bool, str]:
+    """
+    Update the repository's mirror and check ``branch`` out into ``target`` (empty directory).
+    Returns (ok, message); on failure ``target`` may be partially written.
+    """
+    mirror = mirror_dir_for(cache_root, url)
+    branch = branch or remote_default_branch(url)
+    try:
+        with _MirrorLock(mirror):
+            started = time.monotonic()
+            commit, err = fetch_into_mirror(mirror, url, branch)
+            if commit is None:
+                return False, f"mirror fetch failed: {err}"
+            fetch_seconds = time.monotonic() - started
+        err = checkout_from_mirror(mirror, commit, url, branch, target)
+    except (OSError, TimeoutError, subprocess.TimeoutExpired) as e:
+        return False, f"mirror error: {e}"
+    if err:
+        return False, f"checkout from mirror failed: {err}"
+    return True, f"{commit[:12]} via mirror {mirror.name} (fetch {fetch_seconds:.1f}s)"
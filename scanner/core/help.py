@@ -82,15 +82,59 @@ OPTIONAL ENVIRONMENT VARIABLES:
                                  Set to 1, true, or yes for verbose console (legacy-style noise).
                                  Example: SSC_SCAN_LOG_VERBOSE=1
 
+  SSC_SCAN_MAX_PARALLEL          Run independent scanners concurrently (optional)
+                                 Default: unset/1 — scanners run one after another.
+                                 N = at most N scanners at once; auto = one slot per available CPU core.
+                                 Admission uses manifest execution.resources (cpu, memory_mb, exclusive).
+                                 Example: SSC_SCAN_MAX_PARALLEL=auto
+
+  SSC_SCAN_CPU_BUDGET            CPU cores / memory (MB) shared by parallel scanners (optional)
+  SSC_SCAN_MEMORY_BUDGET_MB      Default: detected from cgroup limits, else host CPU count / RAM.
+                                 Example: SSC_SCAN_CPU_BUDGET=8 SSC_SCAN_MEMORY_BUDGET_MB=12000
+                                 Each scanner is told its share (SSC_SCANNER_CPUS) to size tool
+                                 workers, e.g. Semgrep --jobs (override: SEMGREP_JOBS).
+
+  SSC_FINDINGS_CACHE             Per-file findings cache for bandit, semgrep, detect-secrets, eslint
+                                 Default: on — files whose git blob is unchanged since an earlier scan
+                                 (same tool version and scanner config) are not re-analysed.
+                                 Set to 0 to always analyse every file.
+  SSC_FINDINGS_CACHE_DIR         Cache location (default: {RESULTS_DIR_IN_CONTAINER}/.findings-cache)
+  SSC_FINDINGS_CACHE_MAX_AGE_DAYS  Entries older than this are re-analysed (default: 7; registry
+                                 rule packs can change without a tool version bump)
+
+  SSC_INLINE_SUPPRESSIONS_CACHE  Cache of inline suppression comments (# nosec, eslint-disable, ...)
+                                 Default: on — stored next to the findings cache; files whose git blob
+                                 (or size/mtime) is unchanged are not re-read. Set to 0 to disable.
+  SSC_INLINE_SUPPRESSIONS_WORKERS  Threads reading files for the suppression index (default: CPUs, max 8)
+                                 The index skips scan excludes and .gitignore'd paths.
+
+  SSC_SCAN_DIFF_BASE_SCAN_ID     Diff-only scan of a git_repo target (optional; set by the worker
+                                 from scan config diff_base_scan_id)
+                                 Per-file scanners analyse only files changed since that scan's commit
+                                 and keep its findings for the rest (if tool version and config match);
+                                 all other scanners run in full. Falls back to a full scan if the base
+                                 scan or its commit is unavailable.
+
   GIT_BRANCH                     Git branch to clone (for git_repo target type)
                                  Example: GIT_BRANCH=main
 
+  SSC_GIT_MIRROR_CACHE           Shared bare mirror per repository URL for git_repo targets
+                                 Default: on — the scan fetches only new objects into the mirror and
+                                 checks out from it; clones directly if the mirror fetch fails.
+                                 Set to 0 to always clone directly.
+  SSC_GIT_MIRROR_DIR             Mirror location (default: {RESULTS_DIR_IN_CONTAINER}/.git-mirrors)
+
   EXCLUDE_PATHS                   Comma-separated list of paths to exclude
                                  Example: EXCLUDE_PATHS=node_modules,venv,.git
 
   FINDING_POLICY_FILE_IN_CONTAINER  Path to finding policy file inside container
                                      Example: FINDING_POLICY_FILE_IN_CONTAINER=/app/policy.json
 
+  SSC_REPORT_COMPRESS_FINDINGS   Embed report findings gzip+base64 encoded in summary.html
+                                 Default: auto (above 2000 findings); 1 = always, 0 = never
+  SSC_REPORT_TOOL_SECTION_MAX_FINDINGS  Skip per-tool detail tables above this count (default: 500)
+  SSC_REPORT_PAGE_SIZE           Rows per page of the All Findings table (default: 100)
+
   CI_MODE                        Enable CI mode for metadata collection
                                  Valid values: true, false
                                  Default: false
@@ -6,13 +6,20 @@ optional tuning via SSC_INLINE_SUPPRESSIONS_* environment variables.
 """
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from scanner.core.findings_cache import ENV_FINDINGS_CACHE_DIR, indexed_blob_hashes, target_files
+from scanner.core.scan_excludes import exclude_matcher
+
 # (relative_path, line_number) -> suppressions on that line
 SuppressionIndex = dict[tuple[str, int], list["LineSuppressions"]]
 
@@ -40,6 +47,13 @@ _SCAN_EXTENSIONS = {
     ".hcl",
 }
 
+# Every tag below contains one of these; files without any are never line-parsed.
+_MARKER_RE = re.compile(r"nos(?:ec|emgrep)|noqa|ssc:accept|gitleaks:allow|eslint-disable", re.IGNORECASE)
+_MARKER_BYTES_RE = re.compile(_MARKER_RE.pattern.encode("ascii"), re.IGNORECASE)
+
+_INDEX_CACHE_VERSION = 1
+_INDEX_CACHE_MAX_AGE_SECONDS = 7 * 24 * 3600
+
 _NOSEC_RE = re.compile(r"#\s*nosec(?:\s+([A-Za-z]\d+(?:\s+[A-Za-z]\d+)*))?", re.IGNORECASE)
 _NOSEMGREP_RE = re.compile(
     r"#\s*nosemgrep(?::\s*([^#\n]+))?",
@@ -458,32 +472,171 @@ def is_finding_inline_suppressed(
     return False, "", ""
 
 
+def _read_suppression_lines(path: Path) -> list[tuple[int, str]]:
+    """(line_no, line) of lines carrying a suppression marker; most files are rejected on bytes."""
+    with open(path, "rb") as fh:
+        data = fh.read()
+    if not _MARKER_BYTES_RE.search(data):
+        return []
+    text = data.decode("utf-8", errors="replace")
+    return [
+        (line_no, line)
+        for line_no, line in enumerate(text.splitlines(), start=1)
+        if _MARKER_RE.search(line)
+    ]
+
+
+def _index_cache_dir() -> Path | None:
+    if os.environ.get("SSC_INLINE_SUPPRESSIONS_CACHE", "1").strip().lower() in ("0", "false", "no", "off"):
+        return None
+    root = os.environ.get(ENV_FINDINGS_CACHE_DIR, "").strip()
+    if not root:
+        base = os.environ.get("RESULTS_DIR_IN_CONTAINER", "").strip()
+        if not base:
+            return None
+        root = str(Path(base) / ".findings-cache")
+    return Path(root) / "inline-suppressions"
+
+
+def _index_shard(key: str) -> str:
+    """Shard name for a cache key: blob-hash prefix, or a hash prefix of the stat key."""
+    if key.startswith("blob:"):
+        return key[5:7]
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:2]
+
+
+def _load_index_shard(path: Path) -> dict[str, list[Any]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _INDEX_CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    # key -> [last_seen_epoch, [[line_no, line], ...]]
+    return {
+        k: v
+        for k, v in entries.items()
+        if isinstance(v, list) and len(v) == 2 and isinstance(v[0], int) and isinstance(v[1], list)
+    }
+
+
+def _load_index_cache(cache_dir: Path | None, shards: set[str]) -> dict[str, list[Any]]:
+    if cache_dir is None:
+        return {}
+    cached: dict[str, list[Any]] = {}
+    for shard in shards:
+        cached.update(_load_index_shard(cache_dir / f"{shard}.json"))
+    return cached
+
+
+def _save_index_shard(path: Path, updates: dict[str, list[Any]], horizon: int) -> None:
+    """Merge ``updates`` into the shard on disk (re-read, so concurrent scans keep each other's entries)."""
+    entries = {k: v for k, v in _load_index_shard(path).items() if v[0] >= horizon}
+    entries.update(updates)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(
+            json.dumps({"version": _INDEX_CACHE_VERSION, "entries": entries}, separators=(",", ":")),
+            encoding="utf-8",
+        )
+        tmp.replace(path)
+    except OSError as exc:
+        debug(f"Could not write suppression index cache {path}: {exc}")
+
+
+def _index_workers() -> int:
+    raw = os.environ.get("SSC_INLINE_SUPPRESSIONS_WORKERS", "").strip()
+    try:
+        return max(1, int(raw)) if raw else min(8, os.cpu_count() or 1)
+    except ValueError:
+        return 1
+
+
 def build_suppression_index(target_root: str) -> SuppressionIndex:
-    """Walk target tree and index inline suppressions by (relative_path, line)."""
+    """
+    Index inline suppressions under ``target_root`` by (relative_path, line).
+
+    Files come from ``git ls-files`` (or a walk honouring .gitignore) minus scan excludes.
+    Marker lines of files that have any are cached on the results volume under the git blob
+    hash (tracked, unmodified files; shared by every clone of the repo) or path + size + mtime,
+    sharded by hash prefix so a scan only loads and rewrites the shards it touches. Files
+    without markers are not cached; the byte pre-filter rejects them cheaply. Reads run on a
+    thread pool.
+    """
     index: SuppressionIndex = {}
     root = Path(target_root)
     if not root.is_dir():
         debug(f"Target root not found or not a directory: {target_root}")
         return index
 
-    for file_path in root.rglob("*"):
-        if not file_path.is_file():
+    rel_paths = target_files(root, exclude_matcher(root), _SCAN_EXTENSIONS)
+    blobs = indexed_blob_hashes(root)
+    cache_dir = _index_cache_dir()
+    now = int(time.time())
+
+    keys: dict[str, str] = {}
+    for rel in rel_paths:
+        blob = blobs.get(rel)
+        if blob:
+            keys[rel] = f"blob:{blob}"
             continue
-        if file_path.suffix.lower() not in _SCAN_EXTENSIONS:
+        try:
+            st = (root / rel).stat()
+        except OSError:
             continue
+        keys[rel] = f"stat:{rel}:{st.st_size}:{st.st_mtime_ns}"
+    cached = _load_index_cache(cache_dir, {_index_shard(k) for k in keys.values()})
+
+    lines_by_path: dict[str, list[tuple[int, str]]] = {}
+    misses: list[str] = []
+    for rel, key in keys.items():
+        entry = cached.get(key)
+        if entry is not None:
+            try:
+                lines_by_path[rel] = [(int(no), str(line)) for no, line in entry[1]]
+                continue
+            except (TypeError, ValueError):
+                pass
+        misses.append(rel)
+
+    def read(rel: str) -> tuple[str, list[tuple[int, str]] | None]:
         try:
-            rel = file_path.relative_to(root).as_posix()
-            text = file_path.read_text(encoding="utf-8", errors="replace")
+            return rel, _read_suppression_lines(root / rel)
         except OSError as exc:
-            debug(f"Skip {file_path}: {exc}")
-            continue
+            debug(f"Skip {root / rel}: {exc}")
+            return rel, None
+
+    with ThreadPoolExecutor(max_workers=_index_workers()) as pool:
+        for rel, lines in pool.map(read, misses):
+            if lines is not None:
+                lines_by_path[rel] = lines
 
-        for line_no, line in enumerate(text.splitlines(), start=1):
+    for rel in rel_paths:
+        for line_no, line in lines_by_path.get(rel, ()):
             sup = parse_line_suppressions(line)
             if sup:
                 index.setdefault((rel, line_no), []).append(sup)
 
-    debug(f"Indexed inline suppressions in {len(index)} line(s) under {target_root}")
+    if cache_dir is not None:
+        # New marker files, plus hits not re-stamped for a day, go back into their shards
+        updates: dict[str, dict[str, list[Any]]] = {}
+        for rel, key in keys.items():
+            lines = lines_by_path.get(rel)
+            if not lines or (key in cached and cached[key][0] >= now - 86400):
+                continue
+            updates.setdefault(_index_shard(key), {})[key] = [now, [list(x) for x in lines]]
+        horizon = now - _INDEX_CACHE_MAX_AGE_SECONDS
+        for shard, shard_updates in sorted(updates.items()):
+            _save_index_shard(cache_dir / f"{shard}.json", shard_updates, horizon)
+
+    debug(
+        f"Indexed inline suppressions in {len(index)} line(s) under {target_root} "
+        f"({len(rel_paths)} file(s), {len(misses)} read)"
+    )
     return index
 
 
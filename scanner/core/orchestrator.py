@@ -6,6 +6,7 @@ No hardcoded steps, no log parsing - direct step communication!
 import asyncio
 import json
 import os
+import shutil
 import subprocess
 import sys
 import time
@@ -28,8 +29,22 @@ import scanner.plugins  # noqa: F401 - This triggers auto-registration via __ini
 from scanner.core.scanner_registry import ScannerRegistry, ScanType, TargetType, Scanner
 from scanner.core.step_registry import StepRegistry, StepStatus, Step, SubStepType
 from scanner.core.step_definitions import StepDefinitionsRegistry, StepType
-from scanner.core.base_scanner import set_global_step_registry, scan_log_verbose
+from scanner.core.base_scanner import (
+    reset_invocation_env,
+    scan_log_verbose,
+    set_global_step_registry,
+    set_invocation_env,
+)
 from scanner.core import scan_checkpoint as scan_cp
+from scanner.core.findings_cache import ENV_SCANNER_CONFIG_HASH
+from scanner.core.git_mirror import clone_via_mirror, mirror_cache_root
+from scanner.core.scan_diff import (
+    ENV_DIFF_BASE_SCAN_ID,
+    ENV_SCAN_DIFF_FILE,
+    prepare_scan_diff,
+    scan_diff_path,
+)
+from scanner.core.scan_scheduler import ENV_SCANNER_CPUS, ScanResourceBudget, ScannerResourcePool
 from scanner.core.worker_result_collection import (
     DEFAULT_WORKER_RESULT_COLLECTION,
     merge_worker_result_collection,
@@ -39,6 +54,26 @@ from scanner.core.worker_result_collection import (
 _GIT_CLONE_STEP_TIMEOUT_SECONDS = 20
 
 
+def _resources_metadata(resources) -> Optional[Dict[str, Any]]:
+    """Manifest execution.resources as stored in scanner_metadata (None = scanner defaults)."""
+    if resources is None:
+        return None
+    return {
+        "cpu": float(resources.cpu),
+        "memory_mb": int(resources.memory_mb),
+        "exclusive": bool(resources.exclusive),
+    }
+
+
+def _clear_directory(path: Path) -> None:
+    """Remove the contents of ``path`` (leftovers of a failed checkout before a fresh clone)."""
+    for entry in path.iterdir():
+        if entry.is_dir() and not entry.is_symlink():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            entry.unlink(missing_ok=True)
+
+
 # Single Source of Truth: Mapping from frontend scan_type to scanner scan_types
 def get_scanner_scan_types_for_frontend_type(frontend_scan_type: str) -> List[ScanType]:
     """
@@ -179,6 +214,13 @@ class ScanOrchestrator:
             except ValueError:
                 pass
         self._scan_start_monotonic: Optional[float] = None
+        # Set in run_scan; each scanner gets its CPU share via SSC_SCANNER_CPUS.
+        self._resource_budget: Optional[ScanResourceBudget] = None
+        self._parallel_scanners = False
+        # Diff scan mode: scan-diff.json passed to each scanner run via ENV_SCAN_DIFF_FILE
+        self._scan_diff_file: Optional[str] = None
+        # Scanner name -> (processor, findings) parsed as soon as the scanner finished; reused by the report
+        self._parsed_findings: Dict[str, Any] = {}
 
     def _tools_key_for_override(self, scanner: Scanner) -> str:
         """Merge map is keyed by tools_key (same as scanner_tool_settings.scanner_key)."""
@@ -314,6 +356,20 @@ class ScanOrchestrator:
             # Ensure target directory exists
             self.target_path.mkdir(parents=True, exist_ok=True)
             
+            # Shared mirror first (incremental fetch); direct clone if unavailable or failing
+            mirror_root = mirror_cache_root()
+            if mirror_root is not None:
+                ok, detail = await asyncio.to_thread(
+                    clone_via_mirror, scan_target, git_branch or None, self.target_path, mirror_root
+                )
+                if ok:
+                    branch_info = f" (branch: {git_branch})" if git_branch else ""
+                    self.log_message(f"Checked out {detail} to {self.target_path}{branch_info}")
+                    self.step_registry.complete_step("Git Clone", f"Repository cloned successfully{branch_info}")
+                    return True
+                self.log_message(f"[WARN] Git mirror cache not used ({detail}); cloning directly")
+                _clear_directory(self.target_path)
+            
             # Clone repository
             clone_cmd = ["git", "clone", "--depth", "1"]
             if git_branch:
@@ -326,7 +382,7 @@ class ScanOrchestrator:
                 clone_cmd,
                 capture_output=True,
                 text=True,
-                timeout=20,
+                timeout=_GIT_CLONE_STEP_TIMEOUT_SECONDS,
                 check=False
             )
             
@@ -354,10 +410,35 @@ class ScanOrchestrator:
             self.step_registry.complete_step("Git Clone", error_msg)
             return False
     
+    def _invocation_env(self, scanner: Scanner, timeout_sec: int) -> Dict[str, str]:
+        """Per-run env overlay for one scanner (override env, timeout, config hash, CPU share); never applied to os.environ."""
+        env = {
+            str(k): str(v)
+            for k, v in (self._override_for_scanner(scanner).get("env") or {}).items()
+            if k and v is not None
+        }
+        env["SCANNER_TIMEOUT_SECONDS"] = str(timeout_sec)
+        # Always set (empty = full scan) so nothing from the process env leaks into a run
+        env[ENV_SCAN_DIFF_FILE] = self._scan_diff_file or ""
+        if scanner.tools_key:
+            # Namespace for the per-file findings cache (same hash as the checkpoint).
+            env[ENV_SCANNER_CONFIG_HASH] = scan_cp.scanner_config_hash(
+                scanner.tools_key, timeout_sec, self._override_for_scanner(scanner)
+            )
+        budget = self._resource_budget
+        if budget is not None:
+            # Sequential: the scanner has the whole budget; parallel: only its admitted weight.
+            cpus = budget.demand_for(scanner.resources).cpu if self._parallel_scanners else budget.cpu
+            env.setdefault(ENV_SCANNER_CPUS, f"{cpus:g}")
+        return env
+
     async def _run_scanner(self, scanner: Scanner) -> bool:
         """
         Run a scanner via its registered Python class.
 
+        The blocking plugin ``run()`` executes in a worker thread so StepRegistry's
+        DB mirroring and live updates keep flowing on the event loop while the tool runs.
+
         Args:
             scanner: Scanner definition
 
@@ -367,7 +448,6 @@ class ScanOrchestrator:
         # Start step
         self.step_registry.start_step(scanner.name, f"Running {scanner.name} scan...")
         timeout_sec = self._merged_timeout(scanner)
-        os.environ["SCANNER_TIMEOUT_SECONDS"] = str(timeout_sec)
         verbose = scan_log_verbose()
         if verbose and self._worker_wall_seconds is not None and self._scan_start_monotonic is not None:
             _elapsed = time.monotonic() - self._scan_start_monotonic
@@ -376,13 +456,8 @@ class ScanOrchestrator:
                 f"[ORCHESTRATOR] Wall clock: ~{_elapsed:.0f}s elapsed of {self._worker_wall_seconds}s budget "
                 f"(~{_remaining:.0f}s left; worker may kill container when budget is exhausted)"
             )
-        ov = self._override_for_scanner(scanner)
-        env_backup: Dict[str, Optional[str]] = {}
-        for k, v in (ov.get("env") or {}).items():
-            if not k or v is None:
-                continue
-            env_backup[k] = os.environ.get(k)
-            os.environ[str(k)] = str(v)
+        # Context-local: each scanner task (and the thread running it) sees only its own overlay.
+        env_token = set_invocation_env(self._invocation_env(scanner, timeout_sec))
         try:
             if verbose:
                 self.log_message(f"--- Orchestrating {scanner.name} Scan ---")
@@ -452,12 +527,14 @@ class ScanOrchestrator:
                         )
 
                 scanner_instance = scanner_class(**valid_kwargs)
+                scanner_instance.timeout_seconds = timeout_sec
                 if verbose:
                     self.log_message(
                         f"[ORCHESTRATOR] {scanner.name}: calling run() with merged timeout {timeout_sec}s "
                         f"(env SCANNER_TIMEOUT_SECONDS); per-tool log: {scanner_log_file}"
                     )
-                success = scanner_instance.run()
+                # to_thread copies the current context, so the invocation env follows into the thread.
+                success = await asyncio.to_thread(scanner_instance.run)
 
                 scanner_dir = self.tools_dir_results / scanner.tools_key
                 status_file = scanner_dir / "status.json"
@@ -499,11 +576,7 @@ class ScanOrchestrator:
                 self.step_registry.fail_step(scanner.name, f"{scanner.name} scan error: {str(e)}")
                 return False
         finally:
-            for k, old in env_backup.items():
-                if old is None:
-                    os.environ.pop(k, None)
-                else:
-                    os.environ[k] = old
+            reset_invocation_env(env_token)
             if verbose:
                 self.log_message(f"--- {scanner.name} Scan Orchestration Finished ---")
     
@@ -765,6 +838,7 @@ class ScanOrchestrator:
             Exit code (0 for success, non-zero for failure)
         """
         self._scan_start_monotonic = time.monotonic()
+        self.step_registry.bind_event_loop()
         self.log_message("SimpleSecCheck Scan Started")
         v = scan_log_verbose()
         if self._worker_wall_seconds is not None:
@@ -930,14 +1004,22 @@ class ScanOrchestrator:
                 f"Scan excludes (policy file + SIMPLESECCHECK_EXCLUDE_PATHS): {merged_excludes}"
             )
 
-        for scanner in scanners:
-            if not self._scanner_admin_enabled(scanner):
-                continue
+        base_scan_id = os.getenv(ENV_DIFF_BASE_SCAN_ID, "").strip()
+        if base_scan_id and self.target_type == TargetType.GIT_REPO:
+            # Diff mode: path-aware scanners analyse changed files, the rest run in full.
+            scan_diff, diff_msg = prepare_scan_diff(
+                self.target_path, self.results_dir, self.results_dir.parent, base_scan_id
+            )
+            if scan_diff is not None:
+                self._scan_diff_file = str(scan_diff_path(self.results_dir))
+                self.log_message(f"Diff scan: {diff_msg}")
+            else:
+                self.log_message(f"Diff scan not possible ({diff_msg}); scanning all files")
+
+        async def run_and_checkpoint(scanner: Scanner) -> None:
             if not scanner.tools_key:
                 await self._run_scanner(scanner)
-                continue
-            if scanner.name in already_checkpoint_restored:
-                continue
+                return
             scanner_dir = self.tools_dir_results / scanner.tools_key
             cfg_h = scan_cp.scanner_config_hash(
                 scanner.tools_key,
@@ -945,6 +1027,9 @@ class ScanOrchestrator:
                 self._override_for_scanner(scanner),
             )
             ran_ok = await self._run_scanner(scanner)
+            if ran_ok:
+                await self._parse_scanner_findings(scanner)
+            # Runs on the event loop after the tool finished, so checkpoint writes never interleave.
             if ran_ok and scanner.checkpoint and not checkpoint_disabled:
                 scan_cp.record_scanner_completed(
                     cp,
@@ -956,6 +1041,19 @@ class ScanOrchestrator:
                     target_fingerprint_ok=fp_ok,
                 )
                 scan_cp.save_checkpoint(checkpoint_path, cp)
+
+        runnable = [
+            s for s in scanners
+            if self._scanner_admin_enabled(s) and s.name not in already_checkpoint_restored
+        ]
+        budget = ScanResourceBudget.from_env()
+        self._resource_budget = budget
+        self._parallel_scanners = budget.parallel and len(runnable) > 1
+        if self._parallel_scanners:
+            await self._run_scanners_parallel(runnable, budget, run_and_checkpoint)
+        else:
+            for scanner in runnable:
+                await run_and_checkpoint(scanner)
         
         # Run Artifact Collection step AFTER all scanners (before Completion)
         artifact_collection_step_def = None
@@ -998,43 +1096,68 @@ class ScanOrchestrator:
         # Always return 0 to allow summary generation
         return 0
     
-    def _generate_html_report(self) -> bool:
-        """Generate HTML report after scan completion. Returns True if summary.html exists."""
-        html_report_script = self.base_dir / "scanner" / "output" / "generate-html-report.py"
-        html_report_output = self.summary_dir / "summary.html"  # Save to summary/ subdirectory
+    async def _run_scanners_parallel(self, scanners: List[Scanner], budget: ScanResourceBudget, run_one) -> None:
+        """
+        Run scanners concurrently within the per-scan resource budget.
 
-        if not html_report_script.exists():
-            self.log_message(f"[ERROR] HTML report script not found: {html_report_script}")
-            return False
+        Scanners are admitted in registry (priority) order, so steps start in the same order
+        as the sequential path.
+        """
+        self.log_message(
+            f"[ORCHESTRATOR] Parallel scanners: max {budget.max_parallel} at once, "
+            f"budget {budget.cpu:g} CPU / {budget.memory_mb} MB"
+        )
+        pool = ScannerResourcePool(budget)
+        tasks: List[asyncio.Task] = []
 
-        self.log_message(f"Generating HTML report: {html_report_output}")
+        async def run_admitted(scanner: Scanner, demand) -> None:
+            try:
+                await run_one(scanner)
+            except Exception as e:
+                self.log_message(f"[ORCHESTRATOR WARNING] {scanner.name} runner error: {e}")
+                self.scanner_statuses[scanner.name] = "FAILED"
+                self.step_registry.fail_step(scanner.name, f"{scanner.name} scan error: {e}")
+            finally:
+                await pool.release(demand)
 
-        env = os.environ.copy()
-        env["OUTPUT_FILE"] = str(html_report_output)
-        env["RESULTS_DIR"] = str(self.results_dir)  # Pass base results_dir for script to find tools/
-        if self.scan_types:
-            env["SCAN_TYPE"] = self.scan_types[0].value
-        env["TARGET_TYPE"] = self.target_type.value
-        env["PYTHONUNBUFFERED"] = "1"
+        for scanner in scanners:
+            demand = budget.demand_for(scanner.resources)
+            await pool.acquire(demand)
+            if scan_log_verbose():
+                self.log_message(
+                    f"[ORCHESTRATOR] Admitted {scanner.name} (cpu={demand.cpu:g}, mem={demand.memory_mb}MB, "
+                    f"running={pool.running})"
+                )
+            tasks.append(asyncio.create_task(run_admitted(scanner, demand)))
+        await asyncio.gather(*tasks)
 
+    async def _parse_scanner_findings(self, scanner: Scanner) -> None:
+        """Parse a finished scanner's report off the event loop so report generation does not re-read it."""
         try:
-            result = subprocess.run(
-                ["python3", str(html_report_script)],
-                env=env,
-                cwd=str(self.base_dir),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-            )
+            from scanner.output.report_pipeline import parse_tool_findings
 
-            if result.stdout:
-                with open(self.log_file, "a", encoding="utf-8") as f:
-                    f.write(result.stdout)
+            parsed = await asyncio.to_thread(parse_tool_findings, scanner, self.results_dir)
+        except Exception as e:
+            self.log_message(f"[ORCHESTRATOR WARNING] Could not parse {scanner.name} findings early: {e}")
+            return
+        if parsed is not None:
+            self._parsed_findings[scanner.name] = parsed
 
-            if result.returncode != 0:
-                self.log_message(
-                    f"[ERROR] HTML report generation failed with exit code {result.returncode}"
-                )
+    def _generate_html_report(self) -> bool:
+        """Generate HTML report after scan completion. Returns True if summary.html exists."""
+        html_report_output = self.summary_dir / "summary.html"  # Save to summary/ subdirectory
+        self.log_message(f"Generating HTML report: {html_report_output}")
+
+        try:
+            # In-process: reuses the loaded ScannerRegistry/processors and findings parsed per scanner
+            from scanner.output.report_pipeline import ReportOptions, generate_report
+
+            options = ReportOptions.from_env(self.results_dir, html_report_output)
+            if self.scan_types:
+                options.scan_type = self.scan_types[0].value
+            options.target_type = self.target_type.value
+            if not generate_report(options, parsed=self._parsed_findings, log=self.log_message):
+                self.log_message("[ERROR] HTML report generation failed")
                 return False
 
             if not html_report_output.is_file():
@@ -1293,6 +1416,8 @@ async def list_scanners():
                     "assets": scanner_data.get("assets", []),
                     "tools_key": scanner_data.get("tools_key"),
                     "scan_profiles": scan_profiles,
+                    # Worker admission control sizes scan containers from these
+                    "resources": _resources_metadata(getattr(row_manifest, "resources", None)),
                     "worker_result_collection": merge_worker_result_collection(
                         DEFAULT_WORKER_RESULT_COLLECTION,
                         wrc_override,
@@ -1419,7 +1544,12 @@ async def main():
     orchestrator = ScanOrchestrator(step_registry)
     
     # Run scan
-    exit_code = await orchestrator.run_scan()
+    try:
+        exit_code = await orchestrator.run_scan()
+    finally:
+        # Final step states must reach scan_steps and the live stream before the container exits
+        await step_registry.flush_db()
+        step_registry.flush()
     
     sys.exit(exit_code)
 
@@ -4,24 +4,36 @@ from __future__ import annotations
 import re
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Tuple
 
 from scanner.core.policy_matching import (
+    _compile_alternation,
+    _policy_path_regex_variants,
+    compile_policy_path_regex,
     matches_path_for_policy,
     normalize_finding_paths,
     normalize_policy_path,
+    policy_path_candidates,
+    search_policy_path,
 )
 
 
+@lru_cache(maxsize=2048)
+def compile_policy_regex(pattern: str) -> Optional[Pattern]:
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return None
+
+
 def safe_regex_search(pattern: Optional[str], value: Any) -> bool:
     if pattern is None:
         return True
     if value is None:
         value = ""
-    try:
-        return re.search(pattern, str(value)) is not None
-    except re.error:
-        return False
+    compiled = compile_policy_regex(str(pattern))
+    return compiled is not None and compiled.search(str(value)) is not None
 
 
 @dataclass(frozen=True)
@@ -89,6 +101,148 @@ def rule_matches_spec(
     return bool(rule_ok and path_ok and msg_ok)
 
 
+def _finding_rule_id(finding: Dict[str, Any], spec: ToolPolicySpec) -> Any:
+    if spec.rule_id_getter is not None:
+        return spec.rule_id_getter(finding)
+    return finding.get(spec.rule_id_field or "rule_id")
+
+
+def _finding_path(finding: Dict[str, Any], spec: ToolPolicySpec) -> Any:
+    if spec.path_getter is not None:
+        return spec.path_getter(finding)
+    return finding.get(spec.path_field or "path", "")
+
+
+def _finding_message(finding: Dict[str, Any], spec: ToolPolicySpec) -> Any:
+    if spec.message_getter is not None:
+        return spec.message_getter(finding)
+    return finding.get(spec.message_field, "")
+
+
+_NO_MATCH: Tuple[Pattern, ...] = ()
+
+
+@dataclass(frozen=True)
+class _CompiledRule:
+    index: int
+    rule: Dict[str, Any]
+    rule_id_regex: Optional[Pattern]
+    # None = any path; empty tuple = invalid regex (never matches, like rule_matches_spec)
+    path: Optional[Tuple[Pattern, ...]]
+    path_variants: Tuple[str, ...]
+    message: Optional[Pattern]
+    never: bool = False
+
+
+class CompiledPolicyRules:
+    """
+    One tool's policy rules (accepted_findings or severity_overrides), compiled once.
+
+    Regexes are compiled up front, exact ``rule_id`` rules are bucketed by id, and the
+    path regexes of each bucket are joined into one alternation that rejects most
+    findings with a single search. Rule order is kept, so results equal calling
+    ``rule_matches_spec`` for each rule in turn.
+    """
+
+    def __init__(self, rules: Iterable[Any], spec: ToolPolicySpec):
+        self.spec = spec
+        self._rules: List[_CompiledRule] = []
+        self._by_rule_id: Dict[str, List[_CompiledRule]] = defaultdict(list)
+        self._any_rule_id: List[_CompiledRule] = []
+        for index, rule in enumerate(rules or []):
+            if not isinstance(rule, dict):
+                continue
+            compiled = self._compile_rule(index, rule)
+            self._rules.append(compiled)
+            rule_id = rule.get(spec.policy_rule_id_key)
+            if spec.rule_id_mode == "regex" or rule_id is None:
+                self._any_rule_id.append(compiled)
+            else:
+                self._by_rule_id[str(rule_id)].append(compiled)
+        self._candidates: Dict[str, Tuple[List[_CompiledRule], Optional[Tuple[Pattern, ...]]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def _compile_rule(self, index: int, rule: Dict[str, Any]) -> _CompiledRule:
+        spec = self.spec
+        never = False
+        rule_id_regex = None
+        rule_id = rule.get(spec.policy_rule_id_key)
+        if rule_id is not None and spec.rule_id_mode == "regex":
+            rule_id_regex = compile_policy_regex(str(rule_id))
+            never = rule_id_regex is None
+        path_regex = rule.get(spec.policy_path_key)
+        path = None
+        variants: Tuple[str, ...] = ()
+        if path_regex is not None:
+            variants = tuple(_policy_path_regex_variants(str(path_regex)))
+            path = compile_policy_path_regex(str(path_regex)) or _NO_MATCH
+        message = None
+        if spec.policy_message_key is not None and spec.message_field is not None:
+            message_regex = rule.get(spec.policy_message_key)
+            if message_regex is not None:
+                message = compile_policy_regex(str(message_regex))
+                never = never or message is None
+        return _CompiledRule(index, rule, rule_id_regex, path, variants, message, never)
+
+    def _candidates_for(self, rule_id: Any) -> Tuple[List[_CompiledRule], Optional[Tuple[Pattern, ...]]]:
+        """Rules that can match this rule_id (in policy order) + combined path prefilter."""
+        key = str(rule_id)
+        cached = self._candidates.get(key)
+        if cached is not None:
+            return cached
+        bucket = self._by_rule_id.get(key, [])
+        rules = sorted(bucket + self._any_rule_id, key=lambda r: r.index) if bucket else self._any_rule_id
+        prefilter = None
+        if rules and all(r.path is not None for r in rules):
+            # Every candidate needs a path match: one search over all their path regexes
+            prefilter = _compile_alternation(v for r in rules for v in r.path_variants)
+        if len(self._candidates) < 4096:
+            self._candidates[key] = (rules, prefilter)
+        return rules, prefilter
+
+    def _matching(self, finding: Dict[str, Any], first_only: bool) -> List[Dict[str, Any]]:
+        spec = self.spec
+        rule_id = _finding_rule_id(finding, spec)
+        rules, prefilter = self._candidates_for(rule_id)
+        if not rules:
+            return []
+        paths = policy_path_candidates(_finding_path(finding, spec))
+        if prefilter is not None and not search_policy_path(prefilter, paths):
+            return []
+        message: Optional[str] = None
+        matched: List[Dict[str, Any]] = []
+        for r in rules:
+            if r.never:
+                continue
+            if r.rule_id_regex is not None:
+                value = "" if rule_id is None else str(rule_id)
+                if r.rule_id_regex.search(value) is None:
+                    continue
+            if r.path is not None and not search_policy_path(r.path, paths):
+                continue
+            if r.message is not None:
+                if message is None:
+                    raw = _finding_message(finding, spec)
+                    message = "" if raw is None else str(raw)
+                if r.message.search(message) is None:
+                    continue
+            matched.append(r.rule)
+            if first_only:
+                break
+        return matched
+
+    def first_match(self, finding: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """First rule (policy order) matching ``finding``, like the accepted_findings loop."""
+        matched = self._matching(finding, first_only=True)
+        return matched[0] if matched else None
+
+    def matching(self, finding: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """All rules matching ``finding`` in policy order (severity_overrides)."""
+        return self._matching(finding, first_only=False)
+
+
 def apply_policy_generic(
     *,
     findings: Iterable[Dict[str, Any]],
@@ -100,16 +254,12 @@ def apply_policy_generic(
     if not findings_list:
         return [], []
 
-    accepted_rules = tool_policy.get(spec.accepted_rules_key, []) or []
+    accepted_rules = CompiledPolicyRules(tool_policy.get(spec.accepted_rules_key, []) or [], spec)
     accepted_records: List[Dict[str, Any]] = []
     processed: List[Dict[str, Any]] = []
 
     for finding in findings_list:
-        accepted = None
-        for rule in accepted_rules:
-            if rule_matches_spec(finding=finding, rule=rule, spec=spec):
-                accepted = rule
-                break
+        accepted = accepted_rules.first_match(finding) if accepted_rules else None
         if accepted:
             accepted_records.append(accept_record(finding, accepted.get("reason", "Accepted by policy")))
             continue
@@ -241,15 +391,14 @@ def apply_policy_with_severity_overrides(
     if not findings_list:
         return [], []
 
-    severity_overrides = tool_policy.get("severity_overrides", [])
+    severity_overrides = CompiledPolicyRules(tool_policy.get("severity_overrides", []) or [], spec)
     processed: List[Dict[str, Any]] = []
     for finding in findings_list:
         updated = dict(finding)
-        for override in severity_overrides:
-            if rule_matches_spec(finding=updated, rule=override, spec=spec):
-                new_sev = str(override.get("new_severity", "")).strip().upper()
-                if new_sev:
-                    updated["severity"] = new_sev
+        for override in severity_overrides.matching(updated) if severity_overrides else ():
+            new_sev = str(override.get("new_severity", "")).strip().upper()
+            if new_sev:
+                updated["severity"] = new_sev
         processed.append(normalize_finding_paths(updated))
 
     processed, accepted_records = apply_policy_generic(
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import re
+from functools import lru_cache
 
 _MOUNT_PREFIXES = ("/app/target/", "/target/")
 
@@ -46,20 +47,48 @@ def _policy_path_regex_variants(regex):
     return variants
 
 
-def matches_path_for_policy(path, regex):
-    if regex is None:
-        return True
-    if path is None:
-        path = ""
-    candidates = [str(path)]
-    normalized = normalize_policy_path(path)
-    if normalized != candidates[0]:
-        candidates.append(normalized)
-    patterns = _policy_path_regex_variants(regex)
-    compiled = []
-    for pattern in patterns:
+# Numbered/named backreferences change meaning once patterns are joined into one alternation.
+_BACKREF = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def _compile_alternation(patterns):
+    """
+    Compile ``patterns`` as one alternation when that is equivalent (no backreferences,
+    no global inline flags), else one pattern each. None if any pattern is invalid.
+    """
+    patterns = list(patterns)
+    if len(patterns) > 1 and not any(_BACKREF.search(p) for p in patterns):
         try:
-            compiled.append(re.compile(pattern))
+            return (re.compile("|".join(f"(?:{p})" for p in patterns)),)
         except re.error:
-            return False
+            pass
+    try:
+        return tuple(re.compile(p) for p in patterns)
+    except re.error:
+        return None
+
+
+@lru_cache(maxsize=2048)
+def compile_policy_path_regex(regex):
+    """Compiled matcher tuple for a policy ``path_regex`` incl. legacy variants (None = invalid)."""
+    return _compile_alternation(_policy_path_regex_variants(regex))
+
+
+def policy_path_candidates(path):
+    """Path forms a policy regex is tried against: as reported, and without mount prefix."""
+    raw = "" if path is None else str(path)
+    normalized = normalize_policy_path(raw)
+    return (raw,) if normalized == raw else (raw, normalized)
+
+
+def search_policy_path(compiled, candidates):
     return any(pat.search(c) is not None for pat in compiled for c in candidates)
+
+
+def matches_path_for_policy(path, regex):
+    if regex is None:
+        return True
+    compiled = compile_policy_path_regex(str(regex))
+    if compiled is None:
+        return False
+    return search_policy_path(compiled, policy_path_candidates(path))
@@ -0,0 +1,174 @@
+"""
+Diff-only scan mode: analyse only files changed since an earlier scan of the same repository.
+
+The worker passes ``SSC_SCAN_DIFF_BASE_SCAN_ID`` (latest finished scan of the repo). The
+orchestrator reads that scan's commit (checkpoint target fingerprint, else scan.json git_info),
+diffs it against the cloned HEAD and passes the result file to each scanner run via
+``SSC_SCAN_DIFF_FILE`` in that run's invocation env.
+
+Path-aware plugins (``findings_cache.IncrementalScan``) then analyse changed files only and take
+findings for unchanged files from the base scan's tool report — but only when the base run of
+that tool completed with the same tool version and scanner config (base checkpoint). Every other
+scanner runs in full, so the merged reports and findings.json stay complete.
+"""
+from __future__ import annotations
+
+import json
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from scanner.core.scan_checkpoint import (
+    ensure_git_safe_directory,
+    load_checkpoint,
+    scanner_step_key,
+    target_fingerprint_git,
+)
+
+ENV_DIFF_BASE_SCAN_ID = "SSC_SCAN_DIFF_BASE_SCAN_ID"
+# Per-invocation env set by the orchestrator once the diff is known; plugins read it via ``self.getenv``.
+ENV_SCAN_DIFF_FILE = "SSC_SCAN_DIFF_FILE"
+
+_GIT_TIMEOUT_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class ScanDiff:
+    """Changed paths between the base scan's commit and this scan's HEAD."""
+
+    base_scan_id: str
+    base_commit: str
+    head_commit: str
+    base_results_dir: Path
+    changed: FrozenSet[str]
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "base_scan_id": self.base_scan_id,
+            "base_commit": self.base_commit,
+            "head_commit": self.head_commit,
+            "base_results_dir": str(self.base_results_dir),
+            "changed": sorted(self.changed),
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "ScanDiff":
+        return cls(
+            base_scan_id=str(data["base_scan_id"]),
+            base_commit=str(data["base_commit"]),
+            head_commit=str(data["head_commit"]),
+            base_results_dir=Path(data["base_results_dir"]),
+            changed=frozenset(str(p) for p in data.get("changed") or []),
+        )
+
+    def base_report(self, tools_key: str, name: str = "report.json") -> Path:
+        return self.base_results_dir / "tools" / tools_key / name
+
+    def base_step(self, tools_key: str) -> Dict[str, Any]:
+        """Checkpoint entry of ``tools_key`` in the base scan ({} when it did not complete)."""
+        cp = load_checkpoint(self.base_results_dir / "logs" / "checkpoint.json")
+        step = (cp.get("steps") or {}).get(scanner_step_key(tools_key)) or {}
+        return step if step.get("status") == "completed" else {}
+
+
+def base_commit_of_scan(scan_dir: Path) -> str:
+    """Commit a finished scan analysed: checkpoint fingerprint, else collected git metadata."""
+    cp = load_checkpoint(scan_dir / "logs" / "checkpoint.json")
+    fp = str(cp.get("target_fingerprint") or "").strip()
+    if fp:
+        return fp
+    try:
+        meta = json.loads((scan_dir / "metadata" / "scan.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return ""
+    git_info = meta.get("git_info") if isinstance(meta, dict) else None
+    if isinstance(git_info, dict):
+        return str(git_info.get("commit_hash") or "").strip()
+    return ""
+
+
+def _git(repo: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["git", "-C", str(repo), *args],
+        capture_output=True,
+        timeout=_GIT_TIMEOUT_SECONDS,
+        check=False,
+    )
+
+
+def changed_paths(repo: Path, base: str, head: str = "HEAD") -> Optional[List[str]]:
+    """
+    Paths added or modified in ``head`` relative to ``base`` (renames count as new paths,
+    deletions are omitted). Fetches ``base`` when the clone is shallow. None if not computable.
+    """
+    ensure_git_safe_directory(repo)
+    try:
+        if _git(repo, "cat-file", "-e", f"{base}^{{commit}}").returncode != 0:
+            if _git(repo, "fetch", "--quiet", "--depth", "1", "origin", base).returncode != 0:
+                return None
+        r = _git(repo, "diff", "--name-only", "-z", "--no-renames", "--diff-filter=d", base, head)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if r.returncode != 0:
+        return None
+    return [p for p in r.stdout.decode("utf-8", errors="surrogateescape").split("\0") if p]
+
+
+def scan_diff_path(results_dir: Path) -> Path:
+    """Where prepare_scan_diff writes the diff of the scan with this results dir."""
+    return results_dir / "logs" / "scan-diff.json"
+
+
+def prepare_scan_diff(
+    target: Path,
+    results_dir: Path,
+    results_base: Path,
+    base_scan_id: str,
+) -> Tuple[Optional[ScanDiff], str]:
+    """
+    Once per scan: compute the diff against ``base_scan_id`` and write it to scan_diff_path().
+    Returns (diff, message); diff is None when the scan must run in full. The caller passes
+    the file to plugins in their per-invocation env (ENV_SCAN_DIFF_FILE), never os.environ.
+    """
+    out = scan_diff_path(results_dir)
+    try:
+        out.unlink()
+    except OSError:
+        pass
+    if Path(base_scan_id).name != base_scan_id or base_scan_id in (".", ".."):
+        return None, f"invalid base scan id {base_scan_id!r}"
+    base_dir = results_base / base_scan_id
+    if not base_dir.is_dir():
+        return None, f"base scan {base_scan_id} has no results"
+    base_commit = base_commit_of_scan(base_dir)
+    if not base_commit:
+        return None, f"base scan {base_scan_id} has no recorded commit"
+    head_commit = target_fingerprint_git(target)
+    if not head_commit:
+        return None, "target is not a git checkout"
+    paths = changed_paths(target, base_commit, head_commit)
+    if paths is None:
+        return None, f"cannot diff {base_commit[:8]}..{head_commit[:8]}"
+    diff = ScanDiff(
+        base_scan_id=base_scan_id,
+        base_commit=base_commit,
+        head_commit=head_commit,
+        base_results_dir=base_dir,
+        changed=frozenset(paths),
+    )
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(diff.to_json(), indent=2), encoding="utf-8")
+    return diff, (
+        f"{len(paths)} changed file(s) in {base_commit[:8]}..{head_commit[:8]} "
+        f"(base scan {base_scan_id})"
+    )
+
+
+def load_scan_diff(path: str) -> Optional[ScanDiff]:
+    if not path:
+        return None
+    try:
+        return ScanDiff.from_json(json.loads(Path(path).read_text(encoding="utf-8")))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
@@ -11,7 +11,7 @@ from __future__ import annotations
 import os
 import re
 from pathlib import Path
-from typing import List, Union
+from typing import Callable, List, Union
 
 from scanner.core.finding_policy import (
     ENV_POLICY_FILE,
@@ -87,6 +87,20 @@ def path_matches_exclude(target: Union[str, Path], candidate: Union[str, Path])
     return False
 
 
+def exclude_matcher(target: Union[str, Path], extra_csv: str | None = None) -> Callable[[str], bool]:
+    """
+    Predicate on target-relative paths with the semantics of path_matches_exclude, for walks
+    over many files (patterns are resolved once). ``extra_csv`` as for merged_exclude_list.
+    """
+    patterns = [p for p in (normalize_policy_path(x) for x in merged_exclude_list(target, extra_csv)) if p]
+
+    def excluded(rel: str) -> bool:
+        rel = normalize_policy_path(rel)
+        return any(pat in rel for pat in patterns)
+
+    return excluded
+
+
 def bandit_extra_argv(target: Union[str, Path]) -> List[str]:
     argv: List[str] = []
     target_p = Path(target)
@@ -0,0 +1,188 @@
+"""
+Bounded-concurrency scheduling for scanner steps.
+
+Scanners declare a weight in manifest ``execution.resources`` (cpu cores, memory_mb,
+exclusive). The orchestrator sizes a per-scan budget from the container's CPU/memory
+(cgroup limits first, then host) and admits scanners in registry order while their
+summed weight fits. ``SSC_SCAN_MAX_PARALLEL`` unset or ``1`` keeps the sequential path.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+ENV_MAX_PARALLEL = "SSC_SCAN_MAX_PARALLEL"
+ENV_CPU_BUDGET = "SSC_SCAN_CPU_BUDGET"
+ENV_MEMORY_BUDGET_MB = "SSC_SCAN_MEMORY_BUDGET_MB"
+# Per-run share handed to each scanner (invocation env) for sizing tool worker counts.
+ENV_SCANNER_CPUS = "SSC_SCANNER_CPUS"
+
+DEFAULT_SCANNER_CPU = 1.0
+DEFAULT_SCANNER_MEMORY_MB = 512
+# Headroom kept free for the orchestrator, report generation and tool child processes.
+_MEMORY_RESERVE_MB = 512
+
+
+@dataclass(frozen=True)
+class ResourceDemand:
+    """Weight of one running scanner (already clamped to the budget)."""
+
+    cpu: float
+    memory_mb: int
+    exclusive: bool = False
+
+
+@dataclass(frozen=True)
+class ScanResourceBudget:
+    """Per-scan capacity: at most ``max_parallel`` scanners whose weights fit cpu/memory."""
+
+    cpu: float
+    memory_mb: int
+    max_parallel: int
+
+    @property
+    def parallel(self) -> bool:
+        return self.max_parallel > 1
+
+    @classmethod
+    def from_env(cls) -> "ScanResourceBudget":
+        cpu = _env_float(ENV_CPU_BUDGET) or detect_cpu_budget()
+        memory_mb = _env_int(ENV_MEMORY_BUDGET_MB) or detect_memory_budget_mb()
+        raw = (os.getenv(ENV_MAX_PARALLEL) or "").strip().lower()
+        if raw == "auto":
+            max_parallel = max(1, int(cpu))
+        else:
+            try:
+                max_parallel = max(1, int(raw)) if raw else 1
+            except ValueError:
+                max_parallel = 1
+        return cls(cpu=max(cpu, 1.0), memory_mb=max(memory_mb, 0), max_parallel=max_parallel)
+
+    def demand_for(self, resources) -> ResourceDemand:
+        """Clamp a manifest weight so an oversized tool still runs (alone) instead of starving."""
+        cpu = DEFAULT_SCANNER_CPU
+        mem = DEFAULT_SCANNER_MEMORY_MB
+        exclusive = False
+        if resources is not None:
+            cpu = float(getattr(resources, "cpu", cpu) or cpu)
+            mem = int(getattr(resources, "memory_mb", mem) or 0)
+            exclusive = bool(getattr(resources, "exclusive", False))
+        if self.memory_mb:
+            mem = min(mem, self.memory_mb)
+        return ResourceDemand(cpu=min(cpu, self.cpu), memory_mb=mem, exclusive=exclusive)
+
+
+def _env_float(key: str) -> Optional[float]:
+    raw = (os.getenv(key) or "").strip()
+    if not raw:
+        return None
+    try:
+        v = float(raw)
+    except ValueError:
+        return None
+    return v if v > 0 else None
+
+
+def _env_int(key: str) -> Optional[int]:
+    v = _env_float(key)
+    return int(v) if v else None
+
+
+def detect_cpu_budget(cgroup_root: Path = Path("/sys/fs/cgroup")) -> float:
+    """CPU cores available to this container (cgroup v2 cpu.max / v1 quota, else os.cpu_count)."""
+    try:
+        parts = (cgroup_root / "cpu.max").read_text().split()
+        if parts and parts[0] != "max":
+            return max(0.1, int(parts[0]) / int(parts[1]))
+    except (OSError, ValueError, IndexError, ZeroDivisionError):
+        pass
+    try:
+        quota = int((cgroup_root / "cpu" / "cpu.cfs_quota_us").read_text().strip())
+        period = int((cgroup_root / "cpu" / "cpu.cfs_period_us").read_text().strip())
+        if quota > 0 and period > 0:
+            return max(0.1, quota / period)
+    except (OSError, ValueError):
+        pass
+    try:
+        return float(len(os.sched_getaffinity(0)))
+    except (AttributeError, OSError):
+        return float(os.cpu_count() or 1)
+
+
+def detect_memory_budget_mb(cgroup_root: Path = Path("/sys/fs/cgroup")) -> int:
+    """Memory usable by scanners in MB (cgroup limit or physical RAM, minus a fixed reserve)."""
+    limit: Optional[int] = None
+    for candidate in (cgroup_root / "memory.max", cgroup_root / "memory" / "memory.limit_in_bytes"):
+        try:
+            raw = candidate.read_text().strip()
+        except OSError:
+            continue
+        if raw and raw != "max":
+            try:
+                v = int(raw)
+            except ValueError:
+                continue
+            # cgroup v1 reports a huge sentinel when unlimited
+            if v < (1 << 60):
+                limit = v
+                break
+    if limit is None:
+        try:
+            limit = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+        except (AttributeError, ValueError, OSError):
+            return 0
+    return max(0, limit // (1024 * 1024) - _MEMORY_RESERVE_MB)
+
+
+class ScannerResourcePool:
+    """
+    Admission gate for concurrently running scanners.
+
+    ``acquire`` is called in registry order and blocks until the demand fits, so scanner
+    steps start in the same order as the sequential path (no overtaking).
+    """
+
+    def __init__(self, budget: ScanResourceBudget):
+        self.budget = budget
+        self._cond = asyncio.Condition()
+        self._running = 0
+        self._cpu = 0.0
+        self._memory_mb = 0
+        self._exclusive = False
+
+    def _fits(self, demand: ResourceDemand) -> bool:
+        if self._running == 0:
+            return True
+        if self._exclusive or demand.exclusive:
+            return False
+        if self._running >= self.budget.max_parallel:
+            return False
+        if self._cpu + demand.cpu > self.budget.cpu + 1e-9:
+            return False
+        if self.budget.memory_mb and self._memory_mb + demand.memory_mb > self.budget.memory_mb:
+            return False
+        return True
+
+    async def acquire(self, demand: ResourceDemand) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._fits(demand))
+            self._running += 1
+            self._cpu += demand.cpu
+            self._memory_mb += demand.memory_mb
+            self._exclusive = self._exclusive or demand.exclusive
+
+    async def release(self, demand: ResourceDemand) -> None:
+        async with self._cond:
+            self._running = max(0, self._running - 1)
+            self._cpu = max(0.0, self._cpu - demand.cpu)
+            self._memory_mb = max(0, self._memory_mb - demand.memory_mb)
+            if demand.exclusive:
+                self._exclusive = False
+            self._cond.notify_all()
+
+    @property
+    def running(self) -> int:
+        return self._running
@@ -14,6 +14,7 @@ from .models import (
     AssetMount,
     AssetUpdate,
     ScannerCheckpointConfig,
+    ScannerResourceConfig,
 )
 
 
@@ -207,12 +208,30 @@ class ScannerAssetsManager:
                     version_command=vcmd,
                 )
 
+        resources_cfg: Optional[ScannerResourceConfig] = None
+        ex = data.get("execution")
+        res = ex.get("resources") if isinstance(ex, dict) else None
+        if isinstance(res, dict):
+            resources_cfg = ScannerResourceConfig()
+            try:
+                if res.get("cpu") is not None:
+                    resources_cfg.cpu = max(0.1, float(res["cpu"]))
+            except (TypeError, ValueError):
+                pass
+            try:
+                if res.get("memory_mb") is not None:
+                    resources_cfg.memory_mb = max(0, int(res["memory_mb"]))
+            except (TypeError, ValueError):
+                pass
+            resources_cfg.exclusive = bool(res.get("exclusive", False))
+
         return ScannerManifest(
             id=scanner_id,
             assets=assets,
             install=install_commands,
             raw=data,
             checkpoint=checkpoint_cfg,
+            resources=resources_cfg,
             version=version,
             languages=languages,
             severity_supported=severity_supported,
@@ -37,6 +37,15 @@ class ScannerCheckpointConfig:
     version_command: Optional[List[str]] = None
 
 
+@dataclass
+class ScannerResourceConfig:
+    """manifest.execution.resources — per-plugin weight for parallel scheduling."""
+
+    cpu: float = 1.0  # cores the tool typically keeps busy
+    memory_mb: int = 512
+    exclusive: bool = False  # True → never run next to another scanner
+
+
 @dataclass
 class ScannerManifest:
     """Manifest: id is the ONLY technical identity (tools_key). No manifest name field."""
@@ -46,6 +55,7 @@ class ScannerManifest:
     raw: Dict[str, Any]
 
     checkpoint: Optional[ScannerCheckpointConfig] = None
+    resources: Optional[ScannerResourceConfig] = None
     version: Optional[str] = None
     languages: Optional[List[str]] = None  # None = all languages
     severity_supported: Optional[bool] = None
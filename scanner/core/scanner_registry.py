@@ -9,7 +9,7 @@ from pathlib import Path
 import inspect
 
 if TYPE_CHECKING:
-    from scanner.core.scanner_assets.models import ScannerCheckpointConfig
+    from scanner.core.scanner_assets.models import ScannerCheckpointConfig, ScannerResourceConfig
 
 
 class ScanType(Enum):
@@ -82,6 +82,7 @@ class Scanner:
     tools_key: Optional[str] = None  # Canonical key = manifest.id only (results/tools/<id>/, DB scanner_key)
     timeout: Optional[int] = None  # Max duration in seconds (from manifest only); orchestrator/scanner use this
     checkpoint: Optional["ScannerCheckpointConfig"] = None  # from manifest.checkpoint; None = no resume skip
+    resources: Optional["ScannerResourceConfig"] = None  # from manifest.execution.resources; None = defaults
 
 
 class ScannerRegistry:
@@ -255,6 +256,7 @@ class ScannerRegistry:
             except (TypeError, ValueError):
                 pass
         cp = getattr(manifest, "checkpoint", None) if manifest else None
+        resources = getattr(manifest, "resources", None) if manifest else None
         scanner = Scanner(
             name=scanner_name,
             capabilities=capabilities,
@@ -264,6 +266,7 @@ class ScannerRegistry:
             tools_key=tools_key,
             timeout=timeout,
             checkpoint=cp,
+            resources=resources,
         )
         cls.register(scanner)
 
@@ -0,0 +1,115 @@
+"""
+Publish step/substep deltas to the Redis ``scan_events`` channel (REDIS_URL from the worker).
+
+The scanner image has no Redis client library, so this speaks the few RESP commands it
+needs (AUTH/SELECT/PUBLISH) over a plain socket. Events are queued and sent by one daemon
+thread in order; step changes never block on Redis, and events are dropped (the backend
+falls back to GET /steps) when Redis is unreachable or the queue is full.
+"""
+from __future__ import annotations
+
+import json
+import os
+import queue
+import socket
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import unquote, urlparse
+
+SCAN_EVENTS_CHANNEL = "scan_events"
+STEP_DELTA_EVENT = "step_delta"
+_QUEUE_MAX = 1000
+_SOCKET_TIMEOUT = 2.0
+# After Redis failed, drop events for this long instead of reconnecting per event
+_RETRY_AFTER_SECONDS = 5.0
+
+
+def _resp_command(*parts: str) -> bytes:
+    out = [f"*{len(parts)}\r\n".encode()]
+    for part in parts:
+        data = part.encode("utf-8")
+        out.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(out)
+
+
+class StepEventPublisher:
+    """Fire-and-forget PUBLISH of JSON events on a background thread."""
+
+    def __init__(self, redis_url: str, channel: str = SCAN_EVENTS_CHANNEL):
+        parsed = urlparse(redis_url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.username = unquote(parsed.username) if parsed.username else None
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = (parsed.path or "/").lstrip("/") or "0"
+        self.channel = channel
+        self._queue: "queue.Queue[bytes]" = queue.Queue(maxsize=_QUEUE_MAX)
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+        self._down_until = 0.0
+        self._thread = threading.Thread(target=self._run, name="step-events", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_env(cls) -> Optional["StepEventPublisher"]:
+        url = os.environ.get("REDIS_URL", "").strip()
+        if not url.startswith("redis://"):
+            return None
+        return cls(url)
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        payload = json.dumps(event, separators=(",", ":"), default=str)
+        try:
+            self._queue.put_nowait(_resp_command("PUBLISH", self.channel, payload))
+        except queue.Full:
+            pass
+
+    def _call(self, command: bytes) -> None:
+        self._sock.sendall(command)
+        reply = self._reader.readline()
+        if not reply:
+            raise ConnectionError("Redis closed the connection")
+        if reply.startswith(b"-"):
+            raise ConnectionError(reply[1:].strip().decode("utf-8", "replace"))
+
+    def _connect(self) -> None:
+        self._sock = socket.create_connection((self.host, self.port), timeout=_SOCKET_TIMEOUT)
+        self._reader = self._sock.makefile("rb")
+        if self.password:
+            auth = ("AUTH", self.username, self.password) if self.username else ("AUTH", self.password)
+            self._call(_resp_command(*auth))
+        if self.db != "0":
+            self._call(_resp_command("SELECT", self.db))
+
+    def _close(self) -> None:
+        for res in (self._reader, self._sock):
+            try:
+                if res is not None:
+                    res.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._reader = None
+
+    def _run(self) -> None:
+        while True:
+            command = self._queue.get()
+            if time.monotonic() >= self._down_until:
+                for _attempt in range(2):
+                    try:
+                        if self._sock is None:
+                            self._connect()
+                        self._call(command)
+                        break
+                    except (OSError, ConnectionError):
+                        self._close()
+                else:
+                    self._down_until = time.monotonic() + _RETRY_AFTER_SECONDS
+            self._queue.task_done()
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """Wait (bounded) until queued events were handed to Redis, so the final steps go out before exit."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.02)
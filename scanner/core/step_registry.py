@@ -4,13 +4,24 @@ Direct step communication - no log parsing!
 Modern approach: Steps register themselves and communicate directly via WebSocket
 """
 import asyncio
+import json
 import os
+import threading
+import time
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from enum import Enum
 
+from scanner.core.step_events import STEP_DELTA_EVENT, StepEventPublisher
+from shared.steps_log import STEPS_LOG_FILENAME, StepsLogWriter, read_steps
+
+
+# scan_steps mirror: step changes within this window are coalesced into one multi-row upsert
+DB_FLUSH_INTERVAL_SECONDS = 0.5
+
 
 class StepStatus(Enum):
     """Step status enumeration"""
@@ -117,6 +128,33 @@ class Step:
     timeout_seconds: Optional[int] = None  # Max duration from manifest (for scanner steps)
 
 
+def _substep_log_fields(substep: SubStep) -> Dict[str, Any]:
+    return {
+        "name": substep.name,
+        "status": substep.status.value,
+        "message": substep.message,
+        "started_at": _step_time_to_iso_z(substep.started_at),
+        "completed_at": _step_time_to_iso_z(substep.completed_at),
+        "type": _substep_type_value(substep),
+    }
+
+
+def _step_log_fields(step: Step, with_substeps: bool) -> Dict[str, Any]:
+    """Step as written to steps.log / published as a live delta."""
+    fields: Dict[str, Any] = {
+        "number": step.number,
+        "name": step.name,
+        "status": step.status.value,
+        "message": step.message,
+        "started_at": _step_time_to_iso_z(step.started_at),
+        "completed_at": _step_time_to_iso_z(step.completed_at),
+        "timeout_seconds": getattr(step, "timeout_seconds", None),
+    }
+    if with_substeps:
+        fields["substeps"] = [_substep_log_fields(substep) for substep in step.substeps]
+    return fields
+
+
 class StepRegistry:
     """
     Modern step registry - direct communication, no log parsing!
@@ -149,6 +187,10 @@ class StepRegistry:
         self.websocket_manager = websocket_manager
         self.steps: Dict[str, Step] = {}  # {step_name: Step}
         self.step_counter = 0
+        # Scanners may report substeps from worker threads (parallel mode); guard state + log
+        # and hand async work (WebSocket push, DB mirror) back to the orchestrator loop.
+        self._lock = threading.RLock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
         # CRITICAL: Always create logs inside scan-specific directory
         # Structure: /app/results/{scan_id}/logs/steps.log
@@ -161,24 +203,56 @@ class StepRegistry:
         # Create directories
         self.results_dir.mkdir(parents=True, exist_ok=True)
         self.logs_dir.mkdir(parents=True, exist_ok=True)
-        self.steps_log = self.logs_dir / "steps.log"
+        self.steps_log = self.logs_dir / STEPS_LOG_FILENAME
+        # Deltas + periodic snapshots (shared.steps_log); readers fold snapshot + tail only
+        self._log = StepsLogWriter(self.steps_log)
 
         # Optional DB mirror when POSTGRES_* is set (built URL; no DATABASE_URL env)
         from scanner.config.db_url import database_url_from_postgres_env
 
         self.database_url = database_url_from_postgres_env()
         self._db_pool = None
+        # Latest row per step number awaiting the background flush; seq makes the upsert
+        # last-writer-wins even across registries (resume) since it is derived from wall time
+        self._db_pending: Dict[int, tuple] = {}
+        self._db_flush_scheduled = False
+        self._db_flush_lock: Optional[asyncio.Lock] = None
+        self._db_seq = 0
+
+        # Live step/substep deltas on Redis scan_events (REDIS_URL set by the worker); seq orders
+        # events within this registry's epoch so the backend can offer resume-from-seq catch-up
+        self._events = StepEventPublisher.from_env()
+        self._event_epoch = uuid.uuid4().hex[:12]
+        self._event_seq = 0
         
         # Initialize steps.log (JSON Lines format - one JSON object per line)
         if not self.steps_log.exists():
-            with open(self.steps_log, "w", encoding="utf-8") as f:
-                f.write(
-                    f'{{"init": "SimpleSecCheck Steps Log", "timestamp": "{_step_time_to_iso_z(_utc_now())}"}}\n'
-                )
+            self._log.init(_step_time_to_iso_z(_utc_now()))
         else:
             # Read existing steps from log (e.g., Git Clone step written before orchestrator starts)
             self._load_existing_steps()
 
+    def bind_event_loop(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Remember the orchestrator loop so calls from scanner threads can schedule async work."""
+        self._loop = loop or asyncio.get_running_loop()
+
+    def _spawn(self, coro) -> bool:
+        """create_task on the running loop, or thread-safe handoff to the bound loop; else drop (False)."""
+        try:
+            asyncio.get_running_loop().create_task(coro)
+            return True
+        except RuntimeError:
+            pass
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(loop.create_task, coro)
+                return True
+            except RuntimeError:
+                pass
+        coro.close()
+        return False
+
     async def _ensure_db_pool(self):
         if not self.database_url:
             return None
@@ -206,27 +280,28 @@ class StepRegistry:
         Returns:
             Step number
         """
-        if step_name not in self.steps:
-            self.step_counter += 1
-            self.steps[step_name] = Step(
-                number=self.step_counter,
-                name=step_name,
-                status=StepStatus.RUNNING,
-                message=message or f"Running {step_name}...",
-                started_at=_utc_now(),
-            )
+        with self._lock:
+            if step_name not in self.steps:
+                self.step_counter += 1
+                self.steps[step_name] = Step(
+                    number=self.step_counter,
+                    name=step_name,
+                    status=StepStatus.RUNNING,
+                    message=message or f"Running {step_name}...",
+                    started_at=_utc_now(),
+                )
         
-        step = self.steps[step_name]
-        step.status = StepStatus.RUNNING
-        step.started_at = _utc_now()
+            step = self.steps[step_name]
+            step.status = StepStatus.RUNNING
+            step.started_at = _utc_now()
         
-        # Write to steps.log (structured JSON format)
-        self._write_to_log(step)
+            # Write to steps.log (structured JSON format)
+            self._write_to_log(step)
         
-        # Send WebSocket update
-        asyncio.create_task(self._send_update())
+            # Send WebSocket update
+            self._spawn(self._send_update())
         
-        return step.number
+            return step.number
     
     def complete_step(self, step_name: str, message: str = ""):
         """
@@ -236,21 +311,22 @@ class StepRegistry:
             step_name: Name of the step
             message: Optional completion message
         """
-        if step_name not in self.steps:
-            # Step wasn't started, start it first
-            self.start_step(step_name, message)
+        with self._lock:
+            if step_name not in self.steps:
+                # Step wasn't started, start it first
+                self.start_step(step_name, message)
         
-        step = self.steps[step_name]
-        step.status = StepStatus.COMPLETED
-        step.completed_at = _utc_now()
-        if message:
-            step.message = message
+            step = self.steps[step_name]
+            step.status = StepStatus.COMPLETED
+            step.completed_at = _utc_now()
+            if message:
+                step.message = message
         
-        # Write to steps.log (structured JSON format)
-        self._write_to_log(step)
+            # Write to steps.log (structured JSON format)
+            self._write_to_log(step)
         
-        # Send WebSocket update
-        asyncio.create_task(self._send_update())
+            # Send WebSocket update
+            self._spawn(self._send_update())
     
     def fail_step(self, step_name: str, message: str = ""):
         """
@@ -260,21 +336,22 @@ class StepRegistry:
             step_name: Name of the step
             message: Optional error message
         """
-        if step_name not in self.steps:
-            # Step wasn't started, start it first
-            self.start_step(step_name, message)
+        with self._lock:
+            if step_name not in self.steps:
+                # Step wasn't started, start it first
+                self.start_step(step_name, message)
         
-        step = self.steps[step_name]
-        step.status = StepStatus.FAILED
-        step.completed_at = _utc_now()
-        if message:
-            step.message = message
+            step = self.steps[step_name]
+            step.status = StepStatus.FAILED
+            step.completed_at = _utc_now()
+            if message:
+                step.message = message
         
-        # Write to steps.log (structured JSON format)
-        self._write_to_log(step)
+            # Write to steps.log (structured JSON format)
+            self._write_to_log(step)
         
-        # Send WebSocket update
-        asyncio.create_task(self._send_update())
+            # Send WebSocket update
+            self._spawn(self._send_update())
     
     def skip_step(self, step_name: str, reason: str = ""):
         """
@@ -284,29 +361,30 @@ class StepRegistry:
             step_name: Name of the step
             reason: Optional reason for skipping
         """
-        if step_name not in self.steps:
-            self.step_counter += 1
-            self.steps[step_name] = Step(
-                number=self.step_counter,
-                name=step_name,
-                status=StepStatus.SKIPPED,
-                message=reason or f"{step_name} skipped",
-                started_at=_utc_now(),
-                completed_at=_utc_now(),
-            )
-        else:
+        with self._lock:
+            if step_name not in self.steps:
+                self.step_counter += 1
+                self.steps[step_name] = Step(
+                    number=self.step_counter,
+                    name=step_name,
+                    status=StepStatus.SKIPPED,
+                    message=reason or f"{step_name} skipped",
+                    started_at=_utc_now(),
+                    completed_at=_utc_now(),
+                )
+            else:
+                step = self.steps[step_name]
+                step.status = StepStatus.SKIPPED
+                step.completed_at = _utc_now()
+                if reason:
+                    step.message = reason
+        
+            # Write to steps.log
             step = self.steps[step_name]
-            step.status = StepStatus.SKIPPED
-            step.completed_at = _utc_now()
-            if reason:
-                step.message = reason
+            self._write_to_log(step)
         
-        # Write to steps.log
-        step = self.steps[step_name]
-        self._write_to_log(step)
-        
-        # Send WebSocket update
-        asyncio.create_task(self._send_update())
+            # Send WebSocket update
+            self._spawn(self._send_update())
 
     def set_step_pending_for_run(self, step_name: str) -> None:
         """Clear step to pending for a new container run (DB/log). Skips admin-disabled (SKIPPED)."""
@@ -345,44 +423,45 @@ class StepRegistry:
         Returns:
             List of step dictionaries
         """
-        steps_list = []
-        for step in sorted(self.steps.values(), key=lambda s: s.number):
-            duration_seconds = None
-            if step.started_at and step.completed_at:
-                sa, sc = step.started_at, step.completed_at
-                if sa.tzinfo is None:
-                    sa = sa.replace(tzinfo=timezone.utc)
-                if sc.tzinfo is None:
-                    sc = sc.replace(tzinfo=timezone.utc)
-                delta = (sc - sa).total_seconds()
-                duration_seconds = max(0, int(delta))
-            elif step.started_at and step.status == StepStatus.RUNNING:
-                sa = step.started_at
-                if sa.tzinfo is None:
-                    sa = sa.replace(tzinfo=timezone.utc)
-                delta = (_utc_now() - sa).total_seconds()
-                duration_seconds = max(0, int(delta))
-            step_dict = {
-                "number": step.number,
-                "name": step.name,
-                "status": step.status.value,
-                "message": step.message,
-                "started_at": _step_time_to_iso_z(step.started_at),
-                "substeps": [
-                    {
-                        "name": substep.name,
-                        "status": substep.status.value,
-                        "message": substep.message,
-                        "started_at": _step_time_to_iso_z(substep.started_at),
-                        "completed_at": _step_time_to_iso_z(substep.completed_at),
-                    }
-                    for substep in step.substeps
-                ],
-                "duration_seconds": duration_seconds,
-                "timeout_seconds": getattr(step, "timeout_seconds", None),
-            }
-            steps_list.append(step_dict)
-        return steps_list
+        with self._lock:
+            steps_list = []
+            for step in sorted(self.steps.values(), key=lambda s: s.number):
+                duration_seconds = None
+                if step.started_at and step.completed_at:
+                    sa, sc = step.started_at, step.completed_at
+                    if sa.tzinfo is None:
+                        sa = sa.replace(tzinfo=timezone.utc)
+                    if sc.tzinfo is None:
+                        sc = sc.replace(tzinfo=timezone.utc)
+                    delta = (sc - sa).total_seconds()
+                    duration_seconds = max(0, int(delta))
+                elif step.started_at and step.status == StepStatus.RUNNING:
+                    sa = step.started_at
+                    if sa.tzinfo is None:
+                        sa = sa.replace(tzinfo=timezone.utc)
+                    delta = (_utc_now() - sa).total_seconds()
+                    duration_seconds = max(0, int(delta))
+                step_dict = {
+                    "number": step.number,
+                    "name": step.name,
+                    "status": step.status.value,
+                    "message": step.message,
+                    "started_at": _step_time_to_iso_z(step.started_at),
+                    "substeps": [
+                        {
+                            "name": substep.name,
+                            "status": substep.status.value,
+                            "message": substep.message,
+                            "started_at": _step_time_to_iso_z(substep.started_at),
+                            "completed_at": _step_time_to_iso_z(substep.completed_at),
+                        }
+                        for substep in step.substeps
+                    ],
+                    "duration_seconds": duration_seconds,
+                    "timeout_seconds": getattr(step, "timeout_seconds", None),
+                }
+                steps_list.append(step_dict)
+            return steps_list
     
     def get_total_steps(self) -> int:
         """Get total number of registered steps"""
@@ -423,42 +502,43 @@ class StepRegistry:
             message: Optional message for the substep
             substep_type: Type of substep (PHASE, ACTION, OUTPUT)
         """
-        if step_name not in self.steps:
-            # Parent step doesn't exist, create it first
-            self.start_step(step_name, f"Running {step_name}...")
-        
-        step = self.steps[step_name]
-        
-        # Check if substep already exists
-        existing_substep = None
-        for substep in step.substeps:
-            if substep.name == substep_name:
-                existing_substep = substep
-                break
-        
-        if existing_substep:
-            # Update existing substep
-            existing_substep.status = StepStatus.RUNNING
-            existing_substep.started_at = _utc_now()
-            existing_substep.substep_type = substep_type
-            if message:
-                existing_substep.message = message
-        else:
-            # Create new substep
-            new_substep = SubStep(
-                name=substep_name,
-                status=StepStatus.RUNNING,
-                message=message or f"Running {substep_name}...",
-                started_at=_utc_now(),
-                substep_type=substep_type,
-            )
-            step.substeps.append(new_substep)
+        with self._lock:
+            if step_name not in self.steps:
+                # Parent step doesn't exist, create it first
+                self.start_step(step_name, f"Running {step_name}...")
+        
+            step = self.steps[step_name]
         
-        # Write to log
-        self._write_to_log(step)
+            # Check if substep already exists
+            existing_substep = None
+            for substep in step.substeps:
+                if substep.name == substep_name:
+                    existing_substep = substep
+                    break
+        
+            if existing_substep:
+                # Update existing substep
+                existing_substep.status = StepStatus.RUNNING
+                existing_substep.started_at = _utc_now()
+                existing_substep.substep_type = substep_type
+                if message:
+                    existing_substep.message = message
+            else:
+                # Create new substep
+                new_substep = SubStep(
+                    name=substep_name,
+                    status=StepStatus.RUNNING,
+                    message=message or f"Running {substep_name}...",
+                    started_at=_utc_now(),
+                    substep_type=substep_type,
+                )
+                step.substeps.append(new_substep)
         
-        # Send WebSocket update
-        asyncio.create_task(self._send_update())
+            # Write to log
+            self._write_to_log(step, existing_substep or new_substep)
+        
+            # Send WebSocket update
+            self._spawn(self._send_update())
     
     def complete_substep(self, step_name: str, substep_name: str, message: str = ""):
         """
@@ -469,25 +549,28 @@ class StepRegistry:
             substep_name: Name of the substep
             message: Optional completion message
         """
-        if step_name not in self.steps:
-            return
-        
-        step = self.steps[step_name]
+        with self._lock:
+            if step_name not in self.steps:
+                return
         
-        # Find substep
-        for substep in step.substeps:
-            if substep.name == substep_name:
-                substep.status = StepStatus.COMPLETED
-                substep.completed_at = _utc_now()
-                if message:
-                    substep.message = message
-                break
-        
-        # Write to log
-        self._write_to_log(step)
+            step = self.steps[step_name]
         
-        # Send WebSocket update
-        asyncio.create_task(self._send_update())
+            # Find substep
+            changed = None
+            for substep in step.substeps:
+                if substep.name == substep_name:
+                    changed = substep
+                    substep.status = StepStatus.COMPLETED
+                    substep.completed_at = _utc_now()
+                    if message:
+                        substep.message = message
+                    break
+        
+            # Write to log
+            self._write_to_log(step, changed)
+        
+            # Send WebSocket update
+            self._spawn(self._send_update())
     
     def fail_substep(self, step_name: str, substep_name: str, message: str = ""):
         """
@@ -498,25 +581,28 @@ class StepRegistry:
             substep_name: Name of the substep
             message: Optional error message
         """
-        if step_name not in self.steps:
-            return
+        with self._lock:
+            if step_name not in self.steps:
+                return
         
-        step = self.steps[step_name]
-        
-        # Find substep
-        for substep in step.substeps:
-            if substep.name == substep_name:
-                substep.status = StepStatus.FAILED
-                substep.completed_at = _utc_now()
-                if message:
-                    substep.message = message
-                break
-        
-        # Write to log
-        self._write_to_log(step)
+            step = self.steps[step_name]
         
-        # Send WebSocket update
-        asyncio.create_task(self._send_update())
+            # Find substep
+            changed = None
+            for substep in step.substeps:
+                if substep.name == substep_name:
+                    changed = substep
+                    substep.status = StepStatus.FAILED
+                    substep.completed_at = _utc_now()
+                    if message:
+                        substep.message = message
+                    break
+        
+            # Write to log
+            self._write_to_log(step, changed)
+        
+            # Send WebSocket update
+            self._spawn(self._send_update())
     
     def update_substep(self, step_name: str, substep_name: str, message: str = ""):
         """
@@ -527,209 +613,229 @@ class StepRegistry:
             substep_name: Name of the substep
             message: New message
         """
-        if step_name not in self.steps:
-            return
+        with self._lock:
+            if step_name not in self.steps:
+                return
         
-        step = self.steps[step_name]
+            step = self.steps[step_name]
         
-        # Find substep
-        for substep in step.substeps:
-            if substep.name == substep_name:
-                if message:
-                    substep.message = message
-                break
+            # Find substep
+            changed = None
+            for substep in step.substeps:
+                if substep.name == substep_name:
+                    changed = substep
+                    if message:
+                        substep.message = message
+                    break
         
-        # Write to log
-        self._write_to_log(step)
+            # Write to log
+            self._write_to_log(step, changed)
         
-        # Send WebSocket update
-        asyncio.create_task(self._send_update())
+            # Send WebSocket update
+            self._spawn(self._send_update())
     
     def _load_existing_steps(self):
-        """Load existing steps from steps.log (JSON Lines format - no regex parsing!)"""
-        import json
+        """Load existing steps from steps.log (latest snapshot + deltas, see shared.steps_log)"""
+        status_map = {
+            "pending": StepStatus.PENDING,
+            "running": StepStatus.RUNNING,
+            "completed": StepStatus.COMPLETED,
+            "failed": StepStatus.FAILED,
+            "skipped": StepStatus.SKIPPED
+        }
         try:
-            with open(self.steps_log, "r", encoding="utf-8", errors="ignore") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
+            for step_data in read_steps(self.steps_log):
+                step_number = step_data.get("number")
+                step_name = step_data.get("name")
+                if not step_number or not step_name:
+                    continue
+
+                substeps = []
+                for substep_data in step_data.get("substeps") or []:
+                    substep_type = SubStepType.ACTION  # Default
                     try:
-                        # Parse JSON line (structured format - no regex needed!)
-                        step_data = json.loads(line)
-                        
-                        # Skip init line
-                        if "init" in step_data:
-                            continue
-                        
-                        # Extract step data
-                        step_number = step_data.get("number")
-                        step_name = step_data.get("name")
-                        status_str = step_data.get("status", "pending")
-                        message = step_data.get("message", "")
-                        started_at_str = step_data.get("started_at")
-                        completed_at_str = step_data.get("completed_at")
-                        
-                        if not step_number or not step_name:
-                            continue
-                        
-                        # Convert status string to enum
-                        status_map = {
-                            "pending": StepStatus.PENDING,
-                            "running": StepStatus.RUNNING,
-                            "completed": StepStatus.COMPLETED,
-                            "failed": StepStatus.FAILED,
-                            "skipped": StepStatus.SKIPPED
-                        }
-                        status = status_map.get(status_str, StepStatus.PENDING)
-                        
-                        # Parse timestamps
-                        started_at = None
-                        completed_at = None
-                        if started_at_str:
-                            started_at = _parse_log_time(started_at_str)
-                        if completed_at_str:
-                            completed_at = _parse_log_time(completed_at_str)
-                        
-                        # Load substeps if present
-                        substeps = []
-                        substeps_data = step_data.get("substeps", [])
-                        for substep_data in substeps_data:
-                            substep_status_str = substep_data.get("status", "pending")
-                            substep_status = status_map.get(substep_status_str, StepStatus.PENDING)
-                            substep_started_at = None
-                            substep_completed_at = None
-                            if substep_data.get("started_at"):
-                                substep_started_at = _parse_log_time(substep_data["started_at"])
-                            if substep_data.get("completed_at"):
-                                substep_completed_at = _parse_log_time(substep_data["completed_at"])
-                            substep_type_str = substep_data.get("type", "action")
-                            substep_type = SubStepType.ACTION  # Default
-                            try:
-                                substep_type = SubStepType(substep_type_str)
-                            except ValueError:
-                                pass
-                            
-                            substeps.append(SubStep(
-                                name=substep_data.get("name", ""),
-                                status=substep_status,
-                                message=substep_data.get("message", ""),
-                                started_at=substep_started_at,
-                                completed_at=substep_completed_at,
-                                substep_type=substep_type
-                            ))
-                        
-                        timeout_seconds = step_data.get("timeout_seconds")
-                        if timeout_seconds is not None and not isinstance(timeout_seconds, int):
-                            try:
-                                timeout_seconds = int(timeout_seconds)
-                            except (ValueError, TypeError):
-                                timeout_seconds = None
-                        # Register step if not already registered
-                        if step_name not in self.steps:
-                            self.steps[step_name] = Step(
-                                number=step_number,
-                                name=step_name,
-                                status=status,
-                                message=message,
-                                started_at=started_at,
-                                completed_at=completed_at,
-                                substeps=substeps,
-                                timeout_seconds=timeout_seconds,
-                            )
-                            # Update step_counter to highest step number
-                            if step_number > self.step_counter:
-                                self.step_counter = step_number
-                        else:
-                            # Update existing step with latest substeps
-                            self.steps[step_name].substeps = substeps
-                    except json.JSONDecodeError:
-                        # Skip invalid JSON lines (e.g., old format lines)
-                        continue
+                        substep_type = SubStepType(substep_data.get("type", "action"))
+                    except ValueError:
+                        pass
+                    substeps.append(SubStep(
+                        name=substep_data.get("name", ""),
+                        status=status_map.get(substep_data.get("status", "pending"), StepStatus.PENDING),
+                        message=substep_data.get("message", ""),
+                        started_at=_parse_log_time(substep_data.get("started_at")),
+                        completed_at=_parse_log_time(substep_data.get("completed_at")),
+                        substep_type=substep_type
+                    ))
+
+                timeout_seconds = step_data.get("timeout_seconds")
+                if timeout_seconds is not None and not isinstance(timeout_seconds, int):
+                    try:
+                        timeout_seconds = int(timeout_seconds)
+                    except (ValueError, TypeError):
+                        timeout_seconds = None
+                # Register step if not already registered
+                if step_name not in self.steps:
+                    self.steps[step_name] = Step(
+                        number=step_number,
+                        name=step_name,
+                        status=status_map.get(step_data.get("status", "pending"), StepStatus.PENDING),
+                        message=step_data.get("message", ""),
+                        started_at=_parse_log_time(step_data.get("started_at")),
+                        completed_at=_parse_log_time(step_data.get("completed_at")),
+                        substeps=substeps,
+                        timeout_seconds=timeout_seconds,
+                    )
+                    # Update step_counter to highest step number
+                    if step_number > self.step_counter:
+                        self.step_counter = step_number
+                else:
+                    # Update existing step with latest substeps
+                    self.steps[step_name].substeps = substeps
         except Exception as e:
             print(f"[Step Registry] Error loading existing steps: {e}")
     
-    def _write_to_log(self, step: Step):
-        """Write step as JSON line to steps.log file (structured format, no parsing needed!)"""
-        try:
-            import json
-            import os
-            
-            # Ensure directory exists
-            self.logs_dir.mkdir(parents=True, exist_ok=True)
-            
-            step_dict = {
-                "number": step.number,
-                "name": step.name,
-                "status": step.status.value,
-                "message": step.message,
-                "started_at": _step_time_to_iso_z(step.started_at),
-                "completed_at": _step_time_to_iso_z(step.completed_at),
-                "substeps": [
-                    {
-                        "name": substep.name,
-                        "status": substep.status.value,
-                        "message": substep.message,
-                        "started_at": _step_time_to_iso_z(substep.started_at),
-                        "completed_at": _step_time_to_iso_z(substep.completed_at),
-                        "type": _substep_type_value(substep),
-                    }
-                    for substep in step.substeps
-                ],
-                "timestamp": _step_time_to_iso_z(_utc_now()),
-                "timeout_seconds": getattr(step, "timeout_seconds", None),
-            }
-            step_dict = _json_serializable(step_dict)
-
-            # Write to file
-            with open(self.steps_log, "a", encoding="utf-8") as f:
-                f.write(json.dumps(step_dict) + "\n")
-            if self._debug:
-                print(f"[Step Registry] Wrote step {step.number} to {self.steps_log}")
-        except Exception as e:
-            print(f"[Step Registry] Error writing to steps.log: {e}")
-            import traceback
-            traceback.print_exc()
+    def _write_to_log(self, step: Step, substep: Optional[SubStep] = None):
+        """
+        Append a step delta to steps.log (structured format, no parsing needed!) and publish it live.
 
-        # Mirror to DB when POSTGRES_* is set (non-blocking)
-        if self.database_url:
+        ``substep``: the substep that changed, so the delta carries only that substep; step-level
+        changes carry the full substep list (covers resets to pending/restored).
+        """
+        with self._lock:
+            delta: Dict[str, Any] = {"step": _step_log_fields(step, with_substeps=substep is None)}
+            if substep is not None:
+                delta["substep"] = _substep_log_fields(substep)
+            delta = _json_serializable(delta)
             try:
-                asyncio.create_task(self._upsert_step_db(step))
-            except RuntimeError:
-                # If no event loop, skip DB write
-                pass
+                # Ensure directory exists
+                self.logs_dir.mkdir(parents=True, exist_ok=True)
+                self._log.append(delta, _step_time_to_iso_z(_utc_now()), snapshot=self._snapshot_steps)
+                if self._debug:
+                    print(f"[Step Registry] Wrote step {step.number} to {self.steps_log}")
+            except Exception as e:
+                print(f"[Step Registry] Error writing to steps.log: {e}")
+                import traceback
+                traceback.print_exc()
+
+            # Mirror to DB when POSTGRES_* is set (coalesced, flushed in the background)
+            if self.database_url:
+                self._queue_step_db(step)
+
+            if self._events is not None:
+                self._event_seq += 1
+                self._events.publish({
+                    "type": STEP_DELTA_EVENT,
+                    "scan_id": self.scan_id,
+                    "epoch": self._event_epoch,
+                    "seq": self._event_seq,
+                    **delta,
+                })
+
+    def _snapshot_steps(self) -> List[Dict[str, Any]]:
+        """All steps with substeps, for periodic steps.log snapshots (caller holds the lock)."""
+        return _json_serializable(
+            [_step_log_fields(step, with_substeps=True) for step in sorted(self.steps.values(), key=lambda s: s.number)]
+        )
+
+    def _queue_step_db(self, step: Step) -> None:
+        """Replace the step's pending scan_steps row and make sure a flush is scheduled (caller holds the lock)."""
+        self._db_seq = max(self._db_seq + 1, time.time_ns() // 1000)
+        self._db_pending[step.number] = (
+            step.number,
+            self._db_seq,
+            step.name,
+            step.status.value,
+            step.message,
+            _to_naive_utc(step.started_at),
+            _to_naive_utc(step.completed_at),
+            json.dumps(_json_serializable([_substep_log_fields(sub) for sub in step.substeps])),
+            getattr(step, "timeout_seconds", None),
+        )
+        if not self._db_flush_scheduled:
+            self._db_flush_scheduled = self._spawn(self._flush_db_later())
+
+    async def _flush_db_later(self) -> None:
+        await asyncio.sleep(DB_FLUSH_INTERVAL_SECONDS)
+        await self.flush_db()
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """Hand queued live step deltas to Redis (bounded wait); call before the process exits.
+
+        A warm-pool scan ends with ``os._exit`` in a forked child, where atexit handlers never run.
+        """
+        if self._events is not None:
+            self._events.flush(timeout)
 
-    async def _upsert_step_db(self, step: Step):
+    async def flush_db(self) -> None:
+        """Write pending step rows now (one upsert); called by the flusher and when the scan finishes."""
+        if not self.database_url:
+            return
+        if self._db_flush_lock is None:
+            self._db_flush_lock = asyncio.Lock()
+        # One flush at a time so batches reach the DB in order
+        async with self._db_flush_lock:
+            with self._lock:
+                # Every delta published so far is in these rows or an earlier batch; readers of
+                # scan_steps resume the live stream from this position, not the newest delta
+                position = (self._event_epoch, self._event_seq)
+                rows = [row + position for row in self._db_pending.values()]
+                self._db_pending = {}
+                self._db_flush_scheduled = False
+            if rows and not await self._upsert_steps_db(rows):
+                self._requeue_db_rows(rows)
+
+    def _requeue_db_rows(self, rows: List[tuple]) -> None:
+        """Put a failed batch back for the next flush, unless a step has a newer pending row since."""
+        with self._lock:
+            for row in rows:
+                row = row[:-2]  # the next flush attaches its own event position
+                pending = self._db_pending.get(row[0])
+                if pending is None or pending[1] < row[1]:
+                    self._db_pending[row[0]] = row
+
+    async def _upsert_steps_db(self, rows: List[tuple]) -> bool:
+        """One upsert of the batch; False when it did not reach the DB."""
         pool = await self._ensure_db_pool()
         if not pool:
-            return
+            return False
+        columns = list(zip(*rows))
         try:
             async with pool.acquire() as conn:
                 await conn.execute(
                     """
                     INSERT INTO scan_steps (
-                        scan_id, step_number, step_name, status, message, started_at, completed_at, updated_at
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, NOW())
+                        scan_id, step_number, seq, step_name, status, message, started_at, completed_at,
+                        substeps, timeout_seconds, event_epoch, event_seq, updated_at
+                    )
+                    SELECT $1::uuid, r.step_number, r.seq, r.step_name, r.status, r.message, r.started_at,
+                           r.completed_at, r.substeps::jsonb, r.timeout_seconds, r.event_epoch, r.event_seq,
+                           NOW()
+                    FROM unnest(
+                        $2::int[], $3::bigint[], $4::text[], $5::text[], $6::text[],
+                        $7::timestamp[], $8::timestamp[], $9::text[], $10::int[], $11::text[], $12::bigint[]
+                    ) AS r(step_number, seq, step_name, status, message, started_at, completed_at,
+                           substeps, timeout_seconds, event_epoch, event_seq)
                     ON CONFLICT (scan_id, step_number)
                     DO UPDATE SET
+                        seq = EXCLUDED.seq,
+                        event_epoch = EXCLUDED.event_epoch,
+                        event_seq = EXCLUDED.event_seq,
                         step_name = EXCLUDED.step_name,
                         status = EXCLUDED.status,
                         message = EXCLUDED.message,
                         started_at = COALESCE(EXCLUDED.started_at, scan_steps.started_at),
                         completed_at = COALESCE(EXCLUDED.completed_at, scan_steps.completed_at),
+                        substeps = EXCLUDED.substeps,
+                        timeout_seconds = COALESCE(EXCLUDED.timeout_seconds, scan_steps.timeout_seconds),
                         updated_at = NOW()
+                    WHERE scan_steps.seq < EXCLUDED.seq
                     """,
                     self.scan_id,
-                    step.number,
-                    step.name,
-                    step.status.value,
-                    step.message,
-                    _to_naive_utc(step.started_at),
-                    _to_naive_utc(step.completed_at),
+                    *[list(col) for col in columns],
                 )
         except Exception as e:
-            print(f"[Step Registry] DB upsert failed: {e}")
+            print(f"[Step Registry] DB upsert failed, retrying with the next flush: {e}")
+            return False
+        return True
     
     async def _send_update(self):
         """Send step update via WebSocket"""
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Warm scanner container runtime (worker warm pool).
+
+``serve`` runs as the container command of an idle pooled scanner container: it imports the
+orchestrator and all plugins once, then waits on a unix socket for scan assignments. Each
+assignment is run in a forked child (fresh process state, warm imports) with the scan's
+environment; its stdout/stderr stream back over the socket. /target (git_repo) and the /tmp,
+/var/tmp tmpfs are emptied before and after every assignment.
+
+``run`` is what the worker execs (``docker exec -e SCAN_ID=... <container> python3 -m
+scanner.core.warm_runner run``): it forwards its own environment as the assignment, relays the
+scan output and exits with the scan's exit code, so the exec behaves like a cold container run.
+
+Only stdlib imports at module level: ``run`` must start fast.
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import socket
+import sys
+import time
+from pathlib import Path
+
+ENV_WARM_RUNNER_SOCKET = "SSC_WARM_RUNNER_SOCKET"
+DEFAULT_SOCKET = "/tmp/ssc-warm/control.sock"
+# Trailer after the scan output: NUL + marker + exit code (NUL never appears in text logs)
+_EXIT_MARKER = b"\x00SSC-WARM-EXIT "
+_CONNECT_TIMEOUT_SECONDS = 60.0
+# Scratch tmpfs mounts of scanner containers: a scan's leftovers must not reach the next one
+SCRATCH_TMPFS_DIRS = ("/tmp", "/var/tmp")
+
+
+def _socket_path() -> str:
+    return os.environ.get(ENV_WARM_RUNNER_SOCKET, "").strip() or DEFAULT_SOCKET
+
+
+def _clear_dir(path: Path, keep: Path | None = None) -> None:
+    """Remove the contents of ``path`` (a scan tmpfs), except the entry ``keep``."""
+    try:
+        entries = list(path.iterdir())
+    except OSError:
+        return
+    for entry in entries:
+        if keep is not None and entry == keep:
+            continue
+        try:
+            if entry.is_dir() and not entry.is_symlink():
+                shutil.rmtree(entry, ignore_errors=True)
+            else:
+                entry.unlink()
+        except OSError:
+            pass
+
+
+def _scratch_target(env: dict) -> Path | None:
+    """/target is per-scan scratch only for git_repo scans (tmpfs clone); never touch a mount."""
+    if env.get("TARGET_TYPE") != "git_repo":
+        return None
+    return Path(env.get("TARGET_PATH_IN_CONTAINER") or "/target")
+
+
+def _clear_scratch(env: dict) -> None:
+    """Empty /target (git_repo) and the /tmp, /var/tmp tmpfs; the control socket's directory stays."""
+    target = _scratch_target(env)
+    if target is not None:
+        _clear_dir(target)
+    socket_dir = Path(_socket_path()).parent
+    for scratch in SCRATCH_TMPFS_DIRS:
+        _clear_dir(Path(scratch), keep=socket_dir)
+
+
+def _run_assignment(conn: socket.socket, env: dict, base_env: dict) -> int:
+    """Fork a child that runs one scan with ``env``; returns its exit code."""
+    _clear_scratch(env)
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            fd = conn.fileno()
+            os.dup2(fd, 1)
+            os.dup2(fd, 2)
+            devnull = os.open(os.devnull, os.O_RDONLY)
+            os.dup2(devnull, 0)
+            os.environ.clear()
+            os.environ.update(base_env)
+            os.environ.update(env)
+            os.chdir("/app" if os.path.isdir("/app") else "/")
+            sys.argv = ["scanner.core.orchestrator"]
+            import asyncio
+
+            from scanner.core import orchestrator
+
+            try:
+                asyncio.run(orchestrator.main())
+                code = 0
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except BaseException as e:  # noqa: BLE001 - report anything, the parent only sees the code
+            try:
+                print(f"[WarmRunner] Scan failed: {e}", file=sys.stderr)
+            except Exception:
+                pass
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            except Exception:
+                pass
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    _clear_scratch(env)
+    code = os.waitstatus_to_exitcode(status)
+    # Killed by a signal: report it like a container would (128 + signal number)
+    return 128 - code if code < 0 else code
+
+
+def _read_assignment(conn: socket.socket) -> dict:
+    buf = b""
+    while b"\n" not in buf:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        buf += chunk
+    data = json.loads(buf.split(b"\n", 1)[0].decode("utf-8"))
+    env = data.get("env") if isinstance(data, dict) else None
+    if not isinstance(env, dict) or not env.get("SCAN_ID"):
+        raise ValueError("assignment needs env with SCAN_ID")
+    return {str(k): str(v) for k, v in env.items()}
+
+
+def serve() -> int:
+    """Pre-import the scanner stack, then run assignments one at a time until killed."""
+    import scanner.core.orchestrator  # noqa: F401 - warm imports + plugin registration for children
+
+    path = Path(_socket_path())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+    base_env = dict(os.environ)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen(1)
+    print(f"[WarmRunner] Ready on {path}", flush=True)
+    while True:
+        conn, _ = server.accept()
+        with conn:
+            try:
+                env = _read_assignment(conn)
+            except (OSError, ValueError) as e:
+                print(f"[WarmRunner] Bad assignment: {e}", flush=True)
+                continue
+            print(f"[WarmRunner] Scan {env['SCAN_ID']} started", flush=True)
+            code = _run_assignment(conn, env, base_env)
+            print(f"[WarmRunner] Scan {env['SCAN_ID']} finished with exit code {code}", flush=True)
+            try:
+                conn.sendall(_EXIT_MARKER + str(code).encode("ascii") + b"\n")
+            except OSError:
+                pass
+
+
+def run() -> int:
+    """Submit this process's environment as an assignment; relay output; return the scan's exit code."""
+    path = _socket_path()
+    deadline = time.monotonic() + _CONNECT_TIMEOUT_SECONDS
+    while True:
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            conn.connect(path)
+            break
+        except OSError:
+            conn.close()
+            # Container just started: serve() is still importing plugins
+            if time.monotonic() > deadline:
+                print(f"[WarmRunner] No warm runner listening on {path}", file=sys.stderr)
+                return 125
+            time.sleep(0.2)
+    with conn:
+        conn.sendall(json.dumps({"env": dict(os.environ)}).encode("utf-8") + b"\n")
+        out = sys.stdout.buffer
+        held = b""
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            held += chunk
+            idx = held.rfind(_EXIT_MARKER)
+            if idx != -1 and held.endswith(b"\n"):
+                # Stop at the trailer: leftover tool processes may still hold the socket open
+                break
+            # Hold back from the last NUL (possible partial trailer); relay everything before it
+            cut = held.rfind(b"\x00")
+            keep_from = cut if cut != -1 else len(held)
+            out.write(held[:keep_from])
+            held = held[keep_from:]
+        out.flush()
+    idx = held.rfind(_EXIT_MARKER)
+    if idx == -1:
+        out.write(held)
+        out.flush()
+        print("[WarmRunner] Connection closed before the scan finished", file=sys.stderr)
+        return 125
+    out.write(held[:idx])
+    out.flush()
+    try:
+        return int(held[idx + len(_EXIT_MARKER):].strip() or b"1")
+    except ValueError:
+        return 1
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command == "serve":
+        sys.exit(serve())
+    if command == "run":
+        sys.exit(run())
+    print("usage: python3 -m scanner.core.warm_runner serve|run", file=sys.stderr)
+    sys.exit(2)
@@ -168,10 +168,13 @@ function formatSeverityBreakdown(counts: Record<string, number>): string {
 }
 
 function loadReportFindingsFromPage(): ReportFinding[] {
+  // Decoded once by the report script (the embedded payload may be gzip+base64 encoded)
+  const decoded = (window as unknown as { __sscReportFindings?: ReportFinding[] }).__sscReportFindings;
+  if (Array.isArray(decoded)) return decoded;
   const ids = ['report-findings-data', 'findings-data'];
   for (let i = 0; i < ids.length; i++) {
     const el = document.getElementById(ids[i]) as HTMLScriptElement | null;
-    if (!el) continue;
+    if (!el || el.getAttribute('data-encoding')) continue;
     let jsonText = el.textContent || el.innerText || '';
     if (jsonText.indexOf('&quot;') !== -1 || jsonText.indexOf('&amp;') !== -1) {
       const parser = new DOMParser();
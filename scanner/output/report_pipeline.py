@@ -0,0 +1,752 @@
+"""
+In-process HTML report pipeline: build findings -> inline suppressions -> finding policy -> render.
+
+The orchestrator calls ``generate_report`` after the scanners (reusing its loaded ScannerRegistry
+and, optionally, findings it parsed right after each scanner finished). ``generate-html-report.py``
+is the standalone entry point (re-rendering an old scan from its results directory).
+
+Writes summary/summary.html, summary/statistics.json (post-policy counts), summary/findings.db
+(indexed findings store, shared/findings_store.py) and summary/findings.json (export copy).
+"""
+import datetime
+import inspect
+import html
+import json
+import os
+import sys
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Security: processors parse tool XML; defusedxml is a REQUIRED dependency (no fallback)
+from defusedxml import defuse_stdlib
+defuse_stdlib()
+
+from scanner.output.html_utils import (
+    html_header,
+    html_footer,
+    generate_executive_summary,
+    generate_tool_status_section,
+    SCORE_FLOOR,
+    _weighted_penalty,
+    _findings_as_list,
+    _findings_count,
+)
+from scanner.output.report_sections import (
+    FINDINGS_PAGE_SIZE,
+    _report_features_script,
+    _safe_json_for_script_tag,
+    generate_accepted_findings_section,
+    generate_all_findings_section,
+    generate_finding_policy_section,
+    generate_metadata_section,
+    write_findings_payload,
+)
+from scanner.core.finding_policy import load_policy
+from scanner.core.policy_matching import normalize_policy_path
+from scanner.core.inline_suppressions import (
+    apply_inline_suppressions,
+    build_suppression_index,
+    get_inline_config,
+)
+from scanner.core.scan_metadata import load_metadata
+from shared.findings_store import FINDINGS_DB_FILENAME, FindingsStore, write_findings_db
+from shared.steps_log import STEPS_LOG_FILENAME, read_steps
+
+# Single source of truth: scanner names and paths come from ScannerRegistry only (required)
+# Must use scanner.core.scanner_registry so plugin discovery uses the same module (same _scanners dict)
+from scanner.core.scanner_registry import ScannerRegistry, ScanType
+
+# (processor, parsed findings or None if the report could not be parsed)
+ParsedToolFindings = Tuple[Any, Any]
+
+# Embedded findings are gzip+base64 encoded above this count (SSC_REPORT_COMPRESS_FINDINGS=auto)
+COMPRESS_FINDINGS_THRESHOLD = 2000
+# Per-tool detail sections are skipped above this count; the All Findings table covers them
+TOOL_SECTION_MAX_FINDINGS = 500
+
+_log: Optional[Callable[[str], None]] = None
+
+
+def debug(msg):
+    line = f"[generate-html-report] {msg}"
+    if _log is not None:
+        _log(line)
+    else:
+        print(line, file=sys.stderr)
+
+
+def _scanner_result_path(results_dir, tools_key, filename):
+    """Path from registry only: results_dir/tools/<tools_key>/<filename>. tools_key comes from Scanner.tools_key."""
+    if not filename or not tools_key:
+        return None
+    base = Path(results_dir)
+    return str(base / "tools" / tools_key / filename)
+
+
+def _get_processor_for_scanner(scanner):
+    """Resolve report processor for a scanner from the same plugin (by python_class module path)."""
+    if not getattr(scanner, "python_class", None):
+        return None
+    try:
+        # e.g. "scanner.plugins.checkov.scanner.CheckovScanner" -> plugin "checkov"
+        parts = scanner.python_class.split(".")
+        if len(parts) >= 3 and parts[0] == "scanner" and parts[1] == "plugins":
+            plugin_name = parts[2]
+            processor_module = __import__(
+                f"scanner.plugins.{plugin_name}.processor",
+                fromlist=["REPORT_PROCESSOR"],
+            )
+            return getattr(processor_module, "REPORT_PROCESSOR", None)
+    except Exception as exc:
+        debug(f"Could not load processor for {getattr(scanner, 'name', scanner)}: {exc}")
+    return None
+
+
+def read_json(path):
+    """Robust JSON reader that handles missing files and parsing errors gracefully"""
+    if not Path(path).exists():
+        debug(f"Missing JSON file: {path}")
+        return None
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except json.JSONDecodeError as e:
+        debug(f"JSON decode error in {path}: {e}")
+        return None
+    except Exception as e:
+        debug(f"Error reading JSON file {path}: {e}")
+        return None
+
+
+def _normalize_severity(sev):
+    """Map any severity string to CRITICAL|HIGH|MEDIUM|LOW|INFO."""
+    if not sev:
+        return "INFO"
+    s = str(sev).upper()
+    if "CRIT" in s:
+        return "CRITICAL"
+    if s == "HIGH" or s == "ERROR":
+        return "HIGH"
+    if s in ("MEDIUM", "MED", "WARN", "MODERATE"):
+        return "MEDIUM"
+    if s == "LOW":
+        return "LOW"
+    return "INFO"
+
+
+def _normalize_finding_for_report(tool_name, finding, policy_key=None):
+    """Extract tool, severity, path, line, message, rule_id from any finding dict for report table."""
+    from scanner.output.ai_normalizer_utils import normalize_finding_fields
+
+    if not isinstance(finding, dict):
+        return None
+    fields = normalize_finding_fields(finding)
+    row = {
+        "tool": tool_name,
+        "severity": _normalize_severity(fields["severity"]),
+        "path": normalize_policy_path(fields["path"]),
+        "line": fields["line"],
+        "message": fields["message"],
+        "rule_id": fields["rule_id"],
+    }
+    if policy_key:
+        row["policy_key"] = policy_key
+    return row
+
+
+def build_report_findings(all_findings, policy_keys_by_tool=None):
+    """Build a flat list of normalized findings for filter/sort/export. Structure-based (dict with 'alerts' etc.), no tool names."""
+    from scanner.core.scan_excludes import path_matches_exclude
+
+    target_root = (
+        os.environ.get("TARGET_MOUNT_PATH", "").strip()
+        or os.environ.get("TARGET_PATH", "").strip()
+        or "/target"
+    )
+    policy_keys_by_tool = policy_keys_by_tool or {}
+    report_findings = []
+    for tool, findings in all_findings.items():
+        pk = policy_keys_by_tool.get(tool)
+        findings_list = _findings_as_list(findings)
+        for f in findings_list:
+            norm = _normalize_finding_for_report(tool, f, policy_key=pk)
+            if not norm:
+                continue
+            if norm.get("path") and path_matches_exclude(target_root, norm["path"]):
+                continue
+            report_findings.append(norm)
+    return report_findings
+
+
+def sanitize_findings(findings_by_tool):
+    """Remove invalid non-dict entries from findings lists to prevent report crashes."""
+    sanitized = {}
+    for tool, findings in findings_by_tool.items():
+        if isinstance(findings, list):
+            cleaned = []
+            for finding in findings:
+                if isinstance(finding, dict):
+                    cleaned.append(finding)
+                else:
+                    debug(
+                        f"Skipping non-dict finding from {tool}: {type(finding).__name__} -> {finding}"
+                    )
+            sanitized[tool] = cleaned
+        else:
+            sanitized[tool] = findings
+    return sanitized
+
+
+def _compute_tool_severity_counts(all_findings):
+    """Compute per-tool severity counts (c, h, m, l, i) from all_findings. No hardcoded tool names."""
+    result = {}
+    for tool, findings in all_findings.items():
+        findings_list = _findings_as_list(findings)
+        c, h, m, l, i = 0, 0, 0, 0, 0
+        for finding in findings_list:
+            if not isinstance(finding, dict):
+                continue
+            sev = str(finding.get("Severity", finding.get("severity", ""))).upper()
+            if "CRITICAL" in sev or "CRIT" in sev:
+                c += 1
+            elif "HIGH" in sev or sev == "ERROR":
+                h += 1
+            elif "MEDIUM" in sev or "MED" in sev or "WARN" in sev or "MODERATE" in sev:
+                m += 1
+            elif "LOW" in sev:
+                l += 1
+            else:
+                i += 1
+        result[tool] = (c, h, m, l, i)
+    return result
+
+
+def _compute_domain_scores(all_findings):
+    """Compute domain scores from registry only: each ScanType aggregates tools that have that capability. No hardcoded tool names. Only includes domains that have at least one tool in this scan."""
+    tool_severity = _compute_tool_severity_counts(all_findings)
+    tools_in_scan = set(tool_severity.keys())
+    domain_scores = {}
+    for scan_type in ScanType:
+        scanners = ScannerRegistry.get_scanners_for_type(scan_type)
+        dc, dh, dm, dl, di = 0, 0, 0, 0, 0
+        has_any = False
+        for scanner in scanners:
+            if scanner.name not in tools_in_scan:
+                continue
+            has_any = True
+            c, h, m, l, i = tool_severity[scanner.name]
+            dc, dh, dm, dl, di = dc + c, dh + h, dm + m, dl + l, di + i
+        if not has_any:
+            continue
+        penalty = _weighted_penalty(dc, dh, dm, dl, di)
+        score = max(SCORE_FLOOR, int(100 - penalty))
+        label = scan_type.value.replace("_", " ").title()
+        domain_scores[label] = score
+    return domain_scores
+
+
+def load_tool_statuses_from_steps_log(results_dir):
+    """
+    Read steps.log (current state per step, see shared.steps_log) and return a dict:
+    tool_name -> {'status': 'complete'|'failed'|'skipped', 'message': str}.
+    Only includes steps that correspond to scanners (names that appear as step names for scanner runs).
+    """
+    steps_log = Path(results_dir) / "logs" / STEPS_LOG_FILENAME
+    if not steps_log.exists():
+        return {}
+    scanner_names = {s.name for s in ScannerRegistry.get_all_scanners()}
+    tool_statuses = {}
+    try:
+        for data in read_steps(steps_log):
+            name = data.get("name")
+            status_str = data.get("status", "")
+            message = data.get("message", "")
+            if not name:
+                continue
+            if name not in scanner_names:
+                continue
+            if status_str == "completed":
+                tool_statuses[name] = {"status": "complete", "message": message or ""}
+            elif status_str == "failed":
+                tool_statuses[name] = {"status": "failed", "message": message or ""}
+            elif status_str == "skipped":
+                tool_statuses[name] = {"status": "skipped", "message": message or ""}
+            elif status_str == "running":
+                tool_statuses[name] = {"status": "running", "message": message or ""}
+            else:
+                tool_statuses[name] = {"status": "complete", "message": message or ""}
+    except Exception as e:
+        debug(f"Could not read steps.log: {e}")
+    return tool_statuses
+
+
+def _env_tristate(name: str) -> Optional[bool]:
+    raw = os.environ.get(name, "").strip().lower()
+    if raw in ("1", "true", "yes", "always"):
+        return True
+    if raw in ("0", "false", "no", "never"):
+        return False
+    return None
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    try:
+        value = int(raw) if raw else default
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+@dataclass
+class ReportOptions:
+    """Where to read a scan's results and write its report, plus scan context for the header."""
+
+    results_dir: Path
+    output_file: Path
+    scan_type: str = "code"
+    target_type: str = ""
+    scan_target: str = ""
+    # Finding policy file; empty: the one recorded in the scan metadata (if any)
+    policy_path: str = ""
+    # Scanned tree, for inline suppression comments
+    target_root: str = "/app/target"
+    # Directories searched for the embedded report JavaScript (in order)
+    script_dirs: List[Path] = field(default_factory=list)
+    # Compress the embedded findings payload: True / False / None (above COMPRESS_FINDINGS_THRESHOLD)
+    compress_findings: Optional[bool] = None
+    tool_section_max_findings: int = TOOL_SECTION_MAX_FINDINGS
+    page_size: int = FINDINGS_PAGE_SIZE
+
+    @classmethod
+    def from_env(cls, results_dir: Path, output_file: Path) -> "ReportOptions":
+        return cls(
+            results_dir=Path(results_dir).resolve(),
+            output_file=Path(output_file),
+            scan_type=os.environ.get("SCAN_TYPE", "code"),
+            target_type=os.environ.get("TARGET_TYPE", ""),
+            scan_target=os.environ.get("SCAN_TARGET", "Unknown"),
+            policy_path=(
+                os.environ.get("FINDING_POLICY_FILE", "").strip()
+                or os.environ.get("FINDING_POLICY_FILE_IN_CONTAINER", "").strip()
+            ),
+            target_root=(
+                os.environ.get("TARGET_MOUNT_PATH", "").strip()
+                or os.environ.get("TARGET_PATH", "").strip()
+                or "/app/target"
+            ),
+            compress_findings=_env_tristate("SSC_REPORT_COMPRESS_FINDINGS"),
+            tool_section_max_findings=_env_int("SSC_REPORT_TOOL_SECTION_MAX_FINDINGS", TOOL_SECTION_MAX_FINDINGS),
+            page_size=_env_int("SSC_REPORT_PAGE_SIZE", FINDINGS_PAGE_SIZE),
+        )
+
+
+def parse_tool_findings(scanner, results_dir) -> Optional[ParsedToolFindings]:
+    """Parse one scanner's report files; None if it has no report processor or did not write a report."""
+    if not getattr(scanner, "tools_key", None):
+        return None
+    processor = _get_processor_for_scanner(scanner)
+    if not processor:
+        return None
+    if processor.html_file:
+        html_path = _scanner_result_path(results_dir, scanner.tools_key, processor.html_file)
+        json_path = _scanner_result_path(results_dir, scanner.tools_key, processor.json_file) if processor.json_file else None
+        path_to_check = Path(html_path) if html_path else None
+    elif processor.json_file:
+        json_path = _scanner_result_path(results_dir, scanner.tools_key, processor.json_file)
+        html_path = None
+        path_to_check = Path(json_path) if json_path else None
+    else:
+        return None
+    if path_to_check and not path_to_check.exists():
+        return None
+    try:
+        if processor.html_file:
+            findings = processor.summary_func(html_path or "", json_path)
+        else:
+            json_data = read_json(json_path)
+            findings = processor.summary_func(json_data) if json_data is not None else None
+    except Exception as e:
+        debug(f"Warning: Could not process {scanner.name}: {e}")
+        findings = None
+    return processor, findings
+
+
+def build_findings(
+    results_dir,
+    parsed: Optional[Dict[str, ParsedToolFindings]] = None,
+) -> Tuple[Dict[str, Any], List[Tuple[Any, Any]]]:
+    """
+    Findings per scanner name (registry order) and the (scanner, processor) pairs that produced them.
+    ``parsed`` (scanner name -> parse_tool_findings result) skips re-reading reports already parsed.
+    """
+    findings_by_tool: Dict[str, Any] = {}
+    scanner_processors: List[Tuple[Any, Any]] = []
+    parsed = parsed or {}
+    try:
+        for scanner in ScannerRegistry.get_all_scanners():
+            entry = parsed[scanner.name] if scanner.name in parsed else parse_tool_findings(scanner, results_dir)
+            if entry is None:
+                continue
+            processor, findings = entry
+            findings_by_tool[scanner.name] = findings
+            scanner_processors.append((scanner, processor))
+    except Exception as e:
+        debug(f"ScannerRegistry failed: {e}")
+        return {}, []
+    return findings_by_tool, scanner_processors
+
+
+def apply_inline_suppression_stage(findings_by_tool, scanner_processors, target_root) -> List[Dict[str, Any]]:
+    """Drop findings marked by inline comments (# nosec, ...) in place; returns their accepted records."""
+    accepted_findings: List[Dict[str, Any]] = []
+    inline_config = get_inline_config()
+    if not inline_config.get("enabled", True) or not os.path.isdir(target_root):
+        return accepted_findings
+    suppression_index = build_suppression_index(target_root)
+    if not suppression_index:
+        return accepted_findings
+    for scanner, processor in scanner_processors:
+        findings = findings_by_tool.get(scanner.name)
+        if findings is None:
+            continue
+        tool_key = getattr(processor, "policy_key", None) or ""
+        updated, inline_accepted = apply_inline_suppressions(
+            findings,
+            suppression_index,
+            tool_key=tool_key,
+            tool_name=scanner.name,
+            target_root=target_root,
+            config=inline_config,
+        )
+        findings_by_tool[scanner.name] = updated
+        accepted_findings.extend(inline_accepted)
+    return accepted_findings
+
+
+def apply_policy_stage(findings_by_tool, scanner_processors, finding_policy) -> List[Dict[str, Any]]:
+    """Apply the finding policy per tool in place; returns the accepted records."""
+    accepted_findings: List[Dict[str, Any]] = []
+    for scanner, processor in scanner_processors:
+        if not getattr(processor, "policy_key", None) or not getattr(processor, "apply_policy", None):
+            continue
+        findings = findings_by_tool.get(scanner.name)
+        if findings is not None:
+            tool_policy = finding_policy.get(processor.policy_key, {}) if isinstance(finding_policy, dict) else {}
+            updated, accepted = processor.apply_policy(findings, tool_policy)
+            findings_by_tool[scanner.name] = updated
+            for record in accepted:
+                if isinstance(record, dict) and "accept_source" not in record:
+                    record["accept_source"] = "policy"
+            accepted_findings.extend(accepted)
+    return accepted_findings
+
+
+def _report_target(options: ReportOptions) -> str:
+    # For code scans, use better target description
+    if options.target_type in ('local_mount', 'git_repo', 'uploaded_code', '') and options.scan_type == 'code':
+        # Try to get the actual project name from the results directory path
+        # e.g., /app/results/NoServerConvert_20251026_170126 -> NoServerConvert
+        project_name = os.path.basename(str(options.results_dir))
+        if project_name and project_name != 'results':
+            return project_name.split('_')[0]  # Remove timestamp suffix
+        return 'Code scan'
+    return options.scan_target or 'Unknown'
+
+
+def _embedded_scripts(options: ReportOptions) -> str:
+    """Read and embed JavaScript files inline (required for both Blob URLs and file://)."""
+    embedded_scripts = ""
+    js_files = ['ai_prompt_modal.js', 'webui.js']
+    # Try multiple possible locations for JS files (in order of preference)
+    possible_dirs = options.script_dirs or [
+        Path("/app/scanner/output"),  # Container absolute path (PRIMARY)
+        Path(__file__).parent.absolute(),  # scanner/output/
+        Path(options.results_dir),  # results/ (files copied after report generation)
+    ]
+    for js_file in js_files:
+        js_content = None
+        found_path = None
+        for base_dir in possible_dirs:
+            js_path = base_dir / js_file
+            if js_path.exists():
+                try:
+                    with open(js_path, 'r', encoding='utf-8') as js_f:
+                        js_content = js_f.read()
+                        found_path = js_path
+                        break
+                except Exception as e:
+                    debug(f"Warning: Could not read {js_path}: {e}")
+        if js_content:
+            embedded_scripts += f"<script>\n{js_content}\n</script>\n"
+            debug(f"Embedded {js_file} from {found_path}")
+        else:
+            # Continue without JS, but log error
+            debug(f"ERROR: {js_file} not found in any of: {possible_dirs}")
+            debug(f"[ERROR] Failed to embed {js_file} - AI Prompt feature will not work!")
+    return embedded_scripts
+
+
+def render_report(
+    options: ReportOptions,
+    findings_by_tool,
+    scanner_processors,
+    accepted_findings,
+    finding_policy,
+    policy_path,
+    scan_metadata,
+) -> None:
+    """Write statistics.json, findings.json and the HTML report; raises if the HTML cannot be written."""
+    now = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    target = _report_target(options)
+    output_file = Path(options.output_file)
+    all_findings = sanitize_findings(findings_by_tool)
+
+    # Determine which tools were executed: use steps.log for real status (complete/failed/skipped)
+    executed_tools = load_tool_statuses_from_steps_log(options.results_dir)
+    for tool, findings in all_findings.items():
+        if findings is not None:
+            executed_tools[tool] = {"status": "complete", "message": ""}
+
+    embedded_scripts = _embedded_scripts(options)
+
+    # Report findings for filter/sort/export and the AI prompt (flat list, embedded once)
+    policy_keys_by_tool = {
+        scanner.name: getattr(processor, "policy_key", None) or ""
+        for scanner, processor in scanner_processors
+    }
+    report_findings = build_report_findings(
+        all_findings,
+        policy_keys_by_tool=policy_keys_by_tool,
+    )
+    ai_prompt_disabled = len(report_findings) == 0
+    # Pre-fill AI prompt modal: policy path from scan (or default)
+    display_policy_path = (policy_path or ".scanning/finding-policy.json").replace("/target/", "").strip()
+    if not display_policy_path:
+        display_policy_path = ".scanning/finding-policy.json"
+    embedded_scripts += (
+        f'<script type="application/json" id="scan-ai-prompt-defaults">'
+        f'{_safe_json_for_script_tag({"policy_path": display_policy_path})}'
+        "</script>\n"
+    )
+    embedded_scripts += _report_features_script()
+
+    # Overall status for header badge: Critical | High | OK (counts are post-policy)
+    severity_counts: Dict[str, int] = {}
+    for f in report_findings:
+        sev = str(f.get("severity") or "").strip().upper()
+        severity_counts[sev] = severity_counts.get(sev, 0) + 1
+    critical_count = severity_counts.get("CRITICAL", 0)
+    high_count = severity_counts.get("HIGH", 0)
+    medium_count = severity_counts.get("MEDIUM", 0)
+    low_count = severity_counts.get("LOW", 0)
+    info_count = sum(severity_counts.get(s, 0) for s in ("INFO", "INFORMATIONAL", "NOTE"))
+    total_post_policy = len(report_findings)
+    # Write post-policy statistics so worker/backend can store them (no false positives counted)
+    statistics = {
+        "total_vulnerabilities": total_post_policy,
+        "critical_vulnerabilities": critical_count,
+        "high_vulnerabilities": high_count,
+        "medium_vulnerabilities": medium_count,
+        "low_vulnerabilities": low_count,
+        "info_vulnerabilities": info_count,
+    }
+    try:
+        stats_path = output_file.parent / "statistics.json"
+        with open(stats_path, "w", encoding="utf-8") as sf:
+            json.dump(statistics, sf, indent=2)
+        debug(f"Wrote post-policy statistics to {stats_path}")
+    except Exception as e:
+        debug(f"Warning: Could not write statistics.json: {e}")
+
+    generated_at = datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z")
+    # Indexed per-scan store queried by the API, the AI prompt and the report payload below
+    db_path = output_file.parent / FINDINGS_DB_FILENAME
+    try:
+        write_findings_db(db_path, report_findings, summary=statistics, generated_at=generated_at)
+        debug(f"Wrote findings store ({total_post_policy} items) to {db_path}")
+    except Exception as e:
+        debug(f"Warning: Could not write {FINDINGS_DB_FILENAME}: {e}")
+        # Never leave a store from an earlier run; the backend re-imports findings.json instead
+        db_path.unlink(missing_ok=True)
+
+    try:
+        findings_doc = {
+            "generated_at": generated_at,
+            "findings": report_findings,
+            "summary": statistics,
+        }
+        findings_path = output_file.parent / "findings.json"
+        with open(findings_path, "w", encoding="utf-8") as ff:
+            # Export copy (the store is the query source): compact, no indentation
+            json.dump(findings_doc, ff, ensure_ascii=False, separators=(",", ":"))
+        debug(f"Wrote findings.json ({len(report_findings)} items) to {findings_path}")
+    except Exception as e:
+        debug(f"Warning: Could not write findings.json: {e}")
+
+    overall_status = "Critical" if critical_count > 0 else "High" if high_count > 0 else "OK"
+    repo_url = ""
+    if scan_metadata:
+        repo_url = (scan_metadata.get("git_info") or {}).get("repository_url", "") or ""
+
+    with open(output_file, 'w') as f:
+        f.write(html_header(
+            f'{target} - {now}',
+            embedded_scripts,
+            ai_prompt_disabled,
+            overall_status=overall_status,
+            repo_url=repo_url,
+        ))
+
+        # Report actions: Expand/Collapse all, Export JSON/CSV
+        f.write(
+            '<div class="filter-bar" style="margin-bottom: 1rem;">'
+            '<button type="button" class="toggle-btn" id="expand-all-btn">📂 Expand all</button> '
+            '<button type="button" class="toggle-btn" id="collapse-all-btn">📁 Collapse all</button> '
+            '<button type="button" class="toggle-btn" id="export-json-btn">📥 Download JSON</button> '
+            '<button type="button" class="toggle-btn" id="export-csv-btn">📥 Download CSV</button> '
+            '<span id="copy-share-link-wrap">'
+            '<button type="button" class="toggle-btn" id="copy-share-link-btn" '
+            'title="Copy shareable link (only when report is open inside the app)">🔗 Copy share link</button>'
+            '</span>'
+            '</div>'
+        )
+
+        # Scan Metadata Section (only if metadata was collected)
+        if scan_metadata:
+            f.write(generate_metadata_section(scan_metadata))
+
+        # Executive Summary Dashboard (domain_scores from registry ScanType only, no hardcoded tools)
+        domain_scores = _compute_domain_scores(all_findings)
+        f.write(generate_executive_summary(all_findings, domain_scores=domain_scores, executed_tools=executed_tools))
+
+        # Tool execution status
+        f.write(generate_tool_status_section(executed_tools))
+
+        # Simple tool summary grid (structure-based count, no tool names)
+        tool_cards = []
+        for tool, findings in all_findings.items():
+            if findings is None:
+                continue
+            count = _findings_count(findings)
+            tool_cards.append(f"<div class='tool-summary'><strong>{html.escape(tool)}</strong>: {count} findings</div>")
+        if tool_cards:
+            f.write("<div class='summary-box'><h2>Tool Summary</h2>" + "".join(tool_cards) + "</div>")
+
+        # All Findings section (filter/sort table, rows rendered client-side page by page)
+        f.write(generate_all_findings_section(report_findings, page_size=options.page_size))
+
+        # Tool-specific sections (scanner.name is the only key), each wrapped in <details>
+        for scanner, processor in scanner_processors:
+            tool_name = scanner.name
+            findings = all_findings.get(tool_name)
+            if not processor or not getattr(processor, "html_func", None):
+                continue
+            if findings is None:
+                continue
+            count = _findings_count(findings)
+            if count == 0:
+                continue
+            if count > options.tool_section_max_findings:
+                # Full per-tool tables dominate report size; the paginated All Findings table has every row
+                f.write(
+                    '<div class="glass" style="margin: 2rem 0; padding: 1rem 1.5rem;">'
+                    f'<strong>🔍 {html.escape(tool_name)}</strong>: {count} findings – detail section omitted '
+                    f'(more than {options.tool_section_max_findings}); filter the All Findings table by this tool.'
+                    '</div>'
+                )
+                continue
+            try:
+                sig = inspect.signature(processor.html_func)
+                nparams = len(sig.parameters)
+                if nparams > 1:
+                    html_path = _scanner_result_path(options.results_dir, scanner.tools_key, processor.html_file) or ""
+                    tool_html = processor.html_func(findings, html_path, Path, os)
+                else:
+                    tool_html = processor.html_func(findings)
+                if tool_html:
+                    f.write(
+                        '<div class="glass report-section-collapsible" style="margin: 2rem 0; padding: 0; overflow: hidden;">'
+                        '<details class="tool-category" data-category-has-issues="true">'
+                        f'<summary class="category-header"><span class="category-icon">🔍</span> {html.escape(tool_name)}</summary>'
+                        f'<div style="padding: 1rem 1.5rem;">{tool_html}</div>'
+                        '</details></div>'
+                    )
+            except Exception as e:
+                debug(f"Warning: Could not generate HTML for {tool_name}: {e}")
+                continue
+
+        # Accepted Findings Section (only if policy accepted any findings)
+        if len(accepted_findings) > 0:
+            f.write(generate_accepted_findings_section(accepted_findings))
+
+        # Finding Policy Section (always shown - shows status or instructions)
+        f.write(generate_finding_policy_section(finding_policy, policy_path, accepted_findings, scanner_processors))
+
+        # Findings payload (once, streamed) for the table, export and AI prompt
+        compress = options.compress_findings
+        if compress is None:
+            compress = total_post_policy > COMPRESS_FINDINGS_THRESHOLD
+        findings_store = FindingsStore.open(db_path)
+        if findings_store is not None:
+            with findings_store:
+                write_findings_payload(f, findings_store.iter_findings(), compress=compress)
+        else:
+            write_findings_payload(f, report_findings, compress=compress)
+        debug(f"Embedded {total_post_policy} report findings{' (gzip+base64)' if compress else ''}")
+
+        f.write(html_footer())
+    debug(f"HTML report successfully written to {output_file}")
+
+
+def generate_report(
+    options: ReportOptions,
+    parsed: Optional[Dict[str, ParsedToolFindings]] = None,
+    log: Optional[Callable[[str], None]] = None,
+) -> bool:
+    """
+    Run the whole pipeline for one scan. Returns False (details logged) if the report could not be written.
+
+    Args:
+        options: Results directory, output file and scan context
+        parsed: Findings already parsed per scanner name (``parse_tool_findings``); others are read from disk
+        log: Line sink for progress/warnings (default: stderr)
+    """
+    global _log
+    previous, _log = _log, log
+    try:
+        debug(f"Starting HTML report generation. Output: {options.output_file}")
+        findings_by_tool, scanner_processors = build_findings(options.results_dir, parsed)
+
+        # Load scan metadata from results_dir/metadata/scan.json (not results_dir/scan.json)
+        scan_metadata = load_metadata(os.path.join(str(options.results_dir), "metadata"))
+
+        # Finding policy: explicit path, else the one recorded in the scan metadata
+        policy_path = options.policy_path
+        if not policy_path and scan_metadata and scan_metadata.get("finding_policy"):
+            policy_path = scan_metadata.get("finding_policy", "")
+        finding_policy = load_policy(policy_path) if policy_path and policy_path.strip() else {}
+
+        accepted_findings = apply_inline_suppression_stage(
+            findings_by_tool, scanner_processors, options.target_root
+        )
+        accepted_findings.extend(apply_policy_stage(findings_by_tool, scanner_processors, finding_policy))
+
+        render_report(
+            options,
+            findings_by_tool,
+            scanner_processors,
+            accepted_findings,
+            finding_policy,
+            policy_path,
+            scan_metadata,
+        )
+        return True
+    except Exception as e:
+        debug(f"Failed to write HTML report: {e}")
+        debug(traceback.format_exc())
+        return False
+    finally:
+        _log = previous
@@ -0,0 +1,482 @@
+"""
+HTML sections of the standalone scan report (summary.html).
+
+Pure rendering helpers: they take already filtered findings and return HTML strings
+(or stream them to a writer). Used by scanner/output/report_pipeline.py.
+
+Findings are embedded once (``report-findings-data``); the All Findings table is rendered
+from that payload in the browser, one page at a time.
+"""
+import base64
+import html
+import json
+import zlib
+
+# Rows per page of the client-rendered All Findings table
+FINDINGS_PAGE_SIZE = 100
+# data-encoding of a compressed findings payload (decoded by the report script)
+PAYLOAD_ENCODING_GZIP_BASE64 = "gzip+base64"
+
+
+def generate_metadata_section(metadata):
+    """
+    Generate HTML section for scan metadata (only shown if metadata was collected). Collapsible.
+    """
+    if not metadata:
+        return ""
+    
+    html_parts = []
+    html_parts.append('<div class="glass report-section-collapsible" style="margin: 2rem 0; padding: 0; overflow: hidden;">')
+    html_parts.append('<details class="tool-category" data-category-has-issues="false">')
+    html_parts.append('<summary class="category-header"><span class="category-icon">📋</span> Scan Metadata</summary>')
+    html_parts.append('<div style="padding: 2rem;">')
+    html_parts.append('<p style="color: #6c757d; margin-bottom: 1.5rem;">Metadata was collected because you enabled "Collect Metadata" option.</p>')
+    html_parts.append('<table style="width: 100%; border-collapse: collapse;">')
+    
+    # Project Information (host path removed for privacy/security)
+    
+    if metadata.get("scan_type"):
+        html_parts.append(f'<tr><td style="padding: 0.75rem; font-weight: bold;">Scan Type:</td><td style="padding: 0.75rem;">{html.escape(str(metadata.get("scan_type", "")))}</td></tr>')
+    
+    # Git Information
+    git_info = metadata.get("git_info", {})
+    if git_info and any(git_info.values()):
+        html_parts.append('<tr><td colspan="2" style="padding: 1rem 0.75rem 0.5rem; font-weight: bold; border-top: 1px solid rgba(255,255,255,0.2);">Git Repository Information:</td></tr>')
+        
+        if git_info.get("repository_url"):
+            html_parts.append(f'<tr><td style="padding: 0.75rem; font-weight: bold; padding-left: 2rem;">Repository URL:</td><td style="padding: 0.75rem; word-break: break-all;">{html.escape(str(git_info.get("repository_url", "")))}</td></tr>')
+        
+        if git_info.get("branch"):
+            html_parts.append(f'<tr><td style="padding: 0.75rem; font-weight: bold; padding-left: 2rem;">Branch:</td><td style="padding: 0.75rem;">{html.escape(str(git_info.get("branch", "")))}</td></tr>')
+        
+        if git_info.get("commit_hash"):
+            html_parts.append(f'<tr><td style="padding: 0.75rem; font-weight: bold; padding-left: 2rem;">Commit Hash:</td><td style="padding: 0.75rem; font-family: monospace;">{html.escape(str(git_info.get("commit_hash", "")))}</td></tr>')
+        
+        if git_info.get("commit_message"):
+            html_parts.append(f'<tr><td style="padding: 0.75rem; font-weight: bold; padding-left: 2rem;">Commit Message:</td><td style="padding: 0.75rem;">{html.escape(str(git_info.get("commit_message", "")))}</td></tr>')
+        
+        if git_info.get("is_dirty"):
+            html_parts.append('<tr><td style="padding: 0.75rem; font-weight: bold; padding-left: 2rem;">Working Directory:</td><td style="padding: 0.75rem; color: #ffc107;">⚠️ Uncommitted changes detected</td></tr>')
+    
+    # Scan Configuration
+    scan_config = metadata.get("scan_config", {})
+    if scan_config:
+        html_parts.append('<tr><td colspan="2" style="padding: 1rem 0.75rem 0.5rem; font-weight: bold; border-top: 1px solid rgba(255,255,255,0.2);">Scan Configuration:</td></tr>')
+        
+        if scan_config.get("finding_policy_used"):
+            finding_policy_path = metadata.get("finding_policy", "")
+            if finding_policy_path:
+                # Remove /target/ prefix if present for display
+                display_path = finding_policy_path.replace("/target/", "") if finding_policy_path.startswith("/target/") else finding_policy_path
+                html_parts.append(f'<tr><td style="padding: 0.75rem; font-weight: bold; padding-left: 2rem;">Finding Policy:</td><td style="padding: 0.75rem;">✅ Enabled (<code style="background: rgba(0,0,0,0.2); padding: 0.2rem 0.5rem; border-radius: 4px;">{html.escape(display_path)}</code>)</td></tr>')
+            else:
+                html_parts.append('<tr><td style="padding: 0.75rem; font-weight: bold; padding-left: 2rem;">Finding Policy:</td><td style="padding: 0.75rem;">✅ Enabled</td></tr>')
+        
+        if scan_config.get("ci_mode"):
+            html_parts.append('<tr><td style="padding: 0.75rem; font-weight: bold; padding-left: 2rem;">CI Mode:</td><td style="padding: 0.75rem;">✅ Enabled</td></tr>')
+    
+    html_parts.append('</table>')
+    html_parts.append('</div></details></div>')
+    
+    return "".join(html_parts)
+
+
+def generate_all_findings_section(report_findings, page_size=FINDINGS_PAGE_SIZE):
+    """Generate the All Findings filter bar and an empty, paginated table; rows are rendered client-side from report-findings-data."""
+    if not report_findings:
+        return '<div class="glass" style="margin: 2rem 0; padding: 1.5rem;"><h2>📋 All Findings</h2><p>No findings in this scan.</p></div>'
+
+    tools = sorted({f["tool"] for f in report_findings})
+    severities = ["CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"]
+
+    html_parts = [
+        '<div class="glass report-section-collapsible" style="margin: 2rem 0; padding: 0; overflow: hidden;">',
+        '<details open class="tool-category" data-category-has-issues="true">',
+        '<summary class="category-header"><span class="category-icon">📋</span> All Findings</summary>',
+        '<div style="padding: 1rem 1.5rem 1.5rem;">',
+        # Filter bar
+        '<div class="filter-bar" id="findings-filter-bar">',
+        '<label>Tool: <select id="filter-tool"><option value="">All</option>',
+    ]
+    for t in tools:
+        html_parts.append(f'<option value="{html.escape(t)}">{html.escape(t)}</option>')
+    html_parts.append('</select></label>')
+    html_parts.append('<label>Severity: <select id="filter-severity"><option value="">All</option>')
+    for s in severities:
+        html_parts.append(f'<option value="{html.escape(s)}">{html.escape(s)}</option>')
+    html_parts.append('</select></label>')
+    html_parts.append(
+        '<label>Sort: <select id="sort-findings">'
+        '<option value="severity">Severity</option><option value="tool">Tool</option><option value="path">File</option>'
+        '</select></label>'
+    )
+    html_parts.append(f'<span id="findings-count" style="margin-left: auto; font-size: 0.9rem;">{len(report_findings)} findings</span>')
+    html_parts.append('</div>')
+    # Table (body filled page by page by the report script)
+    html_parts.append(
+        f'<table class="findings-table" id="findings-table" data-page-size="{int(page_size)}">'
+        '<thead><tr><th>Severity</th><th>Tool</th><th>File</th><th>Line</th><th>Rule / Message</th></tr></thead>'
+        '<tbody id="findings-tbody"><tr><td colspan="5">Loading findings…</td></tr></tbody></table>'
+    )
+    html_parts.append(
+        '<div class="filter-bar" id="findings-pager" style="margin-top: 0.75rem;">'
+        '<button type="button" class="toggle-btn" id="findings-prev">‹ Previous</button>'
+        '<span id="findings-page-info" style="font-size: 0.9rem;"></span>'
+        '<button type="button" class="toggle-btn" id="findings-next">Next ›</button>'
+        '</div>'
+    )
+    html_parts.append("</div></details></div>")
+    return "".join(html_parts)
+
+
+def generate_accepted_findings_section(accepted_findings):
+    if not accepted_findings:
+        return ""
+
+    html_parts = []
+    html_parts.append(
+        '<details class="tool-category report-section-collapsible" data-category-has-issues="false" id="accepted-findings-section">'
+        '<summary class="category-header"><span class="category-icon">✅</span> Accepted Findings (With Rationale)</summary>'
+        '<div style="padding: 1rem 1.5rem;">'
+    )
+    html_parts.append(
+        "<table><tr><th>Tool</th><th>ID</th><th>File</th><th>Line</th>"
+        "<th>Source</th><th>Reason</th></tr>"
+    )
+    for finding in accepted_findings:
+        tool = html.escape(str(finding.get("tool", "")))
+        fid = html.escape(str(finding.get("id", "")))
+        path = html.escape(str(finding.get("path", "")))
+        line = html.escape(str(finding.get("line", "")))
+        source = html.escape(str(finding.get("accept_source", "policy")))
+        tag = finding.get("suppress_tag")
+        if tag and source == "inline":
+            source = f"{source} ({html.escape(str(tag))})"
+        reason = html.escape(str(finding.get("reason", "Accepted by policy")))
+        html_parts.append(
+            f"<tr><td>{tool}</td><td>{fid}</td><td>{path}</td><td>{line}</td>"
+            f"<td>{source}</td><td>{reason}</td></tr>"
+        )
+    html_parts.append("</table></div></details>")
+    return "".join(html_parts)
+
+
+def generate_finding_policy_section(finding_policy, policy_path, accepted_findings, scanner_processors=None):
+    """
+    Generate expandable Finding Policy section.
+    If no policy: example built from processors that have policy_example_snippet.
+    If policy used: status + link to accepted findings.
+    """
+    html_parts = []
+    html_parts.append('<div class="glass report-section-collapsible" style="margin: 2rem 0; padding: 0; overflow: hidden;">')
+    
+    policy_used = bool(finding_policy and policy_path)
+    has_accepted = len(accepted_findings) > 0
+    
+    # Expandable section using <details>/<summary> (like tool-category)
+    html_parts.append('<details class="tool-category" data-category-has-issues="false" open>')
+    html_parts.append('<summary class="category-header" style="cursor: pointer; user-select: none;">')
+    
+    if policy_used:
+        html_parts.append('<h2 style="display: inline; margin: 0;">📋 Finding Policy</h2>')
+        html_parts.append('<span class="category-status-badge" data-summary="✅ Active"></span>')
+    else:
+        html_parts.append('<h2 style="display: inline; margin: 0;">📋 Finding Policy</h2>')
+        html_parts.append('<span class="category-status-badge" data-summary="ℹ️ Not configured"></span>')
+    
+    html_parts.append('</summary>')
+    
+    # Content
+    html_parts.append('<div style="margin-top: 1.5rem; padding: 1rem; background: rgba(0,0,0,0.1); border-radius: 8px;">')
+    
+    if policy_used:
+        # Policy is active
+        html_parts.append('<p style="color: #28a745; font-weight: 500; margin-bottom: 1rem;">')
+        html_parts.append('✅ A custom finding policy is active for this scan.')
+        html_parts.append('</p>')
+        
+        html_parts.append(f'<p style="margin-bottom: 0.5rem;"><strong>Policy file:</strong> <code style="background: rgba(0,0,0,0.2); padding: 0.2rem 0.5rem; border-radius: 4px;">{html.escape(str(policy_path))}</code></p>')
+        
+        if has_accepted:
+            inline_count = sum(1 for f in accepted_findings if f.get("accept_source") == "inline")
+            policy_count = len(accepted_findings) - inline_count
+            html_parts.append('<p style="margin-top: 1rem; margin-bottom: 0.5rem;">')
+            html_parts.append(
+                f'<strong>Accepted findings:</strong> {len(accepted_findings)} total '
+                f'({policy_count} via policy, {inline_count} via inline comment).'
+            )
+            html_parts.append('</p>')
+            html_parts.append('<p style="margin-top: 0.5rem;">')
+            html_parts.append('<a href="#accepted-findings-section" style="color: #0dcaf0; text-decoration: underline;">View accepted findings →</a>')
+            html_parts.append('</p>')
+        else:
+            html_parts.append('<p style="margin-top: 1rem; color: #6c757d;">No findings were accepted by the policy in this scan.</p>')
+    else:
+        # No policy - show instructions
+        html_parts.append('<p style="color: #6c757d; margin-bottom: 1rem;">')
+        html_parts.append('This project does not currently use a custom finding policy.')
+        html_parts.append('</p>')
+        
+        html_parts.append('<p style="margin-bottom: 1.5rem;">')
+        html_parts.append(
+            'Suppress false positives with inline comments on the affected line '
+            '(<code># nosec</code>, <code># nosemgrep: rule-id</code>, '
+            '<code>// eslint-disable-next-line</code>) or with a JSON finding policy for broad patterns.'
+        )
+        html_parts.append('</p>')
+        
+        # Example JSON from processors that support policy (no hardcoded tool names)
+        snippets = []
+        if scanner_processors:
+            for _, proc in scanner_processors:
+                if getattr(proc, "policy_example_snippet", None):
+                    snippets.append(proc.policy_example_snippet)
+        example_json = "{\n" + ",\n".join(snippets) + "\n}" if snippets else "{}"
+        html_parts.append('<details style="margin-top: 1rem;">')
+        html_parts.append('<summary style="cursor: pointer; font-weight: 500; margin-bottom: 0.5rem; color: #0dcaf0;">📄 Example Policy Structure</summary>')
+        html_parts.append('<pre style="background: rgba(0,0,0,0.3); padding: 1rem; border-radius: 8px; overflow-x: auto; margin-top: 0.5rem;"><code>')
+        html_parts.append(html.escape(example_json))
+        html_parts.append('</code></pre>')
+        html_parts.append('</details>')
+        
+        # Usage instructions
+        html_parts.append('<div style="margin-top: 1.5rem; padding: 1rem; background: rgba(13, 202, 240, 0.1); border-left: 4px solid #0dcaf0; border-radius: 4px;">')
+        html_parts.append('<p style="margin: 0; font-weight: 500; margin-bottom: 0.5rem;">💡 How to use:</p>')
+        html_parts.append('<ol style="margin: 0.5rem 0 0 1.5rem; padding: 0;">')
+        html_parts.append('<li style="margin-bottom: 0.5rem;">Create a file named <code>finding-policy.json</code> in your project (e.g., <code>.scanning/finding-policy.json</code>)</li>')
+        html_parts.append('<li style="margin-bottom: 0.5rem;">Use the example structure above as a template</li>')
+        html_parts.append('<li style="margin-bottom: 0.5rem;">Run the scan with: <code>FINDING_POLICY_FILE=.scanning/finding-policy.json python3 -m scanner.core.orchestrator</code></li>')
+        html_parts.append('<li>Accepted findings will appear in the "Accepted Findings" section with your rationale</li>')
+        html_parts.append('</ol>')
+        html_parts.append('</div>')
+    
+    html_parts.append('</div>')
+    html_parts.append('</details>')
+    html_parts.append('</div>')
+    
+    return "".join(html_parts)
+
+
+def _safe_json_for_script_tag(value) -> str:
+    """Serialize JSON so embedded </script> cannot terminate the script element."""
+    # json.dumps alone is not enough for HTML script tags: a finding message may contain
+    # literal </script> (e.g. CodeQL bad-tag-filter), which would truncate embedded JSON.
+    return json.dumps(value, ensure_ascii=False).replace("</", "<\\/")
+
+
+class _GzipBase64Writer:
+    """Gzip-compress text and write it base64-encoded to a text stream, chunk by chunk."""
+
+    def __init__(self, out):
+        self._out = out
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31: gzip container
+        self._pending = b""
+
+    def _emit(self, data, final=False):
+        data = self._pending + data
+        # Encode whole 3-byte groups only, so the concatenated chunks form one base64 string
+        cut = len(data) if final else len(data) - len(data) % 3
+        self._pending = data[cut:]
+        if cut:
+            self._out.write(base64.b64encode(data[:cut]).decode("ascii"))
+
+    def write(self, text):
+        self._emit(self._compressor.compress(text.encode("utf-8")))
+
+    def close(self):
+        self._emit(self._compressor.flush(), final=True)
+
+
+def write_findings_payload(out, findings, element_id="report-findings-data", compress=False):
+    """
+    Stream findings as one JSON array into a <script type="application/json"> element.
+    With compress, the array is gzip+base64 encoded and marked with data-encoding.
+    """
+    encoding_attr = f' data-encoding="{PAYLOAD_ENCODING_GZIP_BASE64}"' if compress else ""
+    out.write(f'<script type="application/json" id="{element_id}"{encoding_attr}>')
+    sink = _GzipBase64Writer(out) if compress else out
+    sink.write("[")
+    for i, finding in enumerate(findings):
+        if i:
+            sink.write(",")
+        sink.write(_safe_json_for_script_tag(finding))
+    sink.write("]")
+    if compress:
+        sink.close()
+    out.write("</script>\n")
+
+
+def _report_features_script():
+    """Return inline script for the paginated findings table, filter, sort, export, expand/collapse in the standalone report."""
+    return r"""
+<script>
+(function() {
+  var SEV_ORDER = { CRITICAL: 0, HIGH: 1, MEDIUM: 2, LOW: 3, INFO: 4 };
+  var SEV_ICON = { CRITICAL: '🔴', HIGH: '🟠', MEDIUM: '🟡', LOW: '🟢', INFO: 'ℹ️' };
+  var ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+  var findingsPromise = null;
+  var view = [];
+  var page = 0;
+  function decodeGzipBase64(text) {
+    if (typeof DecompressionStream === 'undefined') {
+      return Promise.reject(new Error('this browser cannot decompress the embedded findings'));
+    }
+    var bin = atob(text.replace(/\s+/g, ''));
+    var bytes = new Uint8Array(bin.length);
+    for (var i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+    var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+    return new Response(stream).text();
+  }
+  function loadReportFindings() {
+    if (findingsPromise) return findingsPromise;
+    var el = document.getElementById('report-findings-data');
+    var raw = el ? el.textContent : '';
+    var text = el && el.getAttribute('data-encoding') === 'gzip+base64'
+      ? decodeGzipBase64(raw)
+      : Promise.resolve(raw || '[]');
+    findingsPromise = text.then(function(t) {
+      var data = JSON.parse(t);
+      // Decoded once; the AI prompt modal reads this instead of the (possibly encoded) element
+      window.__sscReportFindings = Array.isArray(data) ? data : [];
+      return window.__sscReportFindings;
+    });
+    return findingsPromise;
+  }
+  function esc(v) {
+    return String(v == null ? '' : v).replace(/[&<>"']/g, function(c) { return ESCAPES[c]; });
+  }
+  function ruleMessage(f) {
+    var rid = String(f.rule_id || '').trim();
+    var msg = String(f.message || '').trim();
+    return rid && msg ? rid + ': ' + msg : (rid || msg);
+  }
+  function sevRank(f) {
+    var s = SEV_ORDER[f.severity];
+    return s === undefined ? 5 : s;
+  }
+  function lower(v) { return String(v || '').toLowerCase(); }
+  function cmp(a, b) { return a < b ? -1 : (a > b ? 1 : 0); }
+  function comparator(sortBy) {
+    if (sortBy === 'tool') return function(a, b) { return cmp(lower(a.tool), lower(b.tool)) || sevRank(a) - sevRank(b); };
+    if (sortBy === 'path') return function(a, b) { return cmp(lower(a.path), lower(b.path)) || sevRank(a) - sevRank(b); };
+    return function(a, b) { return sevRank(a) - sevRank(b) || cmp(lower(a.tool), lower(b.tool)); };
+  }
+  function renderRow(f) {
+    var sev = SEV_ORDER[f.severity] === undefined ? 'INFO' : f.severity;
+    var cell = ruleMessage(f);
+    var shortCell = cell.length > 200 ? cell.slice(0, 200) + '…' : cell;
+    return '<tr class="finding-row sev-' + sev + '" title="' + esc(cell.slice(0, 200)) + '">' +
+      '<td class="sev-' + sev + '"><span class="finding-icon">' + SEV_ICON[sev] + '</span> ' + sev + '</td>' +
+      '<td>' + esc(f.tool) + '</td><td><code>' + esc(f.path) + '</code></td><td>' + esc(f.line) + '</td>' +
+      '<td><span title="' + esc(f.message) + '">' + esc(shortCell) + '</span></td></tr>';
+  }
+  function renderPage() {
+    var tbody = document.getElementById('findings-tbody');
+    if (!tbody) return;
+    var table = document.getElementById('findings-table');
+    var size = parseInt(table && table.getAttribute('data-page-size'), 10) || 100;
+    var pages = Math.max(1, Math.ceil(view.length / size));
+    page = Math.min(Math.max(page, 0), pages - 1);
+    tbody.innerHTML = view.slice(page * size, (page + 1) * size).map(renderRow).join('');
+    var info = document.getElementById('findings-page-info');
+    if (info) info.textContent = 'Page ' + (page + 1) + ' of ' + pages;
+    var prev = document.getElementById('findings-prev');
+    if (prev) prev.disabled = page === 0;
+    var next = document.getElementById('findings-next');
+    if (next) next.disabled = page >= pages - 1;
+  }
+  function showLoadError(err) {
+    var tbody = document.getElementById('findings-tbody');
+    if (tbody) tbody.innerHTML = '<tr><td colspan="5">Could not load findings: ' + esc(err && err.message) + '</td></tr>';
+  }
+  function applyFilterAndSort() {
+    loadReportFindings().then(function(all) {
+      var toolFilter = (document.getElementById('filter-tool') || {}).value || '';
+      var sevFilter = (document.getElementById('filter-severity') || {}).value || '';
+      var sortBy = (document.getElementById('sort-findings') || {}).value || 'severity';
+      view = all.filter(function(f) {
+        return (!toolFilter || f.tool === toolFilter) && (!sevFilter || f.severity === sevFilter);
+      });
+      view.sort(comparator(sortBy));
+      page = 0;
+      renderPage();
+      var countEl = document.getElementById('findings-count');
+      if (countEl) countEl.textContent = view.length + ' of ' + all.length + ' findings';
+    }, showLoadError);
+  }
+  function downloadBlob(content, type, filename) {
+    var blob = new Blob([content], { type: type });
+    var a = document.createElement('a');
+    a.href = URL.createObjectURL(blob);
+    a.download = filename;
+    a.click();
+    URL.revokeObjectURL(a.href);
+  }
+  function downloadJSON() {
+    loadReportFindings().then(function(data) {
+      downloadBlob(JSON.stringify(data, null, 2), 'application/json', 'findings.json');
+    });
+  }
+  function downloadCSV() {
+    loadReportFindings().then(function(data) {
+      if (!data.length) return;
+      var headers = ['tool', 'severity', 'path', 'line', 'rule_id', 'message'];
+      var lines = [headers.join(',')];
+      data.forEach(function(f) {
+        lines.push(headers.map(function(h) {
+          var v = (f[h] != null ? f[h] : '');
+          return '"' + String(v).replace(/"/g, '""') + '"';
+        }).join(','));
+      });
+      downloadBlob(lines.join('\n') + '\n', 'text/csv;charset=utf-8', 'findings.csv');
+    });
+  }
+  function expandAllSections() {
+    document.querySelectorAll('.report-section-collapsible details, details.report-section-collapsible').forEach(function(d) { d.setAttribute('open', ''); });
+  }
+  function collapseAllSections() {
+    document.querySelectorAll('.report-section-collapsible details, details.report-section-collapsible').forEach(function(d) { d.removeAttribute('open'); });
+  }
+  function initReportFeatures() {
+    var tbody = document.getElementById('findings-tbody');
+    if (tbody) {
+      applyFilterAndSort();
+      ['filter-tool', 'filter-severity', 'sort-findings'].forEach(function(id) {
+        var el = document.getElementById(id);
+        if (el) el.addEventListener('change', applyFilterAndSort);
+      });
+      var prev = document.getElementById('findings-prev');
+      if (prev) prev.addEventListener('click', function() { page -= 1; renderPage(); });
+      var next = document.getElementById('findings-next');
+      if (next) next.addEventListener('click', function() { page += 1; renderPage(); });
+    } else {
+      loadReportFindings().catch(function() {});
+    }
+    var btnJson = document.getElementById('export-json-btn');
+    if (btnJson) btnJson.addEventListener('click', downloadJSON);
+    var btnCsv = document.getElementById('export-csv-btn');
+    if (btnCsv) btnCsv.addEventListener('click', downloadCSV);
+    var btnExpand = document.getElementById('expand-all-btn');
+    if (btnExpand) btnExpand.addEventListener('click', expandAllSections);
+    var btnCollapse = document.getElementById('collapse-all-btn');
+    if (btnCollapse) btnCollapse.addEventListener('click', collapseAllSections);
+    var wrap = document.getElementById('copy-share-link-wrap');
+    var btnShare = document.getElementById('copy-share-link-btn');
+    if (wrap && btnShare) {
+      if (window.location.protocol === 'file:' || window.parent === window) {
+        wrap.style.display = 'none';
+      } else {
+        btnShare.addEventListener('click', function() {
+          try { window.parent.postMessage({ type: 'SSC_COPY_SHARE_LINK' }, '*'); } catch (e) {}
+        });
+      }
+    }
+  }
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', initReportFeatures);
+  } else {
+    initReportFeatures();
+  }
+})();
+</script>
+"""
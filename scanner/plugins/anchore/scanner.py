@@ -45,10 +45,10 @@ class AnchoreScanner(BaseScanner):
             anchore_image: Container image to scan
         """
         default_config = "/app/scanner/plugins/anchore/config/config.yaml"
-        resolved_config = config_path or os.getenv("ANCHORE_CONFIG_PATH", default_config)
+        resolved_config = config_path or self.getenv("ANCHORE_CONFIG_PATH", default_config)
         super().__init__("Anchore", target_path, results_dir, log_file, resolved_config)
-        self.target_type = (os.getenv("TARGET_TYPE", "")).lower()
-        self.scan_target = scan_target or os.getenv("SCAN_TARGET", "")
+        self.target_type = (self.getenv("TARGET_TYPE", "")).lower()
+        self.scan_target = scan_target or self.getenv("SCAN_TARGET", "")
         self.anchore_image = anchore_image or self.scan_target
     
     def scan(self) -> bool:
@@ -73,27 +73,21 @@ class AnchoreScanner(BaseScanner):
         config_args = []
         if self.config_path and self.config_path.exists():
             config_args = ["--config", str(self.config_path)]
-        grype_extra = shlex.split(os.getenv("GRYPE_EXTRA_ARGS", "").strip())
+        grype_extra = shlex.split(self.getenv("GRYPE_EXTRA_ARGS", "").strip())
         
         # JSON report
         self.log("Running container image vulnerability scan...")
         cmd = ["grype", *config_args, "--output", "json", *grype_extra, self.anchore_image]
         
-        result = self.run_command(cmd, capture_output=True)
-        if result.returncode == 0 and result.stdout:
-            with open(json_output, "w", encoding="utf-8") as f:
-                f.write(result.stdout)
-        else:
+        result = self.run_command(cmd, stdout_file=json_output)
+        if result.returncode != 0 or not json_output.exists():
             self.log("Scan failed, continuing...", "WARNING")
         
         # Text report
         cmd = ["grype", *config_args, *grype_extra, self.anchore_image]
         
-        result = self.run_command(cmd, capture_output=True)
-        if result.returncode == 0 and result.stdout:
-            with open(text_output, "w", encoding="utf-8") as f:
-                f.write(result.stdout)
-        else:
+        result = self.run_command(cmd, stdout_file=text_output)
+        if result.returncode != 0 or not text_output.exists():
             self.log("Text output generation failed, continuing...", "WARNING")
         
         if json_output.exists():
@@ -6,12 +6,36 @@ import os
 import json
 import shlex
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from scanner.core.base_scanner import BaseScanner
+from scanner.core.findings_cache import IncrementalScan, ReportLayout
 from scanner.core.scanner_registry import ScanType, TargetType, ScannerCapability
 
 
+BANDIT_REPORT_LAYOUT = ReportLayout(
+    items_key="results", path_field="filename", errors=("errors", "filename")
+)
+
+
+def render_text_report(data: dict) -> str:
+    """Text report from bandit JSON (incremental runs, where bandit saw changed files only)."""
+    lines = ["Bandit Scan Results", "==================="]
+    results = [r for r in data.get("results") or [] if isinstance(r, dict)]
+    for r in sorted(results, key=lambda r: (str(r.get("filename", "")), r.get("line_number") or 0)):
+        lines.append(f">> Issue: [{r.get('test_id', '')}:{r.get('test_name', '')}] {r.get('issue_text', '')}")
+        lines.append(
+            f"   Severity: {r.get('issue_severity', '')}   Confidence: {r.get('issue_confidence', '')}"
+        )
+        lines.append(f"   Location: {r.get('filename', '')}:{r.get('line_number', '')}")
+        if r.get("more_info"):
+            lines.append(f"   More Info: {r['more_info']}")
+        lines.append("-" * 50)
+    lines.append(f"Total issues: {len(results)}")
+    lines.append(f"Scan completed at: {datetime.now().isoformat()}")
+    return "\n".join(lines) + "\n"
+
+
 class BanditScanner(BaseScanner):
     """Bandit scanner implementation"""
     
@@ -55,12 +79,13 @@ class BanditScanner(BaseScanner):
         """Count Python files"""
         return len(list(self.target_path.rglob("*.py")))
 
-    def create_empty_reports(self):
-        """Create empty reports when no Python files found"""
-        json_output = self.results_dir / "report.json"  # Changed from bandit.json
-        text_output = self.results_dir / "report.txt"   # Changed from bandit.txt
+    def _python_rel_paths(self) -> List[str]:
+        """Files bandit analyses (findings-cache candidates)."""
+        return self.scan_candidate_files((".py",))
 
-        empty_json = {
+    @staticmethod
+    def _empty_report() -> dict:
+        return {
             "generated_at": datetime.utcnow().isoformat() + "Z",
             "metrics": {
                 "_totals": {
@@ -73,8 +98,13 @@ class BanditScanner(BaseScanner):
             "results": []
         }
 
+    def create_empty_reports(self):
+        """Create empty reports when no Python files found"""
+        json_output = self.results_dir / "report.json"  # Changed from bandit.json
+        text_output = self.results_dir / "report.txt"   # Changed from bandit.txt
+
         with open(json_output, "w", encoding="utf-8") as f:
-            json.dump(empty_json, f, indent=2)
+            json.dump(self._empty_report(), f, indent=2)
 
         with open(text_output, "w", encoding="utf-8") as f:
             f.write("Bandit Scan Results\n")
@@ -101,25 +131,36 @@ class BanditScanner(BaseScanner):
         json_output = self.results_dir / "report.json"  # Changed from bandit.json
         text_output = self.results_dir / "report.txt"   # Changed from bandit.txt
 
-        extra = shlex.split(os.getenv("BANDIT_EXTRA_ARGS", "").strip())
+        extra = shlex.split(self.getenv("BANDIT_EXTRA_ARGS", "").strip())
         extra = [*extra, *self.bandit_exclude_cli()]
 
-        # JSON report
-        cmd = ["bandit", "-r", str(self.target_path), *extra, "-f", "json", "-o", str(json_output)]
+        # Unchanged blobs come from the findings cache; bandit only sees changed files then.
+        incremental = IncrementalScan(self, "bandit", BANDIT_REPORT_LAYOUT, self._python_rel_paths)
+        targets = incremental.targets
+        if targets is None:
+            target_args = [str(self.target_path)]
+        else:
+            target_args = [str(self.target_path / rel) for rel in targets]
 
-        result = self.run_command(cmd, capture_output=True)
-        if result.returncode != 0:
-            self.log("JSON report generation encountered issues", "WARNING")
+        # JSON report
+        returncode = 0
+        if targets == []:
+            with open(json_output, "w", encoding="utf-8") as f:
+                json.dump(self._empty_report(), f, indent=2)
+        else:
+            cmd = ["bandit", "-r", *target_args, *extra, "-f", "json", "-o", str(json_output)]
+            result = self.run_command(cmd, capture_output=True)
+            returncode = result.returncode
+            if result.returncode != 0:
+                self.log("JSON report generation encountered issues", "WARNING")
 
-        # Text report
-        cmd = ["bandit", "-r", str(self.target_path), *extra]
+        # Text report (incremental runs render it from the merged JSON below instead)
+        if targets is None:
+            cmd = ["bandit", "-r", *target_args, *extra]
 
-        result = self.run_command(cmd, capture_output=True)
-        if result.returncode == 0 and result.stdout:
-            with open(text_output, "w", encoding="utf-8") as f:
-                f.write(result.stdout)
-        else:
-            self.log("Text report generation encountered issues", "WARNING")
+            result = self.run_command(cmd, stdout_file=text_output)
+            if result.returncode != 0 or not text_output.exists():
+                self.log("Text report generation encountered issues", "WARNING")
 
         # Check if JSON file was created and contains results
         if json_output.exists():
@@ -130,8 +171,12 @@ class BanditScanner(BaseScanner):
                 # If JSON file exists but has no results, create empty results array
                 if 'results' not in bandit_data:
                     bandit_data['results'] = []
-                    with open(json_output, 'w', encoding='utf-8') as f:
-                        json.dump(bandit_data, f, indent=2)
+                # bandit exits 1 when it reports issues
+                bandit_data = incremental.finish(bandit_data, ok=returncode in (0, 1))
+                with open(json_output, 'w', encoding='utf-8') as f:
+                    json.dump(bandit_data, f, indent=2)
+                if targets is not None:
+                    text_output.write_text(render_text_report(bandit_data), encoding="utf-8")
             except Exception:
                 pass
 
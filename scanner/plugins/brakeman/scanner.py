@@ -90,9 +90,9 @@ class BrakemanScanner(BaseScanner):
             self.log("brakeman not found", "ERROR")
             return False
 
-        extra = shlex.split(os.getenv("BRAKEMAN_EXTRA_ARGS", "").strip())
+        extra = shlex.split(self.getenv("BRAKEMAN_EXTRA_ARGS", "").strip())
         if not extra:
-            w = os.getenv("BRAKEMAN_CONFIDENCE_MIN", "").strip()
+            w = self.getenv("BRAKEMAN_CONFIDENCE_MIN", "").strip()
             if w in ("1", "2", "3"):
                 extra = ["-w", w]
 
@@ -45,7 +45,7 @@ class BurpScanner(BaseScanner):
             scan_target: Target URL to scan (web application)
         """
         super().__init__("Burp Suite", target_path, results_dir, log_file, config_path)
-        self.scan_target = scan_target or os.getenv("SCAN_TARGET", "http://host.docker.internal:8000")
+        self.scan_target = scan_target or self.getenv("SCAN_TARGET", "http://host.docker.internal:8000")
         self.burp_jar = Path("/opt/burp/burp-suite.jar")
     
     def scan(self) -> bool:
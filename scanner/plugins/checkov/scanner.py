@@ -222,7 +222,7 @@ class CheckovScanner(BaseScanner):
         """Optional --skip-framework list from env (comma-separated). Empty/unset = no skips.
         Reserved for future admin config, e.g. CHECKOV_SKIP_FRAMEWORKS=secrets,cdk,arm
         """
-        raw = (os.getenv("CHECKOV_SKIP_FRAMEWORKS") or "").strip()
+        raw = (self.getenv("CHECKOV_SKIP_FRAMEWORKS") or "").strip()
         if not raw or raw.lower() == "none":
             return []
         out: List[str] = []
@@ -236,7 +236,7 @@ class CheckovScanner(BaseScanner):
         """Run Checkov scan with standardized substeps"""
         self.log(
             "scan() start: "
-            f"SCANNER_TIMEOUT_SECONDS={os.getenv('SCANNER_TIMEOUT_SECONDS', '')!r}; "
+            f"SCANNER_TIMEOUT_SECONDS={self.getenv('SCANNER_TIMEOUT_SECONDS', '')!r}; "
             f"plugin log={self.log_file}; target={self.target_path}"
         )
         if not self.check_tool_installed("checkov"):
@@ -278,7 +278,7 @@ class CheckovScanner(BaseScanner):
         # applied in find_infra_files() via SIMPLESECCHECK_EXCLUDE_PATHS.
         fw_skip = self._skip_framework_args()
         config_path = Path(
-            os.getenv("CHECKOV_CONFIG_PATH", "/app/scanner/plugins/checkov/config/config.yaml")
+            self.getenv("CHECKOV_CONFIG_PATH", "/app/scanner/plugins/checkov/config/config.yaml")
         )
         config_prefix: List[str] = []
         if config_path.is_file():
@@ -292,16 +292,16 @@ class CheckovScanner(BaseScanner):
         # SCAN: Evaluating Misconfigurations
         self.start_substep("Evaluating Misconfigurations", "Checking for security misconfigurations...", SubStepType.PHASE)
 
-        env = os.environ.copy()
+        env = self.process_env()
         env["PYTHONHASHSEED"] = "0"
         env["OMP_NUM_THREADS"] = "1"
         env["MKL_NUM_THREADS"] = "1"
 
         checkov_extra = _normalize_checkov_extra_args_tokens(
-            shlex.split(os.getenv("CHECKOV_EXTRA_ARGS", "").strip())
+            shlex.split(self.getenv("CHECKOV_EXTRA_ARGS", "").strip())
         )
 
-        batch_size = max(1, int(os.getenv("CHECKOV_FILES_PER_BATCH", str(self.CHECKOV_FILES_PER_BATCH))))
+        batch_size = max(1, int(self.getenv("CHECKOV_FILES_PER_BATCH", str(self.CHECKOV_FILES_PER_BATCH))))
         batches: List[List[Path]] = [
             infra_files[i : i + batch_size] for i in range(0, len(infra_files), batch_size)
         ]
@@ -332,7 +332,7 @@ class CheckovScanner(BaseScanner):
                 f"Checkov batch {idx}/{len(batches)}: {len(batch)} file(s)…"
             )
             result = self.run_command(
-                cmd, capture_output=True, env=env, use_process_group=False
+                cmd, capture_output=True, env=env, use_process_group=False, keep_output=True
             )
             self.log(
                 f"Checkov batch {idx}/{len(batches)} finished in {time.monotonic() - t0:.1f}s "
@@ -45,10 +45,10 @@ class ClairScanner(BaseScanner):
             clair_image: Container image to scan
         """
         default_config = "/app/scanner/plugins/clair/config/config.yaml"
-        resolved_config = config_path or os.getenv("CLAIR_CONFIG_PATH", default_config)
+        resolved_config = config_path or self.getenv("CLAIR_CONFIG_PATH", default_config)
         super().__init__("Clair", target_path, results_dir, log_file, resolved_config)
-        self.target_type = (os.getenv("TARGET_TYPE", "")).lower()
-        self.scan_target = scan_target or os.getenv("SCAN_TARGET", "")
+        self.target_type = (self.getenv("TARGET_TYPE", "")).lower()
+        self.scan_target = scan_target or self.getenv("SCAN_TARGET", "")
         self.clair_image = clair_image or self.scan_target
     
     def scan(self) -> bool:
@@ -13,12 +13,12 @@ from scanner.core.scanner_registry import ScanType, TargetType, ScannerCapabilit
 from scanner.core.step_registry import SubStepType
 
 
-def codeql_pack_cached(pack_name: str, codeql_home: Optional[Path] = None) -> bool:
-    """True when codeql/<lang>-queries is already present under CODEQL_HOME/packages."""
+def codeql_pack_cached(pack_name: str, codeql_home: Path) -> bool:
+    """True when codeql/<lang>-queries is already present under <codeql_home>/packages (``CodeQLScanner._codeql_home``)."""
     parts = pack_name.split("/")
     if len(parts) != 2:
         return False
-    root = (codeql_home or Path(os.getenv("CODEQL_HOME", str(Path.home() / ".codeql")))) / "packages"
+    root = codeql_home / "packages"
     pack_dir = root / parts[0] / parts[1]
     if not pack_dir.is_dir():
         return False
@@ -76,7 +76,7 @@ class CodeQLScanner(BaseScanner):
         if not tool_cmd:
             return []
         cmd = [*tool_cmd, "resolve", "languages", "--format=json"]
-        result = self.run_command(cmd, capture_output=True)
+        result = self.run_command(cmd, capture_output=True, keep_output=True)
         
         if result.returncode == 0 and result.stdout:
             try:
@@ -116,13 +116,13 @@ class CodeQLScanner(BaseScanner):
         return languages
 
     def _codeql_home(self) -> Path:
-        raw = os.getenv("CODEQL_HOME", "").strip()
+        raw = self.getenv("CODEQL_HOME", "").strip()
         if raw:
             return Path(raw)
         return Path.home() / ".codeql"
 
     def _pack_download_timeout(self) -> int:
-        raw = os.getenv("CODEQL_PACK_DOWNLOAD_TIMEOUT", "").strip()
+        raw = self.getenv("CODEQL_PACK_DOWNLOAD_TIMEOUT", "").strip()
         if raw:
             try:
                 return max(120, int(raw))
@@ -246,7 +246,7 @@ class CodeQLScanner(BaseScanner):
             
             self.start_substep(f"Query Execution ({lang})", f"Running security analysis for {lang}...", SubStepType.PHASE)
             self.log(f"Running security analysis for {lang} with {query_suite}...")
-            analyze_extra = shlex.split(os.getenv("CODEQL_ANALYZE_EXTRA_ARGS", "").strip())
+            analyze_extra = shlex.split(self.getenv("CODEQL_ANALYZE_EXTRA_ARGS", "").strip())
             cmd = [*tool_cmd, "database", "analyze", str(lang_db), query_suite,
                    "--format=sarif-latest", f"--output={lang_sarif}", "--threads=4", *analyze_extra]
             
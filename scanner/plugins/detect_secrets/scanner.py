@@ -2,14 +2,21 @@
 Detect-secrets Scanner
 Python implementation of run_detect_secrets.sh
 """
+import json
 import os
 import shlex
+import shutil
 from pathlib import Path
 from typing import List, Optional
 from scanner.core.base_scanner import BaseScanner
+from scanner.core.findings_cache import IncrementalScan, ReportLayout
 from scanner.core.scanner_registry import ScanType, TargetType, ScannerCapability
 
 
+# {"results": {"<file>": [{"filename": "<file>", ...}, ...]}}
+DETECT_SECRETS_REPORT_LAYOUT = ReportLayout(items_key="results", path_field="filename", keyed_by_path=True)
+
+
 class DetectSecretsScanner(BaseScanner):
     """Detect-secrets scanner implementation"""
     
@@ -46,6 +53,10 @@ class DetectSecretsScanner(BaseScanner):
     def get_exclude_args(self) -> List[str]:
         return self.detect_secrets_exclude_cli()
     
+    def _candidate_rel_paths(self) -> List[str]:
+        """Files detect-secrets scans with --all-files (findings-cache candidates)."""
+        return self.scan_candidate_files(exclude_csv=self.exclude_paths)
+
     def scan(self) -> bool:
         """Run Detect-secrets scan"""
         if not self.check_tool_installed("detect-secrets"):
@@ -58,25 +69,45 @@ class DetectSecretsScanner(BaseScanner):
         text_output = self.results_dir / "report.txt"   # Changed from detect-secrets.txt
         
         exclude_args = self.get_exclude_args()
-        extra = shlex.split(os.getenv("DETECT_SECRETS_EXTRA_ARGS", "").strip())
+        extra = shlex.split(self.getenv("DETECT_SECRETS_EXTRA_ARGS", "").strip())
+        
+        # Unchanged blobs come from the findings cache; detect-secrets only sees changed files then.
+        incremental = IncrementalScan(
+            self, "detect_secrets", DETECT_SECRETS_REPORT_LAYOUT, self._candidate_rel_paths
+        )
+        targets = incremental.targets
+        if targets is None:
+            target_args = [str(self.target_path)]
+        else:
+            target_args = [str(self.target_path / rel) for rel in targets]
         
         # JSON report
         self.log("Running secret detection scan...")
-        cmd = ["detect-secrets", "scan", "--all-files", *exclude_args, *extra, str(self.target_path)]
-        
-        result = self.run_command(cmd, capture_output=True)
-        if result.returncode == 0 and result.stdout:
+        returncode = 0
+        if targets == []:
             with open(json_output, "w", encoding="utf-8") as f:
-                f.write(result.stdout)
+                json.dump({"results": {}}, f)
         else:
-            self.log("JSON report generation failed; no report written.", "WARNING")
+            cmd = ["detect-secrets", "scan", "--all-files", *exclude_args, *extra, *target_args]
+            result = self.run_command(cmd, stdout_file=json_output)
+            returncode = result.returncode
+            if result.returncode != 0 or not json_output.exists():
+                self.log("JSON report generation failed; no report written.", "WARNING")
+        
+        if json_output.exists():
+            try:
+                with open(json_output, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                merged = incremental.finish(data, ok=returncode == 0)
+                if merged is not data:
+                    with open(json_output, "w", encoding="utf-8") as f:
+                        json.dump(merged, f, indent=2)
+            except (OSError, ValueError) as e:
+                self.log(f"Could not apply findings cache: {e}", "WARNING")
         
-        # Text report (same command, different output)
-        self.log("Running text report generation...")
-        result = self.run_command(cmd, capture_output=True)
-        if result.returncode == 0 and result.stdout:
-            with open(text_output, "w", encoding="utf-8") as f:
-                f.write(result.stdout)
+        # Text report: detect-secrets prints the same JSON, so reuse it instead of a second scan
+        if json_output.exists():
+            shutil.copyfile(json_output, text_output)
         else:
             self.log("Text report generation failed; no text report written.", "WARNING")
         
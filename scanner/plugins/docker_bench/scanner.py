@@ -140,14 +140,11 @@ class DockerBenchScanner(BaseScanner):
         
         # Text report
         self.log("Running compliance scan...")
-        db_extra = shlex.split(os.getenv("DOCKER_BENCH_EXTRA_ARGS", "").strip())
+        db_extra = shlex.split(self.getenv("DOCKER_BENCH_EXTRA_ARGS", "").strip())
         cmd = [str(bench_script), *db_extra]
         
-        result = self.run_command(cmd, cwd=self.docker_bench_dir, capture_output=True)
-        if result.returncode == 0 and result.stdout:
-            with open(text_output, "w", encoding="utf-8") as f:
-                f.write(result.stdout)
-        else:
+        result = self.run_command(cmd, cwd=self.docker_bench_dir, stdout_file=text_output)
+        if result.returncode != 0 or not text_output.exists():
             self.log("Text report generation failed", "WARNING")
         
         # Convert text to JSON
@@ -2,14 +2,20 @@
 ESLint Scanner
 Python implementation of run_eslint.sh
 """
+import json
 import os
 import shlex
 from pathlib import Path
 from typing import List, Optional
 from scanner.core.base_scanner import BaseScanner
+from scanner.core.findings_cache import IncrementalScan, ReportLayout
 from scanner.core.scanner_registry import ScanType, TargetType, ScannerCapability
 
 
+# --format=json: a list with one {"filePath": <absolute>, "messages": [...]} entry per file
+ESLINT_REPORT_LAYOUT = ReportLayout(items_key=None, path_field="filePath")
+
+
 class ESLintScanner(BaseScanner):
     """ESLint scanner implementation"""
     
@@ -85,8 +91,29 @@ class ESLintScanner(BaseScanner):
         json_output = self.results_dir / "report.json"  # Changed from eslint.json
         text_output = self.results_dir / "report.txt"   # Changed from eslint.txt
 
+        # Unchanged blobs come from the findings cache; ESLint only lints changed files then.
+        incremental = IncrementalScan(
+            self,
+            "eslint",
+            ESLINT_REPORT_LAYOUT,
+            lambda: (str(f.relative_to(self.target_path)) for f in js_files),
+        )
+        targets = incremental.targets
+        if targets == []:
+            json_output.write_text(
+                json.dumps(incremental.finish([], ok=True), indent=2), encoding="utf-8"
+            )
+            text_output.write_text(
+                "No changed JavaScript/TypeScript files; findings restored from cache (see report.json).\n",
+                encoding="utf-8",
+            )
+            self.log("ESLint scan completed from findings cache", "SUCCESS")
+            return True
+        # Relative to cwd=target, like "."
+        lint_targets = ["."] if targets is None else list(targets)
+
         bundled_nm = Path(
-            os.getenv(
+            self.getenv(
                 "SSC_ESLINT_TOOLCHAIN",
                 "/app/scanner/plugins/eslint/toolchain/node_modules",
             )
@@ -176,13 +203,13 @@ module.exports = [
             return False
 
         ignore_args = self.get_ignore_args()
-        extra = shlex.split(os.getenv("ESLINT_EXTRA_ARGS", "").strip())
+        extra = shlex.split(self.getenv("ESLINT_EXTRA_ARGS", "").strip())
 
         # Run ESLint with cwd=target so config base path = target and "." lints the repo
         run_cwd = str(self.target_path)
         config_arg = ".eslint.scan.cjs"
 
-        run_env = os.environ.copy()
+        run_env = self.process_env()
         prev_np = run_env.get("NODE_PATH", "").strip()
         run_env["NODE_PATH"] = (
             plugins_nm + os.pathsep + prev_np if prev_np else plugins_nm
@@ -198,12 +225,23 @@ module.exports = [
             *extra,
             "--format=json",
             f"--output-file={json_output.resolve()}",
-            ".",
+            *lint_targets,
         ]
         result = self.run_command(cmd, capture_output=True, cwd=Path(run_cwd), env=run_env)
+        # ESLint exits 1 when it reports problems, 2 on configuration/fatal errors
         json_failed = result.returncode != 0
         if json_failed:
             self.log("JSON report generation failed (exit code {}); no report written.".format(result.returncode), "WARNING")
+        if json_output.exists():
+            try:
+                data = json.loads(json_output.read_text(encoding="utf-8"))
+                merged = incremental.finish(data, ok=result.returncode in (0, 1))
+                if merged is not data:
+                    json_output.write_text(json.dumps(merged, indent=2), encoding="utf-8")
+            except (OSError, ValueError) as e:
+                self.log(f"Could not apply findings cache: {e}", "WARNING")
+        if targets is not None:
+            self.log(f"Text report covers the {len(targets)} re-analysed file(s) only")
 
         # Text report
         self.log("Running ESLint scan with text output...")
@@ -216,7 +254,7 @@ module.exports = [
             # ESLint 9+ removed `compact`/`unix` from core; `stylish` remains built-in.
             "--format=stylish",
             f"--output-file={text_output.resolve()}",
-            ".",
+            *lint_targets,
         ]
         result = self.run_command(
             cmd,
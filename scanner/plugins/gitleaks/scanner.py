@@ -112,13 +112,10 @@ class GitLeaksScanner(BaseScanner):
         cmd = ["gitleaks", "detect", "--source", str(self.target_path),
                "--no-git", "--verbose", *config_args]
         
-        result = self.run_command(cmd, capture_output=True)
-        if result.returncode in (0, 1) and result.stdout:
-            with open(text_output, "w", encoding="utf-8") as f:
-                f.write(result.stdout)
-        elif result.returncode == 1:
+        result = self.run_command(cmd, stdout_file=text_output, stdout_file_exit_codes=(0, 1))
+        if result.returncode == 1 and not text_output.exists():
             self.log("Secrets found but no detailed output returned; no text report written.", "WARNING")
-        else:
+        elif result.returncode not in (0, 1):
             self.log("Text report generation failed; no report written.", "WARNING")
         
         if json_output.exists() or text_output.exists():
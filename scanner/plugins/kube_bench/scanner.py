@@ -56,25 +56,19 @@ class KubeBenchScanner(BaseScanner):
         
         # JSON report
         self.log("Running compliance scan...")
-        kb_extra = shlex.split(os.getenv("KUBE_BENCH_EXTRA_ARGS", "").strip())
+        kb_extra = shlex.split(self.getenv("KUBE_BENCH_EXTRA_ARGS", "").strip())
         cmd = ["kube-bench", "--json", *kb_extra]
         
-        result = self.run_command(cmd, capture_output=True)
-        if result.returncode == 0 and result.stdout:
-            with open(json_output, "w", encoding="utf-8") as f:
-                f.write(result.stdout)
-        else:
+        result = self.run_command(cmd, stdout_file=json_output)
+        if result.returncode != 0 or not json_output.exists():
             self.log("JSON report generation failed", "WARNING")
         
         # Text report
         self.log("Running text report generation...")
         cmd = ["kube-bench", "--version", "1.28"]
         
-        result = self.run_command(cmd, capture_output=True)
-        if result.returncode == 0 and result.stdout:
-            with open(text_output, "w", encoding="utf-8") as f:
-                f.write(result.stdout)
-        else:
+        result = self.run_command(cmd, stdout_file=text_output)
+        if result.returncode != 0 or not text_output.exists():
             self.log("Text report generation failed", "WARNING")
         
         if json_output.exists() or text_output.exists():
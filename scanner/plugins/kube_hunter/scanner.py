@@ -56,28 +56,22 @@ class KubeHunterScanner(BaseScanner):
         json_output = self.results_dir / "report.json"  # Changed from kube-hunter.json
         text_output = self.results_dir / "report.txt"   # Changed from kube-hunter.txt
 
-        kh_extra = shlex.split(os.getenv("KUBE_HUNTER_EXTRA_ARGS", "").strip())
+        kh_extra = shlex.split(self.getenv("KUBE_HUNTER_EXTRA_ARGS", "").strip())
         
         # JSON report (with timeout to avoid hanging)
         self.log("Running cluster security scan...")
         cmd = ["kube-hunter", "--remote", "localhost", "--report", "json", *kh_extra]
         
-        result = self.run_command(cmd, capture_output=True)
-        if result.returncode == 0 and result.stdout:
-            with open(json_output, "w", encoding="utf-8") as f:
-                f.write(result.stdout)
-        else:
+        result = self.run_command(cmd, stdout_file=json_output)
+        if result.returncode != 0 or not json_output.exists():
             self.log("JSON report generation failed or timed out", "WARNING")
         
         # Text report (with timeout)
         self.log("Running text report generation...")
         cmd = ["kube-hunter", "--remote", "localhost", "--report", "plain", *kh_extra]
         
-        result = self.run_command(cmd, capture_output=True)
-        if result.returncode == 0 and result.stdout:
-            with open(text_output, "w", encoding="utf-8") as f:
-                f.write(result.stdout)
-        else:
+        result = self.run_command(cmd, stdout_file=text_output)
+        if result.returncode != 0 or not text_output.exists():
             self.log("Text report generation failed or timed out", "WARNING")
         
         if json_output.exists() or text_output.exists():
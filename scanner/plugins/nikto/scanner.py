@@ -44,7 +44,7 @@ class NiktoScanner(BaseScanner):
             scan_target: Target URL to scan (web application)
         """
         super().__init__("Nikto", target_path, results_dir, log_file, config_path)
-        self.scan_target = scan_target or os.getenv("SCAN_TARGET", "http://host.docker.internal:8000")
+        self.scan_target = scan_target or self.getenv("SCAN_TARGET", "http://host.docker.internal:8000")
     
     def scan(self) -> bool:
         """Run Nikto scan"""
@@ -57,7 +57,7 @@ class NiktoScanner(BaseScanner):
         json_output = self.results_dir / "report.json"  # Changed from nikto.json
         text_output = self.results_dir / "report.txt"   # Changed from nikto.txt
 
-        extra = shlex.split(os.getenv("NIKTO_EXTRA_ARGS", "").strip())
+        extra = shlex.split(self.getenv("NIKTO_EXTRA_ARGS", "").strip())
         
         # JSON report
         self.log("Running web server scan...")
@@ -83,11 +83,11 @@ class NpmAuditScanner(BaseScanner):
         
         self.log(f"Scanning directory: {package_dir}")
 
-        extra = shlex.split(os.getenv("NPM_AUDIT_EXTRA_ARGS", "").strip())
+        extra = shlex.split(self.getenv("NPM_AUDIT_EXTRA_ARGS", "").strip())
         
         # JSON report (npm exits 1 when vulnerabilities match --audit-level; stdout is still JSON)
         cmd = ["npm", "audit", *extra, "--json"]
-        result = self.run_command(cmd, cwd=package_dir, capture_output=True)
+        result = self.run_command(cmd, cwd=package_dir, capture_output=True, keep_output=True)
         
         if result.stdout:
             try:
@@ -101,7 +101,7 @@ class NpmAuditScanner(BaseScanner):
         
         # Text report
         cmd = ["npm", "audit", *extra]
-        result = self.run_command(cmd, cwd=package_dir, capture_output=True)
+        result = self.run_command(cmd, cwd=package_dir, capture_output=True, keep_output=True)
         
         if result.stdout and result.returncode in (0, 1):
             with open(text_output, "w", encoding="utf-8") as f:
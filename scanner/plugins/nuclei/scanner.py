@@ -44,7 +44,7 @@ class NucleiScanner(BaseScanner):
             scan_target: Target URL to scan (web application)
         """
         super().__init__("Nuclei", target_path, results_dir, log_file, config_path)
-        self.scan_target = scan_target or os.getenv("SCAN_TARGET", "http://host.docker.internal:8000")
+        self.scan_target = scan_target or self.getenv("SCAN_TARGET", "http://host.docker.internal:8000")
     
     def scan(self) -> bool:
         """Run Nuclei scan"""
@@ -64,16 +64,16 @@ class NucleiScanner(BaseScanner):
 
         def _profile_cli() -> List[str]:
             extra: List[str] = []
-            rl = os.getenv("NUCLEI_RATE_LIMIT", "").strip()
+            rl = self.getenv("NUCLEI_RATE_LIMIT", "").strip()
             if rl:
                 extra.extend(["-rate-limit", rl])
-            cc = os.getenv("NUCLEI_CONCURRENCY", "").strip()
+            cc = self.getenv("NUCLEI_CONCURRENCY", "").strip()
             if cc:
                 extra.extend(["-c", cc])
-            sev = os.getenv("NUCLEI_SEVERITY", "").strip()
+            sev = self.getenv("NUCLEI_SEVERITY", "").strip()
             if sev:
                 extra.extend(["-severity", sev])
-            raw = os.getenv("NUCLEI_EXTRA_ARGS", "").strip()
+            raw = self.getenv("NUCLEI_EXTRA_ARGS", "").strip()
             if raw:
                 extra.extend(shlex.split(raw))
             return extra
@@ -81,7 +81,7 @@ class NucleiScanner(BaseScanner):
         profile_args = _profile_cli()
 
         def _template_dir_prefix() -> List[str]:
-            td = os.getenv("NUCLEI_TEMPLATES_DIR", "").strip() or "/app/scanner/plugins/nuclei/data"
+            td = self.getenv("NUCLEI_TEMPLATES_DIR", "").strip() or "/app/scanner/plugins/nuclei/data"
             p = Path(td)
             try:
                 if p.is_dir() and any(p.iterdir()):
@@ -109,7 +109,7 @@ class NucleiScanner(BaseScanner):
         
         # Critical vulnerability scan
         self.log("Running additional critical vulnerability scan...")
-        crit_sev = os.getenv("NUCLEI_CRITICAL_SCAN_SEVERITY", "critical,high").strip() or "critical,high"
+        crit_sev = self.getenv("NUCLEI_CRITICAL_SCAN_SEVERITY", "critical,high").strip() or "critical,high"
         cmd = [
             "nuclei",
             *tpl,
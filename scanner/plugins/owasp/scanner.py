@@ -115,7 +115,7 @@ class OWASPScanner(BaseScanner):
             cmd = ["dependency-check", "--updateonly", "--data", str(self.data_dir)]
             
             # Add NVD API key if provided
-            nvd_api_key = os.getenv("NVD_API_KEY")
+            nvd_api_key = self.getenv("NVD_API_KEY")
             if nvd_api_key:
                 cmd.append(f"--nvdApiKey={nvd_api_key}")
             
@@ -184,7 +184,7 @@ class OWASPScanner(BaseScanner):
             
             # Check if NVD_API_KEY is provided
             nvd_flag = []
-            nvd_api_key = os.getenv("NVD_API_KEY")
+            nvd_api_key = self.getenv("NVD_API_KEY")
             if nvd_api_key:
                 self.log("Using provided NVD_API_KEY for enhanced vulnerability data...")
                 nvd_flag = [f"--nvdApiKey={nvd_api_key}"]
@@ -193,7 +193,7 @@ class OWASPScanner(BaseScanner):
                 self.log("Consider setting NVD_API_KEY environment variable to avoid rate limiting", "WARNING")
             
             exclude_args = self.get_exclude_args()
-            odc_extra = shlex.split(os.getenv("OWASP_DC_EXTRA_ARGS", "").strip())
+            odc_extra = shlex.split(self.getenv("OWASP_DC_EXTRA_ARGS", "").strip())
             
             # Run OWASP Dependency Check (combines Dependency Analysis and Vulnerability Matching)
             self.update_substep("Dependency Analysis", "Analyzing dependencies and checking for vulnerabilities...")
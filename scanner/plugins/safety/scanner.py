@@ -147,7 +147,7 @@ class SafetyScanner(BaseScanner):
         for dep_file in dependency_files:
             cmd = ["pip-audit", "--format", "json", *self._pip_audit_args_for_file(dep_file)]
             try:
-                result = self.run_command(cmd, capture_output=True, cwd=self.target_path)
+                result = self.run_command(cmd, capture_output=True, cwd=self.target_path, keep_output=True)
             except FileNotFoundError:
                 self.log("pip-audit not installed; cannot scan Python dependencies.", "WARNING")
                 return False
@@ -218,7 +218,7 @@ class SafetyScanner(BaseScanner):
 
         def _safety_extra_for_output(output_format: str) -> List[str]:
             """Strip flags that newer Safety CLI rejects together with ``--output`` (e.g. admin env)."""
-            tokens = shlex.split(os.getenv("SAFETY_EXTRA_ARGS", "").strip())
+            tokens = shlex.split(self.getenv("SAFETY_EXTRA_ARGS", "").strip())
             if output_format not in ("json", "bare"):
                 return tokens
             out: List[str] = []
@@ -246,7 +246,7 @@ class SafetyScanner(BaseScanner):
             cmd = ["safety", "check", *extra, "--output", output_format]
             if file_arg:
                 cmd.extend(["--file", str(dep_file)])
-            result = self.run_command(cmd, cwd=self.target_path, capture_output=True)
+            result = self.run_command(cmd, cwd=self.target_path, capture_output=True, keep_output=True)
             if result.returncode not in (0, 1):
                 return False
             content = (result.stdout or "").strip()
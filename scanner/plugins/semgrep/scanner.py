@@ -2,15 +2,143 @@
 Semgrep Scanner
 Python implementation of run_semgrep.sh
 """
+import json
 import os
+import re
 import subprocess
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from scanner.core.base_scanner import BaseScanner
+from scanner.core.findings_cache import IncrementalScan, ReportLayout
 from scanner.core.scanner_registry import ScanType, TargetType, ScannerCapability
 from scanner.core.step_registry import SubStepType
 
 
+# Registry packs of the former separate "security deep" pass; now part of the merged run.
+SECURITY_DEEP_CONFIGS = ("p/security-audit", "p/secrets", "p/owasp-top-ten")
+# First release with --json-output/--sarif-output/--text-output (several formats from one run).
+_MULTI_OUTPUT_VERSION = (1, 57)
+_SEVERITY_ARGS = ("--severity=ERROR", "--severity=WARNING", "--severity=INFO")
+SEMGREP_REPORT_LAYOUT = ReportLayout(items_key="results", path_field="path", errors=("errors", "path"))
+
+
+def dedupe_config_args(config_args: List[str]) -> List[str]:
+    """Drop repeated ``--config <source>`` pairs (e.g. a pack in both the profile and the deep set)."""
+    out: List[str] = []
+    seen = set()
+    it = iter(config_args)
+    for arg in it:
+        if arg == "--config":
+            source = next(it, None)
+            if source is None or source in seen:
+                continue
+            seen.add(source)
+            out.extend([arg, source])
+        else:
+            out.append(arg)
+    return out
+
+
+def dedupe_results(data: Dict[str, Any]) -> int:
+    """
+    Remove findings reported more than once for the same rule and location (overlapping
+    packs shipping the same rule ID). Mutates ``data["results"]``; returns the number dropped.
+    """
+    results = data.get("results")
+    if not isinstance(results, list):
+        return 0
+    kept: List[Any] = []
+    seen = set()
+    for r in results:
+        if isinstance(r, dict):
+            start = r.get("start") or {}
+            end = r.get("end") or {}
+            key: Tuple = (
+                r.get("check_id"),
+                r.get("path"),
+                start.get("offset", start.get("line")),
+                end.get("offset", end.get("line")),
+            )
+            if key in seen:
+                continue
+            seen.add(key)
+        kept.append(r)
+    data["results"] = kept
+    return len(results) - len(kept)
+
+
+_SARIF_LEVELS = {"ERROR": "error", "WARNING": "warning", "INFO": "note"}
+
+
+def render_text_report(data: Dict[str, Any]) -> str:
+    """Plain-text report from semgrep JSON (incremental runs, where the tool saw changed files only)."""
+    results = [r for r in data.get("results") or [] if isinstance(r, dict)]
+    if not results:
+        return "No findings.\n"
+    lines: List[str] = []
+    by_path: Dict[str, List[Dict[str, Any]]] = {}
+    for r in results:
+        by_path.setdefault(str(r.get("path", "")), []).append(r)
+    for path in sorted(by_path):
+        lines.append(path)
+        for r in sorted(by_path[path], key=lambda r: (r.get("start") or {}).get("line", 0)):
+            extra = r.get("extra") or {}
+            line = (r.get("start") or {}).get("line", "?")
+            lines.append(f"  {r.get('check_id', '')} [{extra.get('severity', '')}] line {line}")
+            message = str(extra.get("message", "")).strip()
+            if message:
+                lines.append(f"    {message}")
+        lines.append("")
+    lines.append(f"{len(results)} finding(s) in {len(by_path)} file(s)")
+    return "\n".join(lines) + "\n"
+
+
+def render_sarif_report(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Minimal SARIF 2.1.0 log from semgrep JSON (incremental runs, see ``render_text_report``)."""
+    rules: Dict[str, Dict[str, Any]] = {}
+    sarif_results: List[Dict[str, Any]] = []
+    for r in data.get("results") or []:
+        if not isinstance(r, dict):
+            continue
+        extra = r.get("extra") or {}
+        rule_id = str(r.get("check_id", ""))
+        rules.setdefault(rule_id, {"id": rule_id})
+        start = r.get("start") or {}
+        end = r.get("end") or {}
+        region = {
+            k: v for k, v in (
+                ("startLine", start.get("line")),
+                ("startColumn", start.get("col")),
+                ("endLine", end.get("line")),
+                ("endColumn", end.get("col")),
+            ) if v is not None
+        }
+        sarif_results.append({
+            "ruleId": rule_id,
+            "level": _SARIF_LEVELS.get(str(extra.get("severity", "")).upper(), "warning"),
+            "message": {"text": str(extra.get("message", ""))},
+            "locations": [{
+                "physicalLocation": {
+                    "artifactLocation": {"uri": str(r.get("path", ""))},
+                    "region": region,
+                }
+            }],
+        })
+    return {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {"driver": {"name": "Semgrep", "rules": list(rules.values())}},
+            "results": sarif_results,
+        }],
+    }
+
+
+def _parse_version(text: str) -> Optional[Tuple[int, int]]:
+    m = re.search(r"(\d+)\.(\d+)", text or "")
+    return (int(m.group(1)), int(m.group(2))) if m else None
+
+
 class SemgrepScanner(BaseScanner):
     """Semgrep scanner implementation"""
     
@@ -57,7 +185,7 @@ class SemgrepScanner(BaseScanner):
     
     def _profile_registry_configs(self) -> List[str]:
         """Optional rule packs from manifest scan profile (SEMGREP_PROFILE_CONFIGS=p/ci,p/owasp-top-ten)."""
-        raw = os.getenv("SEMGREP_PROFILE_CONFIGS", "").strip()
+        raw = self.getenv("SEMGREP_PROFILE_CONFIGS", "").strip()
         if not raw:
             return []
         args: List[str] = []
@@ -67,27 +195,57 @@ class SemgrepScanner(BaseScanner):
                 args.extend(["--config", p])
         return args
 
+    def _run_security_deep(self) -> bool:
+        """Manifest profile can disable the security packs via SEMGREP_RUN_SECURITY_DEEP=0."""
+        return self.getenv("SEMGREP_RUN_SECURITY_DEEP", "1").strip().lower() in ("1", "true", "yes")
+
+    def _jobs(self) -> int:
+        """``--jobs`` from SEMGREP_JOBS, else this run's CPU share."""
+        raw = self.getenv("SEMGREP_JOBS", "").strip()
+        if raw.isdigit() and int(raw) > 0:
+            return int(raw)
+        return self.cpu_budget()
+
+    def _supports_multi_output(self, tool_cmd: List[str]) -> bool:
+        try:
+            result = self.run_command([*tool_cmd, "--version"], capture_output=True, timeout=30)
+        except (subprocess.SubprocessError, OSError):
+            return False
+        version = _parse_version(result.stdout or "") if result.returncode == 0 else None
+        if version is None or version < _MULTI_OUTPUT_VERSION:
+            self.log("Semgrep without --json-output/--sarif-output; text/SARIF need extra runs", "WARNING")
+            return False
+        return True
+
+    def _candidate_rel_paths(self) -> List[str]:
+        """Files semgrep may analyse (findings-cache candidates)."""
+        return self.scan_candidate_files(exclude_csv=self.exclude_paths)
+
+    def _local_rule_files(self) -> List[Path]:
+        """Local rule files passed via ``--config`` (rules directory *.yml/*.yaml, or the single file)."""
+        if self.rules_path.is_dir():
+            return list(self.rules_path.rglob("*.yml")) + list(self.rules_path.rglob("*.yaml"))
+        if self.rules_path.is_file():
+            return [self.rules_path]
+        return []
+
     def get_config_args(self) -> List[str]:
-        """Get Semgrep config arguments"""
+        """Get Semgrep config arguments (all sources for the single merged run, de-duplicated)"""
         config_args = []
         config_args.extend(self._profile_registry_configs())
+        if self._run_security_deep():
+            for pack in SECURITY_DEEP_CONFIGS:
+                config_args.extend(["--config", pack])
 
         if self.rules_path.exists():
+            rule_files = self._local_rule_files()
+            for rule_file in rule_files:
+                config_args.extend(["--config", str(rule_file)])
             if self.rules_path.is_dir():
-                # Directory: add all YAML files (one console line; full list is in tool log)
-                yml_files = list(self.rules_path.rglob("*.yml"))
-                yaml_files = list(self.rules_path.rglob("*.yaml"))
-                all_rule_files = yml_files + yaml_files
-                for rule_file in yml_files:
-                    config_args.extend(["--config", str(rule_file)])
-                for rule_file in yaml_files:
-                    config_args.extend(["--config", str(rule_file)])
+                # Directory: one console line; full list is in tool log
                 self.log(
-                    f"Found rules directory: {len(all_rule_files)} YAML rule file(s) under {self.rules_path}"
+                    f"Found rules directory: {len(rule_files)} YAML rule file(s) under {self.rules_path}"
                 )
-            elif self.rules_path.is_file():
-                # Single file
-                config_args.extend(["--config", str(self.rules_path)])
         else:
             self.log(f"Rules path not found: {self.rules_path}, using auto rules only", "WARNING")
         
@@ -95,7 +253,7 @@ class SemgrepScanner(BaseScanner):
         config_args.append("--config")
         config_args.append("auto")
         
-        return config_args
+        return dedupe_config_args(config_args)
     
     def scan(self) -> bool:
         """Run Semgrep scan with detailed substeps"""
@@ -140,28 +298,53 @@ class SemgrepScanner(BaseScanner):
             self.log("semgrep not found", "ERROR")
             return False
         
-        # SCAN: Code Scanning
-        self.substep_scan("Code Scanning", "Scanning code for security issues...")
+        # Unchanged blobs come from the findings cache; semgrep only sees changed files then.
+        # Local rule contents are part of the cache namespace: editing a rule re-analyses everything.
+        incremental = IncrementalScan(
+            self, "semgrep", SEMGREP_REPORT_LAYOUT, self._candidate_rel_paths,
+            config_files=self._local_rule_files(),
+        )
+        targets = incremental.targets
+        if targets is None:
+            target_args = [str(self.target_path)]
+        else:
+            # Text/SARIF are rendered from the merged JSON below, not by the (targets-only) run.
+            target_args = [str(self.target_path / rel) for rel in targets]
         
-        # JSON report (main scan)
-        cmd = [
+        # SCAN: Code Scanning — one invocation for all rule sources and output formats
+        self.substep_scan("Code Scanning", "Scanning code for security issues...")
+        jobs = self._jobs()
+        multi_output = targets is None and self._supports_multi_output(tool_cmd)
+        base_cmd = [
             *tool_cmd,
             "--disable-version-check",
             *config_args,
-            str(self.target_path),
+            *target_args,
             *exclude_args,
-            "--json",
-            "-o", str(json_output),
-            "--severity=ERROR",
-            "--severity=WARNING",
-            "--severity=INFO"
+            "--jobs", str(jobs),
+            *_SEVERITY_ARGS,
         ]
+        self.log(f"Merged scan: {rule_count} config source(s), --jobs {jobs}")
+        if multi_output:
+            cmd = [
+                *base_cmd,
+                "--json-output", str(json_output),
+                "--sarif-output", str(sarif_output),
+                "--text-output", str(text_output),
+            ]
+        else:
+            cmd = [*base_cmd, "--json", "-o", str(json_output)]
         
-        result = self.run_command(cmd, capture_output=True)
-        if result.returncode != 0:
-            self.log(f"JSON report generation failed with exit code {result.returncode}", "ERROR")
-            self.fail_substep("Code Scanning", f"Scan failed with exit code {result.returncode}")
-            return False
+        if targets == []:
+            # No changed files: skip the tool run, findings come from the cache
+            with open(json_output, "w", encoding="utf-8") as f:
+                json.dump({"results": [], "errors": []}, f)
+        else:
+            result = self.run_command(cmd, capture_output=True)
+            if result.returncode != 0:
+                self.log(f"JSON report generation failed with exit code {result.returncode}", "ERROR")
+                self.fail_substep("Code Scanning", f"Scan failed with exit code {result.returncode}")
+                return False
         
         self.complete_substep("Code Scanning", "Code scanning completed")
         
@@ -169,11 +352,22 @@ class SemgrepScanner(BaseScanner):
         self.substep_process("Finding Processing", "Processing scan results...")
         if json_output.exists() and json_output.stat().st_size > 0:
             try:
-                import json
                 with open(json_output, 'r') as f:
                     data = json.load(f)
-                    findings_count = len(data.get('results', []))
-                    self.complete_substep("Finding Processing", f"Processed {findings_count} finding(s)")
+                dropped = dedupe_results(data)
+                if dropped:
+                    self.log(f"Dropped {dropped} duplicate finding(s) from overlapping rule packs")
+                merged = incremental.finish(data, ok=True)
+                if dropped or merged is not data:
+                    data = merged
+                    with open(json_output, "w", encoding="utf-8") as f:
+                        json.dump(data, f)
+                if targets is not None:
+                    text_output.write_text(render_text_report(data), encoding="utf-8")
+                    with open(sarif_output, "w", encoding="utf-8") as f:
+                        json.dump(render_sarif_report(data), f)
+                findings_count = len(data.get('results', []))
+                self.complete_substep("Finding Processing", f"Processed {findings_count} finding(s)")
             except Exception:
                 self.complete_substep("Finding Processing", "Results processed")
         else:
@@ -188,21 +382,9 @@ class SemgrepScanner(BaseScanner):
         
         # OUTPUT: Text Report Generation
         self.substep_report("Text", "Generating text report...")
-        cmd = [
-            *tool_cmd,
-            "--disable-version-check",
-            *config_args,
-            str(self.target_path),
-            *exclude_args,
-            "--text",
-            "-o", str(text_output),
-            "--severity=ERROR",
-            "--severity=WARNING",
-            "--severity=INFO"
-        ]
-        
-        result = self.run_command(cmd, capture_output=True)
-        if result.returncode == 0 and text_output.exists():
+        if not multi_output and targets is None:
+            self.run_command([*base_cmd, "--text", "-o", str(text_output)], capture_output=True)
+        if text_output.exists():
             self.complete_substep("Generating Text Report", "Text report generated successfully")
         else:
             self.fail_substep("Generating Text Report", "Text report generation failed")
@@ -210,17 +392,9 @@ class SemgrepScanner(BaseScanner):
         # OUTPUT: SARIF Export (optional)
         self.start_substep("SARIF Export", "Generating SARIF report...", SubStepType.OUTPUT)
         try:
-            cmd = [
-                *tool_cmd,
-                "--disable-version-check",
-                *config_args,
-                str(self.target_path),
-                *exclude_args,
-                "--sarif",
-                "-o", str(sarif_output)
-            ]
-            result = self.run_command(cmd, capture_output=True)
-            if result.returncode == 0 and sarif_output.exists():
+            if not multi_output and targets is None:
+                self.run_command([*base_cmd, "--sarif", "-o", str(sarif_output)], capture_output=True)
+            if sarif_output.exists():
                 self.complete_substep("SARIF Export", "SARIF report generated successfully")
             else:
                 self.fail_substep("SARIF Export", "SARIF export failed")
@@ -228,31 +402,9 @@ class SemgrepScanner(BaseScanner):
             self.log(f"SARIF export failed: {e}", "WARNING")
             self.fail_substep("SARIF Export", f"SARIF export failed: {e}")
         
-        # Additional security-focused deep scan (non-critical); manifest profile can disable via SEMGREP_RUN_SECURITY_DEEP=0
-        run_deep = os.getenv("SEMGREP_RUN_SECURITY_DEEP", "1").strip().lower() in ("1", "true", "yes")
-        if run_deep:
-            try:
-                self.start_substep("Security Deep Scan", "Running additional security-focused scan...", SubStepType.PHASE)
-                security_json = self.results_dir / "security-deep.json"
-                cmd = [
-                    "semgrep",
-                    "--disable-version-check",
-                    "--config", "p/security-audit",
-                    "--config", "p/secrets",
-                    "--config", "p/owasp-top-ten",
-                    str(self.target_path),
-                    *exclude_args,
-                    "--json",
-                    "-o", str(security_json)
-                ]
-                self.run_command(cmd, capture_output=True)
-                if security_json.exists():
-                    self.complete_substep("Security Deep Scan", "Security deep scan completed")
-                else:
-                    self.complete_substep("Security Deep Scan", "Security deep scan completed (no findings)")
-            except Exception as e:
-                self.log(f"Security deep scan failed: {e}", "WARNING")
-                self.complete_substep("Security Deep Scan", f"Security deep scan skipped: {e}")
+        if self._run_security_deep():
+            self.start_substep("Security Deep Scan", "Running additional security-focused scan...", SubStepType.PHASE)
+            self.complete_substep("Security Deep Scan", "Security packs included in the merged scan")
         
         # Check if reports were generated
         if json_output.exists() and json_output.stat().st_size > 0:
@@ -264,7 +416,6 @@ class SemgrepScanner(BaseScanner):
 
 
 if __name__ == "__main__":
-    import os
     import sys
     
     # Get default parameters from BaseScanner
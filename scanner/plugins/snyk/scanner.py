@@ -50,7 +50,7 @@ class SnykScanner(BaseScanner):
         step_name: From registry/manifest (single source).
         """
         super().__init__("Snyk", target_path, results_dir, log_file, config_path, step_name=step_name)
-        self.snyk_token = os.getenv("SNYK_TOKEN", "")
+        self.snyk_token = self.getenv("SNYK_TOKEN", "")
     
     def create_empty_reports(self, reason: str = "No SNYK_TOKEN provided"):
         """Create empty reports when Snyk is skipped"""
@@ -120,14 +120,14 @@ class SnykScanner(BaseScanner):
         
         # Main scan
         self.log("Running Snyk test with JSON output...")
-        snyk_extra = shlex.split(os.getenv("SNYK_EXTRA_ARGS", "").strip())
+        snyk_extra = shlex.split(self.getenv("SNYK_EXTRA_ARGS", "").strip())
         cmd = ["snyk", "test", f"--token={self.snyk_token}", *snyk_extra, "--json", f"--output-file={json_output}"]
         
         result = self.run_command(cmd, capture_output=True)
         if result.returncode != 0:
             self.log("JSON report generation failed, trying alternative approach...", "WARNING")
             cmd = ["snyk", "test", f"--token={self.snyk_token}", *snyk_extra, "--json"]
-            result = self.run_command(cmd, capture_output=True)
+            result = self.run_command(cmd, capture_output=True, keep_output=True)
             if result.returncode == 0 and result.stdout:
                 with open(json_output, "w", encoding="utf-8") as f:
                     f.write(result.stdout)
@@ -158,7 +158,7 @@ class SnykScanner(BaseScanner):
         self.log("Running Snyk test with text output...")
         cmd = ["snyk", "test", f"--token={self.snyk_token}", *snyk_extra]
         
-        result = self.run_command(cmd, capture_output=True)
+        result = self.run_command(cmd, capture_output=True, keep_output=True)
         if result.returncode == 0 and result.stdout:
             with open(text_output, "w", encoding="utf-8") as f:
                 f.write(result.stdout)
@@ -169,7 +169,7 @@ class SnykScanner(BaseScanner):
         try:
             self.log("Running additional verbose scan...")
             cmd = ["snyk", "test", f"--token={self.snyk_token}", *snyk_extra, "--verbose"]
-            result = self.run_command(cmd, capture_output=True)
+            result = self.run_command(cmd, capture_output=True, keep_output=True)
             if result.returncode == 0 and result.stdout:
                 with open(text_output, "a", encoding="utf-8") as f:
                     f.write("\n\nVerbose Output:\n")
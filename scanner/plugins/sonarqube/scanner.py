@@ -80,7 +80,7 @@ class SonarQubeScanner(BaseScanner):
         properties_file = self.create_project_properties()
         self.complete_substep("Initialization", "Project configured")
         
-        sonar_url = os.environ.get("SONAR_HOST_URL", "http://localhost:9000").rstrip("/")
+        sonar_url = self.getenv("SONAR_HOST_URL", "http://localhost:9000").rstrip("/")
         try:
             urlopen(sonar_url + "/api/system/status", timeout=3)
         except (URLError, OSError, Exception) as e:
@@ -145,10 +145,10 @@ class SonarQubeScanner(BaseScanner):
         
         # Run SonarQube scan
         self.log("Running SonarQube analysis...")
-        sonar_extra = shlex.split(os.getenv("SONAR_SCANNER_EXTRA_ARGS", "").strip())
+        sonar_extra = shlex.split(self.getenv("SONAR_SCANNER_EXTRA_ARGS", "").strip())
         cmd = [*tool_cmd, *sonar_extra, "-X", f"-Dproject.settings={properties_file}"]
         
-        env = os.environ.copy()
+        env = self.process_env()
         env.setdefault("SONAR_USER_HOME", str(Path.home() / ".sonar"))
         
         result = self.run_command(cmd, cwd=self.target_path, env=env, capture_output=True)
@@ -100,7 +100,7 @@ class TerraformSecurityScanner(BaseScanner):
         
         # Main scan
         self.log("Generating JSON report...")
-        extra = shlex.split(os.getenv("TERRAFORM_SCAN_EXTRA_ARGS", "").strip())
+        extra = shlex.split(self.getenv("TERRAFORM_SCAN_EXTRA_ARGS", "").strip())
         cmd = ["checkov", "-d", str(self.target_path), "--framework", "terraform",
                *extra, "--output", "json", "--output-file", str(json_output)]
         
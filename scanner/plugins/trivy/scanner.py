@@ -2,9 +2,10 @@
 Trivy Scanner
 Python implementation of run_trivy.sh
 """
+import json
 import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from scanner.core.base_scanner import BaseScanner
 from scanner.core.command_retry import run_with_retry
@@ -28,6 +29,59 @@ def trivy_db_usable(cache_dir: Optional[str]) -> bool:
     return meta.is_file() and meta.stat().st_size > 32
 
 
+# Result classes Trivy emits per ``--scanners`` value; used to split a single-pass report.
+_SCANNER_RESULT_CLASSES = {
+    "vuln": ("os-pkgs", "lang-pkgs"),
+    "secret": ("secret",),
+    "misconfig": ("config",),
+    "license": ("license", "license-file"),
+}
+_SEVERITY_FILTERED_KEYS = ("Vulnerabilities", "Misconfigurations", "Secrets", "Licenses")
+
+
+def normalize_trivy_scanners(csv: str) -> List[str]:
+    """``--scanners`` CSV → ordered, de-duplicated names (legacy ``config`` → ``misconfig``)."""
+    out: List[str] = []
+    for raw in (csv or "").split(","):
+        name = raw.strip().lower()
+        if name == "config":
+            name = "misconfig"
+        if name and name not in out:
+            out.append(name)
+    return out
+
+
+def split_trivy_report(
+    report: Dict[str, Any],
+    scanners: Iterable[str],
+    severities: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Subset of a combined Trivy JSON report, as if Trivy had run with only ``scanners``
+    (and ``--severity severities`` when given). Top-level metadata is kept as-is.
+    """
+    classes = set()
+    for name in scanners:
+        classes.update(_SCANNER_RESULT_CLASSES.get(name, ()))
+    sev = {x.strip().upper() for x in severities if x.strip()} if severities is not None else None
+    results = []
+    for item in report.get("Results") or []:
+        if not isinstance(item, dict) or item.get("Class") not in classes:
+            continue
+        item = dict(item)
+        if sev is not None:
+            for key in _SEVERITY_FILTERED_KEYS:
+                if isinstance(item.get(key), list):
+                    item[key] = [
+                        x for x in item[key]
+                        if not isinstance(x, dict) or str(x.get("Severity", "")).upper() in sev
+                    ]
+        results.append(item)
+    out = dict(report)
+    out["Results"] = results
+    return out
+
+
 class TrivyScanner(BaseScanner):
     """Trivy scanner implementation"""
     
@@ -81,7 +135,7 @@ class TrivyScanner(BaseScanner):
             step_name: Step name from registry/manifest (single source)
         """
         super().__init__("Trivy", target_path, results_dir, log_file, config_path, step_name=step_name)
-        self.scan_type = scan_type or os.getenv("TRIVY_SCAN_TYPE", "fs")
+        self.scan_type = scan_type or self.getenv("TRIVY_SCAN_TYPE", "fs")
         self.exclude_paths = self.scan_exclude_paths(exclude_paths)
 
     def get_skip_args(self) -> List[str]:
@@ -98,51 +152,51 @@ class TrivyScanner(BaseScanner):
             return []
 
     def _trivy_severity(self) -> str:
-        s = os.getenv("TRIVY_SEVERITY", "HIGH,CRITICAL,MEDIUM,LOW").strip()
+        s = self.getenv("TRIVY_SEVERITY", "HIGH,CRITICAL,MEDIUM,LOW").strip()
         return s if s else "HIGH,CRITICAL,MEDIUM,LOW"
 
     def _trivy_comprehensive_scanners(self) -> str:
-        s = os.getenv("TRIVY_COMPREHENSIVE_SCANNERS", "vuln,secret,config").strip()
+        s = self.getenv("TRIVY_COMPREHENSIVE_SCANNERS", "vuln,secret,config").strip()
         return s if s else "vuln,secret,config"
 
     def _trivy_run_secret_scan(self) -> bool:
-        return os.getenv("TRIVY_RUN_SECRET_SCAN", "1") == "1"
+        return self.getenv("TRIVY_RUN_SECRET_SCAN", "1") == "1"
 
     def _trivy_run_config_scan(self) -> bool:
-        return os.getenv("TRIVY_RUN_CONFIG_SCAN", "1") == "1"
+        return self.getenv("TRIVY_RUN_CONFIG_SCAN", "1") == "1"
 
     def _trivy_run_license_scan(self) -> bool:
-        return os.getenv("TRIVY_RUN_LICENSE_SCAN", "1") == "1"
+        return self.getenv("TRIVY_RUN_LICENSE_SCAN", "1") == "1"
 
     def _trivy_db_download_timeout(self) -> int:
-        raw = os.getenv("TRIVY_DB_DOWNLOAD_TIMEOUT", "900").strip()
+        raw = self.getenv("TRIVY_DB_DOWNLOAD_TIMEOUT", "900").strip()
         try:
             return max(120, int(raw))
         except ValueError:
             return 900
 
     def _trivy_db_download_retries(self) -> int:
-        raw = os.getenv("TRIVY_DB_DOWNLOAD_RETRIES", "3").strip()
+        raw = self.getenv("TRIVY_DB_DOWNLOAD_RETRIES", "3").strip()
         try:
             return max(1, int(raw))
         except ValueError:
             return 3
 
     def _trivy_command_env(self) -> Dict[str, str]:
-        env = os.environ.copy()
-        cache = os.getenv("TRIVY_CACHE_DIR", "").strip()
+        env = self.process_env()
+        cache = self.getenv("TRIVY_CACHE_DIR", "").strip()
         if cache:
             env["TRIVY_CACHE_DIR"] = cache
-        repo = os.getenv("TRIVY_DB_REPOSITORY", "").strip()
+        repo = self.getenv("TRIVY_DB_REPOSITORY", "").strip()
         if repo:
             env["TRIVY_DB_REPOSITORY"] = repo
         return env
 
     def _scan_flags(self) -> List[str]:
-        force = os.getenv("TRIVY_FORCE_DB_UPDATE", "").strip().lower() in ("1", "true", "yes")
+        force = self.getenv("TRIVY_FORCE_DB_UPDATE", "").strip().lower() in ("1", "true", "yes")
         if force:
             return []
-        if self._skip_db_update or os.getenv("TRIVY_SKIP_DB_UPDATE", "").strip().lower() in (
+        if self._skip_db_update or self.getenv("TRIVY_SKIP_DB_UPDATE", "").strip().lower() in (
             "1",
             "true",
             "yes",
@@ -151,7 +205,7 @@ class TrivyScanner(BaseScanner):
         return []
 
     def _ensure_vuln_db(self) -> bool:
-        cache_dir = os.getenv("TRIVY_CACHE_DIR", "").strip()
+        cache_dir = self.getenv("TRIVY_CACHE_DIR", "").strip()
         if trivy_db_usable(cache_dir):
             self.log("Vulnerability database found in cache")
             self._skip_db_update = True
@@ -161,7 +215,7 @@ class TrivyScanner(BaseScanner):
         env = self._trivy_command_env()
         timeout = self._trivy_db_download_timeout()
         retries = self._trivy_db_download_retries()
-        delay = float(os.getenv("TRIVY_DB_DOWNLOAD_RETRY_DELAY", "8") or "8")
+        delay = float(self.getenv("TRIVY_DB_DOWNLOAD_RETRY_DELAY", "8") or "8")
 
         self.log(
             f"Downloading vulnerability DB (timeout={timeout}s, retries={retries})…"
@@ -191,92 +245,159 @@ class TrivyScanner(BaseScanner):
         )
         return False
     
-    def scan(self) -> bool:
-        """Run Trivy scan with detailed substeps"""
-        if not self.check_tool_installed("trivy"):
-            self.log("trivy not found in PATH", "ERROR")
-            return False
+    def _single_pass_scanners(self) -> Optional[List[str]]:
+        """
+        Union of all categories the profile asks for, or None when one combined run cannot
+        reproduce the per-category passes (TRIVY_SINGLE_PASS=0 or a scanner the split does not know).
+        """
+        if self.getenv("TRIVY_SINGLE_PASS", "1").strip().lower() in ("0", "false", "no"):
+            return None
+        comprehensive = normalize_trivy_scanners(self._trivy_comprehensive_scanners())
+        if any(name not in _SCANNER_RESULT_CLASSES for name in comprehensive):
+            return None
+        wanted = {"vuln", *comprehensive}
+        if self._trivy_run_secret_scan():
+            wanted.add("secret")
+        if self._trivy_run_config_scan():
+            wanted.add("misconfig")
+        # The license-only pass never wrote a report, so license is scanned only when a report
+        # keeps it (TRIVY_COMPREHENSIVE_SCANNERS includes license)
+        return [name for name in _SCANNER_RESULT_CLASSES if name in wanted]
 
-        self._skip_db_update = False
+    def _convert_report(self, source: Path, fmt: str, output: Path) -> bool:
+        """Render another output format from a JSON report without re-scanning (``trivy convert``)."""
+        result = self.run_command(
+            ["trivy", "convert", "--format", fmt, "-o", str(output), str(source)],
+            capture_output=True,
+        )
+        return result.returncode == 0 and output.exists()
 
-        # Use cache path from manifest (asset id=cache) so Trivy DB is on results volume, not /tmp
-        if not os.environ.get("TRIVY_CACHE_DIR"):
-            try:
-                from scanner.core.scanner_assets.manager import ScannerAssetsManager
-                manager = ScannerAssetsManager(Path("/app/scanner/plugins"))
-                asset = manager.get_asset("trivy", "cache")
-                if asset and asset.mount.container_path:
-                    os.environ["TRIVY_CACHE_DIR"] = asset.mount.container_path
-            except Exception:
-                pass
+    def _scan_single_pass(
+        self,
+        scanners: List[str],
+        json_output: Path,
+        text_output: Path,
+        secrets_output: Path,
+        sarif_output: Path,
+        config_args: List[str],
+        skip_args: List[str],
+        scan_flags: List[str],
+    ) -> bool:
+        """
+        One ``trivy`` run for all requested categories (one filesystem walk, one DB load);
+        report.json / secrets-config.json are split from it and table/SARIF rendered via convert.
+        Returns False when the combined run fails; the caller then falls back to the per-category passes.
+        """
+        combined_output = self.results_dir / ".trivy-combined.json"
 
-        self.log(f"Running Trivy {self.scan_type} scan on {self.target_path}...")
-        
-        json_output = self.results_dir / "report.json"
-        text_output = self.results_dir / "report.txt"
-        secrets_output = self.results_dir / "secrets-config.json"
-        sarif_output = self.results_dir / "report.sarif"
-        
-        config_args = self.get_config_args()
-        skip_args = self.get_skip_args()
-        
-        # INIT: Environment Check
-        self.start_substep("Environment Check", "Checking Trivy environment...", SubStepType.ACTION)
-        try:
-            result = self.run_command(["trivy", "--version"], capture_output=True, timeout=10)
-            if result.returncode == 0:
-                version = result.stdout.strip().split('\n')[0] if result.stdout else "unknown"
-                self.complete_substep("Environment Check", f"Trivy {version} ready")
-            else:
-                self.complete_substep("Environment Check", "Environment check completed")
-        except Exception as e:
-            self.complete_substep("Environment Check", f"Environment check completed: {e}")
-        
-        # PREPARE: Download Vulnerability Database (retry + persistent cache)
-        self.substep_prepare("Download Vulnerability Database", "Checking/downloading vulnerability database...")
-        if not self._ensure_vuln_db():
-            self.fail_substep("Download Vulnerability Database", "Vulnerability database unavailable")
+        self.substep_scan("Vulnerability Scanning", "Scanning for known vulnerabilities...")
+        self.log(f"Single-pass scan: --scanners {','.join(scanners)}")
+        cmd = [
+            "trivy",
+            self.scan_type,
+            *scan_flags,
+            *config_args,
+            "--format", "json",
+            "-o", str(combined_output),
+            "--scanners", ",".join(scanners),
+            *skip_args,
+            str(self.target_path)
+        ]
+        result = self.run_command(cmd, capture_output=True)
+        combined: Optional[Dict[str, Any]] = None
+        if result.returncode == 0 and combined_output.exists():
+            try:
+                with open(combined_output, "r", encoding="utf-8") as f:
+                    combined = json.load(f)
+            except (OSError, ValueError) as e:
+                self.log(f"Combined report unreadable: {e}", "ERROR")
+        combined_output.unlink(missing_ok=True)
+        if not isinstance(combined, dict):
+            self.log(
+                f"Single-pass scan failed (exit code {result.returncode}); falling back to per-category passes",
+                "WARNING",
+            )
             return False
+        self.complete_substep("Vulnerability Scanning", "Vulnerability scanning completed")
+
+        self.substep_scan("Secret Scanning", "Scanning for exposed secrets...")
         self.complete_substep(
-            "Download Vulnerability Database",
-            "Using cached database (--skip-db-update on scan steps)",
+            "Secret Scanning",
+            "Secret scanning completed (single pass)" if "secret" in scanners else "Skipped (profile)",
         )
-        
-        # PREPARE: Updating DB
-        self.start_substep("Updating DB", "Updating vulnerability database...", SubStepType.ACTION)
-        self.complete_substep("Updating DB", "Database up to date")
-        
-        # PREPARE: Detecting Project Type
-        self.start_substep("Detecting Project Type", "Detecting project type and dependencies...", SubStepType.ACTION)
-        project_types = []
-        try:
-            if (self.target_path / "package.json").exists():
-                project_types.append("Node.js")
-            if (self.target_path / "requirements.txt").exists() or (self.target_path / "Pipfile").exists():
-                project_types.append("Python")
-            if (self.target_path / "pom.xml").exists() or (self.target_path / "build.gradle").exists():
-                project_types.append("Java")
-            if (self.target_path / "go.mod").exists():
-                project_types.append("Go")
-            if (self.target_path / "Cargo.toml").exists():
-                project_types.append("Rust")
-            if (self.target_path / "Gemfile").exists():
-                project_types.append("Ruby")
-            
-            if project_types:
-                self.complete_substep("Detecting Project Type", f"Detected: {', '.join(project_types)}")
-            else:
-                self.complete_substep("Detecting Project Type", "Generic filesystem scan")
-        except Exception:
-            self.complete_substep("Detecting Project Type", "Project type detection completed")
-        
-        # SCAN: Dependency Scanning
-        self.substep_scan("Dependency Scanning", "Scanning dependencies for vulnerabilities...")
-        self.complete_substep("Dependency Scanning", "Dependency scanning completed")
-        
+        self.substep_scan("Config Scanning", "Scanning for misconfigurations...")
+        self.complete_substep(
+            "Config Scanning",
+            "Config scanning completed (single pass)" if "misconfig" in scanners else "Skipped (profile)",
+        )
+        self.start_substep("License Scanning", "Scanning for license information...", SubStepType.PHASE)
+        self.complete_substep(
+            "License Scanning",
+            "License scanning completed (single pass)" if "license" in scanners
+            else "Skipped (license not in TRIVY_COMPREHENSIVE_SCANNERS)" if self._trivy_run_license_scan()
+            else "Skipped (profile)",
+        )
+
+        # PROCESS: Result Aggregation — split the combined report into the usual artifacts
+        self.substep_process("Result Aggregation", "Aggregating scan results...")
+        severities = self._trivy_severity().split(",")
+        main_report = split_trivy_report(
+            combined, normalize_trivy_scanners(self._trivy_comprehensive_scanners()), severities
+        )
+        with open(json_output, "w", encoding="utf-8") as f:
+            json.dump(main_report, f, indent=2)
+        deep_scanners = [
+            name for name, enabled in (
+                ("secret", self._trivy_run_secret_scan()),
+                ("misconfig", self._trivy_run_config_scan()),
+            ) if enabled
+        ]
+        if deep_scanners:
+            with open(secrets_output, "w", encoding="utf-8") as f:
+                json.dump(split_trivy_report(combined, deep_scanners), f, indent=2)
+        self.complete_substep("Result Aggregation", "Results aggregated successfully")
+
+        # OUTPUT: JSON Report Generation
+        self.substep_report("JSON", "Generating JSON report...")
+        if json_output.exists() and json_output.stat().st_size > 0:
+            self.complete_substep("Generating JSON Report", "JSON report generated successfully")
+        else:
+            self.fail_substep("Generating JSON Report", "JSON report generation failed")
+
+        # OUTPUT: Text Report Generation
+        self.substep_report("Text", "Generating text report...")
+        if self._convert_report(json_output, "table", text_output):
+            self.complete_substep("Generating Text Report", "Text report generated successfully")
+        else:
+            self.fail_substep("Generating Text Report", "Text report generation failed")
+
+        # OUTPUT: SARIF Export (optional)
+        self.start_substep("SARIF Export", "Generating SARIF report...", SubStepType.OUTPUT)
+        if self._convert_report(json_output, "sarif", sarif_output):
+            self.complete_substep("SARIF Export", "SARIF report generated successfully")
+        else:
+            self.fail_substep("SARIF Export", "SARIF export failed")
+
+        self.start_substep("Secrets/Config Deep Scan", "Running additional secrets and config scan...", SubStepType.PHASE)
+        if deep_scanners:
+            self.complete_substep("Secrets/Config Deep Scan", "Secrets/config deep scan completed (single pass)")
+        else:
+            self.complete_substep("Secrets/Config Deep Scan", "Skipped (profile)")
+        return True
+
+    def _scan_multi_pass(
+        self,
+        json_output: Path,
+        text_output: Path,
+        secrets_output: Path,
+        sarif_output: Path,
+        config_args: List[str],
+        skip_args: List[str],
+        scan_flags: List[str],
+    ) -> bool:
+        """One trivy process per category and output format (each re-walks the target)."""
         # SCAN: Vulnerability Scanning
         self.substep_scan("Vulnerability Scanning", "Scanning for known vulnerabilities...")
-        scan_flags = self._scan_flags()
         cmd = [
             "trivy",
             self.scan_type,
@@ -471,6 +592,105 @@ class TrivyScanner(BaseScanner):
         except Exception as e:
             self.log(f"Secrets/config scan failed: {e}", "WARNING")
             self.complete_substep("Secrets/Config Deep Scan", f"Secrets/config scan skipped: {e}")
+        return True
+
+    def scan(self) -> bool:
+        """Run Trivy scan with detailed substeps"""
+        if not self.check_tool_installed("trivy"):
+            self.log("trivy not found in PATH", "ERROR")
+            return False
+
+        self._skip_db_update = False
+
+        # Use cache path from manifest (asset id=cache) so Trivy DB is on results volume, not /tmp
+        if not self.getenv("TRIVY_CACHE_DIR"):
+            try:
+                from scanner.core.scanner_assets.manager import ScannerAssetsManager
+                manager = ScannerAssetsManager(Path("/app/scanner/plugins"))
+                asset = manager.get_asset("trivy", "cache")
+                if asset and asset.mount.container_path:
+                    self.env_overrides["TRIVY_CACHE_DIR"] = asset.mount.container_path
+            except Exception:
+                pass
+
+        self.log(f"Running Trivy {self.scan_type} scan on {self.target_path}...")
+        
+        json_output = self.results_dir / "report.json"
+        text_output = self.results_dir / "report.txt"
+        secrets_output = self.results_dir / "secrets-config.json"
+        sarif_output = self.results_dir / "report.sarif"
+        
+        config_args = self.get_config_args()
+        skip_args = self.get_skip_args()
+        
+        # INIT: Environment Check
+        self.start_substep("Environment Check", "Checking Trivy environment...", SubStepType.ACTION)
+        try:
+            result = self.run_command(["trivy", "--version"], capture_output=True, timeout=10)
+            if result.returncode == 0:
+                version = result.stdout.strip().split('\n')[0] if result.stdout else "unknown"
+                self.complete_substep("Environment Check", f"Trivy {version} ready")
+            else:
+                self.complete_substep("Environment Check", "Environment check completed")
+        except Exception as e:
+            self.complete_substep("Environment Check", f"Environment check completed: {e}")
+        
+        # PREPARE: Download Vulnerability Database (retry + persistent cache)
+        self.substep_prepare("Download Vulnerability Database", "Checking/downloading vulnerability database...")
+        if not self._ensure_vuln_db():
+            self.fail_substep("Download Vulnerability Database", "Vulnerability database unavailable")
+            return False
+        self.complete_substep(
+            "Download Vulnerability Database",
+            "Using cached database (--skip-db-update on scan steps)",
+        )
+        
+        # PREPARE: Updating DB
+        self.start_substep("Updating DB", "Updating vulnerability database...", SubStepType.ACTION)
+        self.complete_substep("Updating DB", "Database up to date")
+        
+        # PREPARE: Detecting Project Type
+        self.start_substep("Detecting Project Type", "Detecting project type and dependencies...", SubStepType.ACTION)
+        project_types = []
+        try:
+            if (self.target_path / "package.json").exists():
+                project_types.append("Node.js")
+            if (self.target_path / "requirements.txt").exists() or (self.target_path / "Pipfile").exists():
+                project_types.append("Python")
+            if (self.target_path / "pom.xml").exists() or (self.target_path / "build.gradle").exists():
+                project_types.append("Java")
+            if (self.target_path / "go.mod").exists():
+                project_types.append("Go")
+            if (self.target_path / "Cargo.toml").exists():
+                project_types.append("Rust")
+            if (self.target_path / "Gemfile").exists():
+                project_types.append("Ruby")
+            
+            if project_types:
+                self.complete_substep("Detecting Project Type", f"Detected: {', '.join(project_types)}")
+            else:
+                self.complete_substep("Detecting Project Type", "Generic filesystem scan")
+        except Exception:
+            self.complete_substep("Detecting Project Type", "Project type detection completed")
+        
+        # SCAN: Dependency Scanning
+        self.substep_scan("Dependency Scanning", "Scanning dependencies for vulnerabilities...")
+        self.complete_substep("Dependency Scanning", "Dependency scanning completed")
+        
+        scan_flags = self._scan_flags()
+        single_pass = self._single_pass_scanners()
+        ok = single_pass is not None and self._scan_single_pass(
+            single_pass, json_output, text_output, secrets_output, sarif_output, config_args, skip_args, scan_flags
+        )
+        if not ok:
+            if single_pass is None:
+                self.log("Multi-pass scan (TRIVY_SINGLE_PASS=0 or scanners outside vuln/secret/misconfig/license)")
+            # Only the vulnerability pass is fatal there, as before the single pass existed
+            ok = self._scan_multi_pass(
+                json_output, text_output, secrets_output, sarif_output, config_args, skip_args, scan_flags
+            )
+        if not ok:
+            return False
         
         # Check if reports were generated
         if json_output.exists() or text_output.exists():
@@ -482,7 +702,6 @@ class TrivyScanner(BaseScanner):
 
 
 if __name__ == "__main__":
-    import os
     import sys
     
     # Get default parameters from BaseScanner
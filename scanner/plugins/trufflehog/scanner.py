@@ -83,7 +83,7 @@ class TruffleHogScanner(BaseScanner):
         self.log("Running secret detection scan...")
         cmd = ["trufflehog", "filesystem", "--json", "--no-update", str(self.target_path)]
         
-        result = self.run_command(cmd, capture_output=True)
+        result = self.run_command(cmd, capture_output=True, keep_output=True)
         
         out = (result.stdout or "") + "\n" + (result.stderr or "")
         if result.returncode == 0 and out.strip():
@@ -136,7 +136,7 @@ class TruffleHogScanner(BaseScanner):
         self.log("Running text report generation...")
         cmd = ["trufflehog", "filesystem", "--no-update", str(self.target_path)]
         
-        result = self.run_command(cmd, capture_output=True)
+        result = self.run_command(cmd, capture_output=True, keep_output=True)
         if result.returncode == 0 and result.stdout:
             with open(text_output, "w", encoding="utf-8") as f:
                 f.write(result.stdout)
@@ -44,7 +44,7 @@ class WapitiScanner(BaseScanner):
             scan_target: Target URL to scan (web application)
         """
         super().__init__("Wapiti", target_path, results_dir, log_file, config_path)
-        self.scan_target = scan_target or os.getenv("SCAN_TARGET", "http://host.docker.internal:8000")
+        self.scan_target = scan_target or self.getenv("SCAN_TARGET", "http://host.docker.internal:8000")
     
     def scan(self) -> bool:
         """Run Wapiti scan"""
@@ -57,7 +57,7 @@ class WapitiScanner(BaseScanner):
         json_output = self.results_dir / "report.json"  # Changed from wapiti.json
         text_output = self.results_dir / "report.txt"   # Changed from wapiti.txt
 
-        extra = shlex.split(os.getenv("WAPITI_EXTRA_ARGS", "").strip())
+        extra = shlex.split(self.getenv("WAPITI_EXTRA_ARGS", "").strip())
         
         # JSON report
         self.log("Running web vulnerability scan...")
@@ -48,8 +48,8 @@ class ZAPScanner(BaseScanner):
             startup_delay: Delay in seconds to wait for target to be ready
         """
         super().__init__("ZAP", target_path, results_dir, log_file, config_path)
-        self.scan_target = scan_target or os.getenv("SCAN_TARGET", "http://host.docker.internal:8000")
-        self.startup_delay = startup_delay or int(os.getenv("ZAP_STARTUP_DELAY", "25"))
+        self.scan_target = scan_target or self.getenv("SCAN_TARGET", "http://host.docker.internal:8000")
+        self.startup_delay = startup_delay or int(self.getenv("ZAP_STARTUP_DELAY", "25"))
     
     def check_target_reachable(self) -> bool:
         """Check if target is reachable"""
@@ -99,11 +99,11 @@ class ZAPScanner(BaseScanner):
         self.check_target_reachable()
         
         # Set environment variables
-        os.environ.setdefault("ZAP_PATH", "/opt/ZAP_2.16.1")
-        os.environ.setdefault("JAVA_HOME", "/usr/lib/jvm/java-17-openjdk-amd64")
-        os.environ["ZAP_OPTIONS"] = "-config api.disablekey=true -config spider.maxDuration=10 -config scanner.maxDuration=30 -config scanner.maxRuleTimeInMs=60000"
+        self.env_overrides.setdefault("ZAP_PATH", self.getenv("ZAP_PATH") or "/opt/ZAP_2.16.1")
+        self.env_overrides.setdefault("JAVA_HOME", self.getenv("JAVA_HOME") or "/usr/lib/jvm/java-17-openjdk-amd64")
+        self.env_overrides["ZAP_OPTIONS"] = "-config api.disablekey=true -config spider.maxDuration=10 -config scanner.maxDuration=30 -config scanner.maxRuleTimeInMs=60000"
         
-        self.log(f"[ZAP ENV] ZAP_PATH={os.environ['ZAP_PATH']}, JAVA_HOME={os.environ['JAVA_HOME']}")
+        self.log(f"[ZAP ENV] ZAP_PATH={self.env_overrides['ZAP_PATH']}, JAVA_HOME={self.env_overrides['JAVA_HOME']}")
         self.log(f"[ZAP] Starting DEEP baseline scan on {self.scan_target} with aggressive policies...")
         
         xml_output = self.results_dir / "report.xml"  # Changed from zap-report.xml
@@ -115,7 +115,7 @@ class ZAPScanner(BaseScanner):
         if html_output.exists():
             html_output.unlink()
         
-        use_active = os.getenv("ZAP_USE_ACTIVE_SCAN", "1").strip().lower() in (
+        use_active = self.getenv("ZAP_USE_ACTIVE_SCAN", "1").strip().lower() in (
             "1",
             "true",
             "yes",
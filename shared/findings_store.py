@@ -0,0 +1,302 @@
+"""
+Per-scan findings store: one SQLite file (results/<scan_id>/summary/findings.db) per scan.
+
+Written by the report pipeline (scanner) and queried by the backend API, the AI prompt builder
+and the report itself, so filters and pages touch only the matching rows instead of loading
+and sorting every finding per request. Rows are inserted in API order (severity, path,
+rule_id, line, message), so ``seq`` doubles as the default sort key.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from shared.finding_normalize import normalize_finding_fields
+
+FINDINGS_DB_FILENAME = "findings.db"
+SCHEMA_VERSION = 1
+
+SEVERITY_RANK = {
+    "CRITICAL": 0,
+    "HIGH": 1,
+    "MEDIUM": 2,
+    "LOW": 3,
+    "INFO": 4,
+    "UNKNOWN": 5,
+}
+
+# ORDER BY per sort option (default "api": insertion order)
+_ORDER_BY = {
+    "api": "seq",
+    "severity": "severity_rank, tool_key, path_key, seq",
+    "tool": "tool_key, severity_rank, path_key, seq",
+    "path": "path_key, severity_rank, tool_key, seq",
+}
+
+_COLUMNS = ("tool", "policy_key", "severity", "path", "line", "message", "rule_id", "cwe", "fix_hint")
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE findings (
+    seq INTEGER PRIMARY KEY,
+    tool TEXT NOT NULL,
+    tool_key TEXT NOT NULL,
+    policy_key TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    severity_key TEXT NOT NULL,
+    severity_rank INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    path_key TEXT NOT NULL,
+    line TEXT NOT NULL,
+    message TEXT NOT NULL,
+    rule_id TEXT NOT NULL,
+    cwe TEXT,
+    fix_hint TEXT
+);
+CREATE INDEX ix_findings_severity ON findings (severity_key, seq);
+CREATE INDEX ix_findings_severity_rank ON findings (severity_rank, tool_key, path_key);
+CREATE INDEX ix_findings_tool ON findings (tool_key, seq);
+CREATE INDEX ix_findings_path ON findings (path_key);
+CREATE INDEX ix_findings_rule ON findings (rule_id);
+"""
+
+
+def severity_rank(severity: str) -> int:
+    key = (severity or "").upper().strip()
+    return SEVERITY_RANK.get(key, SEVERITY_RANK["UNKNOWN"])
+
+
+def finding_row(raw: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """API row fields (tool, policy_key, severity, path, line, message, rule_id, cwe, fix_hint) of a raw finding."""
+    fields = normalize_finding_fields(raw) if isinstance(raw, dict) else {}
+    cwe = raw.get("cwe") or raw.get("CWE") or raw.get("cwe_id")
+    fix_hint = raw.get("fix_hint") or raw.get("remediation") or raw.get("fix")
+    policy_key = str(raw.get("policy_key") or "").strip()
+    if not policy_key:
+        try:
+            from scanner.core.policy_schema_registry import display_name_to_policy_key
+
+            tool_name = str(raw.get("tool") or "").strip()
+            policy_key = display_name_to_policy_key().get(tool_name, "")
+        except ImportError:
+            policy_key = ""
+    return {
+        "tool": str(raw.get("tool") or ""),
+        "policy_key": policy_key,
+        "severity": str(raw.get("severity") or fields.get("severity") or ""),
+        "path": str(fields.get("path") or raw.get("path") or raw.get("file") or ""),
+        "line": str(fields.get("line") or raw.get("line") or raw.get("line_number") or ""),
+        "message": str(fields.get("message") or raw.get("message") or ""),
+        "rule_id": str(fields.get("rule_id") or raw.get("rule_id") or raw.get("check_id") or ""),
+        "cwe": str(cwe) if cwe else None,
+        "fix_hint": str(fix_hint) if fix_hint else None,
+    }
+
+
+def _api_sort_key(row: Dict[str, Optional[str]]) -> Tuple[Any, ...]:
+    return (
+        severity_rank(row["severity"] or ""),
+        (row["path"] or "").lower(),
+        (row["rule_id"] or "").lower(),
+        str(row["line"] or ""),
+        (row["message"] or "").lower(),
+    )
+
+
+def write_findings_db(
+    db_path: Path,
+    findings: Iterable[Dict[str, Any]],
+    *,
+    summary: Optional[Dict[str, Any]] = None,
+    generated_at: Optional[str] = None,
+) -> int:
+    """
+    (Re)write a scan's findings store atomically (temp file + rename). Returns the row count.
+
+    Args:
+        db_path: Target file (normally summary/findings.db)
+        findings: Raw or report-normalized finding dicts
+        summary: Post-policy severity counts (statistics.json)
+        generated_at: ISO timestamp of the report run
+    """
+    db_path = Path(db_path)
+    rows = sorted((finding_row(f) for f in findings if isinstance(f, dict)), key=_api_sort_key)
+    tmp_path = db_path.with_name(f".{db_path.name}.{os.getpid()}.tmp")
+    tmp_path.unlink(missing_ok=True)
+    conn = sqlite3.connect(str(tmp_path))
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.executescript(_SCHEMA)
+        conn.executemany(
+            "INSERT INTO findings (seq, tool, tool_key, policy_key, severity, severity_key, severity_rank, "
+            "path, path_key, line, message, rule_id, cwe, fix_hint) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    seq,
+                    r["tool"],
+                    (r["tool"] or "").strip().lower(),
+                    r["policy_key"],
+                    r["severity"],
+                    (r["severity"] or "").upper().strip(),
+                    severity_rank(r["severity"] or ""),
+                    r["path"],
+                    (r["path"] or "").lower(),
+                    r["line"],
+                    r["message"],
+                    r["rule_id"],
+                    r["cwe"],
+                    r["fix_hint"],
+                )
+                for seq, r in enumerate(rows)
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            [
+                ("schema_version", str(SCHEMA_VERSION)),
+                ("generated_at", generated_at or ""),
+                ("summary", json.dumps(summary or {})),
+            ],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp_path, db_path)
+    return len(rows)
+
+
+class FindingsStore:
+    """Read-only view of one scan's findings.db."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._conn = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+
+    @classmethod
+    def open(cls, db_path: Path) -> Optional["FindingsStore"]:
+        """Open the store, or None if the file is missing or not a current findings store."""
+        if not Path(db_path).is_file():
+            return None
+        try:
+            store = cls(db_path)
+            row = store._conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        except sqlite3.Error:
+            return None
+        if not row or row[0] != str(SCHEMA_VERSION):
+            store.close()
+            return None
+        return store
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "FindingsStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _meta(self, key: str) -> str:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else ""
+
+    @property
+    def generated_at(self) -> Optional[str]:
+        return self._meta("generated_at") or None
+
+    @property
+    def summary(self) -> Dict[str, Any]:
+        try:
+            data = json.loads(self._meta("summary") or "{}")
+        except json.JSONDecodeError:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _where(
+        self,
+        *,
+        severities: Optional[Set[str]] = None,
+        max_severity_rank: Optional[int] = None,
+        tool: Optional[str] = None,
+        tool_exact: Optional[str] = None,
+        path_prefix: Optional[str] = None,
+        rule_id_match: Optional[Callable[[str], bool]] = None,
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if severities:
+            clauses.append(f"severity_key IN ({', '.join('?' for _ in severities)})")
+            params.extend(sorted(severities))
+        if max_severity_rank is not None:
+            clauses.append("severity_rank <= ?")
+            params.append(max_severity_rank)
+        needle = (tool or "").strip().lower()
+        if needle:
+            clauses.append("tool_key = ?")
+            params.append(needle)
+        if tool_exact:
+            clauses.append("TRIM(tool) = ?")
+            params.append(tool_exact)
+        prefix = (path_prefix or "").strip().lower()
+        if prefix:
+            # Index range scan: every string starting with prefix sorts below prefix + U+10FFFF
+            clauses.append("path_key >= ? AND path_key < ?")
+            params.extend([prefix, prefix + "\U0010ffff"])
+        if rule_id_match is not None:
+            self._conn.create_function(
+                "ssc_rule_match", 1, lambda v: bool(rule_id_match((v or "").strip())), deterministic=True
+            )
+            clauses.append("ssc_rule_match(rule_id)")
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def count(self, **filters: Any) -> int:
+        where, params = self._where(**filters)
+        return int(self._conn.execute(f"SELECT COUNT(*) FROM findings{where}", params).fetchone()[0])
+
+    def query(
+        self,
+        *,
+        order: str = "api",
+        limit: Optional[int] = None,
+        offset: int = 0,
+        **filters: Any,
+    ) -> Tuple[int, List[Dict[str, Optional[str]]]]:
+        """
+        One page of findings matching the filters, plus the total match count.
+
+        Filters: severities (exact, upper-case), max_severity_rank, tool (case-insensitive),
+        tool_exact, path_prefix (case-insensitive), rule_id_match (predicate on rule_id).
+        """
+        where, params = self._where(**filters)
+        total = int(self._conn.execute(f"SELECT COUNT(*) FROM findings{where}", params).fetchone()[0])
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM findings{where} ORDER BY {_ORDER_BY.get(order, 'seq')}"
+        sql += " LIMIT ? OFFSET ?"
+        params = params + [-1 if limit is None else max(0, int(limit)), max(0, int(offset))]
+        return total, [dict(r) for r in self._conn.execute(sql, params)]
+
+    def iter_findings(self) -> Iterator[Dict[str, Optional[str]]]:
+        """All findings in API order (cwe/fix_hint only when set), streamed from the cursor."""
+        for r in self._conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM findings ORDER BY seq"):
+            row = dict(r)
+            for key in ("cwe", "fix_hint"):
+                if row[key] is None:
+                    del row[key]
+            yield row
+
+    def severity_counts(self, **filters: Any) -> Dict[str, int]:
+        """Upper-case severity -> count."""
+        where, params = self._where(**filters)
+        return {
+            key: int(n)
+            for key, n in self._conn.execute(
+                f"SELECT severity_key, COUNT(*) FROM findings{where} GROUP BY severity_key", params
+            )
+        }
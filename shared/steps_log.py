@@ -0,0 +1,162 @@
+"""
+steps.log (results/<scan_id>/logs/steps.log): append-only step deltas with periodic snapshots.
+
+Written by the scanner's StepRegistry; read by the registry itself (resume), the backend
+/steps fallback, the worker (per-tool durations) and the report (tool statuses).
+
+Record kinds, one JSON object per line:
+
+- ``{"init": ...}``: first line, ignored.
+- ``{"step": {...}, "substep": {...}, "timestamp": ...}``: delta. ``step`` holds the step's
+  own fields; ``substep`` (optional) is the one substep that changed; ``step.substeps``
+  (optional) replaces the whole substep list.
+- ``{"snapshot": [step, ...], "timestamp": ...}``: full state of all steps. The byte offset of
+  the latest snapshot is kept in ``steps.log.idx`` so readers parse snapshot + tail only.
+- Legacy lines (before deltas): a full step object with top-level ``number``/``name``.
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+STEPS_LOG_FILENAME = "steps.log"
+INDEX_SUFFIX = ".idx"
+# Deltas between snapshots: bounds what a reader parses after seeking to the last snapshot
+SNAPSHOT_EVERY = 200
+
+
+def index_path(log_path: Union[str, Path]) -> Path:
+    log_path = Path(log_path)
+    return log_path.with_name(log_path.name + INDEX_SUFFIX)
+
+
+def _parse_line(raw: bytes) -> Optional[Dict[str, Any]]:
+    raw = raw.strip()
+    if not raw:
+        return None
+    try:
+        record = json.loads(raw.decode("utf-8", errors="ignore"))
+    except json.JSONDecodeError:
+        # Old non-JSON lines or a line still being written
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def _snapshot_offset(log_path: Path) -> int:
+    try:
+        data = json.loads(index_path(log_path).read_text(encoding="utf-8"))
+        return max(0, int(data.get("snapshot_offset") or 0))
+    except (OSError, ValueError, TypeError, AttributeError):
+        return 0
+
+
+def _upsert_substep(substeps: List[Dict[str, Any]], substep: Dict[str, Any]) -> List[Dict[str, Any]]:
+    out = list(substeps)
+    for i, existing in enumerate(out):
+        if existing.get("name") == substep.get("name"):
+            out[i] = dict(substep)
+            return out
+    out.append(dict(substep))
+    return out
+
+
+def apply_record(steps: Dict[int, Dict[str, Any]], record: Dict[str, Any]) -> None:
+    """Fold one steps.log record into ``steps`` (step number -> step dict)."""
+    if "init" in record:
+        return
+    if isinstance(record.get("snapshot"), list):
+        steps.clear()
+        for step in record["snapshot"]:
+            if isinstance(step, dict) and step.get("number") is not None:
+                steps[step["number"]] = dict(step, substeps=list(step.get("substeps") or []))
+        return
+    delta = record.get("step")
+    if isinstance(delta, dict):
+        number = delta.get("number")
+        if number is None:
+            return
+        current = steps.get(number) or {"substeps": []}
+        merged = dict(current)
+        merged.update({k: v for k, v in delta.items() if k != "substeps"})
+        if isinstance(delta.get("substeps"), list):
+            merged["substeps"] = list(delta["substeps"])
+        if isinstance(record.get("substep"), dict):
+            merged["substeps"] = _upsert_substep(merged.get("substeps") or [], record["substep"])
+        if record.get("timestamp"):
+            merged["timestamp"] = record["timestamp"]
+        steps[number] = merged
+        return
+    # Legacy: full step object per line
+    if record.get("number") is not None and record.get("name"):
+        steps[record["number"]] = dict(record, substeps=list(record.get("substeps") or []))
+
+
+def read_steps(log_path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """
+    Current state of every step in steps.log, sorted by step number.
+
+    Seeks to the latest snapshot (from the index) and folds the deltas after it; without a
+    valid index (legacy logs, index not yet written) the whole file is folded.
+    """
+    log_path = Path(log_path)
+    steps: Dict[int, Dict[str, Any]] = {}
+    try:
+        with open(log_path, "rb") as f:
+            offset = _snapshot_offset(log_path)
+            if offset:
+                f.seek(offset)
+                first = _parse_line(f.readline())
+                if first is not None and isinstance(first.get("snapshot"), list):
+                    apply_record(steps, first)
+                else:
+                    f.seek(0)
+            for raw in f:
+                record = _parse_line(raw)
+                if record is not None:
+                    apply_record(steps, record)
+    except FileNotFoundError:
+        return []
+    return [steps[number] for number in sorted(steps)]
+
+
+class StepsLogWriter:
+    """Appends deltas to steps.log and a snapshot (plus index update) every ``snapshot_every`` deltas."""
+
+    def __init__(self, log_path: Union[str, Path], snapshot_every: int = SNAPSHOT_EVERY):
+        self.path = Path(log_path)
+        self.snapshot_every = snapshot_every
+        self._since_snapshot = 0
+
+    def init(self, timestamp: str) -> None:
+        if not self.path.exists():
+            self._append({"init": "SimpleSecCheck Steps Log", "format": 2, "timestamp": timestamp})
+
+    def append(
+        self,
+        delta: Dict[str, Any],
+        timestamp: str,
+        snapshot: Optional[Callable[[], List[Dict[str, Any]]]] = None,
+    ) -> None:
+        """Append one delta (``step`` [+ ``substep``]); ``snapshot`` returns all steps when one is due."""
+        self._append(dict(delta, timestamp=timestamp))
+        self._since_snapshot += 1
+        if snapshot is not None and self._since_snapshot >= self.snapshot_every:
+            self.write_snapshot(snapshot(), timestamp)
+
+    def write_snapshot(self, steps: List[Dict[str, Any]], timestamp: str) -> None:
+        offset = self._append({"snapshot": steps, "timestamp": timestamp})
+        self._since_snapshot = 0
+        idx = index_path(self.path)
+        tmp = idx.with_name(idx.name + ".tmp")
+        tmp.write_text(json.dumps({"snapshot_offset": offset}), encoding="utf-8")
+        os.replace(tmp, idx)
+
+    def _append(self, record: Dict[str, Any]) -> int:
+        """Append one line; returns its byte offset."""
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+        with open(self.path, "ab") as f:
+            offset = f.tell()
+            f.write(line)
+        return offset
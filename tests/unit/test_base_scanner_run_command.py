@@ -0,0 +1,71 @@
+"""Tests for BaseScanner.run_command streaming capture and stdout redirection."""
+import sys
+from pathlib import Path
+
+from scanner.core.base_scanner import OUTPUT_TAIL_LINES, BaseScanner
+
+
+class _Dummy(BaseScanner):
+    def scan(self):
+        return True
+
+
+def _scanner(tmp_path: Path) -> _Dummy:
+    s = _Dummy("dummy", str(tmp_path), str(tmp_path / "results"), str(tmp_path / "dummy.log"))
+    s.timeout_seconds = 30
+    return s
+
+
+def test_output_captured_and_teed_to_log(tmp_path: Path):
+    s = _scanner(tmp_path)
+    code = "import sys; print('hello'); print('warn', file=sys.stderr); sys.stdout.write('x\\r\\ny')"
+    result = s.run_command([sys.executable, "-c", code])
+    assert result.returncode == 0
+    assert result.stdout == "hello\nx\ny"
+    assert result.stderr == "warn\n"
+    log = s.log_file.read_text()
+    assert "hello" in log and "warn" in log
+
+
+def test_stdout_file_kept_only_on_success(tmp_path: Path):
+    s = _scanner(tmp_path)
+    report = tmp_path / "results" / "report.json"
+    result = s.run_command([sys.executable, "-c", "print('{\"a\": 1}')"], stdout_file=report)
+    assert result.stdout is None
+    assert report.read_text().strip() == '{"a": 1}'
+    # Report content goes to the file only, not into the per-tool log
+    assert '{"a": 1}' not in s.log_file.read_text().splitlines()
+
+    failed = tmp_path / "results" / "failed.json"
+    code = "import sys; print('partial'); sys.exit(2)"
+    result = s.run_command([sys.executable, "-c", code], stdout_file=failed)
+    assert result.returncode == 2
+    assert not failed.exists()
+    assert not failed.with_name("failed.json.part").exists()
+
+    accepted = tmp_path / "results" / "findings.txt"
+    code = "import sys; print('secret found'); sys.exit(1)"
+    s.run_command([sys.executable, "-c", code], stdout_file=accepted, stdout_file_exit_codes=(0, 1))
+    assert accepted.read_text().strip() == "secret found"
+
+
+def test_failure_tail_is_bounded(tmp_path: Path, capsys):
+    s = _scanner(tmp_path)
+    code = "import sys\nfor i in range(5000): print(f'line {i}', file=sys.stderr)\nsys.exit(1)"
+    result = s.run_command([sys.executable, "-c", code])
+    assert result.returncode == 1
+    assert "line 4999" in result.stderr
+    out = capsys.readouterr().out
+    assert "line 4999\n" in out and "line 0\n" not in out
+
+
+def test_result_output_is_bounded_unless_kept(tmp_path: Path):
+    s = _scanner(tmp_path)
+    code = "for i in range(5000): print(f'line {i}')"
+    tail = s.run_command([sys.executable, "-c", code])
+    lines = tail.stdout.splitlines()
+    assert len(lines) <= OUTPUT_TAIL_LINES and lines[-1] == "line 4999"
+    assert "line 0" in s.log_file.read_text()
+
+    full = s.run_command([sys.executable, "-c", code], keep_output=True)
+    assert full.stdout.splitlines() == [f"line {i}" for i in range(5000)]
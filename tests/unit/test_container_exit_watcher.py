@@ -0,0 +1,94 @@
+"""Container completion via the shared Docker events stream (no per-second polling)."""
+
+import asyncio
+import queue
+import sys
+from pathlib import Path
+
+_REPO = Path(__file__).resolve().parent.parent.parent
+if str(_REPO) not in sys.path:
+    sys.path.insert(0, str(_REPO))
+
+from worker.infrastructure.docker.container_exit_watcher import ContainerExitWatcher
+
+
+class _Stream:
+    def __init__(self):
+        self.events = queue.Queue()
+
+    def __iter__(self):
+        while True:
+            event = self.events.get()
+            if event is None:
+                return
+            yield event
+
+    def close(self):
+        self.events.put(None)
+
+
+class _Client:
+    def __init__(self):
+        self.stream = _Stream()
+        self.subscriptions = 0
+
+    def events(self, **kwargs):
+        assert kwargs["filters"]["type"] == "container"
+        self.subscriptions += 1
+        return self.stream
+
+
+class _Adapter:
+    def __init__(self):
+        self.client = _Client()
+        self.states = {}
+        self.state_calls = 0
+
+    async def get_container_state(self, container_id):
+        self.state_calls += 1
+        return self.states.get(container_id, "running")
+
+
+def _die(container_id, code):
+    return {"Type": "container", "Action": "die", "id": container_id, "time": 1,
+            "Actor": {"ID": container_id, "Attributes": {"exitCode": str(code)}}}
+
+
+def test_waiters_wake_on_die_event_with_one_subscription():
+    adapter = _Adapter()
+    watcher = ContainerExitWatcher(adapter)
+
+    async def run():
+        waits = [asyncio.create_task(watcher.wait_for_exit(cid, timeout=60)) for cid in ("a", "b")]
+        while not watcher.connected or len(watcher._waiters) < 2:
+            await asyncio.sleep(0.01)
+        adapter.states["a"] = "exited"
+        adapter.client.stream.events.put(_die("a", 3))
+        assert await asyncio.wait_for(waits[0], 5) == (True, 3)
+        assert not waits[1].done()
+        adapter.states["b"] = "exited"
+        adapter.client.stream.events.put({"Action": "destroy", "id": "b", "Actor": {"ID": "b"}})
+        assert await asyncio.wait_for(waits[1], 5) == (True, None)
+
+    try:
+        asyncio.run(run())
+    finally:
+        watcher.stop()
+    assert adapter.client.subscriptions == 1
+    # One check on registration and one per event, regardless of elapsed time
+    assert adapter.state_calls <= 6
+    assert watcher._waiters == {}
+
+
+def test_already_exited_and_timeout():
+    adapter = _Adapter()
+    adapter.client = None
+    adapter.states["done"] = "exited"
+    watcher = ContainerExitWatcher(adapter)
+
+    async def run():
+        assert await watcher.wait_for_exit("done", timeout=5) == (True, None)
+        assert await watcher.wait_for_exit("hung", timeout=0.05) == (False, None)
+
+    asyncio.run(run())
+    assert watcher._waiters == {}
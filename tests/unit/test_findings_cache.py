@@ -0,0 +1,172 @@
+"""Tests for the content-addressed per-file findings cache."""
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from scanner.core.findings_cache import (
+    FindingsCache,
+    ReportLayout,
+    blob_hashes,
+    git_blob_hash,
+    merge_cached,
+    path_mapper,
+    relative_findings,
+    target_files,
+)
+
+LAYOUT = ReportLayout(items_key="results", path_field="filename", errors=("errors", "filename"))
+
+
+def _cache(tmp_path: Path, **kw) -> FindingsCache:
+    return FindingsCache(tmp_path / "cache", "bandit", "bandit 1.7.9", "cfg", **kw)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_blob_hash_matches_git(tmp_path: Path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "a.py").write_text("print('a')\n")
+    (repo / "b.py").write_text("print('b')\n")
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    subprocess.run(["git", "-C", str(repo), "add", "a.py", "b.py"], check=True)
+    expected = subprocess.run(
+        ["git", "hash-object", str(repo / "a.py")], capture_output=True, text=True, check=True
+    ).stdout.strip()
+    assert git_blob_hash(repo / "a.py") == expected
+
+    # Modified after staging: the on-disk content wins over the index entry
+    (repo / "b.py").write_text("print('changed')\n")
+    hashes = blob_hashes(repo, ["a.py", "b.py"])
+    assert hashes["a.py"] == expected
+    assert hashes["b.py"] == git_blob_hash(repo / "b.py")
+
+
+def test_plan_hits_unchanged_files_only(tmp_path: Path):
+    target = tmp_path / "src"
+    target.mkdir()
+    for name in ("a.py", "b.py", "c.py"):
+        (target / name).write_text(f"# {name}\n")
+    cache = _cache(tmp_path)
+
+    first = cache.plan(target, ["a.py", "b.py", "c.py"])
+    assert not first.hits and first.misses == ["a.py", "b.py", "c.py"]
+    assert not first.incremental
+
+    findings = {"a.py": [{"filename": "a.py", "test_id": "B101"}]}
+    assert cache.store(first.hashes, findings, ["a.py", "b.py", "c.py"]) == 3
+
+    (target / "c.py").write_text("# changed\n")
+    second = cache.plan(target, ["a.py", "b.py", "c.py"])
+    assert second.hits == {"a.py": [{"filename": "a.py", "test_id": "B101"}], "b.py": []}
+    assert second.misses == ["c.py"]
+    assert second.incremental
+
+    # Same content at another path is analysed again (rules are path-scoped)
+    (target / "d.py").write_text("# a.py\n")
+    assert cache.plan(target, ["d.py"]).misses == ["d.py"]
+
+    # Another tool version / config is another namespace
+    other = FindingsCache(tmp_path / "cache", "bandit", "bandit 1.8.0", "cfg")
+    assert other.plan(target, ["a.py"]).misses == ["a.py"]
+
+
+def test_rule_file_edits_start_a_new_namespace(tmp_path: Path):
+    rule = tmp_path / "rules" / "custom.yml"
+    rule.parent.mkdir()
+    rule.write_text("rules: []\n")
+    before = _cache(tmp_path, config_files=[rule])
+    assert _cache(tmp_path, config_files=[rule]).dir == before.dir
+    rule.write_text("rules: [{id: new}]\n")
+    assert _cache(tmp_path, config_files=[rule]).dir != before.dir
+    assert _cache(tmp_path).dir != before.dir
+
+
+def test_target_files_skip_git_excluded_and_gitignored(tmp_path: Path):
+    target = tmp_path / "src"
+    for rel in ("app.py", "lib/util.py", "README.md", ".git/hooks/pre-commit.py",
+                "node_modules/pkg/index.py", "build/gen.py", "lib/debug.log"):
+        (target / rel).parent.mkdir(parents=True, exist_ok=True)
+        (target / rel).write_text("x\n")
+    (target / ".gitignore").write_text("build/\n*.log\n")
+
+    excluded = lambda rel: rel.split("/")[0] == "node_modules"
+    assert target_files(target, excluded) == [".gitignore", "README.md", "app.py", "lib/util.py"]
+    assert target_files(target, excluded, (".py",)) == ["app.py", "lib/util.py"]
+
+
+def test_expired_entries_are_misses(tmp_path: Path):
+    target = tmp_path / "src"
+    target.mkdir()
+    (target / "a.py").write_text("x = 1\n")
+    cache = _cache(tmp_path, max_age_days=1)
+    plan = cache.plan(target, ["a.py"])
+    cache.store(plan.hashes, {}, ["a.py"])
+    assert "a.py" in cache.plan(target, ["a.py"]).hits
+
+    cache.max_age_seconds = 0.0
+    assert "a.py" in cache.plan(target, ["a.py"]).hits
+    cache.max_age_seconds = 1e-9
+    assert cache.plan(target, ["a.py"]).misses == ["a.py"]
+
+
+def test_relative_findings_and_merge_round_trip(tmp_path: Path):
+    target = tmp_path / "src"
+    to_rel, to_reported = path_mapper(target, absolute=True)
+    report = {
+        "results": [{"filename": f"{target}/pkg/new.py", "test_id": "B602"}],
+        "errors": [{"filename": f"{target}/pkg/broken.py", "reason": "syntax error"}],
+    }
+    assert relative_findings(LAYOUT, report, to_rel) == {
+        "pkg/new.py": [{"filename": "pkg/new.py", "test_id": "B602"}]
+    }
+    assert [to_rel(p) for p in LAYOUT.errored_paths(report)] == ["pkg/broken.py"]
+
+    merged = merge_cached(
+        LAYOUT,
+        report,
+        {"pkg/old.py": [{"filename": "pkg/old.py", "test_id": "B101"}], "pkg/clean.py": []},
+        to_reported,
+    )
+    assert [r["filename"] for r in merged["results"]] == [f"{target}/pkg/new.py", f"{target}/pkg/old.py"]
+    assert merged["errors"] == report["errors"]
+    assert len(report["results"]) == 1
+
+
+def test_keyed_by_path_layout():
+    layout = ReportLayout(items_key="results", path_field="filename", keyed_by_path=True)
+    to_rel, to_reported = path_mapper(Path("/target"), absolute=True)
+    report = {"version": "1.5.0", "results": {"/target/b.env": [{"filename": "/target/b.env", "line_number": 2}]}}
+    assert relative_findings(layout, report, to_rel) == {"b.env": [{"filename": "b.env", "line_number": 2}]}
+
+    merged = merge_cached(layout, report, {"a.env": [{"filename": "a.env", "line_number": 1}]}, to_reported)
+    assert list(merged["results"]) == ["/target/a.env", "/target/b.env"]
+    assert merged["results"]["/target/a.env"] == [{"filename": "/target/a.env", "line_number": 1}]
+    assert merged["version"] == "1.5.0"
+
+
+def test_prune_deletes_expired_entries_of_every_namespace(tmp_path: Path):
+    import os
+    import time
+
+    target = tmp_path / "src"
+    target.mkdir()
+    (target / "a.py").write_text("x = 1\n")
+    (target / "b.py").write_text("y = 2\n")
+    old_tool = FindingsCache(tmp_path / "cache", "bandit", "bandit 1.7.0", "cfg", max_age_days=1)
+    plan = old_tool.plan(target, ["a.py"])
+    old_tool.store(plan.hashes, {}, ["a.py"])
+    stale = next(old_tool.dir.rglob("*.json"))
+    two_days_ago = time.time() - 2 * 86400
+    os.utime(stale, (two_days_ago, two_days_ago))
+
+    cache = _cache(tmp_path, max_age_days=1)
+    plan = cache.plan(target, ["b.py"])
+    cache.store(plan.hashes, {}, ["b.py"])
+    # The first store already swept; the next sweep is not due yet
+    assert cache.prune_if_due() == 0
+
+    assert cache.prune_if_due(now=time.time() + 7 * 3600) == 1
+    assert not stale.exists() and not old_tool.dir.exists()
+    assert "b.py" in cache.plan(target, ["b.py"]).hits
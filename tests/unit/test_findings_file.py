@@ -66,3 +66,51 @@ def test_load_findings_payload_missing(findings_module):
     payload, source = findings_module.load_findings_payload("no-such-scan")
     assert payload is None
     assert source == "missing"
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_load_findings_payload_from_report_html(tmp_path, findings_module, compress):
+    import io
+
+    from scanner.output.report_sections import write_findings_payload
+
+    findings = [
+        {"tool": "trivy", "severity": "HIGH", "path": "a.py", "line": str(i), "message": "</script> x", "rule_id": "r"}
+        for i in range(50)
+    ]
+    out = io.StringIO()
+    write_findings_payload(out, findings, compress=compress)
+    summary_dir = tmp_path / "html-scan" / "summary"
+    summary_dir.mkdir(parents=True)
+    (summary_dir / "summary.html").write_text(f"<html><body>{out.getvalue()}</body></html>", encoding="utf-8")
+
+    payload, source = findings_module.load_findings_payload("html-scan")
+    assert source == "html"
+    assert payload["findings"] == findings
+    assert ("data-encoding" in out.getvalue()) is compress
+
+
+def test_open_findings_store_imports_findings_json_once(tmp_path, findings_module):
+    summary_dir = tmp_path / "old-scan" / "summary"
+    summary_dir.mkdir(parents=True)
+    doc = {
+        "generated_at": "2026-05-17T12:00:00Z",
+        "findings": [
+            {"tool": "semgrep", "severity": "LOW", "path": "b.py", "line": "1", "message": "x", "rule_id": "r2"},
+            {"tool": "semgrep", "severity": "HIGH", "path": "a.py", "line": "1", "message": "x", "rule_id": "r1"},
+        ],
+        "summary": {"total_vulnerabilities": 2},
+    }
+    (summary_dir / "findings.json").write_text(json.dumps(doc), encoding="utf-8")
+
+    store, source = findings_module.open_findings_store("old-scan")
+    assert source == "file"
+    with store:
+        total, rows = store.query(limit=1)
+    assert (total, rows[0]["rule_id"]) == (2, "r1")
+    assert findings_module.findings_db_path("old-scan").is_file()
+
+    store, source = findings_module.open_findings_store("old-scan")
+    assert source == "store"
+    with store:
+        assert store.summary == {"total_vulnerabilities": 2}
@@ -0,0 +1,28 @@
+"""Findings query cache: LRU eviction by entry count and by total findings held."""
+from application.helpers.findings_query_cache import FindingsQueryCache
+
+
+def test_evicts_least_recently_used_entry():
+    cache = FindingsQueryCache(max_entries=2, max_findings=1000)
+    cache.put(("findings", "a"), "A")
+    cache.put(("findings", "b"), "B")
+    assert cache.get(("findings", "a")) == "A"
+    cache.put(("findings", "c"), "C")
+    assert cache.get(("findings", "b")) is None
+    assert cache.get(("findings", "a")) == "A"
+    assert len(cache) == 2
+
+
+def test_bounds_total_findings_and_skips_oversized_entries():
+    cache = FindingsQueryCache(max_entries=10, max_findings=100)
+    cache.put("small", "s", weight=40)
+    cache.put("medium", "m", weight=50)
+    cache.put("large", "l", weight=30)
+    assert cache.get("small") is None
+    assert cache.get("medium") == "m" and cache.get("large") == "l"
+    cache.put("huge", "h", weight=101)
+    assert cache.get("huge") is None
+    assert len(cache) == 2
+    # Replacing a key reuses its weight budget
+    cache.put("medium", "m2", weight=70)
+    assert (cache.get("medium"), cache.get("large")) == ("m2", "l")
@@ -0,0 +1,65 @@
+"""Per-scan findings store: API order, indexed filters and pagination, prompt selection."""
+import re
+
+from application.helpers.prompt_findings_select import (
+    select_findings_for_prompt,
+    select_findings_for_prompt_from_store,
+)
+from shared.findings_store import FindingsStore, write_findings_db
+
+
+def _f(tool, severity, path, rule_id="r1", line="1"):
+    return {"tool": tool, "severity": severity, "path": path, "line": line, "message": "m", "rule_id": rule_id}
+
+
+FINDINGS = [
+    _f("Bandit", "LOW", "src/z.py", "B101"),
+    _f("Semgrep", "HIGH", "src/b.py", "python.sql"),
+    _f("Semgrep", "HIGH", "Src/a.py", "python.xss"),
+    _f("Trivy", "CRITICAL", "requirements.txt", "CVE-2024-1"),
+    _f("Bandit", "MEDIUM", "tests/t.py", "B105"),
+]
+
+
+def _store(tmp_path):
+    db = tmp_path / "findings.db"
+    assert write_findings_db(db, FINDINGS, summary={"total_vulnerabilities": 5}, generated_at="2026-01-01T00:00:00Z") == 5
+    return FindingsStore.open(db)
+
+
+def test_store_pages_in_api_order_with_filters(tmp_path):
+    with _store(tmp_path) as store:
+        assert store.summary == {"total_vulnerabilities": 5}
+        assert store.generated_at == "2026-01-01T00:00:00Z"
+        total, page = store.query(limit=2, offset=1)
+        assert total == 5
+        assert [(r["severity"], r["path"]) for r in page] == [("HIGH", "Src/a.py"), ("HIGH", "src/b.py")]
+
+        total, rows = store.query(severities={"HIGH", "LOW"}, path_prefix="SRC/")
+        assert total == 3
+        assert [r["rule_id"] for r in rows] == ["python.xss", "python.sql", "B101"]
+
+        total, rows = store.query(tool="bandit", rule_id_match=re.compile(r"^B10[15]$").search)
+        assert total == 2
+        assert {r["tool"] for r in rows} == {"Bandit"}
+        assert store.count(path_prefix="tests") == 1
+
+
+def test_prompt_selection_from_store_matches_list_selection(tmp_path):
+    with _store(tmp_path) as store:
+        for kwargs in (
+            {"min_severity": "HIGH"},
+            {"min_severity": "ALL", "sort_by": "tool", "max_findings": 3},
+            {"min_severity": "LOW", "tool": "Bandit", "sort_by": "path"},
+        ):
+            expected, expected_meta = select_findings_for_prompt(FINDINGS, **kwargs)
+            selected, meta = select_findings_for_prompt_from_store(store, **kwargs)
+            assert [(f["tool"], f["path"]) for f in selected] == [(f["tool"], f["path"]) for f in expected]
+            assert meta == expected_meta
+
+
+def test_open_rejects_missing_or_foreign_files(tmp_path):
+    assert FindingsStore.open(tmp_path / "missing.db") is None
+    other = tmp_path / "other.db"
+    other.write_bytes(b"not a database")
+    assert FindingsStore.open(other) is None
@@ -2,6 +2,7 @@
 import pytest
 
 from domain.utils.git_repo_url import (
+    github_repo_owner_and_slug,
     normalize_git_repo_url,
     normalize_repo_url_for_target_type,
 )
@@ -41,3 +42,19 @@ def test_normalize_only_for_git_target_type() -> None:
     u = "https://github.com/a/b/blob/main/x"
     assert normalize_repo_url_for_target_type(TargetType.GIT_REPO.value, u) == "https://github.com/a/b.git"
     assert normalize_repo_url_for_target_type(TargetType.WEBSITE.value, u) == u
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ("https://github.com/Foo/Bar.git", ("foo", "foo/bar")),
+        ("  https://github.com/foo/bar/tree/main/src?x=1 ", ("foo", "foo/bar")),
+        ("git@github.com:Foo/Bar.git", ("foo", "foo/bar")),
+        ("https://github.com/foo", (None, None)),
+        ("https://www.github.com/foo/bar", (None, None)),
+        ("https://gitlab.com/foo/bar", (None, None)),
+        ("", (None, None)),
+    ],
+)
+def test_github_repo_owner_and_slug(raw: str, expected) -> None:
+    assert github_repo_owner_and_slug(raw) == expected
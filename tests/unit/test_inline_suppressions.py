@@ -1,6 +1,8 @@
 """Unit tests for scanner.core.inline_suppressions."""
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
 
 import pytest
@@ -188,3 +190,64 @@ def test_inline_disabled_skips_filtering(tmp_path: Path, monkeypatch):
     )
     assert len(remaining) == 1
     assert accepted == []
+
+
+def test_build_suppression_index_skips_excludes_and_gitignore(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("SIMPLESECCHECK_EXCLUDE_PATHS", "vendor")
+    monkeypatch.delenv("RESULTS_DIR_IN_CONTAINER", raising=False)
+    (tmp_path / ".gitignore").write_text("node_modules/\n/build\n*.gen.py\n!keep.gen.py\n", encoding="utf-8")
+    for rel in ("src/a.py", "node_modules/m/x.js", "build/b.py", "src/build/c.py",
+                "vendor/v.py", "src/z.gen.py", "src/keep.gen.py"):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("run()  # nosec\n", encoding="utf-8")
+    index = build_suppression_index(str(tmp_path))
+    assert sorted(rel for rel, _ in index) == ["src/a.py", "src/build/c.py", "src/keep.gen.py"]
+
+
+def test_build_suppression_index_reuses_cache(tmp_path: Path, monkeypatch):
+    import scanner.core.inline_suppressions as inline
+
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "a.py").write_text("x()\ny()  # nosec B101\n", encoding="utf-8")
+    (target / "b.py").write_text("clean()\n", encoding="utf-8")
+    monkeypatch.setenv("SSC_FINDINGS_CACHE_DIR", str(tmp_path / "cache"))
+    reads: list[str] = []
+    real_read = inline._read_suppression_lines
+    monkeypatch.setattr(inline, "_read_suppression_lines", lambda p: reads.append(p.name) or real_read(p))
+
+    first = build_suppression_index(str(target))
+    assert sorted(reads) == ["a.py", "b.py"]
+    # Only files with markers are cached, one small shard per key-hash prefix
+    shards = list((tmp_path / "cache" / "inline-suppressions").iterdir())
+    assert len(shards) == 1 and shards[0].suffix == ".json"
+    entries = json.loads(shards[0].read_text(encoding="utf-8"))["entries"]
+    assert len(entries) == 1 and "a.py" in next(iter(entries))
+    reads.clear()
+    second = build_suppression_index(str(target))
+    assert reads == ["b.py"]
+    assert second.keys() == first.keys() == {("a.py", 2)}
+    assert second[("a.py", 2)][0].nosec_ids == {"B101"}
+
+    reads.clear()
+    (target / "b.py").write_text("clean()  # nosemgrep\n", encoding="utf-8")
+    os.utime(target / "b.py", ns=(1, 1))
+    assert ("b.py", 1) in build_suppression_index(str(target))
+    assert reads == ["b.py"]
+    reads.clear()
+    assert ("b.py", 1) in build_suppression_index(str(target))
+    assert reads == []
+
+
+def test_index_shard_write_keeps_other_writers_entries(tmp_path: Path):
+    import scanner.core.inline_suppressions as inline
+
+    shard = tmp_path / "ab.json"
+    inline._save_index_shard(shard, {"blob:ab1": [100, [[1, "x  # nosec"]]]}, horizon=0)
+    inline._save_index_shard(shard, {"blob:ab2": [200, [[2, "y  # nosec"]]]}, horizon=0)
+    assert inline._load_index_shard(shard).keys() == {"blob:ab1", "blob:ab2"}
+    # Entries older than the horizon are dropped on the next write
+    inline._save_index_shard(shard, {"blob:ab3": [300, []]}, horizon=150)
+    assert inline._load_index_shard(shard).keys() == {"blob:ab2", "blob:ab3"}
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+import itertools
+
+import pytest
+
+from scanner.core.policy_engine import (
+    CompiledPolicyRules,
+    ToolPolicySpec,
+    apply_policy_generic,
+    apply_policy_with_severity_overrides,
+    rule_matches_spec,
+)
+
+RULES = [
+    {"rule_id": "B101", "path_regex": r"^tests/", "reason": "asserts in tests"},
+    {"path_regex": r"^vendor/", "reason": "vendored"},
+    {"rule_id": "B602", "message_regex": r"shell=True", "reason": "reviewed"},
+    {"rule_id": "B101", "reason": "second B101 rule"},
+    {"rule_id": "B303", "path_regex": r"([a-z]+)/\1\.py$", "reason": "backref"},
+    {"rule_id": "B404", "path_regex": r"(?i)^SCRIPTS/", "reason": "inline flag"},
+    {"rule_id": "B999", "path_regex": r"([", "reason": "invalid"},
+    {"rule_id": None, "message_regex": r"(", "reason": "invalid message"},
+]
+
+FINDINGS = [
+    {"rule_id": rid, "path": path, "message": msg}
+    for rid, path, msg in itertools.product(
+        ["B101", "B602", "B303", "B404", "B999", None],
+        ["tests/t.py", "/target/vendor/x.py", "/app/target/pkg/pkg.py", "scripts/run.sh", "src/a.py", None],
+        ["subprocess with shell=True", "", None],
+    )
+]
+
+
+@pytest.mark.parametrize("mode", ["exact", "regex"])
+def test_compiled_rules_match_rule_matches_spec(mode):
+    spec = ToolPolicySpec(rule_id_mode=mode)
+    compiled = CompiledPolicyRules(RULES, spec)
+    for finding in FINDINGS:
+        expected = [r for r in RULES if rule_matches_spec(finding=finding, rule=r, spec=spec)]
+        assert compiled.matching(finding) == expected, finding
+        assert compiled.first_match(finding) == (expected[0] if expected else None)
+
+
+def test_apply_policy_generic_keeps_first_matching_rule_in_policy_order():
+    spec = ToolPolicySpec(accept_tool="bandit")
+    findings = [
+        {"rule_id": "B101", "path": "/target/vendor/lib.py", "message": "assert"},
+        {"rule_id": "B101", "path": "tests/test_x.py", "message": "assert"},
+        {"rule_id": "B101", "path": "src/x.py", "message": "assert"},
+        {"rule_id": "B999", "path": "src/x.py", "message": "x"},
+    ]
+    processed, accepted = apply_policy_generic(
+        findings=findings,
+        tool_policy={"accepted_findings": RULES},
+        spec=spec,
+        accept_record=lambda f, reason: {"path": f["path"], "reason": reason},
+    )
+    assert [a["reason"] for a in accepted] == ["vendored", "asserts in tests", "second B101 rule"]
+    assert processed == [findings[3]]
+
+
+def test_severity_overrides_apply_all_matches_in_order():
+    spec = ToolPolicySpec()
+    overrides = [
+        {"rule_id": "B101", "new_severity": "low"},
+        {"path_regex": r"^src/", "new_severity": "high"},
+        {"rule_id": "B102", "new_severity": "critical"},
+    ]
+    processed, _ = apply_policy_with_severity_overrides(
+        findings=[
+            {"rule_id": "B101", "path": "/target/src/a.py", "line": 1, "severity": "MEDIUM"},
+            {"rule_id": "B101", "path": "lib/a.py", "line": 1, "severity": "MEDIUM"},
+            {"rule_id": "B103", "path": "lib/b.py", "line": 1, "severity": "MEDIUM"},
+        ],
+        tool_policy={"severity_overrides": overrides},
+        spec=spec,
+    )
+    assert [f["severity"] for f in processed] == ["HIGH", "LOW", "MEDIUM"]
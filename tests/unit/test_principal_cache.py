@@ -0,0 +1,214 @@
+"""Per-process principal cache: TTL/LRU, tag invalidation, and its use in actor context resolution."""
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+_BACKEND = Path(__file__).resolve().parents[2] / "backend"
+if str(_BACKEND) not in sys.path:
+    sys.path.insert(0, str(_BACKEND))
+
+from infrastructure.redis import principal_cache as pc
+from infrastructure.redis.principal_cache import (
+    PrincipalCache,
+    api_key_tag,
+    apply_invalidation_message,
+    guest_tag,
+    user_tag,
+)
+
+
+def test_get_returns_value_until_ttl_expires():
+    cache = PrincipalCache(ttl_seconds=30, max_entries=10)
+    cache.set("k", "v", tags=("t",), now=100.0)
+    assert cache.get("k", now=129.0) == "v"
+    assert cache.get("k", now=130.0) is None
+    assert len(cache) == 0
+
+
+def test_max_age_shortens_ttl():
+    cache = PrincipalCache(ttl_seconds=30, max_entries=10)
+    cache.set("k", "v", tags=(), max_age=5, now=100.0)
+    assert cache.get("k", now=104.0) == "v"
+    assert cache.get("k", now=105.0) is None
+    cache.set("expired", "v", tags=(), max_age=-1, now=100.0)
+    assert cache.get("expired", now=100.0) is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = PrincipalCache(ttl_seconds=30, max_entries=2)
+    cache.set("a", 1, tags=("ta",), now=0.0)
+    cache.set("b", 2, tags=("tb",), now=0.0)
+    assert cache.get("a", now=1.0) == 1
+    cache.set("c", 3, tags=("tc",), now=1.0)
+    assert cache.get("b", now=1.0) is None
+    assert cache.get("a", now=1.0) == 1
+    assert cache.get("c", now=1.0) == 3
+    # Evicted entries no longer count for their tags
+    assert cache.invalidate("tb") == 0
+
+
+def test_invalidate_by_any_tag():
+    cache = PrincipalCache(ttl_seconds=30, max_entries=10)
+    cache.set("api_key:h1", "ctx1", tags=(api_key_tag("k1"), user_tag("u1")), now=0.0)
+    cache.set("api_key:h2", "ctx2", tags=(api_key_tag("k2"), user_tag("u1")), now=0.0)
+    cache.set("api_key:h3", "ctx3", tags=(api_key_tag("k3"), user_tag("u2")), now=0.0)
+
+    assert cache.invalidate(api_key_tag("k1")) == 1
+    assert cache.get("api_key:h1", now=1.0) is None
+    assert cache.get("api_key:h2", now=1.0) == "ctx2"
+
+    assert cache.invalidate(user_tag("u1")) == 1
+    assert cache.get("api_key:h2", now=1.0) is None
+    assert cache.get("api_key:h3", now=1.0) == "ctx3"
+
+
+def test_disabled_cache_stores_nothing():
+    cache = PrincipalCache(ttl_seconds=0, max_entries=10)
+    cache.set("k", "v", tags=())
+    assert cache.get("k") is None
+
+
+def test_apply_invalidation_message(monkeypatch):
+    cache = PrincipalCache(ttl_seconds=30, max_entries=10)
+    monkeypatch.setattr(pc, "_cache", cache)
+    cache.set("guest:s1", "ctx", tags=(guest_tag("s1"),))
+
+    assert apply_invalidation_message("not json") == 0
+    assert apply_invalidation_message('{"tags": "guest:s1"}') == 0
+    assert apply_invalidation_message('{"tags": ["guest:s1"]}') == 1
+    assert cache.get("guest:s1") is None
+
+
+def test_publish_invalidation_clears_locally_and_publishes(monkeypatch):
+    cache = PrincipalCache(ttl_seconds=30, max_entries=10)
+    monkeypatch.setattr(pc, "_cache", cache)
+    cache.set("api_key:h", "ctx", tags=(api_key_tag("k1"),))
+    publish = AsyncMock()
+    fake_client = SimpleNamespace(redis_client=SimpleNamespace(publish=publish))
+    monkeypatch.setitem(sys.modules, "infrastructure.redis.client", fake_client)
+
+    asyncio.run(pc.publish_invalidation(api_key_tag("k1")))
+
+    assert cache.get("api_key:h") is None
+    publish.assert_awaited_once_with(pc.PRINCIPAL_INVALIDATION_CHANNEL, {"tags": ["api_key:k1"]})
+
+
+def _actor_context_module():
+    pytest.importorskip("pydantic_settings")
+    pytest.importorskip("fastapi")
+    from api.deps import actor_context
+
+    return actor_context
+
+
+def _request(cookies=None):
+    return SimpleNamespace(state=SimpleNamespace(), cookies=cookies or {})
+
+
+def test_api_key_context_is_cached_until_revoked(monkeypatch):
+    actor_context = _actor_context_module()
+    from domain.entities.api_key import ApiKey
+    from domain.entities.user import User, UserRole
+
+    cache = PrincipalCache(ttl_seconds=30, max_entries=10)
+    monkeypatch.setattr(pc, "_cache", cache)
+    api_key = ApiKey(
+        id="key-1",
+        user_id="user-1",
+        name="ci",
+        key_hash="h",
+        created_at=datetime.utcnow(),
+        expires_at=datetime.utcnow() + timedelta(days=1),
+        is_active=True,
+    )
+    user = User(id="user-1", email="ci@test.local", username="ci", role=UserRole.USER, is_active=True)
+    service = MagicMock()
+    service.authenticate = AsyncMock(return_value=(api_key, user))
+
+    monkeypatch.setitem(
+        sys.modules, "infrastructure.container", SimpleNamespace(get_api_key_service=lambda: service)
+    )
+
+    dep = actor_context.ActorContextDependency(jwt_secret_key="secret")
+    plain = "ssc_deadbeef_" + "a" * 32
+    first = asyncio.run(dep._get_context_from_api_key(plain))
+    second = asyncio.run(dep._get_context_from_api_key(plain))
+    assert first.user_id == second.user_id == "user-1"
+    assert service.authenticate.await_count == 1
+
+    cache.invalidate(api_key_tag("key-1"))
+    asyncio.run(dep._get_context_from_api_key(plain))
+    assert service.authenticate.await_count == 2
+
+
+def test_revoked_key_and_deactivated_user_are_rejected_on_next_request(monkeypatch):
+    actor_context = _actor_context_module()
+    from domain.entities.api_key import ApiKey
+    from domain.entities.user import User, UserRole
+
+    cache = PrincipalCache(ttl_seconds=300, max_entries=10)
+    monkeypatch.setattr(pc, "_cache", cache)
+    api_key = ApiKey(
+        id="key-2",
+        user_id="user-2",
+        name="ci",
+        key_hash="h",
+        created_at=datetime.utcnow(),
+        is_active=True,
+    )
+    user = User(id="user-2", email="ci2@test.local", username="ci2", role=UserRole.USER, is_active=True)
+    service = MagicMock()
+    service.authenticate = AsyncMock(return_value=(api_key, user))
+    monkeypatch.setitem(
+        sys.modules, "infrastructure.container", SimpleNamespace(get_api_key_service=lambda: service)
+    )
+    fake_client = SimpleNamespace(redis_client=SimpleNamespace(publish=AsyncMock()))
+    monkeypatch.setitem(sys.modules, "infrastructure.redis.client", fake_client)
+
+    dep = actor_context.ActorContextDependency(jwt_secret_key="secret")
+    plain = "ssc_deadbeef_" + "b" * 32
+    assert asyncio.run(dep._get_context_from_api_key(plain)).user_id == "user-2"
+
+    # DELETE /api-keys/{id}: the key is inactive in the DB and its tag is published
+    service.authenticate.return_value = None
+    asyncio.run(pc.publish_invalidation(api_key_tag("key-2")))
+    assert asyncio.run(dep._get_context_from_api_key(plain)) is None
+
+    # PUT /admin/users/{id} with is_active=false (and DELETE /admin/users/{id}) publish the user tag
+    service.authenticate.return_value = (api_key, user)
+    assert asyncio.run(dep._get_context_from_api_key(plain)) is not None
+    service.authenticate.return_value = None
+    asyncio.run(pc.publish_invalidation(user_tag("user-2")))
+    assert asyncio.run(dep._get_context_from_api_key(plain)) is None
+
+
+def test_resolve_context_is_memoized_per_request(monkeypatch):
+    actor_context = _actor_context_module()
+    dep = actor_context.ActorContextDependency(jwt_secret_key="secret")
+    resolved = actor_context.ActorContext(user_id="u1", is_authenticated=True)
+    monkeypatch.setattr(dep, "_resolve_uncached", AsyncMock(return_value=resolved))
+    request = _request()
+
+    assert asyncio.run(dep.resolve_context(request, MagicMock())) is resolved
+    assert asyncio.run(dep.resolve_context(request, MagicMock())) is resolved
+    dep._resolve_uncached.assert_awaited_once()
+
+
+def test_memoized_new_guest_session_still_sets_cookie(monkeypatch):
+    actor_context = _actor_context_module()
+    dep = actor_context.ActorContextDependency(jwt_secret_key="secret")
+    guest = actor_context.ActorContext(session_id="new-session", is_authenticated=False)
+    monkeypatch.setattr(dep, "_resolve_uncached", AsyncMock(return_value=guest))
+    request = _request()
+
+    asyncio.run(dep.resolve_context(request, MagicMock()))  # middleware, response discarded
+    response = MagicMock()
+    asyncio.run(dep.resolve_context(request, response))
+
+    response.set_cookie.assert_called_once()
+    assert response.set_cookie.call_args.kwargs["value"] == "new-session"
@@ -0,0 +1,48 @@
+"""Rate limiter: local fixed-window fallback and switching to it when Redis fails."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("redis")
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from infrastructure.redis.rate_limiter import LocalRateLimiter, RateLimitDecision, RedisRateLimiter
+
+
+def test_local_limiter_counts_per_window_and_bounds_keys():
+    limiter = LocalRateLimiter(max_keys=2)
+    assert [limiter.hit("a", 2, 60, now=120.0).allowed for _ in range(3)] == [True, True, False]
+    assert limiter.hit("a", 2, 60, now=150.0) == RateLimitDecision(False, 30)
+    assert limiter.hit("a", 2, 60, now=180.0).allowed
+    limiter.hit("b", 2, 60, now=180.0)
+    limiter.hit("c", 2, 60, now=180.0)
+    assert len(limiter._counters) == 2 and "a" not in limiter._counters
+
+
+class _Client:
+    def __init__(self, replies):
+        self.replies = replies
+        self.calls = 0
+
+    async def run_script(self, script, keys, args):
+        self.calls += 1
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+
+def test_redis_limiter_uses_script_and_falls_back_on_errors():
+    client = _Client([[1, 0], [0, 2500], RedisConnectionError("down")])
+    limiter = RedisRateLimiter(client=client, fallback=LocalRateLimiter())
+
+    async def run():
+        return [await limiter.hit("guest:s1", 1, 60) for _ in range(4)]
+
+    allowed, limited, fallback_first, fallback_second = asyncio.run(run())
+    assert allowed == RateLimitDecision(True)
+    assert limited == RateLimitDecision(False, 3)
+    assert fallback_first.allowed and not fallback_second.allowed
+    # Redis is not retried on every request while it is down
+    assert client.calls == 3
@@ -0,0 +1,104 @@
+"""In-process report pipeline: reuse of early-parsed findings, policy stage, rendered outputs."""
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("defusedxml")
+
+from scanner.output import report_pipeline
+from scanner.output.report_pipeline import (
+    ReportOptions,
+    apply_policy_stage,
+    build_findings,
+    generate_report,
+)
+
+
+def _scanner(name):
+    return SimpleNamespace(name=name, tools_key=name.lower(), python_class=None)
+
+
+def _processor(policy_key="tool"):
+    def apply_policy(findings, policy):
+        ignored = set(policy.get("ignore", []))
+        kept = [f for f in findings if f["id"] not in ignored]
+        accepted = [{"tool": policy_key, "id": f["id"]} for f in findings if f["id"] in ignored]
+        return kept, accepted
+
+    return SimpleNamespace(
+        html_file=None,
+        json_file="report.json",
+        summary_func=lambda data: data,
+        html_func=None,
+        policy_key=policy_key,
+        apply_policy=apply_policy,
+    )
+
+
+def test_build_findings_uses_parsed_entries_without_reading_reports(monkeypatch, tmp_path):
+    tool = _scanner("Tool")
+    processor = _processor()
+    monkeypatch.setattr(report_pipeline.ScannerRegistry, "get_all_scanners", staticmethod(lambda: [tool]))
+
+    def fail(*_args):
+        raise AssertionError("report re-read although findings were parsed")
+
+    monkeypatch.setattr(report_pipeline, "parse_tool_findings", fail)
+    findings = [{"id": "a", "severity": "HIGH"}]
+    by_tool, processors = build_findings(tmp_path, {"Tool": (processor, findings)})
+    assert by_tool == {"Tool": findings}
+    assert processors == [(tool, processor)]
+
+
+def test_policy_stage_marks_accepted_records_and_updates_findings():
+    tool = _scanner("Tool")
+    by_tool = {"Tool": [{"id": "a"}, {"id": "b"}]}
+    accepted = apply_policy_stage(by_tool, [(tool, _processor())], {"tool": {"ignore": ["b"]}})
+    assert by_tool["Tool"] == [{"id": "a"}]
+    assert accepted == [{"tool": "tool", "id": "b", "accept_source": "policy"}]
+
+
+def test_generate_report_writes_html_statistics_and_findings(monkeypatch, tmp_path):
+    monkeypatch.setattr(report_pipeline.ScannerRegistry, "get_all_scanners", staticmethod(lambda: []))
+    results = tmp_path / "myproject_20250101_000000"
+    (results / "summary").mkdir(parents=True)
+    lines = []
+    options = ReportOptions(
+        results_dir=results,
+        output_file=results / "summary" / "summary.html",
+        target_root=str(tmp_path / "missing"),
+        script_dirs=[tmp_path],
+    )
+    assert generate_report(options, log=lines.append)
+    assert "myproject" in options.output_file.read_text()
+    stats = json.loads((results / "summary" / "statistics.json").read_text())
+    assert stats["total_vulnerabilities"] == 0
+    assert json.loads((results / "summary" / "findings.json").read_text())["findings"] == []
+    assert (results / "summary" / "findings.db").is_file()
+    assert lines and all(line.startswith("[generate-html-report]") for line in lines)
+
+
+def test_large_reports_embed_findings_once_compressed_and_skip_tool_tables(monkeypatch, tmp_path):
+    tool = _scanner("Tool")
+    processor = _processor()
+    processor.html_func = lambda findings: "<table>per-tool rows</table>"
+    findings = [{"id": str(i), "severity": "LOW", "message": "m"} for i in range(30)]
+    monkeypatch.setattr(report_pipeline.ScannerRegistry, "get_all_scanners", staticmethod(lambda: [tool]))
+    results = tmp_path / "scan"
+    (results / "summary").mkdir(parents=True)
+    options = ReportOptions(
+        results_dir=results,
+        output_file=results / "summary" / "summary.html",
+        target_root=str(tmp_path / "missing"),
+        script_dirs=[tmp_path],
+        compress_findings=True,
+        tool_section_max_findings=10,
+    )
+    assert generate_report(options, parsed={"Tool": (processor, findings)}, log=lambda _line: None)
+    text = options.output_file.read_text()
+    assert 'data-encoding="gzip+base64"' in text
+    assert 'id="findings-data"' not in text
+    assert text.count('id="report-findings-data"') == 1
+    assert "per-tool rows" not in text
+    assert "detail section omitted" in text
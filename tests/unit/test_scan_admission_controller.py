@@ -0,0 +1,197 @@
+"""Scan admission: demand estimate from scanner hints/profile/history, packing by host capacity."""
+
+import asyncio
+import sys
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+_REPO = Path(__file__).resolve().parent.parent.parent
+if str(_REPO) not in sys.path:
+    sys.path.insert(0, str(_REPO))
+
+from worker.domain.job_execution.services.scan_admission_controller import (
+    ScanAdmissionController,
+    ScanResourceDemand,
+)
+
+HINTS = {
+    "CodeQL": {"cpu": 4, "memory_mb": 4096, "exclusive": True, "intensity": {}},
+    "Semgrep": {"cpu": 2, "memory_mb": 2048, "intensity": {"quick": "low"}},
+    "Gitleaks": {"cpu": 1, "memory_mb": 256, "intensity": {"quick": "low"}},
+}
+
+
+def test_estimate_uses_largest_selected_scanner_and_profile():
+    controller = ScanAdmissionController(cpu_capacity=16, memory_capacity_mb=32000)
+    assert controller.estimate(["CodeQL", "Gitleaks"], "standard", HINTS) == ScanResourceDemand(4.0, 4608)
+    assert controller.estimate(["Semgrep", "CodeQL"], "quick", HINTS) == ScanResourceDemand(4.0, 4608)
+    big = {"Big": {"cpu": 8, "memory_mb": 8192, "intensity": {"quick": "low"}}}
+    assert controller.estimate(["Big"], "quick", big) == ScanResourceDemand(4.0, 8704)
+    # Unknown selection: the scanner may run any of them
+    assert controller.estimate([], None, HINTS) == ScanResourceDemand(4.0, 4608)
+    # No metadata at all: previous fixed limits
+    assert controller.estimate(["Semgrep"], None, {}) == ScanResourceDemand(2.0, 4096)
+
+
+def test_estimate_parallel_scanners_and_observed_peak():
+    controller = ScanAdmissionController(cpu_capacity=16, memory_capacity_mb=32000)
+    demand = controller.estimate(["CodeQL", "Semgrep", "Gitleaks"], None, HINTS, max_parallel=2)
+    # CodeQL runs alone (exclusive); Semgrep + Gitleaks can overlap
+    assert demand == ScanResourceDemand(4.0, 4608)
+    controller.record_usage(
+        controller.history_key(["Gitleaks"], None),
+        {"memory_usage": {"max_usage": 4000 * 1024 * 1024}},
+    )
+    assert controller.estimate(["Gitleaks"], None, HINTS).memory_mb == 5000
+
+
+def test_estimate_is_clamped_to_capacity_and_limits_are_docker_strings():
+    controller = ScanAdmissionController(cpu_capacity=2, memory_capacity_mb=3000)
+    demand = controller.estimate(["CodeQL"], None, HINTS)
+    assert demand == ScanResourceDemand(2.0, 3000)
+    assert (demand.cpu_limit, demand.memory_limit) == ("2000m", "4096m")
+
+
+def test_reservations_and_limits_never_drop_below_previous_fixed_limits():
+    controller = ScanAdmissionController(cpu_capacity=16, memory_capacity_mb=32000)
+    cheap = controller.estimate(["Gitleaks"], "quick", HINTS)
+    assert cheap == ScanResourceDemand(2.0, 4096)  # admission reserves what the limits allow
+    assert (cheap.cpu_limit, cheap.memory_limit) == ("2000m", "4096m")
+    heavy = controller.estimate(["CodeQL"], None, HINTS)
+    assert (heavy.cpu_limit, heavy.memory_limit) == ("4000m", "4608m")
+
+
+def test_record_usage_uses_peak_sampled_while_running():
+    controller = ScanAdmissionController(cpu_capacity=16, memory_capacity_mb=32000)
+    key = controller.history_key(["Semgrep"], None)
+    # Stats of a stopped container: no memory figures, nothing to learn from
+    assert controller.record_usage(key, {"memory_usage": {}, "cpu_usage": {}}) is None
+    stats = {
+        "memory_usage": {"usage": 90 * 1024 * 1024, "stats": {"inactive_file": 10 * 1024 * 1024}},
+        "memory_peak_bytes": 4000 * 1024 * 1024,
+    }
+    assert controller.record_usage(key, stats) == 4000
+    assert controller.estimate(["Semgrep"], None, HINTS).memory_mb == 5000
+
+    other = ScanAdmissionController(cpu_capacity=16, memory_capacity_mb=32000)
+    other.observe(key, 4000)  # e.g. loaded from the shared history after a restart
+    assert other.estimate(["Semgrep"], None, HINTS).memory_mb == 5000
+
+
+def test_packs_cheap_scans_and_keeps_heavy_scans_apart():
+    controller = ScanAdmissionController(cpu_capacity=8, memory_capacity_mb=9000)
+    heavy = controller.estimate(["CodeQL"], None, HINTS)
+    cheap = controller.estimate(["Gitleaks"], "quick", HINTS)
+
+    first = uuid.uuid4()
+    assert controller.fits(heavy)
+    controller.admit(first, heavy)
+    assert not controller.fits(heavy)
+
+    cheap_jobs = []
+    while controller.fits(cheap):
+        job = uuid.uuid4()
+        controller.admit(job, cheap)
+        cheap_jobs.append(job)
+    assert len(cheap_jobs) == 1  # 4608 + 4096 MB; another 4096 MB would exceed 9000
+
+    controller.release(first)
+    assert controller.fits(cheap)
+    for job in cheap_jobs:
+        controller.release(job)
+    assert controller.reserved == ScanResourceDemand(0, 0)
+
+
+def _live_stats(usage_mb, inactive_file_mb):
+    """Trimmed ``container.stats(stream=False)`` of a running cgroup v2 container."""
+    mb = 1024 * 1024
+    return {
+        "cpu_usage": {"cpu_usage": {"total_usage": 123456789}, "online_cpus": 4},
+        "memory_usage": {
+            "usage": usage_mb * mb,
+            "limit": 4096 * mb,
+            "stats": {"anon": (usage_mb - inactive_file_mb) * mb, "inactive_file": inactive_file_mb * mb},
+        },
+        "network_io": {},
+        "block_io": {},
+    }
+
+
+def test_executor_samples_memory_peak_while_container_runs(monkeypatch):
+    pytest.importorskip("docker")
+    from worker.infrastructure.docker import docker_job_executor as executor_module
+
+    monkeypatch.setattr(executor_module, "MEMORY_SAMPLE_INTERVAL_SECONDS", 0.01)
+    running = [_live_stats(300, 100), _live_stats(2600, 200), _live_stats(1500, 1200)]
+    # Once the container has exited Docker reports no memory figures
+    exited = {"cpu_usage": {}, "memory_usage": {}, "network_io": {}, "block_io": {}}
+
+    class _Adapter:
+        def __init__(self):
+            self.exited = False
+
+        async def get_container_stats(self, container_id):
+            if self.exited:
+                return exited
+            return running.pop(0) if len(running) > 1 else running[0]
+
+    adapter = _Adapter()
+    executor = executor_module.DockerJobExecutor(adapter, exit_watcher=object())
+
+    async def wait_for_container(container_id, timeout):
+        while running[0]["memory_usage"]["usage"] != 1500 * 1024 * 1024:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.03)
+        adapter.exited = True
+        return 0
+
+    collected = {}
+
+    async def collect_results(job_execution, container_id, logs, exit_code, stats):
+        collected.update(stats)
+        return stats
+
+    monkeypatch.setattr(executor, "_get_container_logs", lambda cid: asyncio.sleep(0, result=[]))
+    monkeypatch.setattr(executor, "_wait_for_container", wait_for_container)
+    monkeypatch.setattr(executor, "_collect_results", collect_results)
+    job = SimpleNamespace(scan_id=uuid.uuid4(), execution_metadata={"container_wait_timeout_seconds": 600})
+
+    asyncio.run(executor._monitor_execution(job, "c1"))
+
+    assert collected["memory_usage"] == {}
+    assert collected["memory_peak_bytes"] == 2400 * 1024 * 1024
+    controller = ScanAdmissionController(cpu_capacity=16, memory_capacity_mb=32000)
+    assert controller.record_usage("standard:Semgrep", collected) == 2400
+
+
+def test_job_waiting_for_capacity_is_requeued_at_the_head(monkeypatch):
+    pytest.importorskip("docker")
+    pytest.importorskip("sqlalchemy")
+    from worker.domain.job_execution.services import job_orchestration_service as orchestration
+    from worker.infrastructure.queue_adapter import QueueAdapter
+
+    monkeypatch.setattr(orchestration, "load_scanner_resource_hints", lambda db: asyncio.sleep(0, result=HINTS))
+    queue = QueueAdapter("memory")
+    controller = ScanAdmissionController(cpu_capacity=8, memory_capacity_mb=6000)
+    controller.admit(uuid.uuid4(), controller.estimate(["CodeQL"], None, HINTS))
+    service = orchestration.JobOrchestrationService(
+        docker_job_executor=None,
+        result_processing_service=None,
+        queue_adapter=queue,
+        database_adapter=None,
+        max_concurrent_jobs=3,
+        admission_controller=controller,
+    )
+    heavy = {"scan_id": str(uuid.uuid4()), "scanners": ["CodeQL"]}
+    later = {"scan_id": str(uuid.uuid4()), "scanners": ["Gitleaks"]}
+    asyncio.run(queue.push_job(heavy))
+    asyncio.run(queue.push_job(later))
+
+    asyncio.run(service._process_queue())
+
+    # Not held in worker memory: still first in line for this and every other worker
+    assert queue.queue == [heavy, later]
+    assert service.active_jobs == {}
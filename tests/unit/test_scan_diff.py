@@ -0,0 +1,127 @@
+"""Tests for diff-only scan mode (changed paths vs. an earlier scan, merged tool reports)."""
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from scanner.core.base_scanner import BaseScanner, reset_invocation_env, set_invocation_env
+from scanner.core.findings_cache import ENV_SCANNER_CONFIG_HASH, IncrementalScan, ReportLayout
+from scanner.core.scan_diff import ENV_SCAN_DIFF_FILE, changed_paths, prepare_scan_diff, scan_diff_path
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+LAYOUT = ReportLayout(items_key="results", path_field="filename")
+
+
+def _git(repo: Path, *args: str) -> str:
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "t",
+        "GIT_AUTHOR_EMAIL": "t@example.com",
+        "GIT_COMMITTER_NAME": "t",
+        "GIT_COMMITTER_EMAIL": "t@example.com",
+    }
+    return subprocess.run(
+        ["git", "-C", str(repo), *args], capture_output=True, text=True, check=True, env=env
+    ).stdout.strip()
+
+
+def _repo_with_two_commits(tmp_path: Path):
+    repo = tmp_path / "target"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    for name in ("keep.py", "edit.py", "gone.py", "old_name.py", "lib1.py", "lib2.py", "lib3.py"):
+        (repo / name).write_text(f"# {name}\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "base")
+    base = _git(repo, "rev-parse", "HEAD")
+    (repo / "edit.py").write_text("# edited\n")
+    (repo / "gone.py").unlink()
+    _git(repo, "mv", "old_name.py", "new_name.py")
+    (repo / "added.py").write_text("# added\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "head")
+    return repo, base
+
+
+def _base_scan(results: Path, base_commit: str, tool_version=None) -> Path:
+    base_dir = results / "base-scan"
+    (base_dir / "logs").mkdir(parents=True)
+    (base_dir / "tools" / "bandit").mkdir(parents=True)
+    (base_dir / "logs" / "checkpoint.json").write_text(json.dumps({
+        "target_fingerprint": base_commit,
+        "steps": {"scanner:bandit": {
+            "status": "completed", "config_hash": "cfg", "tool_version": tool_version,
+        }},
+    }))
+    return base_dir
+
+
+class _Dummy(BaseScanner):
+    def scan(self):
+        return True
+
+
+def test_changed_paths_skips_deletions_and_treats_renames_as_new(tmp_path: Path):
+    repo, base = _repo_with_two_commits(tmp_path)
+    assert sorted(changed_paths(repo, base)) == ["added.py", "edit.py", "new_name.py"]
+    assert changed_paths(repo, "0" * 40) is None
+
+
+def test_prepare_scan_diff_publishes_changed_paths(tmp_path: Path, monkeypatch):
+    monkeypatch.delenv(ENV_SCAN_DIFF_FILE, raising=False)
+    repo, base = _repo_with_two_commits(tmp_path)
+    results = tmp_path / "results"
+    _base_scan(results, base)
+    current = results / "current"
+
+    diff, msg = prepare_scan_diff(repo, current, results, "base-scan")
+    assert diff is not None and diff.base_commit == base
+    assert diff.changed == {"added.py", "edit.py", "new_name.py"}
+    assert "3 changed file(s)" in msg
+    assert json.loads(scan_diff_path(current).read_text())["base_scan_id"] == "base-scan"
+    # Passed per scanner run, never through the process env
+    assert ENV_SCAN_DIFF_FILE not in os.environ
+
+    assert prepare_scan_diff(repo, current, results, "missing")[0] is None
+    assert not scan_diff_path(current).exists()
+    assert prepare_scan_diff(repo, current, results, "../results")[0] is None
+
+
+def test_incremental_scan_merges_base_findings_for_unchanged_files(tmp_path: Path, monkeypatch):
+    monkeypatch.delenv(ENV_SCAN_DIFF_FILE, raising=False)
+    repo, base = _repo_with_two_commits(tmp_path)
+    results = tmp_path / "results"
+    base_dir = _base_scan(results, base)
+    (base_dir / "tools" / "bandit" / "report.json").write_text(json.dumps({"results": [
+        {"filename": f"{repo}/keep.py", "test_id": "B101"},
+        {"filename": f"{repo}/edit.py", "test_id": "B102"},
+        {"filename": f"{repo}/gone.py", "test_id": "B103"},
+    ]}))
+    prepare_scan_diff(repo, results / "current", results, "base-scan")
+    diff_file = str(scan_diff_path(results / "current"))
+    rel_paths = sorted(p.name for p in repo.glob("*.py"))
+
+    token = set_invocation_env(
+        {ENV_SCANNER_CONFIG_HASH: "cfg", "SSC_FINDINGS_CACHE": "0", ENV_SCAN_DIFF_FILE: diff_file}
+    )
+    try:
+        scanner = _Dummy("dummy", str(repo), str(results / "current" / "tools" / "bandit"), str(tmp_path / "d.log"))
+        incremental = IncrementalScan(scanner, "bandit", LAYOUT, lambda: rel_paths)
+        assert incremental.targets == ["added.py", "edit.py", "new_name.py"]
+        report = incremental.finish(
+            {"results": [{"filename": f"{repo}/added.py", "test_id": "B104"}]}, ok=True
+        )
+        assert sorted(r["test_id"] for r in report["results"]) == ["B101", "B104"]
+
+        # Base ran with another scanner config: no reuse, full run
+        set_invocation_env(
+            {ENV_SCANNER_CONFIG_HASH: "other", "SSC_FINDINGS_CACHE": "0", ENV_SCAN_DIFF_FILE: diff_file}
+        )
+        scanner = _Dummy("dummy", str(repo), str(results / "current" / "tools" / "bandit"), str(tmp_path / "d.log"))
+        assert IncrementalScan(scanner, "bandit", LAYOUT, lambda: rel_paths).targets is None
+    finally:
+        reset_invocation_env(token)
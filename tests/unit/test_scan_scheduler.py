@@ -0,0 +1,94 @@
+"""Tests for scanner.core.scan_scheduler (parallel scanner admission)."""
+import asyncio
+import os
+from pathlib import Path
+
+from scanner.core.scan_scheduler import (
+    ResourceDemand,
+    ScanResourceBudget,
+    ScannerResourcePool,
+    detect_cpu_budget,
+    detect_memory_budget_mb,
+)
+from scanner.core.scanner_assets.models import ScannerResourceConfig
+
+
+def test_budget_defaults_to_sequential(monkeypatch):
+    monkeypatch.delenv("SSC_SCAN_MAX_PARALLEL", raising=False)
+    monkeypatch.setenv("SSC_SCAN_CPU_BUDGET", "8")
+    b = ScanResourceBudget.from_env()
+    assert b.max_parallel == 1
+    assert not b.parallel
+
+
+def test_budget_auto_uses_cpu(monkeypatch):
+    monkeypatch.setenv("SSC_SCAN_MAX_PARALLEL", "auto")
+    monkeypatch.setenv("SSC_SCAN_CPU_BUDGET", "6")
+    monkeypatch.setenv("SSC_SCAN_MEMORY_BUDGET_MB", "8000")
+    b = ScanResourceBudget.from_env()
+    assert b.max_parallel == 6
+    assert b.cpu == 6.0
+    assert b.memory_mb == 8000
+
+
+def test_demand_clamped_to_budget():
+    b = ScanResourceBudget(cpu=2, memory_mb=1000, max_parallel=4)
+    d = b.demand_for(ScannerResourceConfig(cpu=8, memory_mb=4096))
+    assert d.cpu == 2 and d.memory_mb == 1000
+    assert b.demand_for(None) == ResourceDemand(cpu=1.0, memory_mb=512)
+
+
+def test_detect_cgroup_v2_limits(tmp_path: Path):
+    (tmp_path / "cpu.max").write_text("200000 100000\n")
+    (tmp_path / "memory.max").write_text(str(4 * 1024 * 1024 * 1024))
+    assert detect_cpu_budget(tmp_path) == 2.0
+    assert detect_memory_budget_mb(tmp_path) == 4096 - 512
+
+
+def test_pool_respects_cpu_and_exclusive():
+    async def scenario():
+        pool = ScannerResourcePool(ScanResourceBudget(cpu=4, memory_mb=0, max_parallel=4))
+        a = ResourceDemand(cpu=2, memory_mb=0)
+        await pool.acquire(a)
+        await pool.acquire(a)
+        assert pool.running == 2
+
+        third = asyncio.create_task(pool.acquire(ResourceDemand(cpu=1, memory_mb=0)))
+        await asyncio.sleep(0)
+        assert not third.done()
+        await pool.release(a)
+        await asyncio.wait_for(third, 1)
+        assert pool.running == 2
+
+        excl = asyncio.create_task(pool.acquire(ResourceDemand(cpu=1, memory_mb=0, exclusive=True)))
+        await asyncio.sleep(0)
+        assert not excl.done()
+        await pool.release(a)
+        await pool.release(ResourceDemand(cpu=1, memory_mb=0))
+        await asyncio.wait_for(excl, 1)
+        assert pool.running == 1
+
+    asyncio.run(scenario())
+
+
+def test_invocation_env_is_context_local(monkeypatch):
+    from scanner.core.base_scanner import BaseScanner, reset_invocation_env, set_invocation_env
+
+    class Dummy(BaseScanner):
+        def scan(self):
+            return True
+
+    monkeypatch.setenv("SCANNER_TIMEOUT_SECONDS", "100")
+
+    def build(env):
+        token = set_invocation_env(env)
+        try:
+            return Dummy("dummy", "/tmp", "/tmp", "/tmp/dummy.log")
+        finally:
+            reset_invocation_env(token)
+
+    a = build({"SCANNER_TIMEOUT_SECONDS": "30", "TOOL_FLAG": "a"})
+    b = build({"TOOL_FLAG": "b"})
+    assert a.get_timeout() == 30 and b.get_timeout() == 100
+    assert a.getenv("TOOL_FLAG") == "a" and b.process_env()["TOOL_FLAG"] == "b"
+    assert "TOOL_FLAG" not in os.environ
@@ -0,0 +1,52 @@
+"""Tests for the merged single-invocation Semgrep run (config and finding de-duplication)."""
+from scanner.plugins.semgrep.scanner import (
+    dedupe_config_args,
+    dedupe_results,
+    render_sarif_report,
+    render_text_report,
+)
+
+
+def test_dedupe_config_args_keeps_first_occurrence():
+    args = [
+        "--config", "p/ci",
+        "--config", "p/owasp-top-ten",
+        "--config", "p/security-audit",
+        "--config", "p/owasp-top-ten",
+        "--config", "auto",
+    ]
+    assert dedupe_config_args(args) == [
+        "--config", "p/ci",
+        "--config", "p/owasp-top-ten",
+        "--config", "p/security-audit",
+        "--config", "auto",
+    ]
+
+
+def test_dedupe_results_by_rule_and_location():
+    hit = {"check_id": "python.eval", "path": "a.py", "start": {"line": 3, "offset": 40}, "end": {"line": 3, "offset": 52}}
+    other_line = {**hit, "start": {"line": 9, "offset": 120}, "end": {"line": 9, "offset": 130}}
+    other_rule = {**hit, "check_id": "python.exec"}
+    data = {"results": [hit, dict(hit), other_line, other_rule], "errors": []}
+    assert dedupe_results(data) == 1
+    assert data["results"] == [hit, other_line, other_rule]
+    assert data["errors"] == []
+
+
+def test_incremental_reports_render_from_merged_json():
+    cached = {"check_id": "python.eval", "path": "/target/a.py", "start": {"line": 3, "col": 1},
+              "end": {"line": 3, "col": 9}, "extra": {"severity": "ERROR", "message": "eval"}}
+    fresh = {**cached, "path": "/target/b.py", "extra": {"severity": "INFO", "message": "note"}}
+    data = {"results": [fresh, cached], "errors": []}
+
+    text = render_text_report(data)
+    assert text.index("/target/a.py") < text.index("/target/b.py")
+    assert "2 finding(s) in 2 file(s)" in text
+
+    sarif = render_sarif_report(data)
+    results = sarif["runs"][0]["results"]
+    assert [r["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] for r in results] == [
+        "/target/b.py", "/target/a.py",
+    ]
+    assert [r["level"] for r in results] == ["note", "error"]
+    assert sarif["runs"][0]["tool"]["driver"]["rules"] == [{"id": "python.eval"}]
@@ -0,0 +1,57 @@
+"""SSE fan-out: sharded registry, per-connection coalescing and bounded buffers."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+
+from infrastructure.realtime import sse_manager
+from infrastructure.realtime.sse_manager import SseConnection
+
+
+def _scan_update(scan_id, status):
+    return {"v": 1, "type": "scan_update", "scope": "all", "payload": {"scan_id": scan_id, "status": status}}
+
+
+def _steps(seq):
+    return {"v": 1, "type": "scan_steps", "scope": "scan", "payload": {"scan_id": "s1", "seq": seq}}
+
+
+def test_superseded_scan_updates_coalesce_and_ordered_events_keep_order():
+    async def run():
+        conn = SseConnection(maxsize=10)
+        conn.put_nowait(_scan_update("s1", "pending"))
+        conn.put_nowait(_steps(1))
+        conn.put_nowait(_scan_update("s1", "running"))
+        conn.put_nowait(_steps(2))
+        return [await conn.get() for _ in range(conn.qsize())]
+
+    out = asyncio.run(run())
+    assert [e["payload"].get("status", e["payload"].get("seq")) for e in out] == ["running", 1, 2]
+
+
+def test_full_buffer_drops_oldest_pending_event():
+    async def run():
+        conn = SseConnection(maxsize=2)
+        for seq in (1, 2):
+            assert conn.put_nowait(_steps(seq))
+        assert not conn.put_nowait(_steps(3))
+        return conn.dropped, [(await conn.get())["payload"]["seq"] for _ in range(2)]
+
+    assert asyncio.run(run()) == (1, [2, 3])
+
+
+def test_emit_and_broadcast_reach_subscribed_connections_only():
+    async def run():
+        a = await sse_manager.sse_subscribe("user-a")
+        b = await sse_manager.sse_subscribe("guest:b")
+        try:
+            await sse_manager.sse_emit_envelope("user-a", _steps(1))
+            await sse_manager.sse_broadcast_envelope(_scan_update("s2", "queued"))
+            return a.qsize(), b.qsize()
+        finally:
+            await sse_manager.sse_unsubscribe("user-a", a)
+            await sse_manager.sse_unsubscribe("guest:b", b)
+
+    assert asyncio.run(run()) == (2, 1)
+    assert sse_manager.subscriber_count() == 0
@@ -0,0 +1,40 @@
+"""Recent step_delta buffer used for resume-from-seq catch-up (GET /scans/{id}/steps/events)."""
+import pytest
+
+pytest.importorskip("pydantic_settings")
+
+from infrastructure.realtime.step_event_buffer import StepEventBuffer
+
+
+def _event(seq, epoch="e1", scan_id="s1"):
+    return {"type": "step_delta", "scan_id": scan_id, "epoch": epoch, "seq": seq, "step": {"number": 1}}
+
+
+def test_since_returns_events_after_seq_and_drops_duplicates():
+    buf = StepEventBuffer()
+    for seq in (1, 2, 3):
+        assert buf.record(_event(seq))
+    assert not buf.record(_event(2))
+    assert buf.position("s1") == ("e1", 3)
+    assert [e["seq"] for e in buf.since("s1", "e1", 1)] == [2, 3]
+    assert buf.since("s1", "e1", 3) == []
+
+
+def test_since_requests_resync_for_evicted_gap_or_new_epoch():
+    buf = StepEventBuffer(max_events=2)
+    for seq in (1, 2, 3):
+        buf.record(_event(seq))
+    assert buf.since("s1", "e1", 0) is None
+    assert [e["seq"] for e in buf.since("s1", "e1", 1)] == [2, 3]
+    buf.record(_event(1, epoch="e2"))
+    assert buf.since("s1", "e1", 3) is None
+    assert buf.position("s1") == ("e2", 1)
+    assert buf.since("unknown", "e1", 0) is None
+
+
+def test_least_recently_updated_scans_are_evicted():
+    buf = StepEventBuffer(max_scans=2)
+    for scan_id in ("a", "b", "c"):
+        buf.record(_event(1, scan_id=scan_id))
+    assert buf.position("a") == (None, 0)
+    assert buf.position("c") == ("e1", 1)
@@ -0,0 +1,109 @@
+"""StepRegistry scan_steps mirror: coalesced per step, flushed as one batch, ordered by seq."""
+import asyncio
+from types import SimpleNamespace
+
+from scanner.core.step_registry import StepRegistry
+
+
+def test_step_changes_are_coalesced_into_one_ordered_batch(tmp_path):
+    scan_id = "11111111-1111-1111-1111-111111111111"
+    batches = []
+
+    async def run():
+        reg = StepRegistry(scan_id, tmp_path / scan_id)
+        reg.database_url = "postgresql://test"
+
+        async def upsert(rows):
+            batches.append(rows)
+            return True
+
+        reg._upsert_steps_db = upsert
+        reg.bind_event_loop()
+        reg.start_step("Semgrep")
+        reg.start_substep("Semgrep", "rules")
+        reg.complete_substep("Semgrep", "rules")
+        reg.complete_step("Semgrep")
+        reg.start_step("Trivy")
+        await reg.flush_db()
+        reg.fail_step("Trivy", "boom")
+        await reg.flush_db()
+        return reg
+
+    asyncio.run(run())
+    first, second = batches
+    assert [(row[0], row[3]) for row in first] == [(1, "completed"), (2, "running")]
+    assert '"rules"' in first[0][7]
+    assert [(row[0], row[3]) for row in second] == [(2, "failed")]
+    assert second[0][1] > first[1][1]
+
+
+def test_flushed_rows_record_the_event_position_they_cover(tmp_path):
+    scan_id = "22222222-2222-2222-2222-222222222222"
+    batches = []
+    published = []
+
+    async def run():
+        reg = StepRegistry(scan_id, tmp_path / scan_id)
+        reg.database_url = "postgresql://test"
+        reg._events = SimpleNamespace(publish=published.append)
+
+        async def upsert(rows):
+            batches.append(rows)
+            return True
+
+        reg._upsert_steps_db = upsert
+        reg.bind_event_loop()
+        reg.start_step("Semgrep")
+        reg.complete_step("Semgrep")
+        await reg.flush_db()
+        # Published live right away, but only in the DB after the next flush
+        reg.start_step("Trivy")
+        assert len(published) == 3
+        await reg.flush_db()
+        return reg
+
+    reg = asyncio.run(run())
+    first, second = batches
+    assert {row[9:] for row in first} == {(reg._event_epoch, 2)}
+    assert [row[9:] for row in second] == [(reg._event_epoch, 3)]
+    assert published[-1]["seq"] == 3
+
+
+def test_failed_upsert_is_retried_by_the_next_flush(tmp_path):
+    scan_id = "33333333-3333-3333-3333-333333333333"
+    batches = []
+
+    async def run():
+        reg = StepRegistry(scan_id, tmp_path / scan_id)
+        reg.database_url = "postgresql://test"
+
+        async def upsert(rows):
+            batches.append(rows)
+            return len(batches) > 1  # DB unreachable for the first batch
+
+        reg._upsert_steps_db = upsert
+        reg.bind_event_loop()
+        reg.start_step("Semgrep")
+        reg.start_step("Trivy")
+        await reg.flush_db()
+        reg.complete_step("Trivy")
+        await reg.flush_db()
+        await reg.flush_db()
+
+    asyncio.run(run())
+    failed, retried = batches
+    # Semgrep's failed row is retried as is; Trivy's newer row replaced the failed one
+    assert [(row[0], row[3]) for row in retried] == [(1, "running"), (2, "completed")]
+    assert retried[0][:9] == failed[0][:9]
+    assert retried[1][1] > failed[1][1]
+
+
+def test_flush_hands_queued_step_events_to_the_publisher(tmp_path):
+    scan_id = "33333333-3333-3333-3333-333333333333"
+    reg = StepRegistry(scan_id, tmp_path / scan_id)
+    flushed = []
+    reg._events = SimpleNamespace(publish=lambda event: None, flush=flushed.append)
+    reg.flush(timeout=1.5)
+    assert flushed == [1.5]
+    reg._events = None
+    reg.flush()  # no REDIS_URL: nothing to do
@@ -0,0 +1,71 @@
+"""steps.log deltas + snapshots (shared.steps_log) and StepRegistry resume from them."""
+import json
+
+from scanner.core.step_registry import StepRegistry, StepStatus
+from shared.steps_log import StepsLogWriter, index_path, read_steps
+
+
+def _registry(tmp_path, scan_id="scan-1"):
+    return StepRegistry(scan_id, tmp_path / scan_id)
+
+
+def test_substep_updates_append_small_deltas_and_fold_to_current_state(tmp_path):
+    reg = _registry(tmp_path)
+    reg.start_step("CodeQL", "running")
+    for i in range(5):
+        reg.start_substep("CodeQL", f"query-{i}")
+        reg.complete_substep("CodeQL", f"query-{i}", "done")
+    reg.complete_step("CodeQL", "ok")
+
+    lines = [json.loads(line) for line in reg.steps_log.read_text().splitlines()]
+    substep_deltas = [r for r in lines if "substep" in r]
+    assert len(substep_deltas) == 10
+    assert all("substeps" not in r["step"] for r in substep_deltas)
+
+    (step,) = read_steps(reg.steps_log)
+    assert step["status"] == "completed"
+    assert [s["name"] for s in step["substeps"]] == [f"query-{i}" for i in range(5)]
+    assert all(s["status"] == "completed" for s in step["substeps"])
+
+
+def test_reader_seeks_to_latest_snapshot(tmp_path):
+    log = tmp_path / "steps.log"
+    writer = StepsLogWriter(log, snapshot_every=2)
+    writer.init("t0")
+    state = {"number": 1, "name": "Trivy", "status": "running"}
+    writer.append({"step": state}, "t1", snapshot=lambda: [state])
+    writer.append({"step": state, "substep": {"name": "a", "status": "running"}}, "t2",
+                  snapshot=lambda: [dict(state, substeps=[{"name": "a", "status": "running"}])])
+    offset = json.loads(index_path(log).read_text())["snapshot_offset"]
+    with open(log, "rb") as f:
+        f.seek(offset)
+        assert "snapshot" in json.loads(f.readline())
+    writer.append({"step": dict(state, status="completed")}, "t3")
+
+    # Lines before the snapshot are not read again
+    with open(log, "r+b") as f:
+        f.seek(0)
+        f.write(b"x" * (offset - 1))
+    (step,) = read_steps(log)
+    assert step["status"] == "completed"
+    assert step["substeps"] == [{"name": "a", "status": "running"}]
+
+
+def test_legacy_full_step_lines_and_registry_resume(tmp_path):
+    results = tmp_path / "scan-2"
+    (results / "logs").mkdir(parents=True)
+    legacy = [
+        {"init": "SimpleSecCheck Steps Log"},
+        {"number": 1, "name": "Git Clone", "status": "running", "substeps": []},
+        {"number": 1, "name": "Git Clone", "status": "completed", "message": "cloned",
+         "substeps": [{"name": "fetch", "status": "completed"}]},
+    ]
+    (results / "logs" / "steps.log").write_text("\n".join(json.dumps(r) for r in legacy) + "\n")
+
+    reg = StepRegistry("scan-2", results)
+    step = reg.get_step("Git Clone")
+    assert step.status == StepStatus.COMPLETED
+    assert [s.name for s in step.substeps] == ["fetch"]
+
+    reg.start_step("Semgrep")
+    assert [s["name"] for s in read_steps(reg.steps_log)] == ["Git Clone", "Semgrep"]
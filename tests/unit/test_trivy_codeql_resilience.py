@@ -4,7 +4,12 @@ from pathlib import Path
 
 from scanner.core.command_retry import run_with_retry
 from scanner.plugins.codeql.scanner import codeql_pack_cached
-from scanner.plugins.trivy.scanner import trivy_db_usable
+from scanner.plugins.trivy.scanner import (
+    TrivyScanner,
+    normalize_trivy_scanners,
+    split_trivy_report,
+    trivy_db_usable,
+)
 
 
 def test_trivy_db_usable_requires_real_db(tmp_path):
@@ -16,6 +21,51 @@ def test_trivy_db_usable_requires_real_db(tmp_path):
     assert trivy_db_usable(str(cache))
 
 
+def test_split_trivy_report_by_scanner_and_severity():
+    combined = {
+        "SchemaVersion": 2,
+        "ArtifactName": ".",
+        "Results": [
+            {"Target": "requirements.txt", "Class": "lang-pkgs", "Vulnerabilities": [
+                {"VulnerabilityID": "CVE-1", "Severity": "HIGH"},
+                {"VulnerabilityID": "CVE-2", "Severity": "LOW"},
+            ]},
+            {"Target": "app.env", "Class": "secret", "Secrets": [{"RuleID": "aws", "Severity": "CRITICAL"}]},
+            {"Target": "Dockerfile", "Class": "config", "Misconfigurations": [{"ID": "DS002", "Severity": "LOW"}]},
+            {"Target": "LICENSE", "Class": "license-file", "Licenses": [{"Name": "GPL-3.0", "Severity": "HIGH"}]},
+        ],
+    }
+    main = split_trivy_report(combined, normalize_trivy_scanners("vuln,secret,config"), ["HIGH", "CRITICAL"])
+    assert main["SchemaVersion"] == 2
+    assert [r["Class"] for r in main["Results"]] == ["lang-pkgs", "secret", "config"]
+    assert [v["VulnerabilityID"] for v in main["Results"][0]["Vulnerabilities"]] == ["CVE-1"]
+    assert main["Results"][2]["Misconfigurations"] == []
+
+    deep = split_trivy_report(combined, ["secret", "misconfig"])
+    assert [r["Target"] for r in deep["Results"]] == ["app.env", "Dockerfile"]
+    assert deep["Results"][1]["Misconfigurations"][0]["ID"] == "DS002"
+    assert len(combined["Results"][0]["Vulnerabilities"]) == 2
+
+
+def test_single_pass_scans_license_only_when_reported(tmp_path):
+    scanner = TrivyScanner(str(tmp_path), str(tmp_path / "results"), str(tmp_path / "scan.log"))
+    assert scanner._single_pass_scanners() == ["vuln", "secret", "misconfig"]
+
+
+def test_failed_single_pass_leaves_fallback_to_per_category_passes(tmp_path):
+    results = tmp_path / "results"
+    scanner = TrivyScanner(str(tmp_path), str(results), str(tmp_path / "scan.log"))
+    scanner.run_command = lambda cmd, **kw: subprocess.CompletedProcess(cmd, 1)
+    outputs = [results / n for n in ("report.json", "report.txt", "secrets-config.json", "report.sarif")]
+    assert scanner._scan_single_pass(["vuln", "secret"], *outputs, [], [], []) is False
+    assert not any(p.exists() for p in outputs)
+    assert not (results / ".trivy-combined.json").exists()
+
+
+def test_normalize_trivy_scanners():
+    assert normalize_trivy_scanners(" vuln, config ,vuln,Secret") == ["vuln", "misconfig", "secret"]
+
+
 def test_run_with_retry_succeeds_on_second_attempt():
     calls = {"n": 0}
 
@@ -29,8 +79,7 @@ def test_run_with_retry_succeeds_on_second_attempt():
     assert calls["n"] == 2
 
 
-def test_codeql_pack_cached_detects_version_dir(tmp_path, monkeypatch):
-    monkeypatch.setenv("CODEQL_HOME", str(tmp_path))
+def test_codeql_pack_cached_detects_version_dir(tmp_path):
     pack_root = tmp_path / "packages" / "codeql" / "javascript-queries" / "1.0.0"
     pack_root.mkdir(parents=True)
     assert codeql_pack_cached("codeql/javascript-queries", tmp_path)
@@ -0,0 +1,182 @@
+"""Warm scanner container pool: reuse for matching git_repo jobs, recycling, cold fallback."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+_REPO = Path(__file__).resolve().parent.parent.parent
+if str(_REPO) not in sys.path:
+    sys.path.insert(0, str(_REPO))
+
+from worker.domain.job_execution.entities.container_spec import ContainerSpec
+from worker.infrastructure.docker.warm_container_pool import WarmContainerPool
+
+
+class _Adapter:
+    client = object()
+
+    def __init__(self):
+        self.created = []
+        self.removed = []
+        self.execs = []
+        self.updates = []
+
+    async def update_container_limits(self, container_id, limits):
+        self.updates.append((container_id, limits))
+
+    async def create_container(self, config):
+        self.created.append(config)
+        return f"warm{len(self.created)}"
+
+    async def start_container(self, container_id):
+        pass
+
+    async def get_container_state(self, container_id):
+        return "exited" if container_id in self.removed else "running"
+
+    async def stop_container(self, container_id):
+        pass
+
+    async def remove_container(self, container_id):
+        self.removed.append(container_id)
+
+    async def exec_in_container(self, container_id, command, environment=None):
+        self.execs.append((container_id, command, environment))
+        return 0, "scan output\n"
+
+
+def _spec(scan_id, target_type="git_repo", mem="4g"):
+    spec = ContainerSpec(
+        image="simpleseccheck-scanner",
+        command=["python3", "-m", "scanner.core.orchestrator"],
+        environment={"SCAN_ID": scan_id, "TARGET_TYPE": target_type, "PUID": "1000", "PGID": "1000"},
+        memory_limit=mem,
+    )
+    spec.add_volume("/host/results", "/app/results")
+    return spec
+
+
+async def _settle(pool):
+    while pool._tasks:
+        await asyncio.gather(*list(pool._tasks))
+
+
+def test_pool_key_ignores_scan_env_and_skips_other_targets():
+    assert WarmContainerPool.pool_key(_spec("a")) == WarmContainerPool.pool_key(_spec("b"))
+    # Limits are applied per job on acquire, so they do not split the pool
+    assert WarmContainerPool.pool_key(_spec("a")) == WarmContainerPool.pool_key(_spec("a", mem="8g"))
+    assert WarmContainerPool.pool_key(_spec("a", target_type="local_mount")) is None
+
+
+def test_acquire_run_release_and_recycle():
+    adapter = _Adapter()
+    pool = WarmContainerPool(adapter, size=1, max_scans=2)
+
+    async def run():
+        assert await pool.acquire(_spec("a")) is None  # cold start, pool warms up behind it
+        await _settle(pool)
+        created = adapter.created[0]
+        assert created["command"][-1] == "serve"
+        assert "SCAN_ID" not in created["environment"]
+        assert created["labels"]["simpleseccheck.job_type"] == "warm-pool"
+
+        first = await pool.acquire(_spec("b", mem="6g"))
+        assert first == "warm1"
+        assert adapter.updates == [("warm1", {"mem_limit": "6g"})]
+        assert await pool.run(first, {"SCAN_ID": "b"}, timeout=5) == (True, 0, "scan output\n")
+        assert adapter.execs[0][1][-1] == "run" and adapter.execs[0][2] == {"SCAN_ID": "b"}
+        await pool.release(first, {"memory_usage": {"usage": 100 * 1024 * 1024}})
+        await _settle(pool)
+        assert pool._idle[WarmContainerPool.pool_key(_spec("x"))] == ["warm1"]
+
+        # Second scan reaches max_scans: container is replaced
+        assert await pool.acquire(_spec("c")) == "warm1"
+        await pool.release("warm1")
+        await _settle(pool)
+        assert "warm1" in adapter.removed
+        assert await pool.acquire(_spec("d")) == "warm2"
+
+        # Memory growth and unclean runs also recycle
+        await pool.release("warm2", {"memory_usage": {"usage": 2048 * 1024 * 1024, "stats": {"inactive_file": 0}}})
+        await _settle(pool)
+        assert "warm2" in adapter.removed
+        third = await pool.acquire(_spec("e"))
+        await pool.release(third, reusable=False)
+        await _settle(pool)
+        assert third in adapter.removed
+
+    asyncio.run(run())
+
+
+def test_forget_on_cancel_starts_a_replacement():
+    adapter = _Adapter()
+    pool = WarmContainerPool(adapter, size=1)
+
+    async def run():
+        await pool.acquire(_spec("a"))
+        await _settle(pool)
+        assert await pool.acquire(_spec("b")) == "warm1"
+        await pool.forget("warm1")
+        await _settle(pool)
+        assert pool._busy == {}
+        assert pool._idle[WarmContainerPool.pool_key(_spec("x"))] == ["warm2"]
+        # The cancelled job's release is a no-op
+        await pool.release("warm1")
+        assert pool._idle[WarmContainerPool.pool_key(_spec("x"))] == ["warm2"]
+
+    asyncio.run(run())
+
+
+def test_disabled_pool_never_creates_containers():
+    adapter = _Adapter()
+    pool = WarmContainerPool(adapter, size=0)
+
+    async def run():
+        assert await pool.acquire(_spec("a")) is None
+        await _settle(pool)
+
+    asyncio.run(run())
+    assert adapter.created == []
+
+
+def test_warm_runner_clears_scratch_but_keeps_control_socket(tmp_path, monkeypatch):
+    from scanner.core import warm_runner
+
+    target, tmp, var_tmp = tmp_path / "target", tmp_path / "tmp", tmp_path / "var_tmp"
+    for d in (target, tmp, var_tmp):
+        (d / "leftover").mkdir(parents=True)
+        (d / "leftover" / "secret.txt").write_text("previous scan")
+    (tmp / "ssc-warm").mkdir()
+    monkeypatch.setattr(warm_runner, "SCRATCH_TMPFS_DIRS", (str(tmp), str(var_tmp)))
+    monkeypatch.setenv(warm_runner.ENV_WARM_RUNNER_SOCKET, str(tmp / "ssc-warm" / "control.sock"))
+
+    warm_runner._clear_scratch({"TARGET_TYPE": "git_repo", "TARGET_PATH_IN_CONTAINER": str(target)})
+
+    assert list(target.iterdir()) == []
+    assert list(tmp.iterdir()) == [tmp / "ssc-warm"]
+    assert list(var_tmp.iterdir()) == []
+
+
+def test_exec_in_container_streams_into_bounded_tail():
+    import pytest
+
+    pytest.importorskip("docker")
+    from worker.infrastructure.docker_adapter import DockerAdapter
+
+    class _Api:
+        def exec_create(self, container_id, command, **kwargs):
+            return {"Id": "exec1"}
+
+        def exec_start(self, exec_id, stream=False):
+            assert stream is True
+            yield b"line 1\nline "
+            yield b"2\nline 3\nunterminated"
+
+        def exec_inspect(self, exec_id):
+            return {"ExitCode": 3}
+
+    adapter = DockerAdapter.__new__(DockerAdapter)
+    adapter.client = type("Client", (), {"api": _Api()})()
+    code, output = asyncio.run(adapter.exec_in_container("c1", ["run"], tail_lines=2))
+    assert code == 3
+    assert output == "line 3\nunterminated"
@@ -16,8 +16,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from worker.config.db_url import build_database_url_from_postgres_env
 from worker.domain.job_execution.services.job_orchestration_service import JobOrchestrationService
+from worker.infrastructure.docker.container_exit_watcher import ContainerExitWatcher
 from worker.infrastructure.docker.docker_job_executor import DockerJobExecutor
+from worker.infrastructure.docker.warm_container_pool import WarmContainerPool
 from worker.domain.job_execution.services.result_processing_service import ResultProcessingService
+from worker.domain.job_execution.services.scan_admission_controller import ScanAdmissionController
 from worker.infrastructure.docker_adapter import DockerAdapter
 from worker.infrastructure.queue_adapter import QueueAdapter
 from worker.infrastructure.database_adapter import PostgreSQLAdapter
@@ -208,6 +211,7 @@ async def main():
         logger.info("Queue adapter initialized", queue_type=args.queue_type)
         logger.info("Max concurrent jobs", max_jobs=args.max_concurrent_jobs)
     
+    exit_watcher = None
     try:
         # Initialize infrastructure adapters
         docker_adapter = DockerAdapter()
@@ -230,15 +234,37 @@ async def main():
                 logger.warning(f"Failed to pre-load scanners on startup: {e}")
             # Don't fail startup - scanners will be loaded on first API request
         
-        # Initialize services
-        docker_job_executor = DockerJobExecutor(docker_adapter, database_adapter)
+        # Warm scanner containers for git_repo scans (SSC_WORKER_WARM_POOL_SIZE=0 disables)
+        warm_pool = WarmContainerPool.from_env(docker_adapter)
+        await warm_pool.remove_stale()
+        
+        # Resource-aware admission of scans (SSC_WORKER_ADMISSION_CONTROL=0: job count only, fixed limits)
+        admission_controller = None
+        if os.environ.get("SSC_WORKER_ADMISSION_CONTROL", "1").strip().lower() not in ("0", "false", "no", "off"):
+            host_cpus, host_memory_mb = (
+                await docker_adapter.get_host_resources() if docker_adapter.client else (0.0, 0)
+            )
+            admission_controller = ScanAdmissionController.from_env(host_cpus, host_memory_mb)
+            if setup_complete:
+                logger.info(
+                    "Scan admission capacity",
+                    cpu=admission_controller.cpu_capacity,
+                    memory_mb=admission_controller.memory_capacity_mb,
+                )
+        
+        # Initialize services (one Docker events stream for all container exits)
+        exit_watcher = ContainerExitWatcher(docker_adapter)
+        docker_job_executor = DockerJobExecutor(
+            docker_adapter, database_adapter, warm_pool=warm_pool, exit_watcher=exit_watcher
+        )
         result_processing_service = ResultProcessingService(database_adapter)
         job_orchestration_service = JobOrchestrationService(
             docker_job_executor,
             result_processing_service,
             queue_adapter,
             database_adapter,
-            args.max_concurrent_jobs
+            args.max_concurrent_jobs,
+            admission_controller=admission_controller,
         )
         
         # Start worker and API server in parallel
@@ -254,6 +280,10 @@ async def main():
         if setup_complete:
             logger.error("Worker failed", error=str(e))
         sys.exit(1)
+    finally:
+        # Close the Docker events stream; its thread is blocked reading it
+        if exit_watcher is not None:
+            exit_watcher.stop()
 
 
 if __name__ == "__main__":
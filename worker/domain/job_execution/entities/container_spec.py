@@ -183,6 +183,9 @@ class ContainerSpec:
         scanner_tool_overrides_json: str = "{}",
         scan_profile: Optional[str] = None,
         max_scan_wall_seconds: Optional[int] = None,
+        diff_base_scan_id: Optional[str] = None,
+        cpu_limit: str = "2000m",
+        memory_limit: str = "4g",
     ) -> 'ContainerSpec':
         """Create container spec from scan configuration.
         
@@ -205,6 +208,13 @@ class ContainerSpec:
         max_scan_wall_seconds:
             Same value as queue ``max_scan_wall_seconds`` / worker ``container_wait_timeout_seconds``.
             Passed into the scanner container so orchestrator can log total wall budget in scan.log.
+
+        diff_base_scan_id:
+            Earlier finished scan of the same repository (scan.config ``diff_base_scan_id``);
+            path-aware scanners then only analyse files changed since that scan's commit.
+
+        cpu_limit / memory_limit:
+            Container limits; the worker's admission controller passes the scan's estimated demand.
         """
         
         # Command: Use orchestrator module (as defined in Dockerfile CMD)
@@ -241,6 +251,10 @@ class ContainerSpec:
             if _pv is not None and str(_pv).strip():
                 environment[_pg] = str(_pv).strip()
         environment["POSTGRES_SSL"] = (os.environ.get("POSTGRES_SSL") or "false").strip().lower()
+        # Live step deltas: scanner PUBLISHes to the same Redis the backend SSE bridge listens on
+        _redis_url = (os.environ.get("REDIS_URL") or "").strip()
+        if _redis_url:
+            environment["REDIS_URL"] = _redis_url
 
         # Add selected scanners if provided (from backend/queue message)
         # This allows backend to control which scanners run, instead of scanner filtering
@@ -267,11 +281,21 @@ class ContainerSpec:
         if git_branch:
             environment["GIT_BRANCH"] = git_branch
 
+        # Diff-only scan mode (scanner/core/scan_diff.py); orchestrator falls back to a full scan
+        if diff_base_scan_id:
+            environment["SSC_SCAN_DIFF_BASE_SCAN_ID"] = str(diff_base_scan_id)
+
         # Optional full git clone (fixes shallow-clone + semgrep/git edge cases)
         _gcf = os.getenv("GIT_CLONE_FULL", "").strip().lower()
         if _gcf in ("1", "true", "yes"):
             environment["GIT_CLONE_FULL"] = "1"
         
+        # Optional parallel scanner execution inside the container (scanner/core/scan_scheduler.py)
+        for _sk in ("SSC_SCAN_MAX_PARALLEL", "SSC_SCAN_CPU_BUDGET", "SSC_SCAN_MEMORY_BUDGET_MB"):
+            _sv = os.getenv(_sk, "").strip()
+            if _sv:
+                environment[_sk] = _sv
+        
         # Finding policy: tell scanner where the policy file is in the container.
         # For both git_repo and local_mount the project (or clone) is mounted at /target,
         # so a relative path (e.g. .scanning/finding-policy.json) becomes /target/.scanning/finding-policy.json.
@@ -326,8 +350,8 @@ class ContainerSpec:
             container_name=f"ssc-scan-{scan_id[:8]}",
             read_only=container_read_only,
             tmpfs=tmpfs_config,
-            cpu_limit="2000m",  # 2 CPU cores
-            memory_limit="4g",  # 4GB RAM
+            cpu_limit=cpu_limit,
+            memory_limit=memory_limit,
             labels={
                 "simpleseccheck.scan_id": scan_id,
                 "simpleseccheck.scan_type": scan_type,
@@ -16,8 +16,34 @@ from uuid import UUID
 from worker.domain.job_execution.entities.job_execution import JobExecution, JobExecutionStatus, ContainerState
 from worker.infrastructure.docker.docker_job_executor import DockerJobExecutor
 from worker.domain.job_execution.services.result_processing_service import ResultProcessingService
+from worker.domain.job_execution.services.scan_admission_controller import (
+    ScanAdmissionController,
+    ScanResourceDemand,
+)
 from worker.infrastructure.queue_adapter import QueueAdapter
 from worker.infrastructure.database_adapter import PostgreSQLAdapter
+from worker.infrastructure.scanner_resource_hints import load_scanner_resource_hints
+
+
+def _scan_profile(job_data: Dict[str, Any]) -> Optional[str]:
+    cfg = job_data.get("config") or {}
+    if not isinstance(cfg, dict):
+        return None
+    raw_profile = cfg.get("scan_profile")
+    if raw_profile is None or not str(raw_profile).strip():
+        return None
+    return str(raw_profile).strip()
+
+
+def _scan_max_parallel(scanner_count: int) -> int:
+    """Scanners a container runs at once (SSC_SCAN_MAX_PARALLEL, forwarded to the scanner)."""
+    raw = os.getenv("SSC_SCAN_MAX_PARALLEL", "").strip().lower()
+    if raw == "auto":
+        return max(1, scanner_count)
+    try:
+        return max(1, int(raw)) if raw else 1
+    except ValueError:
+        return 1
 
 
 class JobOrchestrationService:
@@ -29,7 +55,8 @@ class JobOrchestrationService:
         result_processing_service: ResultProcessingService,
         queue_adapter: QueueAdapter,
         database_adapter: PostgreSQLAdapter,
-        max_concurrent_jobs: int = 3
+        max_concurrent_jobs: int = 3,
+        admission_controller: Optional[ScanAdmissionController] = None
     ):
         """Initialize the job orchestration service.
         
@@ -39,13 +66,18 @@ class JobOrchestrationService:
             queue_adapter: Queue adapter for job queuing
             database_adapter: Database adapter for persistence
             max_concurrent_jobs: Maximum number of concurrent jobs
+            admission_controller: Admits jobs by estimated CPU/memory and sizes their
+                container limits (None: fixed limits, admission by job count only)
         """
         self.docker_job_executor = docker_job_executor
         self.result_processing_service = result_processing_service
         self.queue_adapter = queue_adapter
         self.database_adapter = database_adapter
         self.max_concurrent_jobs = max_concurrent_jobs
+        self.admission_controller = admission_controller
         self.active_jobs: Dict[UUID, JobExecution] = {}
+        # Scan waiting for capacity (requeued at the head, so later jobs do not overtake it)
+        self._waiting_scan_id: Optional[str] = None
         self.logger = logging.getLogger(__name__)
     
     async def start_worker(self) -> None:
@@ -72,7 +104,7 @@ class JobOrchestrationService:
                 await asyncio.sleep(5)  # Wait before retrying
     
     async def _process_queue(self) -> None:
-        """Start as many queued jobs as free slots allow (same loop tick, not one per second)."""
+        """Start as many queued jobs as free slots and host capacity allow (same loop tick, not one per second)."""
         try:
             while len(self.active_jobs) < self.max_concurrent_jobs:
                 self.logger.debug(
@@ -86,10 +118,31 @@ class JobOrchestrationService:
                     self.logger.error(f"Error calling pop_job: {e}", exc_info=True)
                     break
 
-                self.logger.info(f"Found job in queue: scan_id={job_data.get('scan_id')}")
+                scan_id = str(job_data.get("scan_id"))
+                if scan_id != self._waiting_scan_id:
+                    self.logger.info(f"Found job in queue: scan_id={scan_id}")
+                demand = await self._estimate_demand(job_data)
+
+                if demand is not None and not self.admission_controller.fits(demand):
+                    # Back to the head of the queue rather than held here: survives a worker
+                    # crash and another worker with room can take it
+                    if scan_id != self._waiting_scan_id:
+                        reserved = self.admission_controller.reserved
+                        self.logger.info(
+                            f"Waiting for capacity: scan_id={scan_id} needs "
+                            f"{demand.cpu:g} CPU / {demand.memory_mb} MB, reserved "
+                            f"{reserved.cpu:g}/{self.admission_controller.cpu_capacity:g} CPU, "
+                            f"{reserved.memory_mb}/{self.admission_controller.memory_capacity_mb} MB"
+                        )
+                        self._waiting_scan_id = scan_id
+                    if not await self.queue_adapter.requeue_job(job_data):
+                        self.logger.error(f"Could not requeue scan {scan_id}; starting it over capacity")
+                    else:
+                        break
+                self._waiting_scan_id = None
 
                 try:
-                    job_execution = await self._create_job_execution(job_data)
+                    job_execution = await self._create_job_execution(job_data, demand)
                     self.logger.info(
                         f"Created job execution: {job_execution.id} for scan {job_execution.scan_id}"
                     )
@@ -99,21 +152,63 @@ class JobOrchestrationService:
 
                 try:
                     self.active_jobs[job_execution.id] = job_execution
+                    if demand is not None:
+                        self.admission_controller.admit(job_execution.id, demand)
                     asyncio.create_task(self._execute_job_wrapper(job_execution))
                     self.logger.info(f"Started job execution: {job_execution.id}")
                 except Exception as e:
                     self.logger.error(f"Error starting job execution: {e}", exc_info=True)
-                    self.active_jobs.pop(job_execution.id, None)
+                    self._remove_active_job(job_execution.id)
                     break
 
         except Exception as e:
             self.logger.error(f"Unexpected error processing queue: {e}", exc_info=True)
     
-    async def _create_job_execution(self, job_data: Dict[str, Any]) -> JobExecution:
+    async def _estimate_demand(self, job_data: Dict[str, Any]) -> Optional[ScanResourceDemand]:
+        """Estimated CPU/memory of the job's scan container, or None without admission control.
+        
+        Args:
+            job_data: Job data from queue
+            
+        Returns:
+            Resource demand (container limits are derived from it)
+        """
+        if self.admission_controller is None:
+            return None
+        try:
+            hints = await load_scanner_resource_hints(self.database_adapter)
+            scanners = [str(s) for s in (job_data.get("scanners") or [])]
+            scan_profile = _scan_profile(job_data)
+            history_key = ScanAdmissionController.history_key(scanners, scan_profile)
+            observed_mb = await self.queue_adapter.get_resource_history(history_key)
+            if observed_mb:
+                self.admission_controller.observe(history_key, observed_mb)
+            return self.admission_controller.estimate(
+                scanners,
+                scan_profile,
+                hints,
+                max_parallel=_scan_max_parallel(len(scanners) or len(hints)),
+            )
+        except Exception as e:
+            self.logger.error(f"Error estimating job resources: {e}", exc_info=True)
+            return None
+    
+    def _remove_active_job(self, job_id: UUID) -> None:
+        """Drop a job from the active set and free its reserved capacity."""
+        self.active_jobs.pop(job_id, None)
+        if self.admission_controller is not None:
+            self.admission_controller.release(job_id)
+    
+    async def _create_job_execution(
+        self,
+        job_data: Dict[str, Any],
+        demand: Optional[ScanResourceDemand] = None,
+    ) -> JobExecution:
         """Create a job execution from job data.
         
         Args:
             job_data: Job data from queue
+            demand: Estimated resources (sets the container limits); None keeps the default limits
             
         Returns:
             Job execution
@@ -198,12 +293,10 @@ class JobOrchestrationService:
             cfg = job_data.get("config") or {}
             if not isinstance(cfg, dict):
                 cfg = {}
-            raw_profile = cfg.get("scan_profile")
-            scan_profile = (
-                str(raw_profile).strip()
-                if raw_profile is not None and str(raw_profile).strip()
-                else None
-            )
+            scan_profile = _scan_profile(job_data)
+
+            raw_diff_base = cfg.get("diff_base_scan_id")
+            diff_base_scan_id = str(raw_diff_base).strip() if raw_diff_base else None
 
             mw = job_data.get("max_scan_wall_seconds")
             if mw is None:
@@ -219,6 +312,10 @@ class JobOrchestrationService:
                     f"max_scan_wall_seconds out of allowed range [60, 86400]: {n}"
                 )
 
+            limits = {}
+            if demand is not None:
+                limits = {"cpu_limit": demand.cpu_limit, "memory_limit": demand.memory_limit}
+
             # Create container specification
             # Pass host paths for volume mounting, container paths for environment variables
             # NOTE: Logs are part of Results - Scanner creates results/{scan_id}/logs/ automatically
@@ -240,6 +337,8 @@ class JobOrchestrationService:
                 scanner_tool_overrides_json=scanner_tool_overrides_json,
                 scan_profile=scan_profile,
                 max_scan_wall_seconds=n,
+                diff_base_scan_id=diff_base_scan_id,
+                **limits,
             )
 
             # Create job execution
@@ -254,6 +353,10 @@ class JobOrchestrationService:
                 container_spec=container_spec
             )
             job_execution.execution_metadata["container_wait_timeout_seconds"] = n
+            if demand is not None:
+                job_execution.execution_metadata["resource_history_key"] = ScanAdmissionController.history_key(
+                    [str(s) for s in scanners], scan_profile
+                )
 
             # Save to database
             await self._save_job_execution(job_execution)
@@ -277,11 +380,19 @@ class JobOrchestrationService:
             # Process results
             await self.result_processing_service.process_execution_result(result)
             
+            history_key = job_execution.execution_metadata.get("resource_history_key")
+            if self.admission_controller is not None and history_key and result is not None:
+                peak_mb = self.admission_controller.record_usage(
+                    history_key, (result.metadata or {}).get("container_stats")
+                )
+                if peak_mb:
+                    await self.queue_adapter.set_resource_history(history_key, peak_mb)
+            
             # Update job status
             await self._update_job_status(job_execution.id, JobExecutionStatus.COMPLETED)
             
             # Remove from active jobs
-            self.active_jobs.pop(job_execution.id, None)
+            self._remove_active_job(job_execution.id)
             
             self.logger.info(f"Completed job execution: {job_execution.id}")
             
@@ -292,7 +403,7 @@ class JobOrchestrationService:
             await self._update_job_status(job_execution.id, JobExecutionStatus.FAILED, str(e))
             
             # Remove from active jobs
-            self.active_jobs.pop(job_execution.id, None)
+            self._remove_active_job(job_execution.id)
     
     async def _check_completed_jobs(self) -> None:
         """Check for completed jobs and clean up."""
@@ -305,7 +416,7 @@ class JobOrchestrationService:
             
             # Remove completed jobs
             for job_id in completed_jobs:
-                self.active_jobs.pop(job_id, None)
+                self._remove_active_job(job_id)
                 
         except Exception as e:
             self.logger.error(f"Error checking completed jobs: {e}")
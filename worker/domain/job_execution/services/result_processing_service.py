@@ -512,7 +512,7 @@ class ResultProcessingService:
             else:
                 duration_seconds = None
             
-            # Update scan status, vulnerability counts, and results in database
+            # Update scan status and vulnerability counts; per-tool results go to scan_results
             async with self.database_adapter.get_session() as session:
                 update_query = text("""
                     UPDATE scans 
@@ -526,8 +526,7 @@ class ResultProcessingService:
                         medium_vulnerabilities = :medium_vulnerabilities,
                         low_vulnerabilities = :low_vulnerabilities,
                         info_vulnerabilities = :info_vulnerabilities,
-                        duration = :duration,
-                        results = CAST(:results AS jsonb)
+                        duration = :duration
                     WHERE id = :scan_id
                 """)
                 
@@ -546,9 +545,23 @@ class ResultProcessingService:
                         "low_vulnerabilities": vuln_counts["low_vulnerabilities"],
                         "info_vulnerabilities": vuln_counts["info_vulnerabilities"],
                         "duration": duration_seconds,
-                        "results": results_json,
                     }
                 )
+                if results_json is not None:
+                    await session.execute(
+                        text("""
+                            INSERT INTO scan_results (scan_id, results, updated_at)
+                            VALUES (:scan_id, CAST(:results AS jsonb), :updated_at)
+                            ON CONFLICT (scan_id) DO UPDATE SET
+                                results = EXCLUDED.results,
+                                updated_at = EXCLUDED.updated_at
+                        """),
+                        {"scan_id": scan_id, "results": results_json, "updated_at": datetime.utcnow()},
+                    )
+                else:
+                    await session.execute(
+                        text("DELETE FROM scan_results WHERE scan_id = :scan_id"), {"scan_id": scan_id}
+                    )
                 await session.commit()
 
                 # Update scanner_duration_stats (per-tool) so admin "Tool duration" and queue estimates get real data
@@ -0,0 +1,191 @@
+"""
+Scan admission controller for the worker domain.
+
+Estimates each scan container's CPU/memory demand from its selected scanners (manifest
+``execution.resources``, synced to ``scanners.scanner_metadata``), the scan profile and peak
+memory observed on earlier runs of the same scanner set, and admits scans only while their
+summed demand fits the Docker host. Demand never drops below the previous fixed 2 CPU / 4 GB:
+manifest hints are sizing guesses, not a cap a scan should be OOM-killed at, and admission
+reserves what the container may actually use (its limits).
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+# Scanner without a resources entry (same default as scanner/core/scan_scheduler.py)
+DEFAULT_SCANNER_CPU = 1.0
+DEFAULT_SCANNER_MEMORY_MB = 512
+# Headroom for the orchestrator, report generation and tool child processes; the scanner
+# subtracts the same reserve from its cgroup memory limit when sizing its own budget.
+CONTAINER_MEMORY_RESERVE_MB = 512
+# Kept free on the host for the backend, database and Docker itself
+DEFAULT_HOST_MEMORY_RESERVE_MB = 1024
+# Used when no scanner metadata is available; also the floor of every demand and container
+# limit (previous fixed limits)
+FALLBACK_CPU = 2.0
+FALLBACK_MEMORY_MB = 4096
+# Observed peak memory is scaled by this before it can raise an estimate
+_OBSERVED_MEMORY_HEADROOM = 1.25
+# Low-intensity profiles (scan_profiles.<profile>.hints.intensity) keep fewer cores busy
+_INTENSITY_CPU_SCALE = {"low": 0.5}
+
+
+@dataclass(frozen=True)
+class ScanResourceDemand:
+    """CPU cores and memory reserved for one scan container."""
+
+    cpu: float
+    memory_mb: int
+
+    @property
+    def cpu_limit(self) -> str:
+        """Docker CPU limit: the reservation, at least FALLBACK_CPU even where capacity clamped it."""
+        return f"{int(round(max(self.cpu, FALLBACK_CPU) * 1000))}m"
+
+    @property
+    def memory_limit(self) -> str:
+        """Docker memory limit: the reservation, at least FALLBACK_MEMORY_MB even where capacity clamped it."""
+        return f"{max(self.memory_mb, FALLBACK_MEMORY_MB)}m"
+
+
+def _env_float(name: str) -> Optional[float]:
+    raw = os.environ.get(name, "").strip()
+    try:
+        value = float(raw) if raw else None
+    except ValueError:
+        return None
+    return value if value and value > 0 else None
+
+
+class ScanAdmissionController:
+    """Packs scan containers onto the host by estimated CPU/memory demand."""
+
+    def __init__(self, cpu_capacity: float, memory_capacity_mb: int):
+        """Initialize the controller.
+
+        Args:
+            cpu_capacity: CPU cores available to scan containers
+            memory_capacity_mb: Memory (MB) available to scan containers
+        """
+        self.cpu_capacity = max(1.0, cpu_capacity)
+        self.memory_capacity_mb = max(CONTAINER_MEMORY_RESERVE_MB, memory_capacity_mb)
+        self._admitted: Dict[UUID, ScanResourceDemand] = {}
+        # history key -> observed peak memory (MB) of the latest run (persisted by the caller)
+        self._observed_memory_mb: Dict[str, int] = {}
+
+    @classmethod
+    def from_env(cls, host_cpus: float, host_memory_mb: int) -> "ScanAdmissionController":
+        """Capacity from SSC_WORKER_CPU_CAPACITY / SSC_WORKER_MEMORY_CAPACITY_MB, else the Docker host.
+
+        Args:
+            host_cpus: CPU cores of the Docker host (0 if unknown)
+            host_memory_mb: Memory of the Docker host in MB (0 if unknown)
+        """
+        cpu = _env_float("SSC_WORKER_CPU_CAPACITY") or host_cpus or float(os.cpu_count() or 1)
+        memory = _env_float("SSC_WORKER_MEMORY_CAPACITY_MB")
+        if memory is None:
+            reserve = _env_float("SSC_WORKER_HOST_MEMORY_RESERVE_MB") or DEFAULT_HOST_MEMORY_RESERVE_MB
+            memory = (host_memory_mb or FALLBACK_MEMORY_MB + reserve) - reserve
+        return cls(cpu, int(memory))
+
+    @staticmethod
+    def history_key(scanners: List[str], scan_profile: Optional[str]) -> str:
+        return f"{scan_profile or 'standard'}:{','.join(sorted(scanners))}"
+
+    def estimate(
+        self,
+        scanners: List[str],
+        scan_profile: Optional[str],
+        hints: Dict[str, Dict[str, Any]],
+        max_parallel: int = 1,
+    ) -> ScanResourceDemand:
+        """Estimate a scan container's demand.
+
+        Args:
+            scanners: Selected scanner names (empty: the scanner picks by scan type, assume any)
+            scan_profile: Scan profile (quick / standard / deep)
+            hints: Scanner name -> {"cpu", "memory_mb", "exclusive", "intensity": {profile: ...}}
+            max_parallel: Scanners the container runs at once (SSC_SCAN_MAX_PARALLEL)
+
+        Returns:
+            Demand of at least FALLBACK_CPU / FALLBACK_MEMORY_MB (the container limits), clamped
+            to the host capacity, so an oversized scan still runs (alone)
+        """
+        names = list(scanners) or list(hints)
+        if not hints or not names:
+            cpu, memory_mb = FALLBACK_CPU, FALLBACK_MEMORY_MB
+        else:
+            profile = scan_profile or "standard"
+            weights = []
+            for name in names:
+                hint = hints.get(name) or {}
+                scale = _INTENSITY_CPU_SCALE.get((hint.get("intensity") or {}).get(profile), 1.0)
+                weights.append((
+                    float(hint.get("cpu") or DEFAULT_SCANNER_CPU) * scale,
+                    int(hint.get("memory_mb") or DEFAULT_SCANNER_MEMORY_MB),
+                    bool(hint.get("exclusive")),
+                ))
+            # Sequential scanners: the largest one; parallel: the largest set that can run at once
+            cpu = max(w[0] for w in weights)
+            memory_mb = max(w[1] for w in weights)
+            if max_parallel > 1:
+                shared = sorted((w for w in weights if not w[2]), key=lambda w: w[1], reverse=True)
+                top = shared[:max_parallel]
+                cpu = max(cpu, sum(w[0] for w in top))
+                memory_mb = max(memory_mb, sum(w[1] for w in top))
+            memory_mb += CONTAINER_MEMORY_RESERVE_MB
+        observed = self._observed_memory_mb.get(self.history_key(scanners, scan_profile))
+        if observed:
+            memory_mb = max(memory_mb, int(observed * _OBSERVED_MEMORY_HEADROOM))
+        # Reserve what the container is allowed to use, not just the estimate
+        return ScanResourceDemand(
+            cpu=min(max(cpu, FALLBACK_CPU), self.cpu_capacity),
+            memory_mb=min(max(memory_mb, FALLBACK_MEMORY_MB), self.memory_capacity_mb),
+        )
+
+    @property
+    def reserved(self) -> ScanResourceDemand:
+        return ScanResourceDemand(
+            cpu=sum(d.cpu for d in self._admitted.values()),
+            memory_mb=sum(d.memory_mb for d in self._admitted.values()),
+        )
+
+    def fits(self, demand: ScanResourceDemand) -> bool:
+        """True if the scan fits next to the admitted ones (always true on an idle host)."""
+        if not self._admitted:
+            return True
+        reserved = self.reserved
+        return (
+            reserved.cpu + demand.cpu <= self.cpu_capacity + 1e-9
+            and reserved.memory_mb + demand.memory_mb <= self.memory_capacity_mb
+        )
+
+    def admit(self, job_id: UUID, demand: ScanResourceDemand) -> None:
+        self._admitted[job_id] = demand
+
+    def release(self, job_id: UUID) -> None:
+        self._admitted.pop(job_id, None)
+
+    def observe(self, key: str, peak_mb: int) -> None:
+        """Seed the observed peak memory of a scanner set (e.g. loaded from the shared history)."""
+        if peak_mb > 0:
+            self._observed_memory_mb[key] = int(peak_mb)
+
+    def record_usage(self, key: str, stats: Optional[Dict[str, Any]]) -> Optional[int]:
+        """Remember the peak memory of a finished scan (``container_stats`` from the executor).
+
+        Uses ``memory_peak_bytes``, sampled by the executor while the scan ran; a stopped
+        container's ``memory_stats`` are empty and a warm container's ``usage`` is idle memory.
+
+        Returns:
+            Recorded peak in MB, or None if the stats carry no peak
+        """
+        stats = stats or {}
+        peak = stats.get("memory_peak_bytes") or (stats.get("memory_usage") or {}).get("max_usage") or 0
+        if peak <= 0:
+            return None
+        peak_mb = int(peak // (1024 * 1024))
+        self._observed_memory_mb[key] = peak_mb
+        return peak_mb
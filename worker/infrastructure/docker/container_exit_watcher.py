@@ -0,0 +1,154 @@
+"""
+Container exit watcher for the worker infrastructure.
+
+One Docker events subscription per worker (``die`` / ``destroy`` of containers), fanned out
+to the jobs waiting for their container. Completion is detected when the event arrives
+instead of by polling every running container once per second.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from worker.infrastructure.docker_adapter import DockerAdapter
+
+_FINISHED_STATES = ("exited", "dead")
+
+
+class ContainerExitWatcher:
+    """Shared Docker events stream that wakes waiters when their container stops."""
+
+    # Safety net for events missed while the stream reconnects (and restart policies)
+    RECONCILE_INTERVAL_SECONDS = 30.0
+    # Used while no events subscription is live (e.g. Docker daemon restarting)
+    FALLBACK_POLL_SECONDS = 1.0
+    MAX_RECONNECT_BACKOFF_SECONDS = 30.0
+
+    def __init__(self, docker_adapter: "DockerAdapter"):
+        """Initialize the watcher.
+
+        Args:
+            docker_adapter: Docker adapter whose client is used for the events stream
+        """
+        self.docker_adapter = docker_adapter
+        self.logger = logging.getLogger(__name__)
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stream: Any = None
+        self._stopped = threading.Event()
+        self._connected = threading.Event()
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        if getattr(self.docker_adapter, "client", None) is None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="docker-exit-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Close the events stream and stop the watcher thread."""
+        self._stopped.set()
+        stream = self._stream
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    def _run(self) -> None:
+        since: Optional[int] = None
+        backoff = 1.0
+        while not self._stopped.is_set():
+            try:
+                kwargs: Dict[str, Any] = {
+                    "decode": True,
+                    "filters": {"type": "container", "event": ["die", "destroy"]},
+                }
+                if since is not None:
+                    # Replay what happened while disconnected (duplicates are harmless)
+                    kwargs["since"] = since
+                self._stream = self.docker_adapter.client.events(**kwargs)
+                self._connected.set()
+                backoff = 1.0
+                for event in self._stream:
+                    since = event.get("time") or since
+                    self._dispatch(event)
+            except Exception as e:
+                if not self._stopped.is_set():
+                    self.logger.warning(f"Docker events stream failed, reconnecting: {e}")
+            finally:
+                self._connected.clear()
+                self._stream = None
+            self._stopped.wait(backoff)
+            backoff = min(backoff * 2, self.MAX_RECONNECT_BACKOFF_SECONDS)
+
+    def _dispatch(self, event: Dict[str, Any]) -> None:
+        actor = event.get("Actor") or {}
+        container_id = event.get("id") or actor.get("ID")
+        if not container_id or self._loop is None:
+            return
+        exit_code = None
+        if (event.get("Action") or event.get("status")) == "die":
+            try:
+                exit_code = int((actor.get("Attributes") or {}).get("exitCode"))
+            except (TypeError, ValueError):
+                exit_code = None
+        try:
+            self._loop.call_soon_threadsafe(self._resolve, container_id, exit_code)
+        except RuntimeError:
+            # Event loop closed (worker shutting down)
+            self._stopped.set()
+
+    def _resolve(self, container_id: str, exit_code: Optional[int]) -> None:
+        for future in self._waiters.pop(container_id, []):
+            if not future.done():
+                future.set_result(exit_code)
+
+    async def wait_for_exit(self, container_id: str, timeout: float) -> Tuple[bool, Optional[int]]:
+        """Wait until the container has stopped.
+
+        Args:
+            container_id: Full container ID
+            timeout: Timeout in seconds
+
+        Returns:
+            (finished, exit code from the die event or None if unknown); finished is
+            False when the timeout was reached
+        """
+        self._ensure_started()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        exit_code: Optional[int] = None
+        while True:
+            future = loop.create_future()
+            self._waiters.setdefault(container_id, []).append(future)
+            try:
+                # Registered first, then checked: an exit before registration is not missed
+                state = await self.docker_adapter.get_container_state(container_id)
+                if state in _FINISHED_STATES:
+                    return True, exit_code
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False, None
+                interval = self.RECONCILE_INTERVAL_SECONDS if self.connected else self.FALLBACK_POLL_SECONDS
+                try:
+                    exit_code = await asyncio.wait_for(asyncio.shield(future), timeout=min(remaining, interval))
+                except asyncio.TimeoutError:
+                    pass
+            finally:
+                waiters = self._waiters.get(container_id)
+                if waiters and future in waiters:
+                    waiters.remove(future)
+                    if not waiters:
+                        del self._waiters[container_id]
+                future.cancel()
@@ -7,8 +7,7 @@ Handles the lifecycle of containers including creation, execution, monitoring, a
 import asyncio
 import logging
 import subprocess
-import time
-from typing import Dict, List, Optional, Any, AsyncGenerator
+from typing import Dict, List, Optional, Any, AsyncGenerator, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -16,24 +15,50 @@ from worker.domain.job_execution.entities.job_execution import JobExecution, Job
 from worker.domain.job_execution.entities.container_spec import ContainerSpec
 from worker.domain.job_execution.entities.execution_result import ExecutionResult
 from worker.infrastructure.docker_adapter import DockerAdapter
+from worker.infrastructure.docker.container_exit_watcher import ContainerExitWatcher
+from worker.infrastructure.docker.warm_container_pool import WarmContainerPool
 from worker.infrastructure.worker_result_collection import (
     collect_file_results_for_scan_sync,
     load_merged_worker_result_collection,
 )
+from shared.steps_log import STEPS_LOG_FILENAME, read_steps
+
+# Memory of a running scan container is sampled this often; a stopped container reports no
+# memory stats, so the peak (used for scan admission) has to be taken while it runs
+MEMORY_SAMPLE_INTERVAL_SECONDS = 10.0
+
+
+def _working_set_bytes(stats: Optional[Dict[str, Any]]) -> int:
+    memory = (stats or {}).get("memory_usage") or {}
+    usage = memory.get("usage") or 0
+    detail = memory.get("stats") or {}
+    # Same as `docker stats`: page cache that can be reclaimed does not count
+    cache = detail.get("inactive_file", detail.get("total_inactive_file", 0)) or 0
+    return max(0, usage - cache)
 
 
 class DockerJobExecutor:
     """Service for managing container execution lifecycle."""
     
-    def __init__(self, docker_adapter: DockerAdapter, database_adapter=None):
+    def __init__(
+        self,
+        docker_adapter: DockerAdapter,
+        database_adapter=None,
+        exit_watcher: Optional[ContainerExitWatcher] = None,
+        warm_pool: Optional[WarmContainerPool] = None,
+    ):
         """Initialize the container execution service.
         
         Args:
             docker_adapter: Docker adapter for container operations
             database_adapter: Optional database adapter for status updates
+            exit_watcher: Shared container exit watcher (one events stream per worker)
+            warm_pool: Optional pool of pre-started scanner containers
         """
         self.docker_adapter = docker_adapter
         self.database_adapter = database_adapter
+        self.exit_watcher = exit_watcher or ContainerExitWatcher(docker_adapter)
+        self.warm_pool = warm_pool
         self.logger = logging.getLogger(__name__)
     
     async def execute_job(self, job_execution: JobExecution) -> ExecutionResult:
@@ -61,18 +86,38 @@ class DockerJobExecutor:
                 self.logger.warning(f"Failed to update scan status to running: {e}")
                 # Don't fail the job execution if status update fails
             
-            # Create container
-            container_id = await self._create_container(job_execution.container_spec)
-            job_execution.container_id = container_id
-            
-            # Start container
-            await self._start_container(container_id)
+            # Warm pooled container if one fits this job, else create and start a fresh one
+            warm_container_id = None
+            if self.warm_pool is not None:
+                warm_container_id = await self.warm_pool.acquire(job_execution.container_spec)
             
-            # Monitor execution
-            result = await self._monitor_execution(job_execution, container_id)
-            
-            # Cleanup
-            await self._cleanup_container(container_id)
+            if warm_container_id:
+                container_id = warm_container_id
+                job_execution.container_id = container_id
+                self.logger.info(f"Running job {job_execution.id} in warm container: {container_id}")
+                result = None
+                try:
+                    result = await self._monitor_execution(job_execution, container_id, warm=True)
+                finally:
+                    # After an error the scan may still be running in it: never hand it out again
+                    await self.warm_pool.release(
+                        container_id,
+                        (result.metadata or {}).get("container_stats") if result else None,
+                        reusable=result is not None,
+                    )
+            else:
+                # Create container
+                container_id = await self._create_container(job_execution.container_spec)
+                job_execution.container_id = container_id
+                
+                # Start container
+                await self._start_container(container_id)
+                
+                # Monitor execution
+                result = await self._monitor_execution(job_execution, container_id)
+                
+                # Cleanup
+                await self._cleanup_container(container_id)
             
             # Complete execution
             job_execution.complete_execution(result.success, result.error_message)
@@ -136,19 +181,31 @@ class DockerJobExecutor:
             except asyncio.TimeoutError:
                 continue
 
-    async def _monitor_execution(self, job_execution: JobExecution, container_id: str) -> ExecutionResult:
+    async def _sample_memory_peak(self, container_id: str, stop: asyncio.Event, peak: Dict[str, int]) -> None:
+        """Keep ``peak["bytes"]`` at the highest working-set memory seen until ``stop`` is set."""
+        while not stop.is_set():
+            stats = await self._get_container_stats(container_id)
+            peak["bytes"] = max(peak.get("bytes", 0), _working_set_bytes(stats))
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=MEMORY_SAMPLE_INTERVAL_SECONDS)
+                return
+            except asyncio.TimeoutError:
+                continue
+
+    async def _monitor_execution(self, job_execution: JobExecution, container_id: str, warm: bool = False) -> ExecutionResult:
         """Monitor container execution and collect results.
         
         Args:
             job_execution: Job execution
             container_id: Container ID
+            warm: Scan runs as an assignment in a warm pooled container
             
         Returns:
             Execution result
         """
         try:
-            # Get container logs
-            logs = await self._get_container_logs(container_id)
+            # Get container logs (warm container: the assignment's output is the scan log)
+            logs = [] if warm else await self._get_container_logs(container_id)
 
             stop_hb = asyncio.Event()
             hb_task = None
@@ -156,6 +213,10 @@ class DockerJobExecutor:
                 hb_task = asyncio.create_task(
                     self._heartbeat_while_running(job_execution.scan_id, stop_hb)
                 )
+            memory_peak: Dict[str, int] = {}
+            sample_task = asyncio.create_task(
+                self._sample_memory_peak(container_id, stop_hb, memory_peak)
+            )
             try:
                 raw_to = job_execution.execution_metadata.get("container_wait_timeout_seconds")
                 if raw_to is None:
@@ -168,19 +229,25 @@ class DockerJobExecutor:
                 except (TypeError, ValueError) as e:
                     raise ValueError(f"Invalid container_wait_timeout_seconds: {raw_to!r}") from e
                 timeout = max(60, min(86400, timeout))
-                # Wait for container to complete
-                exit_code = await self._wait_for_container(container_id, timeout=timeout)
+                if warm:
+                    exit_code, logs = await self._run_in_warm_container(job_execution, container_id, timeout=timeout)
+                else:
+                    # Wait for container to complete
+                    exit_code = await self._wait_for_container(container_id, timeout=timeout)
             finally:
                 stop_hb.set()
-                if hb_task:
-                    hb_task.cancel()
-                    try:
-                        await hb_task
-                    except asyncio.CancelledError:
-                        pass
+                for task in (hb_task, sample_task):
+                    if task:
+                        task.cancel()
+                        try:
+                            await task
+                        except asyncio.CancelledError:
+                            pass
             
             # Get container stats
             stats = await self._get_container_stats(container_id)
+            if memory_peak.get("bytes"):
+                stats = {**stats, "memory_peak_bytes": memory_peak["bytes"]}
             
             # Collect results
             result = await self._collect_results(job_execution, container_id, logs, exit_code, stats)
@@ -219,12 +286,11 @@ class DockerJobExecutor:
             Container exit code
         """
         try:
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                state = await self.docker_adapter.get_container_state(container_id)
-                if state in ['exited', 'dead']:
-                    return await self.docker_adapter.get_container_exit_code(container_id)
-                await asyncio.sleep(1)
+            finished, exit_code = await self.exit_watcher.wait_for_exit(container_id, timeout)
+            if finished:
+                if exit_code is not None:
+                    return exit_code
+                return await self.docker_adapter.get_container_exit_code(container_id)
             
             # Timeout reached
             await self.docker_adapter.stop_container(container_id)
@@ -234,6 +300,25 @@ class DockerJobExecutor:
             self.logger.error(f"Error waiting for container {container_id}: {e}")
             raise
     
+    async def _run_in_warm_container(self, job_execution: JobExecution, container_id: str, timeout: int) -> Tuple[int, List[str]]:
+        """Run the scan as an assignment in a warm container and wait for it.
+        
+        Args:
+            job_execution: Job execution (its container spec environment is the scan env)
+            container_id: Warm container ID
+            timeout: Timeout in seconds
+            
+        Returns:
+            (exit code, log lines)
+        """
+        finished, exit_code, output = await self.warm_pool.run(
+            container_id, job_execution.container_spec.environment, timeout
+        )
+        if not finished:
+            await self.docker_adapter.stop_container(container_id)
+            raise TimeoutError(f"Container {container_id} timed out after {timeout} seconds")
+        return exit_code, output.split('\n') if output else []
+    
     async def _get_container_stats(self, container_id: str) -> Dict[str, Any]:
         """Get container resource usage statistics.
         
@@ -374,20 +459,11 @@ class DockerJobExecutor:
                 except (json.JSONDecodeError, OSError) as e:
                     self.logger.warning(f"Could not read post-policy statistics from {stats_file}: {e}")
 
-            # steps.log (JSON Lines): one line per step with name, started_at, completed_at -> used for per-tool duration stats
-            steps_log = Path(results_dir) / scan_id / "logs" / "steps.log"
+            # steps.log: current state per step (name, started_at, completed_at) -> used for per-tool duration stats
+            steps_log = Path(results_dir) / scan_id / "logs" / STEPS_LOG_FILENAME
             if steps_log.exists():
                 try:
-                    lines = await asyncio.to_thread(steps_log.read_text, encoding="utf-8")
-                    steps = []
-                    for line in lines.strip().splitlines():
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            steps.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            continue
+                    steps = await asyncio.to_thread(read_steps, steps_log)
                     if steps:
                         structured_results["_steps"] = steps
                         self.logger.debug(f"Loaded {len(steps)} steps from steps.log for per-tool duration")
@@ -478,6 +554,8 @@ class DockerJobExecutor:
         """
         try:
             if job_execution.container_id:
+                if self.warm_pool is not None:
+                    await self.warm_pool.forget(job_execution.container_id)
                 await self.docker_adapter.stop_container(job_execution.container_id)
                 await self.docker_adapter.remove_container(job_execution.container_id)
                 job_execution.cancel_execution()
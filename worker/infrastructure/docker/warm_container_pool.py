@@ -0,0 +1,299 @@
+"""
+Warm scanner container pool for the worker infrastructure.
+
+Keeps pre-started idle scanner containers (``scanner.core.warm_runner serve``: orchestrator and
+all plugins already imported) and hands them scan assignments via ``docker exec``, instead of
+creating, starting and removing a fresh container per job.
+
+Only git_repo scans are pooled: their /target is a tmpfs the warm runner clears between scans,
+like the /tmp and /var/tmp scratch tmpfs.
+A pooled container is reusable only for jobs with the same image, mounts and creation env
+(pool key); the job's CPU/memory limits are applied with ``docker update`` when it is handed out.
+It is recycled after ``max_scans`` scans or when its memory grows past ``max_memory_mb``.
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import uuid
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from worker.domain.job_execution.entities.container_spec import ContainerSpec
+
+if TYPE_CHECKING:
+    from worker.infrastructure.docker_adapter import DockerAdapter
+
+POOL_LABEL = "simpleseccheck.job_type=warm-pool"
+WARM_RUNNER_COMMAND = ["python3", "-m", "scanner.core.warm_runner"]
+# Creation env of a pooled container: what the entrypoint needs before any scan is known.
+# Everything scan-specific is passed per assignment (exec environment).
+_CONTAINER_ENV_KEYS = (
+    "PUID",
+    "PGID",
+    "RESULTS_DIR_IN_CONTAINER",
+    "PROJECT_RESULTS_DIR",
+    "TARGET_PATH_IN_CONTAINER",
+)
+# Host config keys of the per-job resource limits (``ContainerSpec.to_docker_config``)
+_LIMIT_KEYS = ("cpu_quota", "cpu_period", "mem_limit")
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    try:
+        return max(0, int(raw)) if raw else default
+    except ValueError:
+        return default
+
+
+class WarmContainerPool:
+    """Idle pre-started scanner containers, keyed by image, mounts and creation env."""
+
+    def __init__(
+        self,
+        docker_adapter: "DockerAdapter",
+        size: int = 2,
+        max_scans: int = 20,
+        max_memory_mb: int = 1024,
+    ):
+        """Initialize the pool.
+
+        Args:
+            docker_adapter: Docker adapter for container operations
+            size: Maximum number of warm containers, idle or running a scan (0 disables the pool)
+            max_scans: Scans per container before it is replaced
+            max_memory_mb: Container memory (without page cache) above which it is replaced
+        """
+        self.docker_adapter = docker_adapter
+        self.size = size
+        self.max_scans = max_scans
+        self.max_memory_mb = max_memory_mb
+        self.logger = logging.getLogger(__name__)
+        # key -> idle container IDs; order = least recently used key first
+        self._idle: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._busy: Dict[str, str] = {}
+        self._uses: Dict[str, int] = {}
+        self._warming: Set[str] = set()
+        # Last job spec per key, to start replacements for recycled containers
+        self._specs: Dict[str, ContainerSpec] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_env(cls, docker_adapter: "DockerAdapter") -> "WarmContainerPool":
+        return cls(
+            docker_adapter,
+            size=_env_int("SSC_WORKER_WARM_POOL_SIZE", 2),
+            max_scans=max(1, _env_int("SSC_WORKER_WARM_POOL_MAX_SCANS", 20)),
+            max_memory_mb=_env_int("SSC_WORKER_WARM_POOL_MAX_MEMORY_MB", 1024),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0 and getattr(self.docker_adapter, "client", None) is not None
+
+    @staticmethod
+    def pool_key(spec: ContainerSpec) -> Optional[str]:
+        """Pool key of a job's container spec, or None if the job cannot run in a warm container."""
+        if spec.environment.get("TARGET_TYPE") != "git_repo":
+            return None
+        config = spec.to_docker_config()
+        for per_job in ("command", "environment", "labels", "name"):
+            config.pop(per_job, None)
+        config["environment"] = {k: spec.environment.get(k) for k in _CONTAINER_ENV_KEYS}
+        # Per-scan limits (admission sizes them per job) are applied on acquire, not keyed on
+        config["host_config"] = {
+            k: v for k, v in config.get("host_config", {}).items() if k not in _LIMIT_KEYS
+        }
+        raw = json.dumps(config, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+    def _warm_spec(self, spec: ContainerSpec, key: str) -> ContainerSpec:
+        environment = {k: spec.environment[k] for k in _CONTAINER_ENV_KEYS if k in spec.environment}
+        return dataclasses.replace(
+            spec,
+            command=WARM_RUNNER_COMMAND + ["serve"],
+            environment=environment,
+            container_name=f"ssc-warm-{uuid.uuid4().hex[:8]}",
+            labels={
+                "simpleseccheck.job_type": "warm-pool",
+                "simpleseccheck.warm_pool_key": key,
+            },
+            volumes=list(spec.volumes),
+            tmpfs=list(spec.tmpfs),
+        )
+
+    async def remove_stale(self) -> None:
+        """Remove warm containers left behind by an earlier worker process."""
+        if not self.enabled:
+            return
+        for container_id in await self.docker_adapter.list_container_ids(POOL_LABEL):
+            await self._discard(container_id)
+
+    async def acquire(self, spec: ContainerSpec) -> Optional[str]:
+        """Take an idle warm container for this job, or None (cold start); refills in the background."""
+        if not self.enabled:
+            return None
+        key = self.pool_key(spec)
+        if key is None:
+            return None
+        container_id = None
+        async with self._lock:
+            idle = self._idle.get(key) or []
+            while idle and container_id is None:
+                candidate = idle.pop(0)
+                state = await self.docker_adapter.get_container_state(candidate)
+                if state == "running":
+                    container_id = candidate
+                else:
+                    self._spawn(self._discard(candidate))
+            if key in self._idle:
+                self._idle.move_to_end(key)
+            if container_id is not None:
+                self._busy[container_id] = key
+            self._specs[key] = spec
+        self._spawn(self._refill(key, spec))
+        if container_id is not None:
+            limits = self.limits(spec)
+            try:
+                await self.docker_adapter.update_container_limits(container_id, limits)
+            except Exception as e:
+                self.logger.warning(f"Could not apply limits to warm container {container_id[:12]}: {e}")
+                async with self._lock:
+                    self._busy.pop(container_id, None)
+                self._spawn(self._discard(container_id))
+                return None
+        return container_id
+
+    @staticmethod
+    def limits(spec: ContainerSpec) -> Dict[str, Any]:
+        """The job's CPU/memory limits (host config keys), applied to a warm container on acquire."""
+        host_config = spec.to_docker_config().get("host_config", {})
+        return {k: host_config[k] for k in _LIMIT_KEYS if k in host_config}
+
+    async def run(
+        self,
+        container_id: str,
+        environment: Dict[str, str],
+        timeout: float,
+    ) -> Tuple[bool, int, str]:
+        """Run one scan in an acquired warm container.
+
+        Returns:
+            (finished, exit code, output); finished is False when the timeout was reached
+        """
+        try:
+            exit_code, output = await asyncio.wait_for(
+                self.docker_adapter.exec_in_container(
+                    container_id, WARM_RUNNER_COMMAND + ["run"], environment
+                ),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            return False, -1, ""
+        return True, exit_code, output
+
+    async def release(
+        self,
+        container_id: str,
+        stats: Optional[Dict[str, Any]] = None,
+        reusable: bool = True,
+    ) -> None:
+        """Return a container after its scan; replaced when worn out, stopped or grown too large."""
+        async with self._lock:
+            key = self._busy.pop(container_id, None)
+            if key is None:
+                return
+            uses = self._uses.get(container_id, 0) + 1
+            self._uses[container_id] = uses
+        reason = None
+        if not reusable:
+            reason = "scan did not finish cleanly"
+        elif uses >= self.max_scans:
+            reason = f"{uses} scans"
+        elif self._memory_mb(stats) > self.max_memory_mb > 0:
+            reason = f"{self._memory_mb(stats):.0f} MB memory"
+        elif await self.docker_adapter.get_container_state(container_id) != "running":
+            reason = "not running"
+        if reason:
+            self.logger.info(f"Recycling warm container {container_id[:12]} ({reason})")
+            self._spawn(self._discard(container_id))
+            spec = self._specs.get(key)
+            if spec is not None:
+                self._spawn(self._refill(key, spec))
+            return
+        async with self._lock:
+            self._idle.setdefault(key, []).append(container_id)
+            self._idle.move_to_end(key)
+
+    async def forget(self, container_id: str) -> None:
+        """Drop a busy container that was stopped/removed by someone else (job cancel); starts a replacement."""
+        async with self._lock:
+            key = self._busy.pop(container_id, None)
+            self._uses.pop(container_id, None)
+            spec = self._specs.get(key) if key is not None else None
+        if spec is not None:
+            self._spawn(self._refill(key, spec))
+
+    async def close(self) -> None:
+        """Remove all idle warm containers."""
+        for task in list(self._tasks):
+            task.cancel()
+        async with self._lock:
+            idle = [c for ids in self._idle.values() for c in ids]
+            self._idle.clear()
+        for container_id in idle:
+            await self._discard(container_id)
+
+    @staticmethod
+    def _memory_mb(stats: Optional[Dict[str, Any]]) -> float:
+        memory = (stats or {}).get("memory_usage") or {}
+        usage = memory.get("usage") or 0
+        detail = memory.get("stats") or {}
+        # Same as `docker stats`: page cache that can be reclaimed does not count
+        cache = detail.get("inactive_file", detail.get("total_inactive_file", 0)) or 0
+        return max(0, usage - cache) / (1024 * 1024)
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refill(self, key: str, spec: ContainerSpec) -> None:
+        async with self._lock:
+            if key in self._warming or self._idle.get(key):
+                return
+            total = sum(len(ids) for ids in self._idle.values()) + len(self._busy) + len(self._warming)
+            if total >= self.size:
+                # Make room: idle container of the least recently used other key
+                victim_key = next((k for k, ids in self._idle.items() if ids and k != key), None)
+                if victim_key is None:
+                    return
+                self._spawn(self._discard(self._idle[victim_key].pop(0)))
+                if not self._idle[victim_key]:
+                    del self._idle[victim_key]
+            self._warming.add(key)
+        try:
+            warm_spec = self._warm_spec(spec, key)
+            container_id = await self.docker_adapter.create_container(warm_spec.to_docker_config())
+            await self.docker_adapter.start_container(container_id)
+            self.logger.info(f"Started warm scanner container {container_id[:12]}")
+            async with self._lock:
+                self._idle.setdefault(key, []).append(container_id)
+                self._idle.move_to_end(key)
+        except Exception as e:
+            self.logger.warning(f"Could not start warm scanner container: {e}")
+        finally:
+            self._warming.discard(key)
+
+    async def _discard(self, container_id: str) -> None:
+        self._uses.pop(container_id, None)
+        try:
+            await self.docker_adapter.stop_container(container_id)
+        except Exception:
+            pass
+        await self.docker_adapter.remove_container(container_id)
@@ -5,10 +5,12 @@ Provides Docker container management operations.
 """
 
 import asyncio
+import codecs
 import logging
 import subprocess
 import time
-from typing import Dict, List, Optional, Any, AsyncGenerator
+from collections import deque
+from typing import Dict, List, Optional, Any, AsyncGenerator, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -25,6 +27,10 @@ except ImportError:
     logger = logging.getLogger(__name__)
     logger.setLevel(logging.ERROR)  # Only show errors if structlog not available
 
+# Lines of exec output (warm container scans) kept in memory; the full scan log is on the results volume
+EXEC_OUTPUT_TAIL_LINES = 2000
+_EXEC_TAIL_LINE_CHARS = 4096
+
 
 class DockerAdapter:
     """Adapter for Docker container operations."""
@@ -211,7 +217,30 @@ class DockerAdapter:
         except DockerException as e:
             self.logger.error(f"Error removing container {container_id}: {e}")
             # Don't raise here - cleanup failure shouldn't fail the job
-    
+
+    async def update_container_limits(self, container_id: str, limits: Dict[str, Any]) -> None:
+        """Change the resource limits of a running container (``docker update``).
+
+        Args:
+            container_id: Container ID
+            limits: Host config limit keys (cpu_quota, cpu_period, mem_limit)
+        """
+        if not limits:
+            return
+        kwargs = dict(limits)
+        if "mem_limit" in kwargs:
+            # Same swap allowance docker gives a container created with only a memory limit
+            kwargs["memswap_limit"] = 2 * docker.utils.parse_bytes(kwargs["mem_limit"])
+        try:
+            container = await asyncio.to_thread(
+                self.client.containers.get,
+                container_id
+            )
+            await asyncio.to_thread(container.update, **kwargs)
+        except DockerException as e:
+            self.logger.error(f"Error updating limits of container {container_id}: {e}")
+            raise
+
     async def get_container_logs(self, container_id: str) -> str:
         """Get container logs.
         
@@ -390,4 +419,93 @@ class DockerAdapter:
             }
         except DockerException as e:
             self.logger.error(f"Error getting container info for {container_id}: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    async def exec_in_container(
+        self,
+        container_id: str,
+        command: List[str],
+        environment: Optional[Dict[str, str]] = None,
+        tail_lines: int = EXEC_OUTPUT_TAIL_LINES,
+    ) -> Tuple[int, str]:
+        """Run a command in a running container and wait for it.
+        
+        Output is streamed while the command runs; only the last ``tail_lines`` lines are kept.
+        
+        Args:
+            container_id: Container ID
+            command: Command to run
+            environment: Extra environment for the command
+            tail_lines: Lines of combined stdout/stderr to return
+            
+        Returns:
+            (exit code, last lines of combined stdout/stderr); exit code -1 if it could not be determined
+        """
+        return await asyncio.to_thread(
+            self._exec_streaming,
+            container_id,
+            command,
+            environment or {},
+            tail_lines,
+        )
+
+    def _exec_streaming(
+        self,
+        container_id: str,
+        command: List[str],
+        environment: Dict[str, str],
+        tail_lines: int,
+    ) -> Tuple[int, str]:
+        api = self.client.api
+        exec_id = api.exec_create(
+            container_id, command, stdout=True, stderr=True, environment=environment
+        )["Id"]
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        tail: deque = deque(maxlen=tail_lines)
+        partial = ""
+        for chunk in api.exec_start(exec_id, stream=True):
+            text = decoder.decode(chunk)
+            if "\n" not in text:
+                partial = (partial + text)[-_EXEC_TAIL_LINE_CHARS:]
+                continue
+            lines = (partial + text).split("\n")
+            partial = lines.pop()[-_EXEC_TAIL_LINE_CHARS:]
+            tail.extend(line[-_EXEC_TAIL_LINE_CHARS:] for line in lines[-tail_lines:])
+        partial += decoder.decode(b"", final=True)
+        if partial:
+            tail.append(partial)
+        exit_code = api.exec_inspect(exec_id).get("ExitCode")
+        return (exit_code if exit_code is not None else -1), "\n".join(tail)
+    
+    async def list_container_ids(self, label: str) -> List[str]:
+        """List IDs of all containers (any state) carrying a label.
+        
+        Args:
+            label: Label filter, ``key`` or ``key=value``
+            
+        Returns:
+            Container IDs
+        """
+        try:
+            containers = await asyncio.to_thread(
+                self.client.containers.list,
+                all=True,
+                filters={"label": label}
+            )
+            return [c.id for c in containers]
+        except DockerException as e:
+            self.logger.error(f"Error listing containers with label {label}: {e}")
+            return []
+    
+    async def get_host_resources(self) -> Tuple[float, int]:
+        """CPU cores and memory (MB) of the Docker host that runs the scan containers.
+        
+        Returns:
+            (cpus, memory_mb); (0, 0) if the daemon cannot be queried
+        """
+        try:
+            info = await asyncio.to_thread(self.client.info)
+            return float(info.get("NCPU") or 0), int(info.get("MemTotal") or 0) // (1024 * 1024)
+        except DockerException as e:
+            self.logger.error(f"Error reading Docker host info: {e}")
+            return 0.0, 0
@@ -10,6 +10,9 @@ import json
 from typing import Dict, List, Optional, Any, AsyncGenerator
 from datetime import datetime
 
+# Hash of scan admission history key -> observed peak memory (MB), shared by all workers
+RESOURCE_HISTORY_KEY = "scan_resource_history"
+
 
 class QueueAdapter:
     """Adapter for queue operations."""
@@ -24,6 +27,9 @@ class QueueAdapter:
         self.queue_type = queue_type
         self.connection_string = connection_string
         self.logger = logging.getLogger(__name__)
+        # (scan_id, score) of the last job popped from the priority queue, for requeue_job()
+        self._last_priority_pop: Optional[tuple] = None
+        self._resource_history: Dict[str, int] = {}
         # Don't suppress logs - we need to see queue operations
         
         if queue_type == "redis":
@@ -101,6 +107,8 @@ class QueueAdapter:
                     self.logger.error(f"Redis connection error: {e}", exc_info=True)
                     return None
 
+                self._last_priority_pop = None
+
                 # --- Priority queue (same as backend QueueService when strategy == priority)
                 try:
                     popped = await self.redis_client.zpopmin("scan_queue:priority", 1)
@@ -110,6 +118,7 @@ class QueueAdapter:
                         if raw:
                             await self.redis_client.delete(f"scan:{scan_id}")
                             job_data = json.loads(raw)
+                            self._last_priority_pop = (scan_id, _score)
                             self.logger.info(
                                 f"Popped job from priority queue: scan_id={job_data.get('scan_id')}"
                             )
@@ -166,6 +175,61 @@ class QueueAdapter:
             self.logger.error(f"Unexpected error in pop_job: {e}", exc_info=True)
             return None
     
+    async def requeue_job(self, job_data: Dict[str, Any]) -> bool:
+        """Put a popped job back at the head of its queue (e.g. it has to wait for capacity).
+
+        The job is visible to every worker again and survives a worker crash; a priority job
+        keeps its score, a FIFO job goes back to the pop end of ``scan_queue``.
+
+        Args:
+            job_data: Job data returned by the last pop_job()
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if self.queue_type == "redis":
+                job_json = json.dumps(job_data)
+                last = self._last_priority_pop
+                self._last_priority_pop = None
+                if last is not None and str(last[0]) == str(job_data.get("scan_id")):
+                    scan_id, score = last
+                    await self.redis_client.set(f"scan:{scan_id}", job_json)
+                    await self.redis_client.zadd("scan_queue:priority", {scan_id: score})
+                else:
+                    await self.redis_client.rpush("scan_queue", job_json)
+            else:
+                self.queue.insert(0, job_data)
+            self.logger.debug(f"Requeued job: {job_data.get('scan_id')}")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error requeueing job {job_data.get('scan_id')}: {e}", exc_info=True)
+            return False
+    
+    async def get_resource_history(self, key: str) -> Optional[int]:
+        """Observed peak memory (MB) of a scan admission history key, None if unknown."""
+        try:
+            if self.queue_type == "redis":
+                raw = await self.redis_client.hget(RESOURCE_HISTORY_KEY, key)
+                return int(raw) if raw else None
+            return self._resource_history.get(key)
+        except (TypeError, ValueError):
+            return None
+        except Exception as e:
+            self.logger.warning(f"Error reading resource history for {key}: {e}")
+            return None
+    
+    async def set_resource_history(self, key: str, peak_mb: int) -> None:
+        """Store the observed peak memory (MB) of a scan admission history key."""
+        try:
+            if self.queue_type == "redis":
+                await self.redis_client.hset(RESOURCE_HISTORY_KEY, key, int(peak_mb))
+            else:
+                self._resource_history[key] = int(peak_mb)
+        except Exception as e:
+            self.logger.warning(f"Error storing resource history for {key}: {e}")
+    
     async def get_queue_length(self) -> int:
         """Get queue length.
         
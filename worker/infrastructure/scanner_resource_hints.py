@@ -0,0 +1,76 @@
+"""
+Load per-scanner resource hints from DB (scanner_metadata) for scan admission.
+
+``resources`` mirrors manifest ``execution.resources`` (synced by the orchestrator);
+``intensity`` maps profile -> ``scan_profiles.<profile>.hints.intensity``.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+_hints_cache: Optional[Tuple[Dict[str, Dict[str, Any]], float]] = None
+_HINTS_CACHE_TTL_SEC = 60.0
+
+
+def invalidate_scanner_resource_hints_cache() -> None:
+    """Call after scanner metadata in DB changes (e.g. POST /api/scanners/refresh)."""
+    global _hints_cache
+    _hints_cache = None
+
+
+def _hint_from_metadata(sm: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(sm, str):
+        try:
+            sm = json.loads(sm)
+        except json.JSONDecodeError:
+            return None
+    if not isinstance(sm, dict):
+        return None
+    resources = sm.get("resources")
+    hint: Dict[str, Any] = dict(resources) if isinstance(resources, dict) else {}
+    intensity: Dict[str, str] = {}
+    for profile, cfg in (sm.get("scan_profiles") or {}).items():
+        hints = cfg.get("hints") if isinstance(cfg, dict) else None
+        if isinstance(hints, dict) and hints.get("intensity"):
+            intensity[str(profile)] = str(hints["intensity"]).strip().lower()
+    hint["intensity"] = intensity
+    return hint
+
+
+async def load_scanner_resource_hints(database_adapter) -> Dict[str, Dict[str, Any]]:
+    """Scanner name -> {"cpu", "memory_mb", "exclusive", "intensity"} for enabled scanners ({} if unavailable)."""
+    global _hints_cache
+    now = time.monotonic()
+    if _hints_cache is not None:
+        data, ts = _hints_cache
+        if now - ts < _HINTS_CACHE_TTL_SEC:
+            return data
+
+    if not database_adapter:
+        return {}
+
+    try:
+        async with database_adapter.get_session() as session:
+            result = await session.execute(
+                text("SELECT name, scanner_metadata FROM scanners WHERE enabled = true")
+            )
+            rows = result.fetchall()
+    except Exception as e:
+        logger.warning("scanner resource hints: DB read failed, using defaults: %s", e)
+        return {}
+
+    hints: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        hint = _hint_from_metadata(row[1])
+        if row[0] and hint is not None:
+            hints[str(row[0])] = hint
+
+    _hints_cache = (hints, now)
+    return hints